@@ -7,6 +7,7 @@ from django.utils.translation import gettext_lazy as _
 
 from lib.erp_base.models.otp import OTP
 from lib.erp_base.tasks import send_sms
+from outbox.services import enqueue
 
 
 class PhoneOTP(OTP):
@@ -19,15 +20,17 @@ class PhoneOTP(OTP):
     def send(self):
         if not self.is_alive():
             code = self.generate()
+            self.last_send_date = timezone.localtime(timezone.now())
             if settings.CAS_DEBUG:
                 print(code)
             else:
-                send_sms.apply_async(
+                enqueue(
+                    send_sms,
                     (
                         self.phone_number,
                         f"Verification code: {code}"
-                    )
+                    ),
+                    dedup_key=f"otp:{self.phone_number}:{self.last_send_date.timestamp()}",
                 )
-            self.last_send_date = timezone.localtime(timezone.now())
             self.save(update_fields=["last_send_date"])
         return True
@@ -4,6 +4,7 @@ from django.db import transaction
 
 from banking.utils.choices import BankCardStatus
 from banking.tasks import validate_card_task
+from outbox.services import enqueue
 
 
 def normalize_card_number(number: str) -> str:
@@ -11,7 +12,10 @@ def normalize_card_number(number: str) -> str:
 
 def enqueue_validation_if_pending(old_status, card):
     if card.status == BankCardStatus.PENDING and old_status != BankCardStatus.PENDING:
-        transaction.on_commit(lambda: validate_card_task.delay(str(card.id)))
+        enqueue(
+            validate_card_task, (str(card.id),),
+            dedup_key=f"bank_card:validate:{card.id}",
+        )
 
 def is_luhn_valid(card_number: str) -> bool:
     card_number = normalize_card_number(card_number)
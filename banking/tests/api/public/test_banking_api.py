@@ -8,7 +8,9 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from banking.models import Bank, BankCard
+from banking.tasks import validate_card_task
 from banking.utils.choices import BankCardStatus
+from outbox.models import OutboxMessage
 
 User = get_user_model()
 
@@ -82,24 +84,17 @@ class TestBankingAPI:
         """Test card creation schedules validation task."""
         data = {"card_number": "5022291333461554"}  # Luhn-valid card number
 
-        with patch("django.db.transaction.on_commit", lambda func: func()):
-            with patch(
-                    "banking.services.bank_card_service.validate_card_task.delay"
-            ) as mock_task:
-                response = api_client.post(
-                    "/saeedpay/api/banking/v1/cards/", data
-                )
-                print(
-                    "RESPONSE DATA:", response.data
-                )  # Debug print for error details
-                assert response.status_code == status.HTTP_201_CREATED
-                assert BankCard.objects.count() == 1
-
-                card = BankCard.objects.first()
-                assert card.status == BankCardStatus.PENDING
-
-                # Verify task was scheduled
-                mock_task.assert_called_once_with(str(response.data["id"]))
+        response = api_client.post("/saeedpay/api/banking/v1/cards/", data)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert BankCard.objects.count() == 1
+
+        card = BankCard.objects.first()
+        assert card.status == BankCardStatus.PENDING
+
+        # Verify task was scheduled through the outbox
+        message = OutboxMessage.objects.get()
+        assert message.task_name == validate_card_task.name
+        assert message.args == [str(response.data["id"])]
 
     def test_create_card_invalid_luhn(self, api_client):
         data = {"card_number": "1234567812345678"}
@@ -110,19 +105,17 @@ class TestBankingAPI:
         """Test updating rejected card schedules validation task."""
         data = {"card_number": "6362141111393550"}
 
-        with patch("django.db.transaction.on_commit", lambda func: func()):
-            with patch(
-                    "banking.services.bank_card_service.validate_card_task.delay"
-            ) as mock_task:
-                response = api_client.patch(
-                    f"/saeedpay/api/banking/v1/cards/{rejected_card.id}/", data
-                )
-                assert response.status_code == status.HTTP_200_OK
-                rejected_card.refresh_from_db()
-                assert rejected_card.status == BankCardStatus.PENDING
-
-                # Verify task was scheduled
-                mock_task.assert_called_once_with(str(rejected_card.id))
+        response = api_client.patch(
+            f"/saeedpay/api/banking/v1/cards/{rejected_card.id}/", data
+        )
+        assert response.status_code == status.HTTP_200_OK
+        rejected_card.refresh_from_db()
+        assert rejected_card.status == BankCardStatus.PENDING
+
+        # Verify task was scheduled through the outbox
+        message = OutboxMessage.objects.get()
+        assert message.task_name == validate_card_task.name
+        assert message.args == [str(rejected_card.id)]
 
     def test_update_verified_card_not_allowed(self, api_client, verified_card):
         data = {"card_number": "6362141111393550"}
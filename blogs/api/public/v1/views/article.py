@@ -15,10 +15,11 @@ from blogs.api.public.v1.serializers import (
 )
 from blogs.filters import ArticleFilter
 from blogs.models import Article, Comment, ArticleSection
+from utils.db_routing import ReplicaReadMixin
 
 
 @article_viewset_schema
-class ArticleViewSet(viewsets.ReadOnlyModelViewSet):
+class ArticleViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """
     Read-only ViewSet for Article.
     - List: published & time passed for non-authors; include author's own drafts if authenticated.
@@ -27,10 +27,13 @@ from blogs.api.public.v1.serializers import (
 )
 from blogs.models import Comment
 from lib.erp_base.rest.throttling import ScopedThrottleByActionMixin
+from utils.db_routing import ReplicaReadMixin
 
 
 @comment_viewset_schema
-class CommentViewSet(ScopedThrottleByActionMixin, viewsets.ModelViewSet):
+class CommentViewSet(
+    ReplicaReadMixin, ScopedThrottleByActionMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for comments with moderation support.
     - List supports filtering by article and reply_to.
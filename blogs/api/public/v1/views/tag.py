@@ -9,10 +9,11 @@ from blogs.api.public.v1.schema import tag_viewset_schema
 from blogs.api.public.v1.serializers import TagSerializer, TagListSerializer
 from blogs.models import Tag
 from django.db.models import Count, Q
+from utils.db_routing import ReplicaReadMixin
 
 
 @tag_viewset_schema
-class TagViewSet(viewsets.ReadOnlyModelViewSet):
+class TagViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """Read-only Tag API."""
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
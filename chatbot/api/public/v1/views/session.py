@@ -28,6 +28,7 @@ from chatbot.api.public.v1.serializers import (
 )
 from chatbot.models import ChatSession, ChatMessage
 from lib.erp_base.rest.throttling import ScopedThrottleByActionMixin
+from utils.db_routing import ReplicaReadMixin
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ SESSION_LIMIT_ANONYMOUS = getattr(settings, "CHATBOT_SESSION_LIMIT", 2)
 
 @chat_session_viewset_schema
 class ChatSessionViewSet(
+    ReplicaReadMixin,
     ScopedThrottleByActionMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
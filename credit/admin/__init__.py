@@ -2,3 +2,4 @@ from .credit_limit import *
 from .statement import *
 from .statement_line import *
 from .loan_risk_report import *
+from .rollover_run import *
@@ -33,6 +33,7 @@ class CreditLimitAdmin(BaseAdmin):
     ]
     readonly_fields = [
         "reference_code",
+        "used_credit",
         "available_limit_display",
         "jalali_creation_time",
         "jalali_update_time",
@@ -40,7 +41,9 @@ class CreditLimitAdmin(BaseAdmin):
     fieldsets = (
         (_("اطلاعات کاربر"), {"fields": ("user",)}),
         (_("محدودیت اعتباری"),
-         {"fields": ("approved_limit", "available_limit_display")}),
+         {"fields": (
+             "approved_limit", "used_credit", "available_limit_display"
+         )}),
         (_("وضعیت و اعتبار"),
          {"fields": ("is_active", "expiry_date", "grace_period_days")}),
         (_("اطلاعات پیگیری"),
@@ -0,0 +1,45 @@
+# credit/admin/rollover_run.py
+
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+
+from credit.models import StatementRolloverRun
+from lib.erp_base.admin import BaseAdmin
+
+
+@admin.register(StatementRolloverRun)
+class StatementRolloverRunAdmin(BaseAdmin):
+    list_display = [
+        "id",
+        "year",
+        "month",
+        "status",
+        "progress_display",
+        "statements_closed",
+        "statements_created",
+        "interest_lines_added",
+        "users_failed",
+        "jalali_creation_time",
+    ]
+    list_filter = ["status", "year", "month"]
+    readonly_fields = [
+        "year",
+        "month",
+        "status",
+        "chunks_total",
+        "chunks_done",
+        "statements_closed",
+        "statements_created",
+        "interest_lines_added",
+        "users_failed",
+        "finished_at",
+        "jalali_creation_time",
+        "jalali_update_time",
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.display(description=_("پیشرفت"))
+    def progress_display(self, obj):
+        return f"{obj.chunks_done}/{obj.chunks_total}"
@@ -10,6 +10,7 @@ from credit.models import Statement
 from credit.models.statement_line import StatementLine
 from credit.utils.choices import StatementLineType
 from lib.erp_base.admin import BaseAdmin, BaseInlineAdmin
+from utils.db_routing import ReplicaChangeListMixin
 
 
 class StatementLineInline(BaseInlineAdmin):
@@ -79,7 +80,7 @@ class StatementLineInline(BaseInlineAdmin):
 
 
 @admin.register(Statement)
-class StatementAdmin(BaseAdmin):
+class StatementAdmin(ReplicaChangeListMixin, BaseAdmin):
     list_display = [
         "reference_code",
         "user",
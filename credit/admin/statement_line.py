@@ -8,10 +8,11 @@ from django.utils.translation import gettext_lazy as _
 from credit.models.statement_line import StatementLine
 from credit.utils.choices import StatementLineType
 from lib.erp_base.admin import BaseAdmin
+from utils.db_routing import ReplicaChangeListMixin
 
 
 @admin.register(StatementLine)
-class StatementLineAdmin(BaseAdmin):
+class StatementLineAdmin(ReplicaChangeListMixin, BaseAdmin):
     list_display = (
         "id",
         "statement_link",
@@ -6,10 +6,12 @@ from credit.api.public.v1.schema import credit_limit_viewset_schema
 from credit.api.public.v1.serializers.credit import CreditLimitSerializer
 from credit.models.credit_limit import CreditLimit
 from lib.erp_base.rest.throttling import ScopedThrottleByActionMixin
+from utils.db_routing import ReplicaReadMixin
 
 
 @credit_limit_viewset_schema
 class CreditLimitViewSet(
+    ReplicaReadMixin,
     ScopedThrottleByActionMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
@@ -20,6 +20,8 @@ from credit.api.public.v1.serializers.credit import (
 from credit.models.statement import Statement
 from credit.services.use_cases import StatementUseCases
 from lib.erp_base.rest.throttling import ScopedThrottleByActionMixin
+from utils.db_routing import ReplicaReadMixin
+from utils.pagination import OptInKeysetPagination
 from wallets.models import Transaction
 from wallets.utils.choices import TransactionStatus, WalletKind
 
@@ -28,6 +30,7 @@ logger = logging.getLogger(__name__)
 
 @statement_viewset_schema
 class StatementViewSet(
+    ReplicaReadMixin,
     ScopedThrottleByActionMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
@@ -37,6 +40,7 @@ class StatementViewSet(
     list:     Paginated list of user's statements (year/month/created desc).
     retrieve: Statement details with lines (prefetched).
     """
+    pagination_class = OptInKeysetPagination
     lookup_field = "pk"
     lookup_value_regex = r"\d+"
 
@@ -7,10 +7,13 @@ from credit.api.public.v1.schema import statement_line_viewset_schema
 from credit.api.public.v1.serializers import StatementLineSerializer
 from credit.models.statement_line import StatementLine
 from lib.erp_base.rest.throttling import ScopedThrottleByActionMixin
+from utils.db_routing import ReplicaReadMixin
+from utils.pagination import OptInKeysetPagination
 
 
 @statement_line_viewset_schema
 class StatementLineViewSet(
+    ReplicaReadMixin,
     ScopedThrottleByActionMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
@@ -21,6 +24,7 @@ class StatementLineViewSet(
     retrieve: Single line owned by the user (via parent statement).
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = OptInKeysetPagination
     serializer_class = StatementLineSerializer
     lookup_field = "pk"
     lookup_value_regex = r"\d+"
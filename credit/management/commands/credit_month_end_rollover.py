@@ -17,6 +17,7 @@ class Command(BaseCommand):
             self.style.SUCCESS(
                 f"Closed: {result['statements_closed']}, "
                 f"Created: {result['statements_created']}, "
-                f"Interest lines: {result['interest_lines_added']}"
+                f"Interest lines: {result['interest_lines_added']}, "
+                f"Failed users: {result['users_failed']}"
             )
         )
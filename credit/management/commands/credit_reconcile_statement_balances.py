@@ -0,0 +1,32 @@
+# credit/management/commands/credit_reconcile_statement_balances.py
+
+from django.core.management.base import BaseCommand
+
+from credit.services.use_cases import StatementUseCases
+from credit.utils.choices import StatementStatus
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute statement totals from their lines and repair drift of the "
+        "incrementally maintained balances (CURRENT statements by default)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--status",
+            action="append",
+            choices=StatementStatus.values,
+            help="Statement status to reconcile (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        result = StatementUseCases.reconcile_statement_balances(
+            statuses=options.get("status")
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked: {result['statements_checked']}, "
+                f"Drifted: {result['statements_drifted']}"
+            )
+        )
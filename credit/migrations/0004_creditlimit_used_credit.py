@@ -0,0 +1,38 @@
+# Generated by Django 5.0 on 2026-10-16 11:00
+
+from django.db import migrations, models
+
+
+def backfill_used_credit(apps, schema_editor):
+    CreditLimit = apps.get_model('credit', 'CreditLimit')
+    Statement = apps.get_model('credit', 'Statement')
+    CreditAuthorization = apps.get_model('credit', 'CreditAuthorization')
+    for credit_limit in CreditLimit.objects.filter(is_active=True).iterator():
+        debt = Statement.objects.filter(
+            user_id=credit_limit.user_id,
+            status='current',
+            closing_balance__lt=0,
+        ).aggregate(total=models.Sum('closing_balance'))['total'] or 0
+        holds = CreditAuthorization.objects.filter(
+            user_id=credit_limit.user_id,
+            status='active',
+        ).aggregate(total=models.Sum('amount'))['total'] or 0
+        CreditLimit.objects.filter(pk=credit_limit.pk).update(
+            used_credit=abs(int(debt)) + int(holds)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('credit', '0003_loanriskreport'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='creditlimit',
+            name='used_credit',
+            field=models.BigIntegerField(default=0, verbose_name='اعتبار مصرف‌شده'),
+        ),
+        migrations.RunPython(backfill_used_credit, migrations.RunPython.noop),
+    ]
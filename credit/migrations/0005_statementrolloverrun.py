@@ -0,0 +1,43 @@
+# Generated by Django 5.0 on 2026-10-16 12:00
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('credit', '0004_creditlimit_used_credit'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatementRolloverRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.UUIDField(default=uuid.uuid4, null=True, unique=True, verbose_name='GUID')),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('extra_document', models.FileField(blank=True, max_length=127, null=True, upload_to='extra_documents', verbose_name='دستورات و مستندات')),
+                ('year', models.SmallIntegerField(choices=[(1404, '1404')], verbose_name='سال')),
+                ('month', models.SmallIntegerField(choices=[(1, 'فروردین'), (2, 'اردیبهشت'), (3, 'خرداد'), (4, 'تیر'), (5, 'مرداد'), (6, 'شهریور'), (7, 'مهر'), (8, 'آبان'), (9, 'آذر'), (10, 'دی'), (11, 'بهمن'), (12, 'اسفند')], verbose_name='ماه')),
+                ('status', models.CharField(choices=[('running', 'در حال اجرا'), ('completed', 'تکمیل شده')], db_index=True, default='running', max_length=16, verbose_name='وضعیت')),
+                ('chunks_total', models.PositiveIntegerField(default=0, verbose_name='تعداد بخش‌ها')),
+                ('chunks_done', models.PositiveIntegerField(default=0, verbose_name='بخش‌های انجام‌شده')),
+                ('statements_closed', models.PositiveIntegerField(default=0, verbose_name='صورتحساب‌های بسته‌شده')),
+                ('statements_created', models.PositiveIntegerField(default=0, verbose_name='صورتحساب‌های ایجادشده')),
+                ('interest_lines_added', models.PositiveIntegerField(default=0, verbose_name='ردیف‌های سود')),
+                ('users_failed', models.PositiveIntegerField(default=0, verbose_name='کاربران ناموفق')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='زمان پایان')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_creations', to=settings.AUTH_USER_MODEL, verbose_name='ایجاد کننده')),
+            ],
+            options={
+                'verbose_name': 'اجرای انتقال ماهانه',
+                'verbose_name_plural': 'اجراهای انتقال ماهانه',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0 on 2026-10-16 15:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('credit', '0005_statementrolloverrun'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='statementline',
+            name='stl_stmt_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='statement',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='st_user_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='statementline',
+            index=models.Index(fields=['statement', 'created_at', 'id'], name='stl_stmt_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-16 23:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('credit', '0006_statement_st_user_created_id_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='statementrolloverrun',
+            name='status',
+            field=models.CharField(choices=[('running', 'در حال اجرا'), ('completed', 'تکمیل شده'), ('failed', 'ناموفق')], db_index=True, default='running', max_length=16, verbose_name='وضعیت'),
+        ),
+    ]
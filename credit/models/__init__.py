@@ -2,5 +2,7 @@ from .credit_limit import CreditLimit
 from .statement import Statement
 from .authorization import CreditAuthorization
 from .loan_risk_report import LoanRiskReport
+from .rollover_run import StatementRolloverRun
 
-__all__ = ['CreditLimit', 'Statement', 'CreditAuthorization', 'LoanRiskReport']
+__all__ = ['CreditLimit', 'Statement', 'CreditAuthorization', 'LoanRiskReport',
+           'StatementRolloverRun']
@@ -1,12 +1,12 @@
 # credit/models/authorization.py
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from lib.erp_base.models import BaseModel
-from utils.reference import generate_reference_code
+from utils.reference import generate_reference_code, save_with_reference_code
 
 
 class CreditAuthorization(BaseModel):
@@ -40,19 +40,48 @@ class CreditAuthorization(BaseModel):
     )
 
     def save(self, *args, **kwargs):
-        if not self.reference_code:
-            for _ in range(5):
-                code = generate_reference_code(prefix="AUTH", random_digits=6)
-                if not CreditAuthorization.objects.filter(
-                        reference_code=code
-                ).exists():
-                    self.reference_code = code
-                    break
+        adding = self._state.adding
+        with transaction.atomic():
+            if self.reference_code:
+                super().save(*args, **kwargs)
             else:
-                raise Exception(
-                    "Failed to generate authorization reference code."
+                save_with_reference_code(
+                    self, lambda: generate_reference_code(prefix="AUTH"),
+                    super().save, *args, **kwargs
                 )
-        super().save(*args, **kwargs)
+            if adding and self.status == self.Status.ACTIVE:
+                self._adjust_used_credit(self.amount)
+
+    def _adjust_used_credit(self, delta: int):
+        from credit.models.credit_limit import CreditLimit
+        CreditLimit.objects.adjust_used_credit(self.user_id, delta)
+
+    @transaction.atomic
+    def _finish(self, status: str) -> bool:
+        """
+        Move an ACTIVE hold to a terminal status with a conditional UPDATE
+        and give its amount back to the user's used-credit counter.
+        Returns False when the hold was no longer ACTIVE.
+        """
+        updated = CreditAuthorization.objects.filter(
+            pk=self.pk, status=self.Status.ACTIVE
+        ).update(
+            status=status, updated_at=timezone.localtime(timezone.now())
+        )
+        if updated != 1:
+            return False
+        self.status = status
+        self._adjust_used_credit(-int(self.amount))
+        return True
+
+    def settle(self) -> bool:
+        return self._finish(self.Status.SETTLED)
+
+    def release(self) -> bool:
+        return self._finish(self.Status.RELEASED)
+
+    def expire(self) -> bool:
+        return self._finish(self.Status.EXPIRED)
 
     def is_active(self) -> bool:
         if self.status != self.Status.ACTIVE:
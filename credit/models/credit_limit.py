@@ -1,14 +1,19 @@
 # credit/models/credit_limit.py
 
+import logging
+
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError, transaction
+from django.db import transaction
 from django.db import models
+from django.db.models import BigIntegerField, Case, F, Value, When
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from credit.utils.constants import STATEMENT_GRACE_DAYS
 from lib.erp_base.models import BaseModel
-from utils.reference import generate_reference_code
+from utils.reference import generate_reference_code, save_with_reference_code
+
+logger = logging.getLogger(__name__)
 
 
 class CreditLimitManager(models.Manager):
@@ -24,6 +29,59 @@ class CreditLimitManager(models.Manager):
         credit_limit = self.get_user_credit_limit(user)
         return credit_limit.available_limit if credit_limit else 0
 
+    def adjust_used_credit(self, user_id, delta: int) -> int:
+        """
+        Atomically shift the used-credit counter of the user's active limit.
+        Users without an active limit are skipped; activate() recomputes.
+        """
+        delta = int(delta)
+        if not delta:
+            return 0
+        return self.filter(user_id=user_id, is_active=True).update(
+            used_credit=F("used_credit") + delta,
+            updated_at=timezone.localtime(timezone.now()),
+        )
+
+    def adjust_used_credit_many(self, deltas) -> int:
+        """
+        adjust_used_credit() for many users in one UPDATE: `deltas` maps
+        user ids to the amount to shift their active limit by.
+        """
+        deltas = {
+            user_id: int(delta) for user_id, delta in deltas.items()
+            if int(delta)
+        }
+        if not deltas:
+            return 0
+        return self.filter(user_id__in=deltas, is_active=True).update(
+            used_credit=F("used_credit") + Case(
+                *[
+                    When(user_id=user_id, then=Value(delta))
+                    for user_id, delta in deltas.items()
+                ],
+                default=Value(0),
+                output_field=BigIntegerField(),
+            ),
+            updated_at=timezone.localtime(timezone.now()),
+        )
+
+    def reconcile_used_credit(self, chunk_size: int = 500):
+        """
+        Recompute the counter of every active limit from source and repair
+        drift. Each limit is checked in its own short transaction.
+        """
+        checked = drifted = 0
+        for credit_limit in self.filter(is_active=True).order_by(
+                "pk"
+        ).iterator(chunk_size=chunk_size):
+            checked += 1
+            if credit_limit.reconcile_used_credit():
+                drifted += 1
+        return {
+            "credit_limits_checked": checked,
+            "credit_limits_drifted": drifted,
+        }
+
 
 class CreditLimit(BaseModel):
     user = models.ForeignKey(
@@ -56,19 +114,22 @@ class CreditLimit(BaseModel):
         verbose_name=_("کد پیگیری")
     )
 
+    # Denormalized: current debt + active holds, maintained incrementally
+    used_credit = models.BigIntegerField(
+        default=0, verbose_name=_("اعتبار مصرف‌شده")
+    )
+
     objects = CreditLimitManager()
 
     def save(self, *args, **kwargs):
-        if not self.reference_code:
-            for _ in range(5):
-                self.reference_code = generate_reference_code(prefix="CR")
-                try:
-                    with transaction.atomic():
-                        return super().save(*args, **kwargs)
-                except IntegrityError:
-                    self.reference_code = None
-                    continue
-        return super().save(*args, **kwargs)
+        if self._state.adding and self.is_active:
+            self.used_credit = self.compute_used_credit()
+        if self.reference_code:
+            return super().save(*args, **kwargs)
+        return save_with_reference_code(
+            self, lambda: generate_reference_code(prefix="CR"),
+            super().save, *args, **kwargs
+        )
 
     @property
     def is_approved(self) -> bool:
@@ -77,11 +138,10 @@ class CreditLimit(BaseModel):
     @property
     def available_limit(self) -> int:
         """
-        approved_limit - (sum(active debts) + sum(active credit holds))
+        approved_limit - used_credit, where used_credit is the cached
+        sum(active debts) + sum(active credit holds)
         """
-        debt = self._current_active_debt()
-        holds = self._active_credit_holds()
-        return max(0, int(self.approved_limit) - debt - holds)
+        return max(0, int(self.approved_limit) - int(self.used_credit))
 
     @property
     def grace_days(self) -> int:
@@ -117,13 +177,35 @@ class CreditLimit(BaseModel):
         )
         return int(agg["total"] or 0)
 
+    def compute_used_credit(self) -> int:
+        """Source of truth for used_credit (two aggregates)."""
+        return self._current_active_debt() + self._active_credit_holds()
+
+    @transaction.atomic
+    def reconcile_used_credit(self) -> bool:
+        """Repair the cached counter; returns True when it had drifted."""
+        locked = CreditLimit.objects.select_for_update().get(pk=self.pk)
+        used = locked.compute_used_credit()
+        drifted = locked.used_credit != used
+        if drifted:
+            logger.warning(
+                "CreditLimit %s used_credit drift: stored=%s recomputed=%s",
+                self.pk, locked.used_credit, used,
+            )
+            CreditLimit.objects.filter(pk=self.pk).update(used_credit=used)
+        self.used_credit = used
+        return drifted
+
     def activate(self):
         with transaction.atomic():
             CreditLimit.objects.filter(user=self.user, is_active=True).update(
                 is_active=False, updated_at=timezone.localtime(timezone.now())
             )
             self.is_active = True
-            self.save(update_fields=["is_active", "updated_at"])
+            self.used_credit = self.compute_used_credit()
+            self.save(
+                update_fields=["is_active", "used_credit", "updated_at"]
+            )
 
     @classmethod
     def deactivate_user_active_limits(cls, user):
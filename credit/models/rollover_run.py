@@ -0,0 +1,100 @@
+# credit/models/rollover_run.py
+
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from credit.utils.choices import RolloverRunStatus
+from lib.erp_base.constants import JalaliYearChoices, JalaliMonthChoices
+from lib.erp_base.models import BaseModel
+
+
+class StatementRolloverRun(BaseModel):
+    """
+    Progress record of one fanned-out month-end rollover. Chunk tasks add
+    their counts with F() increments, so workers never contend on more
+    than a single-row UPDATE.
+    """
+    year = models.SmallIntegerField(
+        choices=JalaliYearChoices.choices(1404),
+        verbose_name=_("سال"),
+    )
+    month = models.SmallIntegerField(
+        choices=JalaliMonthChoices.choices,
+        verbose_name=_("ماه"),
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=RolloverRunStatus.choices,
+        default=RolloverRunStatus.RUNNING,
+        db_index=True,
+        verbose_name=_("وضعیت"),
+    )
+    chunks_total = models.PositiveIntegerField(
+        default=0, verbose_name=_("تعداد بخش‌ها")
+    )
+    chunks_done = models.PositiveIntegerField(
+        default=0, verbose_name=_("بخش‌های انجام‌شده")
+    )
+    statements_closed = models.PositiveIntegerField(
+        default=0, verbose_name=_("صورتحساب‌های بسته‌شده")
+    )
+    statements_created = models.PositiveIntegerField(
+        default=0, verbose_name=_("صورتحساب‌های ایجادشده")
+    )
+    interest_lines_added = models.PositiveIntegerField(
+        default=0, verbose_name=_("ردیف‌های سود")
+    )
+    users_failed = models.PositiveIntegerField(
+        default=0, verbose_name=_("کاربران ناموفق")
+    )
+    finished_at = models.DateTimeField(
+        null=True, blank=True, verbose_name=_("زمان پایان")
+    )
+
+    COUNTER_FIELDS = (
+        "statements_closed",
+        "statements_created",
+        "interest_lines_added",
+        "users_failed",
+    )
+
+    def record_chunk(self, counts: dict):
+        """Fold one chunk's counts into the run."""
+        StatementRolloverRun.objects.filter(pk=self.pk).update(
+            chunks_done=F("chunks_done") + 1,
+            updated_at=timezone.localtime(timezone.now()),
+            **{
+                field: F(field) + int(counts.get(field, 0))
+                for field in self.COUNTER_FIELDS
+            },
+        )
+
+    def mark_completed(self):
+        self.status = RolloverRunStatus.COMPLETED
+        self.finished_at = timezone.localtime(timezone.now())
+        self.save(update_fields=["status", "finished_at", "updated_at"])
+
+    def mark_failed(self):
+        self.status = RolloverRunStatus.FAILED
+        self.finished_at = timezone.localtime(timezone.now())
+        self.save(update_fields=["status", "finished_at", "updated_at"])
+
+    def as_result(self) -> dict:
+        result = {field: getattr(self, field) for field in self.COUNTER_FIELDS}
+        result.update(
+            run_id=self.pk,
+            status=self.status,
+            chunks_total=self.chunks_total,
+            chunks_done=self.chunks_done,
+        )
+        return result
+
+    def __str__(self):
+        return f"{self.year}/{self.month:02d} ({self.get_status_display()})"
+
+    class Meta:
+        verbose_name = _("اجرای انتقال ماهانه")
+        verbose_name_plural = _("اجراهای انتقال ماهانه")
+        ordering = ["-created_at"]
@@ -1,9 +1,10 @@
 # credit/models/statement.py
 
+import logging
 from datetime import timedelta
 
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError, models, transaction
+from django.db import models, transaction
 from django.db.models import Sum, Case, When, Value, IntegerField, F
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -16,10 +17,13 @@ from credit.utils.constants import (
     MINIMUM_PAYMENT_THRESHOLD,
     STATEMENT_PENALTY_RATE,
     STATEMENT_MAX_PENALTY_RATE,
+    STATEMENT_INCREMENTAL_BALANCES,
 )
 from lib.erp_base.constants import JalaliYearChoices, JalaliMonthChoices
 from lib.erp_base.models import BaseModel
-from utils.reference import generate_reference_code
+from utils.reference import generate_reference_code, save_with_reference_code
+
+logger = logging.getLogger(__name__)
 
 
 class StatementManager(models.Manager):
@@ -39,61 +43,228 @@ class StatementManager(models.Manager):
             month=jalali_today.month,
             status=StatementStatus.CURRENT,
             opening_balance=starting_balance,
+            closing_balance=starting_balance,
         )
         return statement, True
 
+    @staticmethod
+    def _past_month_q(jalali_today=None):
+        jalali_today = jalali_today or JalaliDate.today()
+        return models.Q(year__lt=jalali_today.year) | models.Q(
+            year=jalali_today.year, month__lt=jalali_today.month
+        )
+
+    def past_month_current(self, jalali_today=None):
+        """CURRENT statements that belong to a past Persian month."""
+        return self.filter(
+            self._past_month_q(jalali_today), status=StatementStatus.CURRENT
+        )
+
+    def rollover_user_ranges(self, chunk_size: int, jalali_today=None):
+        """
+        Partition users with past-month CURRENT statements into contiguous
+        (first_user_id, last_user_id) ranges of at most chunk_size users.
+        """
+        ranges = []
+        first = last = None
+        count = 0
+        user_ids = self.past_month_current(jalali_today).order_by(
+            "user_id"
+        ).values_list("user_id", flat=True).distinct()
+        for user_id in user_ids.iterator(chunk_size=max(chunk_size, 1)):
+            if first is None:
+                first = user_id
+            last = user_id
+            count += 1
+            if count >= chunk_size:
+                ranges.append((first, last))
+                first, count = None, 0
+        if first is not None:
+            ranges.append((first, last))
+        return ranges
+
+    def apply_debits(self, debits):
+        """
+        Set-based apply_line_delta() for debit lines: `debits` maps CURRENT
+        statements, locked by the caller, to the amount debited on each.
+        One UPDATE folds every amount into its statement (Case/When on pk)
+        and one more shifts the users' used credit.
+        """
+        debits = {
+            statement: int(amount)
+            for statement, amount in debits.items() if int(amount)
+        }
+        if not debits:
+            return
+        if not STATEMENT_INCREMENTAL_BALANCES:
+            for statement in debits:
+                statement.update_balances()
+            return
+
+        amount_by_pk = Case(
+            *[
+                When(pk=statement.pk, then=Value(amount))
+                for statement, amount in debits.items()
+            ],
+            default=Value(0),
+            output_field=models.BigIntegerField(),
+        )
+        self.filter(pk__in=[statement.pk for statement in debits]).update(
+            total_debit=F("total_debit") + amount_by_pk,
+            closing_balance=(
+                    F("opening_balance") + F("total_credit")
+                    - F("total_debit") - amount_by_pk
+            ),
+        )
+
+        used_credit_deltas = {}
+        for statement, amount in debits.items():
+            old_closing = int(statement.closing_balance)
+            statement.total_debit = int(statement.total_debit) + amount
+            statement.closing_balance = (
+                    int(statement.opening_balance)
+                    + int(statement.total_credit) - statement.total_debit
+            )
+            used_credit_deltas[statement.user_id] = (
+                used_credit_deltas.get(statement.user_id, 0)
+                + statement._counted_debt(
+                    statement.status, statement.closing_balance
+                )
+                - statement._counted_debt(statement.status, old_closing)
+            )
+        from credit.models.credit_limit import CreditLimit
+        CreditLimit.objects.adjust_used_credit_many(used_credit_deltas)
+
     @transaction.atomic
-    def close_monthly_statements(self):
+    def rollover_user(self, user_id, jalali_today=None):
         """
-        Close any 'current' statements belonging to past Persian months,
-        then create a new current statement per user and carry over balances.
-        Adds monthly interest on carried-over negative balances.
+        Close the user's past-month CURRENT statements, create the new CURRENT
+        with carry-over and add monthly interest on negative carry-over.
+        Runs in its own transaction and is idempotent: once committed the
+        user has no past-month CURRENT left, so a rerun is a no-op.
         """
-        jalali_today = JalaliDate.today()
+        jalali_today = jalali_today or JalaliDate.today()
         closed_count = 0
         created_count = 0
         interest_lines = 0
 
-        current_statements = self.filter(status=StatementStatus.CURRENT)
-        for statement in current_statements:
-            if statement.year < jalali_today.year or (
-                    statement.year == jalali_today.year and statement.month < jalali_today.month
-            ):
-                statement.close_statement()
-                closed_count += 1
-
-                new_statement, created = self.get_or_create(
-                    user=statement.user,
-                    year=jalali_today.year,
-                    month=jalali_today.month,
-                    defaults={
-                        "status": StatementStatus.CURRENT,
-                        "opening_balance": statement.closing_balance,
-                    },
+        statements = self.past_month_current(jalali_today).filter(
+            user_id=user_id
+        ).select_for_update().order_by("year", "month")
+        for statement in statements:
+            statement.close_statement()
+            closed_count += 1
+
+            new_statement, created = self.get_or_create(
+                user_id=user_id,
+                year=jalali_today.year,
+                month=jalali_today.month,
+                defaults={
+                    "status": StatementStatus.CURRENT,
+                    "opening_balance": statement.closing_balance,
+                    "closing_balance": statement.closing_balance,
+                },
+            )
+
+            if created:
+                created_count += 1
+            else:
+                # The carried balance moves the closing balance too, so
+                # save() shifts used credit by the debt carried over
+                new_statement = self.select_for_update().get(
+                    pk=new_statement.pk
+                )
+                new_statement.opening_balance = statement.closing_balance
+                new_statement.closing_balance = (
+                        int(statement.closing_balance)
+                        + int(new_statement.total_credit)
+                        - int(new_statement.total_debit)
+                )
+                new_statement.save(
+                    update_fields=["opening_balance", "closing_balance"]
                 )
 
-                if created:
-                    created_count += 1
-                else:
-                    new_statement.opening_balance = statement.closing_balance
-                    new_statement.save(update_fields=["opening_balance"])
-
-                if statement.closing_balance < 0:
-                    interest_amount = int(
-                        abs(statement.closing_balance) * MONTHLY_INTEREST_RATE
-                    )
-                    new_statement.add_line(
-                        type_=StatementLineType.INTEREST,
-                        amount=-interest_amount,
-                        description=f"Monthly interest on {statement.year}/{statement.month:02d}",
-                    )
-                    interest_lines += 1
+            if statement.closing_balance < 0:
+                interest_amount = int(
+                    abs(statement.closing_balance) * MONTHLY_INTEREST_RATE
+                )
+                new_statement.add_line(
+                    type_=StatementLineType.INTEREST,
+                    amount=-interest_amount,
+                    description=f"Monthly interest on {statement.year}/{statement.month:02d}",
+                )
+                interest_lines += 1
         return {
             "statements_closed": closed_count,
             "statements_created": created_count,
             "interest_lines_added": interest_lines,
         }
 
+    def rollover_user_range(
+            self, first_user_id=None, last_user_id=None, jalali_today=None
+    ):
+        """
+        Roll over every user in [first_user_id, last_user_id] (open-ended when
+        a bound is None), one transaction per user. A failing user is logged
+        and counted without undoing the rest of the range.
+        """
+        jalali_today = jalali_today or JalaliDate.today()
+        result = {
+            "statements_closed": 0,
+            "statements_created": 0,
+            "interest_lines_added": 0,
+            "users_failed": 0,
+        }
+        qs = self.past_month_current(jalali_today)
+        if first_user_id is not None:
+            qs = qs.filter(user_id__gte=first_user_id)
+        if last_user_id is not None:
+            qs = qs.filter(user_id__lte=last_user_id)
+        user_ids = list(
+            qs.order_by("user_id").values_list("user_id", flat=True).distinct()
+        )
+        for user_id in user_ids:
+            try:
+                counts = self.rollover_user(user_id, jalali_today)
+            except Exception:
+                logger.exception(
+                    "Month-end rollover failed for user %s", user_id
+                )
+                result["users_failed"] += 1
+                continue
+            for key, value in counts.items():
+                result[key] += value
+        return result
+
+    def close_monthly_statements(self):
+        """
+        Close any 'current' statements belonging to past Persian months,
+        then create a new current statement per user and carry over balances.
+        Adds monthly interest on carried-over negative balances.
+        Inline variant of the fanned-out rollover task; every user is
+        committed in its own transaction.
+        """
+        return self.rollover_user_range()
+
+    def reconcile_balances(self, statuses=None, chunk_size: int = 500):
+        """
+        Full re-aggregation of every statement in `statuses` (default CURRENT)
+        to detect and repair drift of the incrementally maintained totals.
+        Each statement is reconciled in its own short transaction.
+        """
+        statuses = statuses or [StatementStatus.CURRENT]
+        checked = drifted = 0
+        for statement in self.filter(status__in=statuses).order_by(
+                "pk"
+        ).iterator(chunk_size=chunk_size):
+            checked += 1
+            if statement.reconcile_balances():
+                drifted += 1
+        return {
+            "statements_checked": checked,
+            "statements_drifted": drifted,
+        }
+
 
 class Statement(BaseModel):
     user = models.ForeignKey(
@@ -171,14 +342,9 @@ class Statement(BaseModel):
         return int(self.closing_balance)
 
     # ---------- Core mechanics ----------
-    @transaction.atomic
-    def update_balances(self):
-        """
-        Recompute totals and closing balance from lines.
-        Only active (non-voided) lines are considered.
-        """
-        locked = Statement.objects.select_for_update().get(pk=self.pk)
-        totals = locked.lines.filter(is_voided=False).aggregate(
+    def _totals_from_lines(self):
+        """Aggregate (total_debit, total_credit) over active lines."""
+        totals = self.lines.filter(is_voided=False).aggregate(
             total_debit=Sum(
                 Case(
                     When(amount__lt=0, then=-F("amount")), default=Value(0),
@@ -192,8 +358,18 @@ class Statement(BaseModel):
                 )
             ),
         )
-        total_debit = int(totals["total_debit"] or 0)
-        total_credit = int(totals["total_credit"] or 0)
+        return (
+            int(totals["total_debit"] or 0), int(totals["total_credit"] or 0)
+        )
+
+    @transaction.atomic
+    def update_balances(self):
+        """
+        Recompute totals and closing balance from lines.
+        Only active (non-voided) lines are considered.
+        """
+        locked = Statement.objects.select_for_update().get(pk=self.pk)
+        total_debit, total_credit = locked._totals_from_lines()
         closing_balance = int(
             locked.opening_balance
         ) + total_credit - total_debit
@@ -204,6 +380,102 @@ class Statement(BaseModel):
             closing_balance=closing_balance
         )
         self.refresh_from_db()
+        self._shift_used_credit(
+            self._counted_debt(locked.status, closing_balance)
+            - self._counted_debt(locked.status, locked.closing_balance)
+        )
+
+    @staticmethod
+    def _counted_debt(status, closing_balance) -> int:
+        """Debt a statement adds to used credit: CURRENT ones only."""
+        if status != StatementStatus.CURRENT:
+            return 0
+        return max(0, -int(closing_balance or 0))
+
+    def _shift_used_credit(self, delta: int):
+        from credit.models.credit_limit import CreditLimit
+        CreditLimit.objects.adjust_used_credit(self.user_id, delta)
+
+    @transaction.atomic
+    def apply_line_delta(self, amount: int, *, undo: bool = False):
+        """
+        Incremental balance mode: fold one line's signed amount into the
+        locked row's totals with one UPDATE; undo=True removes a voided
+        line. closing_balance is derived from opening_balance, so
+        carried-over opening balances stay consistent, and used credit is
+        shifted against the stored closing balance.
+        """
+        if not STATEMENT_INCREMENTAL_BALANCES:
+            return self.update_balances()
+
+        amount = int(amount)
+        debit_delta = -amount if amount < 0 else 0
+        credit_delta = amount if amount > 0 else 0
+        if undo:
+            debit_delta, credit_delta = -debit_delta, -credit_delta
+        # The locked row gives the stored closing balance, which the used
+        # credit counter was last shifted by
+        locked = Statement.objects.select_for_update().filter(
+            pk=self.pk
+        ).values(
+            "status", "opening_balance", "total_debit", "total_credit",
+            "closing_balance",
+        ).get()
+        total_debit = int(locked["total_debit"]) + debit_delta
+        total_credit = int(locked["total_credit"]) + credit_delta
+        closing_balance = (
+                int(locked["opening_balance"]) + total_credit - total_debit
+        )
+        Statement.objects.filter(pk=self.pk).update(
+            total_debit=total_debit,
+            total_credit=total_credit,
+            closing_balance=closing_balance,
+        )
+        self.total_debit = total_debit
+        self.total_credit = total_credit
+        self.closing_balance = closing_balance
+
+        # Only debt on CURRENT statements counts against the credit limit
+        self._shift_used_credit(
+            self._counted_debt(locked["status"], closing_balance)
+            - self._counted_debt(locked["status"], locked["closing_balance"])
+        )
+
+    @transaction.atomic
+    def reconcile_balances(self) -> bool:
+        """
+        Full recompute used to detect drift of the incremental totals.
+        Repairs the row and returns True when the stored totals had drifted.
+        """
+        locked = Statement.objects.select_for_update().get(pk=self.pk)
+        total_debit, total_credit = locked._totals_from_lines()
+        closing_balance = int(
+            locked.opening_balance
+        ) + total_credit - total_debit
+        drifted = (
+                locked.total_debit != total_debit
+                or locked.total_credit != total_credit
+                or locked.closing_balance != closing_balance
+        )
+        if drifted:
+            logger.warning(
+                "Statement %s balance drift: stored=(%s, %s, %s) "
+                "recomputed=(%s, %s, %s)",
+                self.pk, locked.total_debit, locked.total_credit,
+                locked.closing_balance, total_debit, total_credit,
+                closing_balance,
+            )
+            Statement.objects.filter(pk=self.pk).update(
+                total_debit=total_debit,
+                total_credit=total_credit,
+                closing_balance=closing_balance
+            )
+            self._shift_used_credit(
+                self._counted_debt(locked.status, closing_balance)
+                - self._counted_debt(locked.status, locked.closing_balance)
+            )
+        self.refresh_from_db()
+        return drifted
 
     @transaction.atomic
     def close_statement(self):
@@ -214,7 +486,7 @@ class Statement(BaseModel):
         if self.status != StatementStatus.CURRENT:
             return
 
-        self.update_balances()
+        self.reconcile_balances()
 
         from credit.models.credit_limit import CreditLimit
         credit_limit = CreditLimit.objects.get_user_credit_limit(self.user)
@@ -400,17 +672,40 @@ class Statement(BaseModel):
             description=f"Monthly interest on {previous_stmt.year}/{previous_stmt.month:02d}",
         )
 
+    @transaction.atomic
     def save(self, *args, **kwargs):
-        if not self.reference_code:
-            for _ in range(5):
-                self.reference_code = generate_reference_code(prefix="ST")
-                try:
-                    with transaction.atomic():
-                        return super().save(*args, **kwargs)
-                except IntegrityError:
-                    self.reference_code = None
-                    continue
-        return super().save(*args, **kwargs)
+        # Statement rows are saved on lifecycle events only (open, close,
+        # rollover); line postings go through apply_line_delta(). The used
+        # credit counter is shifted by the change in counted debt, read
+        # from the locked row, instead of being recomputed.
+        fields = kwargs.get("update_fields")
+        fields = None if fields is None else set(fields)
+        tracked = fields is None or bool(
+            fields & {"status", "closing_balance"}
+        )
+        status, closing = None, 0
+        if tracked and not self._state.adding:
+            stored = Statement.objects.select_for_update().filter(
+                pk=self.pk
+            ).values_list("status", "closing_balance").first()
+            status, closing = stored or (None, 0)
+        before = self._counted_debt(status, closing)
+        if fields is None or "status" in fields:
+            status = self.status
+        if fields is None or "closing_balance" in fields:
+            closing = self.closing_balance
+
+        if self.reference_code:
+            super().save(*args, **kwargs)
+        else:
+            save_with_reference_code(
+                self, lambda: generate_reference_code(prefix="ST"),
+                super().save, *args, **kwargs
+            )
+        if tracked:
+            self._shift_used_credit(
+                self._counted_debt(status, closing) - before
+            )
 
     def __str__(self):
         return f"{self.user} - {self.year}/{self.month:02d} ({self.get_status_display()})"
@@ -423,4 +718,8 @@ class Statement(BaseModel):
         indexes = [
             models.Index(fields=["user", "status"], name="st_user_status_idx"),
             models.Index(fields=["due_date"], name="st_due_idx"),
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="st_user_created_id_idx",
+            ),
         ]
@@ -94,7 +94,8 @@ class StatementLine(BaseModel):
         if int(self.amount or 0) == 0:
             errors["amount"] = _("Amount cannot be zero.")
 
-        # transaction must belong to statement user
+        # transaction must belong to statement user; a linked transaction
+        # is never archived, so the hot table is enough here
         if self.transaction_id and self.statement_id:
             from_to_user_ids = (
                                    Transaction.objects.filter(
@@ -161,14 +162,16 @@ class StatementLine(BaseModel):
 
         super().save(*args, **kwargs)
 
-        # recompute parent balances when needed (only non-voided lines affect totals)
+        # keep parent balances in sync (only non-voided lines affect totals):
+        # a new line applies its own delta, edits of an existing line recompute
+        if not self.statement_id or self.is_voided:
+            return
         update_fields = kwargs.get("update_fields")
-        should_recompute = (
-                is_new
-                or update_fields is None
-                or any(field in update_fields for field in ("amount", "type"))
-        )
-        if should_recompute and self.statement_id:
+        if is_new:
+            self.statement.apply_line_delta(self.amount)
+        elif update_fields is None or any(
+                field in update_fields for field in ("amount", "type")
+        ):
             self.statement.update_balances()
 
     # ---------- lifecycle: forbid hard delete ----------
@@ -193,7 +196,7 @@ class StatementLine(BaseModel):
                            "void_reason"]
         )
         if self.statement_id:
-            self.statement.update_balances()
+            self.statement.apply_line_delta(self.amount, undo=True)
         return True
 
     @db_transaction.atomic
@@ -219,8 +222,6 @@ class StatementLine(BaseModel):
                              :255] if reason else f"Reversal of line {self.pk}"),
             reverses=self,
         )
-        if self.statement_id:
-            self.statement.update_balances()
         return rev
 
     def __str__(self):
@@ -258,7 +259,8 @@ class StatementLine(BaseModel):
         ]
         indexes = [
             models.Index(
-                fields=["statement", "created_at"], name="stl_stmt_created_idx"
+                fields=["statement", "created_at", "id"],
+                name="stl_stmt_created_id_idx",
             ),
             models.Index(fields=["type"], name="stl_type_idx"),
             models.Index(fields=["is_voided"], name="stl_void_idx"),
@@ -0,0 +1,46 @@
+# credit/pollers.py
+
+from django.conf import settings
+
+from credit.tasks_loan_validation import (
+    _begin_report_check,
+    _complete_report,
+    _fail_report,
+)
+from polling.services import ResultPoller, register_poller
+from polling.utils.choices import PollKind
+
+
+@register_poller
+class LoanReportResultPoller(ResultPoller):
+    """Waits for a requested loan validation report to be generated."""
+    kind = PollKind.LOAN_REPORT
+    first_delay = getattr(settings, "LOAN_REPORT_POLL_FIRST_DELAY", 10)
+    base_delay = getattr(settings, "LOAN_REPORT_POLL_BASE_DELAY", 10)
+    max_delay = getattr(settings, "LOAN_REPORT_POLL_MAX_DELAY", 5 * 60)
+    max_attempts = getattr(settings, "LOAN_REPORT_POLL_MAX_ATTEMPTS", 12)
+
+    def prepare(self, report_id):
+        report_unique_id, early = _begin_report_check(report_id)
+        if early is not None:
+            return None
+        return report_unique_id
+
+    async def fetch(self, client, report_unique_id):
+        return await client.loan_get_report_result(report_unique_id)
+
+    def apply(self, report_id, report_unique_id, result):
+        if not result.get("success"):
+            return False
+        _complete_report(report_id, result)
+        return True
+
+    def give_up(self, report_id, report_unique_id, result):
+        if isinstance(result, Exception):
+            _fail_report(report_id, str(result), "SERVICE_ERROR")
+            return
+        _fail_report(
+            report_id,
+            result.get("error", "Failed to get report"),
+            result.get("error_code") or "REPORT_RETRIEVAL_FAILED",
+        )
@@ -3,14 +3,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import Optional, Dict
 
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import BigIntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
-
-from credit.models import Statement
-from credit.utils.choices import StatementStatus, StatementLineType
+from persiantools.jdatetime import JalaliDate
+
+from credit.models import CreditLimit, Statement, StatementRolloverRun
+from credit.models.statement_line import StatementLine
+from credit.utils.choices import (
+    RolloverRunStatus,
+    StatementLineType,
+    StatementStatus,
+)
+from credit.utils.constants import (
+    FINALIZE_DUE_MAX_PAGES,
+    FINALIZE_DUE_PAGE_SIZE,
+    MINIMUM_PAYMENT_THRESHOLD,
+    STATEMENT_ROLLOVER_CHUNK_SIZE,
+    STATEMENT_ROLLOVER_STALE_HOURS,
+)
 from wallets.models import Transaction as WalletTransaction
 from wallets.utils.choices import TransactionStatus
 
@@ -51,6 +66,8 @@ class StatementUseCases:
         Business validations specific to credit availability live in
         Statement.add_purchase(), so we delegate to it.
         """
+        # hot table only: the line keeps a FK to the transaction, and a row
+        # old enough to be archived is long past its statement anyway
         transaction_obj = (
             WalletTransaction.objects.select_related(
                 "from_wallet", "to_wallet"
@@ -70,7 +87,7 @@ class StatementUseCases:
         statement.add_purchase(
             transaction=transaction_obj, description=description
         )
-        # Balances are recomputed via StatementLine.save() -> Statement.update_balances()
+        # Balances are adjusted via StatementLine.save() -> Statement.apply_line_delta()
         return statement
 
     # ---------- Payments (always on CURRENT) ----------
@@ -105,19 +122,120 @@ class StatementUseCases:
     # ---------- Month-end rollover ----------
 
     @staticmethod
-    @transaction.atomic
     def perform_month_end_rollover() -> Dict[str, int]:
         """
         Close past-month CURRENT statements, create the new CURRENT with carry-over,
         and add a monthly interest line for negative carry-overs.
+        Inline variant; every user is committed in its own transaction.
         """
         return Statement.objects.close_monthly_statements()
 
+    @staticmethod
+    def start_month_end_rollover(chunk_size: Optional[int] = None):
+        """
+        Plan a fanned-out rollover: partition users with past-month CURRENT
+        statements into user-id ranges and open a run to track them.
+        Returns (run, ranges); run is None when there is nothing to roll.
+
+        A run of this month that is still RUNNING (a retried coordinator, or
+        a run that lost a chunk) is reused for the remaining users instead
+        of opening a second one; stuck runs are failed first.
+        """
+        StatementUseCases.fail_stale_rollover_runs()
+        jalali_today = JalaliDate.today()
+        ranges = Statement.objects.rollover_user_ranges(
+            chunk_size or STATEMENT_ROLLOVER_CHUNK_SIZE, jalali_today
+        )
+        if not ranges:
+            return None, []
+        with transaction.atomic():
+            run = (
+                StatementRolloverRun.objects.select_for_update()
+                .filter(
+                    year=jalali_today.year,
+                    month=jalali_today.month,
+                    status=RolloverRunStatus.RUNNING,
+                )
+                .order_by("-created_at")
+                .first()
+            )
+            if run is None:
+                run = StatementRolloverRun.objects.create(
+                    year=jalali_today.year,
+                    month=jalali_today.month,
+                    chunks_total=len(ranges),
+                )
+            else:
+                run.chunks_total = run.chunks_done + len(ranges)
+                run.save(update_fields=["chunks_total", "updated_at"])
+        return run, ranges
+
+    @staticmethod
+    def perform_month_end_rollover_chunk(
+            run_id, first_user_id, last_user_id
+    ) -> Dict[str, int]:
+        """Roll over one user-id range of a run and record its counts."""
+        run = StatementRolloverRun.objects.get(pk=run_id)
+        counts = Statement.objects.rollover_user_range(
+            first_user_id, last_user_id, JalaliDate(run.year, run.month, 1)
+        )
+        run.record_chunk(counts)
+        return counts
+
+    @staticmethod
+    def complete_month_end_rollover(run_id) -> Dict[str, int]:
+        run = StatementRolloverRun.objects.get(pk=run_id)
+        run.mark_completed()
+        return run.as_result()
+
+    @staticmethod
+    def fail_month_end_rollover(run_id) -> Dict[str, int]:
+        """A chunk gave up: close the run as FAILED so it is not left open."""
+        run = StatementRolloverRun.objects.get(pk=run_id)
+        if run.status == RolloverRunStatus.RUNNING:
+            run.mark_failed()
+        return run.as_result()
+
+    @staticmethod
+    def fail_stale_rollover_runs(now=None) -> int:
+        """
+        Mark RUNNING runs without progress for STATEMENT_ROLLOVER_STALE_HOURS
+        as FAILED; backstop for a lost chord callback or errback.
+        """
+        now = now or timezone.localtime(timezone.now())
+        return StatementRolloverRun.objects.filter(
+            status=RolloverRunStatus.RUNNING,
+            updated_at__lt=now - timedelta(hours=STATEMENT_ROLLOVER_STALE_HOURS),
+        ).update(
+            status=RolloverRunStatus.FAILED, finished_at=now, updated_at=now
+        )
+
+    # ---------- Balance reconciliation ----------
+
+    @staticmethod
+    def reconcile_statement_balances(statuses=None) -> Dict[str, int]:
+        """
+        Detect and repair drift between incrementally maintained statement
+        totals and a full re-aggregation of their lines.
+        """
+        return Statement.objects.reconcile_balances(statuses=statuses)
+
+    @staticmethod
+    def reconcile_used_credit() -> Dict[str, int]:
+        """
+        Recompute every active CreditLimit.used_credit from statements and
+        credit holds and repair drift of the cached counter.
+        """
+        return CreditLimit.objects.reconcile_used_credit()
+
     # ---------- Due-window finalization ----------
 
     @staticmethod
-    @transaction.atomic
-    def finalize_due_windows(now=None) -> FinalizeResult:
+    def finalize_due_windows(
+            now=None,
+            page_size: Optional[int] = None,
+            max_pages: Optional[int] = None,
+    ) -> FinalizeResult:
         """
         For each PENDING_PAYMENT whose due_date has passed:
           1) Ensure there is a CURRENT statement for the user.
@@ -125,70 +243,153 @@ class StatementUseCases:
           3) Decide statement outcome (closed_no_penalty / closed_with_penalty).
           4) If closed_with_penalty: compute penalty on the pending snapshot and add a PENALTY line to CURRENT.
              (Penalty is computed *before* status changes, because compute_penalty_amount depends on status.)
+
+        Works page by page (see _finalize_due_page); each page is its own
+        transaction claimed with skip_locked, so several workers can share the
+        backlog and one run is bounded by max_pages.
         """
         now = now or timezone.localtime(timezone.now())
-
-        pending_candidates = (
-            Statement.objects
-            .select_for_update()
-            .filter(status=StatementStatus.PENDING_PAYMENT, due_date__lt=now)
-            .order_by("user_id", "year", "month")
-        )
+        page_size = page_size or FINALIZE_DUE_PAGE_SIZE
+        max_pages = max_pages or FINALIZE_DUE_MAX_PAGES
 
         finalized_count = 0
         closed_without_penalty_count = 0
         closed_with_penalty_count = 0
 
-        for pending_statement in pending_candidates:
-            current_statement = Statement.objects.get_current_statement(
-                pending_statement.user
+        for _ in range(max_pages):
+            page = StatementUseCases._finalize_due_page(now, page_size)
+            finalized_count += page.finalized_count
+            closed_without_penalty_count += page.closed_without_penalty_count
+            closed_with_penalty_count += page.closed_with_penalty_count
+            if page.finalized_count < page_size:
+                break
+
+        return FinalizeResult(
+            finalized_count=finalized_count,
+            closed_without_penalty_count=closed_without_penalty_count,
+            closed_with_penalty_count=closed_with_penalty_count,
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def _finalize_due_page(now, page_size: int) -> FinalizeResult:
+        """
+        Finalize one page of past-due PENDING_PAYMENT statements:
+        window payments come from one grouped subquery, outcomes and
+        penalties are decided in memory, penalty lines are bulk-inserted,
+        their amounts are folded into the CURRENT statements and used credit
+        with one UPDATE each, and statuses are bulk-updated.
+        """
+        window_payments = (
+            StatementLine.objects
+            .filter(
+                statement__user_id=OuterRef("user_id"),
+                statement__status=StatementStatus.CURRENT,
+                type=StatementLineType.PAYMENT,
+                created_at__gte=OuterRef("closed_at"),
+                created_at__lte=OuterRef("due_date"),
+            )
+            .order_by()
+            .values("statement__user_id")
+            .annotate(total=Sum("amount"))
+            .values("total")
+        )
+        pending_page = list(
+            Statement.objects
+            .select_for_update(skip_locked=True, of=("self",))
+            .filter(status=StatementStatus.PENDING_PAYMENT, due_date__lt=now)
+            .annotate(
+                window_payments=Coalesce(
+                    Subquery(window_payments), 0,
+                    output_field=BigIntegerField(),
+                )
             )
-            if not current_statement:
-                current_statement, _ = Statement.objects.get_or_create_current_statement(
-                    pending_statement.user, starting_balance=0
+            .order_by("due_date", "pk")[:page_size]
+        )
+        if not pending_page:
+            return FinalizeResult(0, 0, 0)
+
+        current_by_user = {
+            stmt.user_id: stmt
+            for stmt in Statement.objects.select_for_update().filter(
+                user_id__in={p.user_id for p in pending_page},
+                status=StatementStatus.CURRENT,
+            )
+        }
+        # Users without a CURRENT (rare) get one; their window sum is 0
+        for pending_statement in pending_page:
+            if pending_statement.user_id not in current_by_user:
+                current_by_user[pending_statement.user_id], _ = (
+                    Statement.objects.get_or_create_current_statement(
+                        pending_statement.user, starting_balance=0
+                    )
                 )
 
-            total_payments_amount = StatementUseCases._sum_payments_on_current_during_window(
-                current_statement=current_statement,
-                start=pending_statement.closed_at,
-                end=pending_statement.due_date,
-            )
+        line_ts = timezone.localtime(timezone.now())
+        penalty_lines = []
+        no_penalty_ids = []
+        with_penalty_ids = []
+        for pending_statement in pending_page:
+            if not (
+                    pending_statement.closed_at and pending_statement.due_date
+                    and pending_statement.due_date > pending_statement.closed_at
+            ):
+                total_payments_amount = 0
+            else:
+                total_payments_amount = int(pending_statement.window_payments)
 
-            # Decide outcome (replicates Statement.determine_due_outcome() decision to know if penalty is needed)
+            # Same decision as Statement.determine_due_outcome(), without a save per row
             minimum_required = pending_statement.calculate_minimum_payment_amount()
             debt_amount = abs(
                 int(pending_statement.closing_balance)
             ) if pending_statement.closing_balance < 0 else 0
-            qualifies_for_penalty = (debt_amount > 0) and (
-                    total_payments_amount < minimum_required)
+            if debt_amount < MINIMUM_PAYMENT_THRESHOLD or (
+                    total_payments_amount >= minimum_required
+            ):
+                no_penalty_ids.append(pending_statement.pk)
+                continue
+            with_penalty_ids.append(pending_statement.pk)
+
+            # Compute before status changes, because compute_penalty_amount checks status
+            penalty_amount = pending_statement.compute_penalty_amount(now=now)
+            if penalty_amount <= 0:
+                continue
+            penalty_lines.append(
+                StatementLine(
+                    statement=current_by_user[pending_statement.user_id],
+                    type=StatementLineType.PENALTY,
+                    amount=-int(penalty_amount),
+                    description=f"Late penalty for {pending_statement.year}/{pending_statement.month:02d}",
+                    created_at=line_ts,
+                    updated_at=line_ts,
+                )
+            )
 
-            if qualifies_for_penalty:
-                # Compute before status changes, because compute_penalty_amount checks status
-                penalty_amount = pending_statement.compute_penalty_amount(
-                    now=now
+        if penalty_lines:
+            StatementLine.objects.bulk_create(penalty_lines)
+            debits = {}
+            for line in penalty_lines:
+                debits[line.statement] = (
+                    debits.get(line.statement, 0) - int(line.amount)
                 )
-                if penalty_amount > 0:
-                    current_statement.add_line(
-                        type_=StatementLineType.PENALTY,
-                        amount=-int(penalty_amount),
-                        description=f"Late penalty for {pending_statement.year}/{pending_statement.month:02d}",
-                    )
+            Statement.objects.apply_debits(debits)
 
-            # Persist the final outcome on the pending snapshot
-            outcome = pending_statement.determine_due_outcome(
-                int(total_payments_amount)
+        closed_at = timezone.localtime(timezone.now())
+        if no_penalty_ids:
+            Statement.objects.filter(pk__in=no_penalty_ids).update(
+                status=StatementStatus.CLOSED_NO_PENALTY,
+                closed_at=closed_at, updated_at=closed_at,
+            )
+        if with_penalty_ids:
+            Statement.objects.filter(pk__in=with_penalty_ids).update(
+                status=StatementStatus.CLOSED_WITH_PENALTY,
+                closed_at=closed_at, updated_at=closed_at,
             )
-
-            finalized_count += 1
-            if outcome == StatementStatus.CLOSED_NO_PENALTY:
-                closed_without_penalty_count += 1
-            else:
-                closed_with_penalty_count += 1
 
         return FinalizeResult(
-            finalized_count=finalized_count,
-            closed_without_penalty_count=closed_without_penalty_count,
-            closed_with_penalty_count=closed_with_penalty_count,
+            finalized_count=len(pending_page),
+            closed_without_penalty_count=len(no_penalty_ids),
+            closed_with_penalty_count=len(with_penalty_ids),
         )
 
     # ---------- Private helpers ----------
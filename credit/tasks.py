@@ -1,6 +1,6 @@
 # credit/tasks.py
 
-from celery import shared_task
+from celery import chord, shared_task
 
 from credit.services.use_cases import StatementUseCases
 
@@ -8,18 +8,84 @@ from credit.services.use_cases import StatementUseCases
 @shared_task(bind=True, max_retries=3, default_retry_delay=300)
 def task_month_end_rollover(self):
     """
-    Close CURRENT statements of past Persian months, create new CURRENT with carry-over,
-    and add monthly interest on negative carry-over.
+    Coordinator: close CURRENT statements of past Persian months, create new
+    CURRENT with carry-over and add monthly interest on negative carry-over.
+    Users are partitioned into id ranges and each range runs as its own
+    task_month_end_rollover_chunk; task_month_end_rollover_complete closes
+    the run once all chunks report, task_month_end_rollover_failed if one
+    gives up. Progress is kept on StatementRolloverRun.
     Safe to run periodically; only affects statements that belong to past months.
     """
     try:
-        result = StatementUseCases.perform_month_end_rollover()
-        # result: {"statements_closed": int, "statements_created": int, "interest_lines_added": int}
+        run, ranges = StatementUseCases.start_month_end_rollover()
+        if run is None:
+            return {
+                "status": "success",
+                "result": {
+                    "statements_closed": 0,
+                    "statements_created": 0,
+                    "interest_lines_added": 0,
+                    "users_failed": 0,
+                },
+            }
+        if len(ranges) == 1:
+            # A single chunk is not worth a round-trip through the broker
+            first_user_id, last_user_id = ranges[0]
+            StatementUseCases.perform_month_end_rollover_chunk(
+                run.pk, first_user_id, last_user_id
+            )
+            result = StatementUseCases.complete_month_end_rollover(run.pk)
+        else:
+            callback = task_month_end_rollover_complete.si(run.pk)
+            # A chunk that exhausts its retries skips the callback; close the
+            # run as FAILED instead of leaving it RUNNING
+            callback.link_error(task_month_end_rollover_failed.si(run.pk))
+            chord(
+                task_month_end_rollover_chunk.si(run.pk, first, last)
+                for first, last in ranges
+            )(callback)
+            run.refresh_from_db()
+            result = run.as_result()
+        # result: {"run_id", "status", "chunks_total", "chunks_done",
+        #          "statements_closed", "statements_created",
+        #          "interest_lines_added", "users_failed"}
         return {"status": "success", "result": result}
     except Exception as exc:
         raise self.retry(exc=exc)
 
 
+@shared_task(bind=True, max_retries=3, default_retry_delay=300)
+def task_month_end_rollover_chunk(self, run_id, first_user_id, last_user_id):
+    """
+    Roll over users in [first_user_id, last_user_id]; one transaction per
+    user, so a retry only picks up users that are still un-rolled.
+    """
+    try:
+        result = StatementUseCases.perform_month_end_rollover_chunk(
+            run_id, first_user_id, last_user_id
+        )
+        return {"status": "success", "result": result}
+    except Exception as exc:
+        raise self.retry(exc=exc)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=300)
+def task_month_end_rollover_complete(self, run_id):
+    """Chord callback: mark the rollover run completed and report totals."""
+    try:
+        result = StatementUseCases.complete_month_end_rollover(run_id)
+        return {"status": "success", "result": result}
+    except Exception as exc:
+        raise self.retry(exc=exc)
+
+
+@shared_task
+def task_month_end_rollover_failed(run_id):
+    """Chord error callback: mark the rollover run failed."""
+    result = StatementUseCases.fail_month_end_rollover(run_id)
+    return {"status": "failed", "result": result}
+
+
 @shared_task(bind=True, max_retries=3, default_retry_delay=300)
 def task_finalize_due_windows(self):
     """
@@ -43,6 +109,34 @@ def task_finalize_due_windows(self):
         raise self.retry(exc=exc)
 
 
+@shared_task(bind=True, max_retries=3, default_retry_delay=300)
+def task_reconcile_statement_balances(self):
+    """
+    Recompute CURRENT statement totals from their lines and repair any drift
+    of the incrementally maintained balances.
+    """
+    try:
+        result = StatementUseCases.reconcile_statement_balances()
+        # result: {"statements_checked": int, "statements_drifted": int}
+        return {"status": "success", "result": result}
+    except Exception as exc:
+        raise self.retry(exc=exc)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=300)
+def task_reconcile_used_credit(self):
+    """
+    Recompute the cached used-credit counter of active credit limits from
+    source and repair any drift.
+    """
+    try:
+        result = StatementUseCases.reconcile_used_credit()
+        # result: {"credit_limits_checked": int, "credit_limits_drifted": int}
+        return {"status": "success", "result": result}
+    except Exception as exc:
+        raise self.retry(exc=exc)
+
+
 @shared_task(bind=True, max_retries=3, default_retry_delay=300)
 def task_daily_credit_maintenance(self):
     """
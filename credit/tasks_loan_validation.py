@@ -10,6 +10,8 @@ from django.utils import timezone
 from credit.models import LoanRiskReport
 from credit.utils.choices import LoanReportStatus
 from kyc.services.identity_auth_service import get_identity_auth_service
+from polling.services import schedule_poll
+from polling.utils.choices import PollKind
 
 logger = logging.getLogger(__name__)
 
@@ -221,11 +223,8 @@ def verify_loan_otp_and_request_report(
             f"Report requested successfully for report {report_id}, unique_id: {new_unique_id}"
         )
 
-        # Automatically trigger checking the result after a delay
-        check_loan_report_result.apply_async(
-            args=[report_id],
-            countdown=10  # Check after 10 seconds
-        )
+        # The polling scheduler checks for the result with backoff
+        schedule_poll(PollKind.LOAN_REPORT, report_id)
 
         return {
             "success": True,
@@ -263,18 +262,11 @@ def verify_loan_otp_and_request_report(
         }
 
 
-@shared_task(bind=True, max_retries=5)
-def check_loan_report_result(self, report_id: int) -> dict:
+def _begin_report_check(report_id: int):
     """
-    Task to check loan validation report result (Stage 3).
-    
-    This task will retry if the report is still processing.
-    
-    Args:
-        report_id: ID of the LoanRiskReport
-        
-    Returns:
-        Dict with success status and report data
+    Check the report still waits for its result. Returns
+    (report_unique_id, None), or (None, result) when there is nothing to
+    poll.
     """
     with transaction.atomic():
         try:
@@ -283,7 +275,7 @@ def check_loan_report_result(self, report_id: int) -> dict:
             )
         except LoanRiskReport.DoesNotExist:
             logger.error(f"LoanRiskReport {report_id} not found")
-            return {"success": False, "error": "report_not_found"}
+            return None, {"success": False, "error": "report_not_found"}
 
         # Validate report state
         if not report.can_check_result():
@@ -291,12 +283,100 @@ def check_loan_report_result(self, report_id: int) -> dict:
             logger.warning(
                 f"Report {report_id} cannot check result: {error_msg}"
             )
-            return {
+            return None, {
                 "success": False,
                 "error": "invalid_report_state",
                 "message": error_msg,
             }
-        report_unique_id = report.report_unique_id
+        return report.report_unique_id, None
+
+
+def _complete_report(report_id: int, result: dict) -> dict:
+    """Store a successful report result."""
+    credit_score = result.get("score")
+    risk_level = result.get("risk")
+    grade_description = result.get("grade_description")
+    report_data = result.get("report_data")
+    report_timestamp = result.get("timestamp")
+
+    # Extract report types if available
+    report_types = report_data.get("reportTypes") if report_data else None
+
+    with transaction.atomic():
+        try:
+            report = LoanRiskReport.objects.select_for_update().get(
+                id=report_id
+            )
+            report.mark_completed(
+                credit_score=credit_score,
+                risk_level=risk_level,
+                grade_description=grade_description,
+                report_data=report_data,
+                report_timestamp=report_timestamp,
+                report_types=report_types
+            )
+        except LoanRiskReport.DoesNotExist:
+            logger.error(
+                "loan.check_result | report_id=%s disappeared before save",
+                report_id
+            )
+            return {
+                "success": False, "error": "report_not_found_after_service"
+            }
+
+    logger.info(
+        "loan.check_result | report_id=%s completed score=%s risk=%s",
+        report_id, credit_score, risk_level
+    )
+    return {
+        "success": True,
+        "report_id": report_id,
+        "credit_score": credit_score,
+        "risk_level": risk_level,
+        "grade_description": grade_description,
+        "message": "گزارش با موفقیت دریافت شد",
+    }
+
+
+def _fail_report(report_id: int, error_msg: str, error_code: str) -> dict:
+    """Permanent failure once polling has given up on the report."""
+    with transaction.atomic():
+        try:
+            report = LoanRiskReport.objects.select_for_update().get(
+                id=report_id
+            )
+            report.mark_failed(error_message=error_msg, error_code=error_code)
+        except LoanRiskReport.DoesNotExist:
+            pass
+    logger.warning(
+        "loan.check_result | report_id=%s failed: %s", report_id, error_msg
+    )
+    return {
+        "success": False,
+        "report_id": report_id,
+        "error": "report_retrieval_failed",
+        "message": error_msg,
+    }
+
+
+@shared_task(bind=True)
+def check_loan_report_result(self, report_id: int) -> dict:
+    """
+    Task to check loan validation report result (Stage 3).
+
+    A report that is still processing is left to the polling scheduler,
+    which checks again with backoff and fails it after
+    LOAN_REPORT_POLL_MAX_ATTEMPTS checks.
+
+    Args:
+        report_id: ID of the LoanRiskReport
+
+    Returns:
+        Dict with success status and report data
+    """
+    report_unique_id, early = _begin_report_check(report_id)
+    if early is not None:
+        return early
 
     # Get report result
     service = get_identity_auth_service()
@@ -305,91 +385,17 @@ def check_loan_report_result(self, report_id: int) -> dict:
             unique_id=report_unique_id
         )
     except Exception as e:
-        # Network error - retry
-        retry_delay = 10  # 10 seconds
-        if self.request.retries < self.max_retries:
-            logger.warning(f"Report {report_id}: Service error, retrying: {e}")
-            raise self.retry(exc=e, countdown=retry_delay)
-
-        logger.error(
-            f"Report {report_id}: Service error after max retries: {e}"
-        )
-        report.mark_failed(error_message=str(e), error_code="SERVICE_ERROR")
-        return {"success": False, "error": "service_error", "message": str(e)}
+        logger.warning(f"Report {report_id}: Service error, polling later: {e}")
+        result = {"success": False, "error": str(e)}
 
-    # Update report based on result
     if result.get("success"):
-        # Report is ready
-        credit_score = result.get("score")
-        risk_level = result.get("risk")
-        grade_description = result.get("grade_description")
-        report_data = result.get("report_data")
-        report_timestamp = result.get("timestamp")
-
-        # Extract report types if available
-        report_types = report_data.get("reportTypes") if report_data else None
-
-        with transaction.atomic():
-            try:
-                report = LoanRiskReport.objects.select_for_update().get(
-                    id=report_id
-                )
-                report.mark_completed(
-                    credit_score=credit_score,
-                    risk_level=risk_level,
-                    grade_description=grade_description,
-                    report_data=report_data,
-                    report_timestamp=report_timestamp,
-                    report_types=report_types
-                )
-            except LoanRiskReport.DoesNotExist:
-                logger.error(
-                    "loan.check_result | report_id=%s disappeared before save",
-                    report_id
-                )
-                return {
-                    "success": False, "error": "report_not_found_after_service"
-                }
-
-        logger.info(
-            "loan.check_result | report_id=%s completed score=%s risk=%s",
-            report_id, credit_score, risk_level
-        )
-        return {
-            "success": True,
-            "report_id": report_id,
-            "credit_score": credit_score,
-            "risk_level": risk_level,
-            "grade_description": grade_description,
-            "message": "گزارش با موفقیت دریافت شد",
-        }
-    else:
-        error_msg = result.get("error", "Failed to get report")
-        error_code = result.get("error_code")
-
-        retry_delay = 10  # 10 seconds
-        if self.request.retries < self.max_retries:
-            logger.info(f"Report {report_id} still processing, will retry")
-            raise self.retry(countdown=retry_delay)
-
-        # Permanent failure after retries
-        with transaction.atomic():
-            try:
-                report = LoanRiskReport.objects.select_for_update().get(
-                    id=report_id
-                )
-                report.mark_failed(
-                    error_message=error_msg,
-                    error_code=error_code or "REPORT_RETRIEVAL_FAILED"
-                )
-            except LoanRiskReport.DoesNotExist:
-                pass
-        logger.warning(
-            "loan.check_result | report_id=%s failed: %s", report_id, error_msg
-        )
-        return {
-            "success": False,
-            "report_id": report.id,
-            "error": "report_retrieval_failed",
-            "message": error_msg,
-        }
+        return _complete_report(report_id, result)
+
+    schedule_poll(PollKind.LOAN_REPORT, report_id)
+    logger.info(f"Report {report_id} still processing, polling later")
+    return {
+        "success": False,
+        "report_id": report_id,
+        "error": "report_pending",
+        "message": result.get("error", "Failed to get report"),
+    }
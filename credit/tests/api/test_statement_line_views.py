@@ -0,0 +1,54 @@
+# credit/tests/api/test_statement_line_views.py
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from credit.models.statement import Statement
+from credit.models.statement_line import StatementLine
+from credit.utils.choices import StatementStatus, StatementLineType
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def auth_client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+class TestStatementLineCursorPagination:
+    url_name = "credit_public_v1:statement-line-list"
+
+    def test_cursor_mode_walks_all_lines_without_count(
+            self, auth_client, user
+    ):
+        stmt = Statement.objects.create(
+            user=user, year=1404, month=1, status=StatementStatus.CURRENT
+        )
+        made = [
+            StatementLine.objects.create(
+                statement=stmt, type=StatementLineType.PURCHASE, amount=100 + i
+            )
+            for i in range(7)
+        ]
+
+        url = reverse(self.url_name)
+        r = auth_client.get(url, {"pagination": "cursor", "page_size": 3})
+        assert r.status_code == 200
+        seen = []
+        while True:
+            data = r.json()
+            assert "count" not in data
+            seen.extend(item["id"] for item in data["results"])
+            if not data["next"]:
+                break
+            r = auth_client.get(data["next"])
+            assert r.status_code == 200
+
+        assert seen == [obj.id for obj in reversed(made)]
+
+    def test_invalid_cursor_returns_404(self, auth_client):
+        r = auth_client.get(reverse(self.url_name), {"cursor": "not-a-cursor"})
+        assert r.status_code == 404
@@ -57,6 +57,37 @@ class TestBalanceMechanics:
         assert stmt.total_credit == 0
         assert stmt.closing_balance == 123_456
 
+    def test_incremental_line_delta_and_void(self, user):
+        today = JalaliDate.today()
+        stmt = Statement.objects.create(
+            user=user, year=today.year, month=today.month,
+            status=StatementStatus.CURRENT, opening_balance=5_000
+        )
+        stmt.add_line(StatementLineType.PURCHASE, 20_000)
+        stmt.add_line(StatementLineType.PAYMENT, 7_000)
+        assert (stmt.total_debit, stmt.total_credit) == (20_000, 7_000)
+        assert stmt.closing_balance == -8_000
+
+        stmt.lines.get(type=StatementLineType.PAYMENT).void(reason="test")
+        stmt.refresh_from_db()
+        assert (stmt.total_debit, stmt.total_credit) == (20_000, 0)
+        assert stmt.closing_balance == -15_000
+        assert stmt.reconcile_balances() is False
+
+    def test_reconcile_detects_and_repairs_drift(self, user):
+        today = JalaliDate.today()
+        stmt = Statement.objects.create(
+            user=user, year=today.year, month=today.month,
+            status=StatementStatus.CURRENT
+        )
+        stmt.add_line(StatementLineType.PURCHASE, 10_000)
+        Statement.objects.filter(pk=stmt.pk).update(closing_balance=0)
+
+        result = Statement.objects.reconcile_balances()
+        stmt.refresh_from_db()
+        assert result == {"statements_checked": 1, "statements_drifted": 1}
+        assert stmt.closing_balance == -10_000
+
 
 class TestManagerGetOrCreateCurrent:
     def test_creates_and_reuses(self, user):
@@ -378,29 +409,7 @@ class TestReferenceCode:
         )
         assert stmt.reference_code is not None
 
-    def test_retries_on_collision(self, monkeypatch, user):
-        today = JalaliDate.today()
-        py, pm = _shift_month(today.year, today.month, -1)
-        Statement.objects.create(
-            user=user, year=py, month=pm, status=StatementStatus.CURRENT,
-            reference_code="ST-DUP"
-        )
-        from credit.models import statement as st_mod
-        calls = {"n": 0}
-
-        def fake_gen(prefix="ST"):
-            calls["n"] += 1
-            return "ST-DUP" if calls["n"] == 1 else "ST-UNIQ"
-
-        monkeypatch.setattr(st_mod, "generate_reference_code", fake_gen)
-        obj = Statement(
-            user=user, year=today.year, month=today.month,
-            status=StatementStatus.CURRENT
-        )
-        obj.save()
-        assert obj.reference_code == "ST-UNIQ"
-
-    def test_five_collisions_then_null(self, monkeypatch, user):
+    def test_collision_raises(self, monkeypatch, user):
         from credit.models import statement as st_mod
         def dup_gen(prefix="ST"): return "ST-DUP"
 
@@ -415,7 +424,8 @@ class TestReferenceCode:
             user=user, year=today.year, month=today.month,
             status=StatementStatus.CURRENT
         )
-        obj.save()
+        with pytest.raises(IntegrityError):
+            obj.save()
         assert obj.reference_code is None
 
 
@@ -650,5 +660,37 @@ class TestManagerCloseMonthlyStatements:
         result = Statement.objects.close_monthly_statements()
         assert result == {
             "statements_closed": 0, "statements_created": 0,
-            "interest_lines_added": 0
+            "interest_lines_added": 0, "users_failed": 0,
+        }
+
+    def test_failing_user_does_not_stop_the_others(
+            self, user_factory, monkeypatch
+    ):
+        today = JalaliDate.today()
+        py, pm = _shift_month(today.year, today.month, -1)
+        broken, healthy = user_factory(), user_factory()
+        for u in (broken, healthy):
+            Statement.objects.create(
+                user=u, year=py, month=pm, status=StatementStatus.CURRENT
+            )
+        original = Statement.close_statement
+
+        def close_statement(self):
+            if self.user_id == broken.id:
+                raise RuntimeError("boom")
+            return original(self)
+
+        monkeypatch.setattr(Statement, "close_statement", close_statement)
+
+        result = Statement.objects.close_monthly_statements()
+
+        assert result == {
+            "statements_closed": 1, "statements_created": 1,
+            "interest_lines_added": 0, "users_failed": 1,
         }
+        assert Statement.objects.get(
+            user=broken, year=py, month=pm
+        ).status == StatementStatus.CURRENT
+        assert Statement.objects.get(
+            user=healthy, year=py, month=pm
+        ).status == StatementStatus.PENDING_PAYMENT
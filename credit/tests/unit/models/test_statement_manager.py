@@ -281,3 +281,48 @@ class TestCloseMonthlyStatements:
         assert prev.status == StatementStatus.PENDING_PAYMENT
         assert prev.closed_at is not None and prev.due_date is not None
         assert (prev.due_date - prev.closed_at).days == 0
+
+
+class TestRolloverChunks:
+    def _past_current(self, user):
+        py, pm = _prev_jalali_year_month()
+        return Statement.objects.create(
+            user=user, year=py, month=pm, status=StatementStatus.CURRENT,
+            opening_balance=0
+        )
+
+    def test_ranges_partition_users_by_id(self, user_factory):
+        users = sorted(
+            (user_factory() for _ in range(5)), key=lambda u: u.pk
+        )
+        for u in users:
+            self._past_current(u)
+
+        ranges = Statement.objects.rollover_user_ranges(chunk_size=2)
+
+        assert ranges == [
+            (users[0].pk, users[1].pk),
+            (users[2].pk, users[3].pk),
+            (users[4].pk, users[4].pk),
+        ]
+
+    def test_failing_user_does_not_undo_the_range(
+            self, user_factory, mocker
+    ):
+        ok_user, bad_user = user_factory(), user_factory()
+        self._past_current(ok_user)
+        self._past_current(bad_user)
+        original = Statement.close_statement
+
+        def close(stmt):
+            if stmt.user_id == bad_user.pk:
+                raise RuntimeError("boom")
+            return original(stmt)
+
+        mocker.patch.object(Statement, "close_statement", close)
+
+        res = Statement.objects.rollover_user_range()
+
+        assert res["statements_closed"] == 1
+        assert res["users_failed"] == 1
+        assert Statement.objects.past_month_current().get().user_id == bad_user.pk
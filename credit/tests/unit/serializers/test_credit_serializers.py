@@ -67,6 +67,7 @@ class TestCreditLimitSerializer:
         stmt = current_statement_factory(user=user, opening_balance=0)
         stmt.add_line(StatementLineType.PURCHASE, 120_000)
         stmt.refresh_from_db()
+        limit.refresh_from_db()
 
         ser = CreditLimitSerializer(limit)
         assert ser.data["available_limit"] == limit.available_limit == 880_000
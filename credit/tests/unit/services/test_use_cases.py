@@ -343,6 +343,39 @@ class TestMonthEndRollover:
             type=StatementLineType.INTEREST
         ).exists()
 
+    def test_month_end_rollover_keeps_carried_debt_in_used_credit(
+            self, user, active_credit_limit_factory, current_statement_factory
+    ):
+        from persiantools.jdatetime import JalaliDate
+        from credit.models import CreditLimit
+
+        limit = active_credit_limit_factory(
+            user=user, is_active=True, expiry_days=30
+        )
+        current_statement = current_statement_factory(user)
+        today = JalaliDate.today()
+        current_statement.year, current_statement.month = (
+            (today.year - 1, 12) if today.month == 1
+            else (today.year, today.month - 1)
+        )
+        current_statement.save(update_fields=["year", "month"])
+        current_statement.add_line(
+            StatementLineType.PURCHASE, 500_000, description="past purchase"
+        )
+
+        StatementUseCases.perform_month_end_rollover()
+
+        new_current = Statement.objects.get(
+            user=user, status=StatementStatus.CURRENT
+        )
+        assert new_current.closing_balance < -500_000
+        limit.refresh_from_db()
+        assert limit.used_credit == limit.compute_used_credit()
+        assert limit.used_credit == -new_current.closing_balance
+        assert CreditLimit.objects.reconcile_used_credit()[
+            "credit_limits_drifted"
+        ] == 0
+
     def test_month_end_rollover_no_interest_when_carryover_non_negative(
             self, user, active_credit_limit_factory, current_statement_factory
     ):
@@ -505,7 +538,7 @@ class TestMonthEndRollover:
         res = StatementUseCases.perform_month_end_rollover()
         assert res == {
             "statements_closed": 0, "statements_created": 0,
-            "interest_lines_added": 0
+            "interest_lines_added": 0, "users_failed": 0,
         }
 
     def test_month_end_rollover_returns_exact_counts_for_one_past_current(
@@ -536,7 +569,7 @@ class TestMonthEndRollover:
         res = StatementUseCases.perform_month_end_rollover()
         assert res == {
             "statements_closed": 1, "statements_created": 1,
-            "interest_lines_added": 1
+            "interest_lines_added": 1, "users_failed": 0,
         }
 
     def test_rollover_interest_amount_exact(
@@ -1250,6 +1283,75 @@ class TestFinalizeCountsMultiUser:
         assert res.closed_with_penalty_count >= 1
 
 
+    def test_finalize_due_windows_pages_are_bounded_by_max_pages(
+            self, user, django_user_model, active_credit_limit_factory
+    ):
+        users = [user] + [
+            django_user_model.objects.create(username=f"pager_{i}", password="x")
+            for i in range(2)
+        ]
+        for u in users:
+            active_credit_limit_factory(user=u, is_active=True, expiry_days=30)
+            TestFinalizeDueWindows()._make_pending_with_due(
+                u, closing_balance=-1_200_000, grace_days=3
+            )
+        now = timezone.localtime(timezone.now()) + dt.timedelta(days=10)
+
+        first = StatementUseCases.finalize_due_windows(
+            now=now, page_size=1, max_pages=2
+        )
+        assert first.finalized_count == 2
+        assert Statement.objects.filter(
+            status=StatementStatus.PENDING_PAYMENT
+        ).count() == 1
+
+        rest = StatementUseCases.finalize_due_windows(now=now, page_size=1)
+        assert rest.finalized_count == 1
+        assert rest.closed_with_penalty_count == 1
+        for u in users:
+            current = Statement.objects.get_current_statement(u)
+            assert current.lines.filter(
+                type=StatementLineType.PENALTY
+            ).count() == 1
+
+    def test_finalize_due_windows_folds_page_penalties_into_balances(
+            self, user, django_user_model, active_credit_limit_factory
+    ):
+        from credit.models import CreditLimit
+
+        users = [user, django_user_model.objects.create(
+            username="penalized_b", password="x"
+        )]
+        for u in users:
+            active_credit_limit_factory(user=u, is_active=True, expiry_days=30)
+            TestFinalizeDueWindows()._make_pending_with_due(
+                u, closing_balance=-1_200_000, grace_days=3
+            )
+        before = {
+            u.pk: CreditLimit.objects.get(user=u, is_active=True).used_credit
+            for u in users
+        }
+        now = timezone.localtime(timezone.now()) + dt.timedelta(days=10)
+
+        res = StatementUseCases.finalize_due_windows(now=now)
+        assert res.closed_with_penalty_count == 2
+
+        for u in users:
+            current = Statement.objects.get_current_statement(u)
+            penalty = current.lines.get(type=StatementLineType.PENALTY)
+            assert current.total_debit == -penalty.amount
+            assert current.closing_balance == (
+                    current.opening_balance + penalty.amount
+            )
+            limit = CreditLimit.objects.get(user=u, is_active=True)
+            assert limit.used_credit == before[u.pk] - penalty.amount
+        assert Statement.objects.reconcile_balances()[
+            "statements_drifted"
+        ] == 0
+        assert CreditLimit.objects.reconcile_used_credit()[
+            "credit_limits_drifted"
+        ] == 0
+
 # ======================================================================
 # Sum helper ignores non-PAYMENT lines
 # ======================================================================
@@ -1303,3 +1405,53 @@ class TestPenaltySign:
         # There may be no penalty if minimum threshold logic disables it; guard accordingly:
         if pen:
             assert pen.amount < 0  # enforced by use-case + StatementLine.save()
+
+
+class TestMonthEndRolloverRuns:
+    def test_open_run_is_reused_instead_of_duplicated(self, mocker):
+        from credit.models import StatementRolloverRun
+
+        mocker.patch.object(
+            Statement.objects, "rollover_user_ranges",
+            return_value=[(1, 10), (11, 20)],
+        )
+        first, _ = StatementUseCases.start_month_end_rollover()
+        StatementRolloverRun.objects.filter(pk=first.pk).update(chunks_done=1)
+
+        second, _ = StatementUseCases.start_month_end_rollover()
+
+        assert second.pk == first.pk
+        assert StatementRolloverRun.objects.count() == 1
+        second.refresh_from_db()
+        assert second.chunks_total == 3
+
+    def test_failed_chunk_closes_run(self, mocker):
+        from credit.utils.choices import RolloverRunStatus
+
+        mocker.patch.object(
+            Statement.objects, "rollover_user_ranges",
+            return_value=[(1, 10), (11, 20)],
+        )
+        run, _ = StatementUseCases.start_month_end_rollover()
+
+        result = StatementUseCases.fail_month_end_rollover(run.pk)
+
+        assert result["status"] == RolloverRunStatus.FAILED
+        again, _ = StatementUseCases.start_month_end_rollover()
+        assert again.pk != run.pk
+
+    def test_stale_running_run_is_failed(self):
+        from credit.models import StatementRolloverRun
+        from credit.utils.choices import RolloverRunStatus
+
+        stale = StatementRolloverRun.objects.create(year=1404, month=1)
+        fresh = StatementRolloverRun.objects.create(year=1404, month=2)
+        StatementRolloverRun.objects.filter(pk=stale.pk).update(
+            updated_at=timezone.now() - dt.timedelta(days=1)
+        )
+
+        assert StatementUseCases.fail_stale_rollover_runs() == 1
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        assert stale.status == RolloverRunStatus.FAILED
+        assert fresh.status == RolloverRunStatus.RUNNING
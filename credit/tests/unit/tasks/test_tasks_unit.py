@@ -31,28 +31,50 @@ class TestTaskMetadata:
 
 
 class TestMonthEndRolloverUnit:
-    def test_success_wraps_usecase_result(self, mocker):
+    def test_nothing_to_roll_returns_zeroes(self, mocker):
         mocked = mocker.patch(
-            "credit.tasks.StatementUseCases.perform_month_end_rollover",
-            return_value={
-                "statements_closed": 2, "statements_created": 1,
-                "interest_lines_added": 1
-            },
+            "credit.tasks.StatementUseCases.start_month_end_rollover",
+            return_value=(None, []),
         )
         out = task_month_end_rollover.apply().result
         mocked.assert_called_once_with()
         assert out == {
             "status": "success",
             "result": {
-                "statements_closed": 2, "statements_created": 1,
-                "interest_lines_added": 1
+                "statements_closed": 0, "statements_created": 0,
+                "interest_lines_added": 0, "users_failed": 0,
             },
         }
 
+    def test_fans_out_one_chunk_task_per_range(self, mocker):
+        run = SimpleNamespace(
+            pk=7, refresh_from_db=lambda: None,
+            as_result=lambda: {"run_id": 7, "chunks_total": 2}
+        )
+        mocker.patch(
+            "credit.tasks.StatementUseCases.start_month_end_rollover",
+            return_value=(run, [(1, 10), (11, 20)]),
+        )
+        chord_spy = mocker.patch("credit.tasks.chord")
+
+        out = task_month_end_rollover.apply().result
+
+        header = list(chord_spy.call_args.args[0])
+        assert [sig.args for sig in header] == [(7, 1, 10), (7, 11, 20)]
+        callback = chord_spy.return_value.call_args.args[0]
+        assert callback.args == (7,)
+        [errback] = callback.options["link_error"]
+        assert errback["task"] == "credit.tasks.task_month_end_rollover_failed"
+        assert tuple(errback["args"]) == (7,)
+        assert out == {
+            "status": "success",
+            "result": {"run_id": 7, "chunks_total": 2},
+        }
+
     def test_exception_triggers_retry(self, mocker):
         boom = RuntimeError("db down")
         mocker.patch(
-            "credit.tasks.StatementUseCases.perform_month_end_rollover",
+            "credit.tasks.StatementUseCases.start_month_end_rollover",
             side_effect=boom,
         )
         retry_spy = mocker.patch.object(
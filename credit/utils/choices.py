@@ -19,6 +19,12 @@ class StatementLineType(models.TextChoices):
     INTEREST = "interest", _("سود")
 
 
+class RolloverRunStatus(models.TextChoices):
+    RUNNING = "running", _("در حال اجرا")
+    COMPLETED = "completed", _("تکمیل شده")
+    FAILED = "failed", _("ناموفق")
+
+
 class LoanReportStatus(models.TextChoices):
     """Status of the loan risk report request."""
     PENDING = 'PENDING', 'در انتظار'
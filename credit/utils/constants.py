@@ -10,6 +10,25 @@ CREDIT_LIMIT_DEFAULT_EXPIRY_DAYS = getattr(
 STATEMENT_GRACE_DAYS = getattr(settings, 'STATEMENT_GRACE_DAYS', 25)
 STATEMENT_PENALTY_RATE = getattr(settings, 'CREDIT_STATEMENT_PENALTY_RATE', 0.02)  # 2% per day
 STATEMENT_MAX_PENALTY_RATE = getattr(settings, 'CREDIT_STATEMENT_MAX_PENALTY_RATE', 0.20)  # 20% max
+# New/voided lines adjust statement totals by their own delta (O(1) per line)
+# instead of re-aggregating every line; drift is caught by the reconcile task.
+STATEMENT_INCREMENTAL_BALANCES = getattr(
+    settings, 'CREDIT_STATEMENT_INCREMENTAL_BALANCES', True
+)
+
+# Month-end rollover fans out one Celery task per range of this many users
+STATEMENT_ROLLOVER_CHUNK_SIZE = getattr(
+    settings, 'CREDIT_STATEMENT_ROLLOVER_CHUNK_SIZE', 1000
+)
+# A RUNNING rollover run with no progress for this long is marked FAILED
+STATEMENT_ROLLOVER_STALE_HOURS = getattr(
+    settings, 'CREDIT_STATEMENT_ROLLOVER_STALE_HOURS', 6
+)
+
+# Due-window finalization claims pending statements in pages (skip_locked);
+# one run handles at most FINALIZE_DUE_MAX_PAGES pages
+FINALIZE_DUE_PAGE_SIZE = getattr(settings, 'CREDIT_FINALIZE_DUE_PAGE_SIZE', 500)
+FINALIZE_DUE_MAX_PAGES = getattr(settings, 'CREDIT_FINALIZE_DUE_MAX_PAGES', 100)
 
 # Penalty
 LATE_FEE_FIXED = getattr(settings, 'LATE_FEE_FIXED', 100_000)
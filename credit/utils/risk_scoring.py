@@ -60,7 +60,7 @@ class RiskScoringEngine:
         # Transaction history (if available)
         try:
             from wallets.models import Transaction
-            transaction_count = Transaction.objects.filter(
+            transaction_count = Transaction.objects.with_archive(
                 models.Q(from_wallet__user=user) | models.Q(
                     to_wallet__user=user
                 ),
@@ -0,0 +1,209 @@
+# kyc/services/async_provider_client.py
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from urllib.parse import urljoin
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .identity_auth_service import IdentityAuthService, parse_shahkar_response
+from .loan_validation_service import parse_report_result_response
+from .video_identity_verification_service import \
+    parse_verification_result_response
+
+logger = logging.getLogger(__name__)
+
+# Endpoint names used for the per-endpoint concurrency limits
+SHAHKAR = "shahkar"
+VIDEO_RESULT = "video_result"
+LOAN_REPORT = "loan_report"
+
+DEFAULT_ENDPOINT_CONCURRENCY = {
+    SHAHKAR: 10,
+    VIDEO_RESULT: 10,
+    LOAN_REPORT: 5,
+}
+
+AUTH_FAILED = {
+    "success": False, "error": "Authentication failed",
+    "error_code": "AUTH_FAILED"
+}
+
+
+class AsyncProviderClient:
+    """
+    asyncio client for the KYC provider, for tasks that poll many profiles
+    at once instead of holding a worker per provider round-trip.
+
+    One pooled httpx connection set is shared by all calls; each endpoint
+    has its own semaphore so a burst on one cannot starve the others or
+    exceed what the provider accepts. The access token is shared too: it
+    comes from IdentityAuthService (same cache and locks as the sync
+    tasks) and only one coroutine fetches or refreshes it at a time.
+    Results have the same shape as the sync service methods.
+
+    Use as `async with AsyncProviderClient() as client:`.
+    """
+
+    def __init__(self, auth_service: Optional[IdentityAuthService] = None):
+        self.base_url = getattr(settings, "KYC_IDENTITY_BASE_URL", "")
+        self.timeout = getattr(settings, "KYC_IDENTITY_TIMEOUT", 30)
+        self.max_connections = getattr(
+            settings, "KYC_ASYNC_MAX_CONNECTIONS", 20
+        )
+        concurrency = {
+            **DEFAULT_ENDPOINT_CONCURRENCY,
+            **getattr(settings, "KYC_ASYNC_ENDPOINT_CONCURRENCY", {}),
+        }
+        self._semaphores = {
+            name: asyncio.Semaphore(limit)
+            for name, limit in concurrency.items()
+        }
+        self._auth = auth_service or IdentityAuthService()
+        self._token = None
+        self._token_lock = asyncio.Lock()
+        self._client = None
+
+    async def __aenter__(self):
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            headers={"User-Agent": "SaeedPay-KYC-Service/1.0"},
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._client.aclose()
+        self._client = None
+
+    # ---------------- plumbing ---------------- #
+
+    def _url(self, path: str) -> str:
+        return urljoin(self.base_url.rstrip("/") + "/", path)
+
+    async def _access_token(self, rejected: str = None) -> Optional[str]:
+        async with self._token_lock:
+            if self._token and self._token != rejected and \
+                    self._auth.tokens.is_fresh(self._token):
+                return self._token
+            if rejected:
+                await sync_to_async(self._auth.invalidate_access_token)(
+                    rejected
+                )
+            self._token, _ = await sync_to_async(
+                self._auth.get_valid_tokens
+            )()
+            return self._token
+
+    async def _send(self, endpoint: str, method: str, path: str,
+                    **kwargs) -> Optional[httpx.Response]:
+        """
+        Authenticated request under the endpoint's semaphore. A 401 gets
+        one retry with a refreshed token; None means no token at all.
+        """
+        token = await self._access_token()
+        if not token:
+            return None
+        for retried in (False, True):
+            async with self._semaphores[endpoint]:
+                response = await self._client.request(
+                    method, self._url(path),
+                    headers={"Authorization": f"Bearer {token}"},
+                    **kwargs
+                )
+            if response.status_code != 401 or retried:
+                return response
+            logger.info(f"{endpoint}: access token rejected, refreshing")
+            token = await self._access_token(rejected=token)
+            if not token:
+                return response
+
+    # ---------------- provider calls ---------------- #
+
+    async def verify_mobile_national_id(
+            self, national_code: str, mobile_number: str
+    ) -> Dict:
+        payload = {
+            "nationalCode": national_code, "mobileNumber": mobile_number
+        }
+        try:
+            response = await self._send(
+                SHAHKAR, "POST", "api/inq/shahkar/verify", json=payload
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Shahkar verification request failed: {e}")
+            return {
+                "success": False,
+                "error": f"Verification request failed: {str(e)}",
+                "error_code": "VERIFICATION_FAILED"
+            }
+        if response is None:
+            return dict(AUTH_FAILED)
+        return parse_shahkar_response(response)
+
+    async def get_video_verification_result(self, unique_id: str) -> Dict:
+        try:
+            response = await self._send(
+                VIDEO_RESULT, "GET", "api/vvs/video/verify/result",
+                params={"uniqueId": unique_id}
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Network error: {e}")
+            return {"success": False, "error": str(e), "status": "network"}
+        if response is None:
+            return dict(AUTH_FAILED)
+        return parse_verification_result_response(response, unique_id)
+
+    async def loan_get_report_result(self, unique_id: str) -> Dict:
+        try:
+            response = await self._send(
+                LOAN_REPORT, "POST", "api/inq/loan-validation/report-json",
+                json={"uniqueId": unique_id}
+            )
+        except httpx.TimeoutException:
+            logger.error("Report retrieval timeout")
+            return {
+                "success": False,
+                "error": "Request timeout",
+                "error_code": "TIMEOUT",
+            }
+        except httpx.HTTPError as e:
+            logger.error(f"Report retrieval request failed: {e}")
+            return {
+                "success": False,
+                "error": f"Network error: {str(e)}",
+                "error_code": "NETWORK_ERROR",
+            }
+        if response is None:
+            return dict(AUTH_FAILED)
+        return parse_report_result_response(response, unique_id)
+
+
+def run_concurrently(
+        call: Callable[[AsyncProviderClient, Any], Awaitable[Dict]],
+        items: Dict[Hashable, Any],
+) -> Dict[Hashable, Any]:
+    """
+    Sync entry point for Celery tasks: run `call(client, value)` for every
+    item on one event loop and one client. Returns {key: result}; a call
+    that raised maps to its exception.
+    """
+    if not items:
+        return {}
+
+    async def _run():
+        async with AsyncProviderClient() as client:
+            keys = list(items)
+            results = await asyncio.gather(
+                *(call(client, items[key]) for key in keys),
+                return_exceptions=True,
+            )
+            return dict(zip(keys, results))
+
+    return asyncio.run(_run())
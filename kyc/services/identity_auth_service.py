@@ -9,14 +9,85 @@ from urllib.parse import urljoin
 import jwt
 import requests
 from django.conf import settings
-from django.core.cache import cache
 
 from .loan_validation_service import LoanValidationService
+from .token_manager import SingleFlightTokenManager
 from .video_identity_verification_service import \
     VideoIdentityVerificationService
 
 logger = logging.getLogger(__name__)
 
+# Headroom on top of the provider timeouts for the token renewal lease
+TOKEN_LEASE_MARGIN_SECONDS = 5
+
+
+def parse_shahkar_response(response) -> Dict:
+    """Map a Shahkar verify response (requests or httpx) to the result dict."""
+    if response.status_code == 200:
+        try:
+            resp_json = response.json()
+            data = resp_json.get("data", {})
+            details = data.get("details", {})
+            is_matched = details.get("isMatched", False)
+
+            return {
+                "success": True,
+                "is_matched": is_matched,
+                "unique_id": resp_json.get("uniqueId"),
+                "message": data.get("message", ""),
+                "raw": resp_json,
+            }
+        except Exception as e:
+            logger.error(
+                f"Invalid JSON in Shahkar success response: {e}"
+            )
+            return {
+                "success": False,
+                "error": "Invalid JSON in success response",
+                "error_code": "INVALID_JSON"
+            }
+
+    elif response.status_code == 400:
+        # Validation errors (e.g., invalid inputs)
+        try:
+            resp_json = response.json()
+            error_obj = resp_json.get("error", {})
+            error_message = error_obj.get("message", "خطای اعتبارسنجی")
+            error_code = error_obj.get("code")
+            logger.warning(
+                f"Shahkar validation error: {error_message} (code: {error_code})"
+            )
+            return {
+                "success": False,
+                "error": error_message,
+                "error_code": f"VALIDATION_ERROR_{error_code}" if error_code else "VALIDATION_ERROR",
+                "status": 400,
+                "is_validation_error": True,
+                "raw": resp_json,
+            }
+        except Exception as e:
+            logger.error(f"Failed to parse 400 error response: {e}")
+            return {
+                "success": False,
+                "error": response.text[
+                    :500] if response.text else "Validation failed",
+                "error_code": "VALIDATION_ERROR",
+                "status": 400,
+                "is_validation_error": True,
+            }
+
+    else:
+        error_body = response.text[:500] if response.text else ""
+        logger.error(
+            f"Shahkar verification failed: HTTP {response.status_code} | Response: {error_body}"
+        )
+        return {
+            "success": False,
+            "error": error_body or "Verification failed",
+            "error_code": "VERIFICATION_FAILED",
+            "status": response.status_code,
+        }
+
 
 class IdentityAuthService:
     """
@@ -37,6 +108,20 @@ class IdentityAuthService:
             settings, "KYC_IDENTITY_TOKEN_SKEW_SECONDS", 30
         )
         self.cache_key_prefix = "kyc_identity_"
+        self.tokens = SingleFlightTokenManager(
+            self.cache_key_prefix,
+            refresh=self._refresh_token,
+            authenticate=self._authenticate,
+            skew_seconds=self.token_skew_seconds,
+            refresh_ahead_seconds=getattr(
+                settings, "KYC_IDENTITY_TOKEN_REFRESH_AHEAD_SECONDS", 120
+            ),
+            # A renewal may try the refresh endpoint and then log in, each
+            # bounded by the request timeout; the lease must outlive both so
+            # nobody starts a second renewal, and waiters outlive the lease.
+            lease_seconds=2 * self.timeout + TOKEN_LEASE_MARGIN_SECONDS,
+            wait_seconds=2 * self.timeout + 2 * TOKEN_LEASE_MARGIN_SECONDS,
+        )
         self.video_verification = VideoIdentityVerificationService()
         self.loan_validation = LoanValidationService(self.base_url, self.timeout)
 
@@ -55,34 +140,7 @@ class IdentityAuthService:
                 "(base_url/username/password)"
             )
 
-    # ---------------- cache utils ---------------- #
-
-    def _get_cache_key(self, key_suffix: str) -> str:
-        return f"{self.cache_key_prefix}{key_suffix}"
-
-    def _cache_token_with_exp(
-            self, key_suffix: str, token: str, default_ttl: int
-    ) -> None:
-        if not token:
-            return
-        ttl = default_ttl
-        try:
-            decoded = jwt.decode(
-                token, options={
-                    "verify_signature": False, "verify_exp": False
-                }
-            )
-            exp_ts = decoded.get("exp")
-            if exp_ts:
-                now_ts = int(time.time())
-                ttl = max(
-                    int(exp_ts) - now_ts - int(self.token_skew_seconds), 0
-                )
-        except Exception:
-            pass
-        cache.set(
-            self._get_cache_key(key_suffix), token, timeout=ttl or default_ttl
-        )
+    # ---------------- token utils ---------------- #
 
     def _is_token_valid(self, token: str, token_type: str = "access") -> bool:
         if not token:
@@ -128,14 +186,6 @@ class IdentityAuthService:
             refresh_token = data.get("refreshToken") or data.get(
                 "refresh_token"
             )
-            if access_token:
-                self._cache_token_with_exp(
-                    "access_token", access_token, default_ttl=3600
-                )
-            if refresh_token:
-                self._cache_token_with_exp(
-                    "refresh_token", refresh_token, default_ttl=86400
-                )
             if access_token or refresh_token:
                 logger.info(
                     f"Successfully completed {context} with KYC Identity service"
@@ -185,64 +235,11 @@ class IdentityAuthService:
         )
 
     def get_valid_tokens(self) -> Tuple[Optional[str], Optional[str]]:
-        access_token = cache.get(self._get_cache_key("access_token"))
-        refresh_token = cache.get(self._get_cache_key("refresh_token"))
-
-        if access_token and self._is_token_valid(access_token, "access"):
-            return access_token, refresh_token
-
-        if refresh_token and self._is_token_valid(refresh_token, "refresh"):
-            # basic cache lock to avoid thundering herd
-            lock_key = self._get_cache_key("refresh_lock")
-            got_lock = cache.add(lock_key, str(time.time()), timeout=10)
-            if got_lock:
-                try:
-                    logger.info("Access token expired, attempting refresh")
-                    new_access_token, new_refresh_token = self._refresh_token(
-                        refresh_token, access_token
-                    )
-                    if new_access_token:
-                        return new_access_token, (
-                                new_refresh_token or refresh_token)
-                finally:
-                    cache.delete(lock_key)
-            else:
-                # wait briefly for other worker to refresh
-                for _ in range(3):
-                    time.sleep(0.25)
-                    access_token = cache.get(
-                        self._get_cache_key("access_token")
-                    )
-                    if access_token and self._is_token_valid(
-                            access_token, "access"
-                    ):
-                        return access_token, cache.get(
-                            self._get_cache_key("refresh_token")
-                        )
-
-        # authenticate as last resort
-        auth_lock_key = self._get_cache_key("auth_lock")
-        got_auth_lock = cache.add(auth_lock_key, str(time.time()), timeout=10)
-        if got_auth_lock:
-            try:
-                logger.info(
-                    "Refresh failed or no valid tokens, re-authenticating"
-                )
-                return self._authenticate()
-            finally:
-                cache.delete(auth_lock_key)
-        else:
-            for _ in range(3):
-                time.sleep(0.25)
-                access_token = cache.get(self._get_cache_key("access_token"))
-                if access_token and self._is_token_valid(
-                        access_token, "access"
-                ):
-                    return access_token, cache.get(
-                        self._get_cache_key("refresh_token")
-                    )
-
-        return None, None
+        """
+        Cached (access, refresh) tokens, renewed single-flight across
+        workers by SingleFlightTokenManager; (None, None) on failure.
+        """
+        return self.tokens.get_tokens()
 
     # ---------------- public KYC methods ---------------- #
 
@@ -272,9 +269,8 @@ class IdentityAuthService:
                 logger.info(
                     "Access token unauthorized (401). Attempting token refresh and retrying verification."
                 )
-                new_access_token, _ = self._refresh_token(
-                    refresh_token, access_token
-                )
+                self.tokens.invalidate(access_token)
+                new_access_token, _ = self.get_valid_tokens()
                 if new_access_token:
                     response = _make_verification_request(new_access_token)
 
@@ -328,6 +324,7 @@ class IdentityAuthService:
             rand_action,
             matching_thr=None,
             liveness_thr=None,
+            selfie_video_key=None,
     ):
         """Proxy for video-based identity verification using a valid access token."""
         access_token, _ = self.get_valid_tokens()
@@ -348,6 +345,7 @@ class IdentityAuthService:
             access_token=access_token,
             matching_thr=matching_thr,
             liveness_thr=liveness_thr,
+            selfie_video_key=selfie_video_key,
         )
 
     def get_video_verification_result(self, unique_id):
@@ -396,70 +394,7 @@ class IdentityAuthService:
                 verify_url, json=payload, headers=headers, timeout=self.timeout
             )
 
-            if response.status_code == 200:
-                try:
-                    resp_json = response.json()
-                    data = resp_json.get("data", {})
-                    details = data.get("details", {})
-                    is_matched = details.get("isMatched", False)
-
-                    return {
-                        "success": True,
-                        "is_matched": is_matched,
-                        "unique_id": resp_json.get("uniqueId"),
-                        "message": data.get("message", ""),
-                        "raw": resp_json,
-                    }
-                except Exception as e:
-                    logger.error(
-                        f"Invalid JSON in Shahkar success response: {e}"
-                    )
-                    return {
-                        "success": False,
-                        "error": "Invalid JSON in success response",
-                        "error_code": "INVALID_JSON"
-                    }
-
-            elif response.status_code == 400:
-                # Validation errors (e.g., invalid inputs)
-                try:
-                    resp_json = response.json()
-                    error_obj = resp_json.get("error", {})
-                    error_message = error_obj.get("message", "خطای اعتبارسنجی")
-                    error_code = error_obj.get("code")
-                    logger.warning(
-                        f"Shahkar validation error: {error_message} (code: {error_code})"
-                    )
-                    return {
-                        "success": False,
-                        "error": error_message,
-                        "error_code": f"VALIDATION_ERROR_{error_code}" if error_code else "VALIDATION_ERROR",
-                        "status": 400,
-                        "is_validation_error": True,
-                        "raw": resp_json,
-                    }
-                except Exception as e:
-                    logger.error(f"Failed to parse 400 error response: {e}")
-                    return {
-                        "success": False,
-                        "error": response.text[
-                            :500] if response.text else "Validation failed",
-                        "error_code": "VALIDATION_ERROR",
-                        "status": 400,
-                        "is_validation_error": True,
-                    }
-
-            else:
-                error_body = response.text[:500] if response.text else ""
-                logger.error(
-                    f"Shahkar verification failed: HTTP {response.status_code} | Response: {error_body}"
-                )
-                return {
-                    "success": False,
-                    "error": error_body or "Verification failed",
-                    "error_code": "VERIFICATION_FAILED",
-                    "status": response.status_code,
-                }
+            return parse_shahkar_response(response)
         except requests.exceptions.RequestException as e:
             logger.error(f"Shahkar verification request failed: {e}")
             return {
@@ -477,9 +412,17 @@ class IdentityAuthService:
 
     def clear_tokens(self) -> None:
         """Clear cached tokens (useful for logout or service restart)."""
-        cache.delete(self._get_cache_key("access_token"))
-        cache.delete(self._get_cache_key("refresh_token"))
+        self.tokens.clear()
         logger.info("KYC Identity tokens cleared from cache")
+
+    def invalidate_access_token(self, access_token: str) -> None:
+        """
+        Drop a cached access token the provider rejected (401), so the next
+        get_valid_tokens() refreshes it. A token another worker has already
+        replaced is left alone.
+        """
+        self.tokens.invalidate(access_token)
+
     # Loan Validation Service Methods (with automatic token management)
     def loan_send_otp(self, national_code: str, mobile_number: str) -> Dict:
         """
@@ -8,6 +8,99 @@ from urllib.parse import urljoin
 logger = logging.getLogger(__name__)
 
 
+def parse_report_result_response(response, unique_id: str) -> Dict:
+    """Map a report-json response (requests or httpx) to the result dict."""
+    try:
+        resp_json = response.json()
+    except Exception as e:
+        logger.error(f"Invalid JSON in report result response: {e}")
+        return {
+            "success": False,
+            "error": "Invalid response format",
+            "error_code": "INVALID_JSON",
+        }
+
+    if response.status_code == 200:
+        data = resp_json.get("data", {})
+        error_obj = resp_json.get("error")
+
+        if error_obj:
+            # Error in response body
+            error_message = error_obj.get("message", "Failed to retrieve report")
+            error_code = error_obj.get("code")
+
+            logger.warning(f"Report retrieval error: {error_message} (code: {error_code})")
+            return {
+                "success": False,
+                "error": error_message,
+                "error_code": error_code or "REPORT_RETRIEVAL_FAILED",
+                "raw": resp_json,
+            }
+
+        # Success case - extract report data
+        details = data.get("details", {})
+        json_data = details.get("jsonData", {})
+        score_data = json_data.get("score", {})
+        person_info = score_data.get("personInformation", {})
+
+        credit_score = score_data.get("score")
+        risk_level = score_data.get("risk")
+        grade_description = person_info.get("gradeDescription")
+
+        logger.info(
+            f"Report retrieved successfully: unique_id={unique_id}, "
+            f"score={credit_score}, risk={risk_level}"
+        )
+
+        return {
+            "success": True,
+            "report_data": json_data,
+            "score": credit_score,
+            "risk": risk_level,
+            "grade_description": grade_description,
+            "person_info": person_info,
+            "score_codes": score_data.get("scoreCodes", []),
+            "message": data.get("message", "Report retrieved successfully"),
+            "unique_id": resp_json.get("uniqueId"),
+            "timestamp": resp_json.get("timestamp"),
+            "raw": resp_json,
+        }
+
+    elif response.status_code == 400:
+        # Handle validation errors
+        try:
+            error_obj = resp_json.get("error", {})
+            error_message = error_obj.get("message", "Validation error")
+            error_code = error_obj.get("code")
+
+            logger.warning(f"Report result validation error: {error_message} (code: {error_code})")
+            return {
+                "success": False,
+                "error": error_message,
+                "error_code": error_code or "VALIDATION_ERROR",
+                "status": 400,
+                "is_validation_error": True,
+                "raw": resp_json,
+            }
+        except Exception:
+            return {
+                "success": False,
+                "error": response.text[:500] if response.text else "Validation failed",
+                "error_code": "VALIDATION_ERROR",
+                "status": 400,
+            }
+    else:
+        error_body = response.text[:500] if response.text else ""
+        logger.error(f"Report retrieval failed: HTTP {response.status_code} | {error_body}")
+        return {
+            "success": False,
+            "error": error_body or "Failed to retrieve report",
+            "error_code": "SERVICE_ERROR",
+            "status": response.status_code,
+        }
+
+
+
 class LoanValidationService:
     """
     Service for loan validation and credit scoring through external KYC provider.
@@ -337,95 +430,7 @@ class LoanValidationService:
                 url, json=payload, headers=headers, timeout=self.timeout
             )
 
-            try:
-                resp_json = response.json()
-            except Exception as e:
-                logger.error(f"Invalid JSON in report result response: {e}")
-                return {
-                    "success": False,
-                    "error": "Invalid response format",
-                    "error_code": "INVALID_JSON",
-                }
-
-            if response.status_code == 200:
-                data = resp_json.get("data", {})
-                error_obj = resp_json.get("error")
-                
-                if error_obj:
-                    # Error in response body
-                    error_message = error_obj.get("message", "Failed to retrieve report")
-                    error_code = error_obj.get("code")
-                    
-                    logger.warning(f"Report retrieval error: {error_message} (code: {error_code})")
-                    return {
-                        "success": False,
-                        "error": error_message,
-                        "error_code": error_code or "REPORT_RETRIEVAL_FAILED",
-                        "raw": resp_json,
-                    }
-                
-                # Success case - extract report data
-                details = data.get("details", {})
-                json_data = details.get("jsonData", {})
-                score_data = json_data.get("score", {})
-                person_info = score_data.get("personInformation", {})
-                
-                credit_score = score_data.get("score")
-                risk_level = score_data.get("risk")
-                grade_description = person_info.get("gradeDescription")
-                
-                logger.info(
-                    f"Report retrieved successfully: unique_id={unique_id}, "
-                    f"score={credit_score}, risk={risk_level}"
-                )
-                
-                return {
-                    "success": True,
-                    "report_data": json_data,
-                    "score": credit_score,
-                    "risk": risk_level,
-                    "grade_description": grade_description,
-                    "person_info": person_info,
-                    "score_codes": score_data.get("scoreCodes", []),
-                    "message": data.get("message", "Report retrieved successfully"),
-                    "unique_id": resp_json.get("uniqueId"),
-                    "timestamp": resp_json.get("timestamp"),
-                    "raw": resp_json,
-                }
-            
-            elif response.status_code == 400:
-                # Handle validation errors
-                try:
-                    error_obj = resp_json.get("error", {})
-                    error_message = error_obj.get("message", "Validation error")
-                    error_code = error_obj.get("code")
-                    
-                    logger.warning(f"Report result validation error: {error_message} (code: {error_code})")
-                    return {
-                        "success": False,
-                        "error": error_message,
-                        "error_code": error_code or "VALIDATION_ERROR",
-                        "status": 400,
-                        "is_validation_error": True,
-                        "raw": resp_json,
-                    }
-                except Exception:
-                    return {
-                        "success": False,
-                        "error": response.text[:500] if response.text else "Validation failed",
-                        "error_code": "VALIDATION_ERROR",
-                        "status": 400,
-                    }
-            else:
-                error_body = response.text[:500] if response.text else ""
-                logger.error(f"Report retrieval failed: HTTP {response.status_code} | {error_body}")
-                return {
-                    "success": False,
-                    "error": error_body or "Failed to retrieve report",
-                    "error_code": "SERVICE_ERROR",
-                    "status": response.status_code,
-                }
-
+            return parse_report_result_response(response, unique_id)
         except requests.exceptions.Timeout:
             logger.error("Report retrieval timeout")
             return {
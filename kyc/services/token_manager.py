@@ -0,0 +1,211 @@
+# kyc/services/token_manager.py
+
+import logging
+import time
+import uuid
+from typing import Callable, Optional, Tuple
+
+import jwt
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+Tokens = Tuple[Optional[str], Optional[str]]
+
+
+def token_expiry(token: str) -> Optional[int]:
+    """`exp` claim of a JWT (unverified); None when it has none."""
+    decoded = jwt.decode(
+        token, options={"verify_signature": False, "verify_exp": False}
+    )
+    exp = decoded.get("exp")
+    return int(exp) if exp else None
+
+
+class SingleFlightTokenManager:
+    """
+    Provider tokens shared by all workers through the Django cache, with
+    at most one worker talking to the token endpoint at a time.
+
+    - A token within `refresh_ahead_seconds` of expiry is refreshed by the
+      first caller that takes the lease; everybody else keeps using the
+      still-valid token meanwhile, so rollover never blocks requests.
+    - Without a usable token, the lease holder refreshes (or logs in) and
+      the other callers poll the cache for its result instead of calling
+      the provider themselves.
+    - The lease is a cache key with a short TTL, so a crashed refresher
+      only holds the others up for `lease_seconds`. A failed refresh is
+      remembered for `failure_backoff_seconds` so waiters give up together
+      instead of retrying the login one after another.
+
+    `refresh(refresh_token, access_token)` and `authenticate()` do the
+    network calls and return (access, refresh); storing is done here.
+    """
+    poll_interval = 0.1
+
+    def __init__(
+            self,
+            cache_key_prefix: str,
+            refresh: Callable[[str, Optional[str]], Tokens],
+            authenticate: Callable[[], Tokens],
+            *,
+            skew_seconds: int = 30,
+            refresh_ahead_seconds: int = 120,
+            lease_seconds: int = 10,
+            wait_seconds: int = 15,
+            failure_backoff_seconds: int = 5,
+    ):
+        self.cache_key_prefix = cache_key_prefix
+        self._refresh = refresh
+        self._authenticate = authenticate
+        self.skew_seconds = int(skew_seconds)
+        self.refresh_ahead_seconds = int(refresh_ahead_seconds)
+        self.lease_seconds = int(lease_seconds)
+        self.wait_seconds = wait_seconds
+        self.failure_backoff_seconds = failure_backoff_seconds
+
+    # ---------------- cache ---------------- #
+
+    def _key(self, suffix: str) -> str:
+        return f"{self.cache_key_prefix}{suffix}"
+
+    def cached(self) -> Tokens:
+        return (
+            cache.get(self._key("access_token")),
+            cache.get(self._key("refresh_token")),
+        )
+
+    def _ttl(self, token: str, default_ttl: int) -> int:
+        try:
+            exp = token_expiry(token)
+        except jwt.InvalidTokenError:
+            return default_ttl
+        if not exp:
+            return default_ttl
+        return max(exp - int(time.time()) - self.skew_seconds, 1)
+
+    def store(self, access_token: str = None, refresh_token: str = None):
+        if access_token:
+            cache.set(
+                self._key("access_token"), access_token,
+                timeout=self._ttl(access_token, 3600)
+            )
+        if refresh_token:
+            cache.set(
+                self._key("refresh_token"), refresh_token,
+                timeout=self._ttl(refresh_token, 86400)
+            )
+
+    def invalidate(self, access_token: str) -> None:
+        """Drop a rejected access token unless it was already replaced."""
+        key = self._key("access_token")
+        if cache.get(key) == access_token:
+            cache.delete(key)
+
+    def clear(self) -> None:
+        cache.delete_many([
+            self._key("access_token"), self._key("refresh_token")
+        ])
+
+    # ---------------- validity ---------------- #
+
+    def _seconds_left(self, token: str, now: float) -> Optional[float]:
+        """Seconds until `exp - skew`; inf without exp, None if unusable."""
+        if not token:
+            return None
+        try:
+            exp = token_expiry(token)
+        except jwt.InvalidTokenError as e:
+            logger.warning(f"Invalid cached provider token: {e}")
+            return None
+        if not exp:
+            return float("inf")
+        left = exp - self.skew_seconds - now
+        return left if left > 0 else None
+
+    def is_fresh(self, access_token: str) -> bool:
+        """Usable and not yet due for the proactive refresh."""
+        left = self._seconds_left(access_token, time.time())
+        return left is not None and left > self.refresh_ahead_seconds
+
+    # ---------------- lease ---------------- #
+
+    def _acquire(self) -> Optional[str]:
+        lease = uuid.uuid4().hex
+        if cache.add(self._key("token_lease"), lease, self.lease_seconds):
+            return lease
+        return None
+
+    def _release(self, lease: str) -> None:
+        key = self._key("token_lease")
+        if cache.get(key) == lease:
+            cache.delete(key)
+
+    # ---------------- public ---------------- #
+
+    def get_tokens(self) -> Tokens:
+        access, refresh = self.cached()
+        if self.is_fresh(access):
+            return access, refresh
+        if self._seconds_left(access, time.time()) is not None:
+            # Soft expiry: one caller renews ahead of time, the rest go on
+            # with the current token.
+            lease = self._acquire()
+            if lease:
+                try:
+                    logger.info("Provider token near expiry, renewing")
+                    renewed = self._renew(access, refresh)
+                finally:
+                    self._release(lease)
+                if renewed[0]:
+                    return renewed
+            return access, refresh
+
+        deadline = time.monotonic() + self.wait_seconds
+        while True:
+            lease = self._acquire()
+            if lease:
+                try:
+                    # Another worker may have finished just before this one
+                    # got the lease.
+                    access, refresh = self.cached()
+                    if self._seconds_left(access, time.time()) is not None:
+                        return access, refresh
+                    logger.info("No valid provider token, renewing")
+                    return self._renew(access, refresh)
+                finally:
+                    self._release(lease)
+
+            tokens = self._wait_for_refresher(deadline)
+            if tokens[0] or time.monotonic() >= deadline:
+                return tokens
+            if cache.get(self._key("token_failure")):
+                return None, None
+
+    def _wait_for_refresher(self, deadline: float) -> Tokens:
+        """Poll for the lease holder's token until it finishes or gives up."""
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            access, refresh = self.cached()
+            if self._seconds_left(access, time.time()) is not None:
+                return access, refresh
+            if cache.get(self._key("token_lease")) is None:
+                break
+        return None, None
+
+    def _renew(self, access: Optional[str], refresh: Optional[str]) -> Tokens:
+        if cache.get(self._key("token_failure")):
+            return None, None
+        new_access, new_refresh = None, None
+        if self._seconds_left(refresh, time.time()) is not None:
+            new_access, new_refresh = self._refresh(refresh, access)
+        if not new_access:
+            new_access, new_refresh = self._authenticate()
+        if not new_access:
+            cache.set(
+                self._key("token_failure"), 1, self.failure_backoff_seconds
+            )
+            return None, None
+        new_refresh = new_refresh or refresh
+        self.store(new_access, new_refresh)
+        return new_access, new_refresh
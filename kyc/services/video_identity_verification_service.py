@@ -2,15 +2,142 @@
 
 import logging
 import os
+import uuid
 from typing import Optional, Dict, Any
 from urllib.parse import urljoin
 
 import requests
 from django.conf import settings
 
+from kyc.utils.video_blob import get_video_storage
+
 logger = logging.getLogger(__name__)
 
 
+def parse_verification_result_response(response, unique_id: str) -> Dict:
+    """Map a video result response (requests or httpx) to the result dict."""
+    if response.status_code == 200:
+        try:
+            resp_json = response.json()
+            data = resp_json.get("data", {})
+            details = data.get("details", {})
+
+            # Extract verification status
+            verify_status = details.get("verifyStatus")
+
+            # If still in progress, return not ready
+            if verify_status == "IN_PROGRESS":
+                return {
+                    "success": False,
+                    "status": "in_progress",
+                    "error": "Verification still in progress",
+                    "raw": resp_json,
+                }
+
+            # Extract verification details
+            return {
+                "success": True,
+                "matching": details.get("matching"),
+                "liveness": details.get("liveness"),
+                "spoofing": details.get("spoofing"),
+                "spoofingDoubleCheck": details.get(
+                    "spoofingDoubleCheck"
+                ),
+                "verifyStatus": verify_status,
+                "verifyStatusMsg": details.get("verifyStatusMsg"),
+                "reason": details.get("reason", []),
+                "raw": resp_json,
+            }
+        except Exception as e:
+            logger.error(f"Invalid JSON in success response: {e}")
+            return {
+                "success": False,
+                "error": "Invalid JSON in success response",
+                "status": "parse_error",
+            }
+    elif response.status_code == 404:
+        # Result not yet available
+        logger.info(
+            f"Verification result not yet available for {unique_id}"
+        )
+        return {
+            "success": False,
+            "error": "Result not yet available",
+            "status": 404,
+        }
+    elif response.status_code == 202:
+        retry_after = response.headers.get("Retry-After")
+        return {
+            "success": False,
+            "status": "in_progress",
+            "error": "Verification still in progress",
+            "retry_after": retry_after,
+        }
+    else:
+        try:
+            err_json = response.json()
+            logger.error(
+                f"Unexpected status {response.status_code}: {err_json}"
+            )
+            return {
+                "success": False,
+                "error": err_json,
+                "status": response.status_code,
+            }
+        except Exception:
+            logger.error(
+                f"Unexpected status {response.status_code}: {response.text}"
+            )
+            return {
+                "success": False,
+                "error": response.text,
+                "status": response.status_code,
+            }
+
+
+class MultipartFileStream:
+    """
+    multipart/form-data body that yields the file in chunks instead of
+    building the whole request in memory. Its length is known up front, so
+    requests sends a Content-Length rather than chunked encoding.
+    """
+    chunk_size = 256 * 1024
+
+    def __init__(self, fields, file_field, filename, fileobj, size,
+                 content_type="video/mp4"):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        parts = []
+        for name, value in fields.items():
+            parts.append(
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n"
+            )
+        parts.append(
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{file_field}"; '
+            f'filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        self.head = "".join(parts).encode("utf-8")
+        self.tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self.fileobj = fileobj
+        self.size = size
+
+    def __len__(self):
+        return len(self.head) + self.size + len(self.tail)
+
+    def __iter__(self):
+        yield self.head
+        while True:
+            chunk = self.fileobj.read(self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        yield self.tail
+
+
 class VideoIdentityVerificationService:
     """
     Service for handling video-based identity verification via external API.
@@ -30,22 +157,25 @@ class VideoIdentityVerificationService:
             self,
             national_code: str,
             birth_date: str,
-            selfie_video_path: str,
+            selfie_video_path: Optional[str],
             rand_action: str,
             access_token: str,
             matching_thr: Optional[int] = None,
             liveness_thr: Optional[int] = None,
+            selfie_video_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Send video-based identity verification request.
         Args:
             national_code: National ID number
             birth_date: Date of birth (YYYYMMDD format)
-            selfie_video_path: Path to selfie video file
+            selfie_video_path: Path to a local selfie video file, or None
             rand_action: Random action string
             access_token: Bearer token for authentication
             matching_thr: (optional) facial matching threshold
             liveness_thr: (optional) liveness threshold
+            selfie_video_key: (optional) key of the video in the shared
+                upload storage; streamed to the provider without a local copy
         Returns:
             Dict with API response or error info
         """
@@ -57,19 +187,30 @@ class VideoIdentityVerificationService:
                 "status": "validation_error"
             }
 
-        if not selfie_video_path or not selfie_video_path.strip():
-            logger.error("Selfie video file path is empty or None")
-            return {
-                "success": False, "error": "selfie_video_file_path_empty",
-                "status": "validation_error"
-            }
+        if selfie_video_key:
+            storage = get_video_storage()
+            if not storage.exists(selfie_video_key):
+                logger.error(f"Selfie video blob not found: {selfie_video_key}")
+                return {
+                    "success": False, "error": "selfie_video_file_not_found",
+                    "status": "file_error"
+                }
+        else:
+            if not selfie_video_path or not selfie_video_path.strip():
+                logger.error("Selfie video file path is empty or None")
+                return {
+                    "success": False, "error": "selfie_video_file_path_empty",
+                    "status": "validation_error"
+                }
 
-        if not os.path.exists(selfie_video_path):
-            logger.error(f"Selfie video file not found: {selfie_video_path}")
-            return {
-                "success": False, "error": "selfie_video_file_not_found",
-                "status": "file_error"
-            }
+            if not os.path.exists(selfie_video_path):
+                logger.error(
+                    f"Selfie video file not found: {selfie_video_path}"
+                )
+                return {
+                    "success": False, "error": "selfie_video_file_not_found",
+                    "status": "file_error"
+                }
 
         # Prepare request
         url = urljoin(
@@ -90,17 +231,21 @@ class VideoIdentityVerificationService:
             data["livenessTHR"] = str(liveness_thr)
 
         try:
-            with open(selfie_video_path, "rb") as video_file:
-
-                files = {
-                    "selfieVideo": (
-                        os.path.basename(selfie_video_path),
-                        video_file,
-                        "video/mp4",
-                    )
-                }
+            if selfie_video_key:
+                video_file = storage.open(selfie_video_key, "rb")
+                video_size = storage.size(selfie_video_key)
+                filename = os.path.basename(selfie_video_key)
+            else:
+                video_file = open(selfie_video_path, "rb")
+                video_size = os.path.getsize(selfie_video_path)
+                filename = os.path.basename(selfie_video_path)
+            with video_file:
+                body = MultipartFileStream(
+                    data, "selfieVideo", filename, video_file, video_size
+                )
                 response = self.session.post(
-                    url, data=data, files=files, headers=headers,
+                    url, data=body,
+                    headers={**headers, "Content-Type": body.content_type},
                     timeout=self.timeout
                 )
             if response.status_code == 200:
@@ -173,83 +318,7 @@ class VideoIdentityVerificationService:
             response = self.session.get(
                 url, headers=headers, params=params, timeout=self.timeout
             )
-            if response.status_code == 200:
-                try:
-                    resp_json = response.json()
-                    data = resp_json.get("data", {})
-                    details = data.get("details", {})
-
-                    # Extract verification status
-                    verify_status = details.get("verifyStatus")
-
-                    # If still in progress, return not ready
-                    if verify_status == "IN_PROGRESS":
-                        return {
-                            "success": False,
-                            "status": "in_progress",
-                            "error": "Verification still in progress",
-                            "raw": resp_json,
-                        }
-
-                    # Extract verification details
-                    return {
-                        "success": True,
-                        "matching": details.get("matching"),
-                        "liveness": details.get("liveness"),
-                        "spoofing": details.get("spoofing"),
-                        "spoofingDoubleCheck": details.get(
-                            "spoofingDoubleCheck"
-                        ),
-                        "verifyStatus": verify_status,
-                        "verifyStatusMsg": details.get("verifyStatusMsg"),
-                        "reason": details.get("reason", []),
-                        "raw": resp_json,
-                    }
-                except Exception as e:
-                    logger.error(f"Invalid JSON in success response: {e}")
-                    return {
-                        "success": False,
-                        "error": "Invalid JSON in success response",
-                        "status": "parse_error",
-                    }
-            elif response.status_code == 404:
-                # Result not yet available
-                logger.info(
-                    f"Verification result not yet available for {unique_id}"
-                )
-                return {
-                    "success": False,
-                    "error": "Result not yet available",
-                    "status": 404,
-                }
-            elif response.status_code == 202:
-                retry_after = response.headers.get("Retry-After")
-                return {
-                    "success": False,
-                    "status": "in_progress",
-                    "error": "Verification still in progress",
-                    "retry_after": retry_after,
-                }
-            else:
-                try:
-                    err_json = response.json()
-                    logger.error(
-                        f"Unexpected status {response.status_code}: {err_json}"
-                    )
-                    return {
-                        "success": False,
-                        "error": err_json,
-                        "status": response.status_code,
-                    }
-                except Exception:
-                    logger.error(
-                        f"Unexpected status {response.status_code}: {response.text}"
-                    )
-                    return {
-                        "success": False,
-                        "error": response.text,
-                        "status": response.status_code,
-                    }
+            return parse_verification_result_response(response, unique_id)
         except requests.exceptions.RequestException as e:
             logger.error(f"Network error: {e}")
             return {"success": False, "error": str(e), "status": "network"}
@@ -0,0 +1,178 @@
+# kyc/tests/services/test_async_provider_client.py
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import jwt
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from kyc.services.async_provider_client import run_concurrently
+
+
+class ProviderStub:
+    """Local stand-in for the KYC provider; counts logins and concurrency."""
+
+    def __init__(self, delay=0.2, reject_first_token=False):
+        self.delay = delay
+        self.reject_first_token = reject_first_token
+        self.issued = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status, body):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _authorized(self):
+                token = self.headers.get("Authorization", "")[7:]
+                if token not in stub.issued:
+                    return False
+                return not (
+                        stub.reject_first_token and token == stub.issued[0]
+                )
+
+            def _slow(self):
+                with stub.lock:
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(
+                        stub.max_in_flight, stub.in_flight
+                    )
+                time.sleep(stub.delay)
+                with stub.lock:
+                    stub.in_flight -= 1
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if self.path == "/api/ums/token":
+                    token = jwt.encode(
+                        {"exp": int(time.time()) + 3600,
+                         "n": len(stub.issued)},
+                        "secret", algorithm="HS256"
+                    )
+                    stub.issued.append(token)
+                    return self._reply(200, {"accessToken": token})
+                if not self._authorized():
+                    return self._reply(401, {"error": "unauthorized"})
+                if self.path == "/api/inq/shahkar/verify":
+                    self._slow()
+                    return self._reply(200, {
+                        "uniqueId": f"u-{payload['nationalCode']}",
+                        "data": {
+                            "message": "ok",
+                            "details": {"isMatched": True},
+                        },
+                    })
+                self._reply(404, {})
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if not self._authorized():
+                    return self._reply(401, {"error": "unauthorized"})
+                if url.path == "/api/vvs/video/verify/result":
+                    unique_id = parse_qs(url.query)["uniqueId"][0]
+                    status = "ACCEPT" if unique_id == "done" else "IN_PROGRESS"
+                    return self._reply(200, {
+                        "data": {"details": {"verifyStatus": status}}
+                    })
+                self._reply(404, {})
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class AsyncProviderClientTestCase(SimpleTestCase):
+    """Batch provider calls run concurrently against a local stub."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _settings(self, stub, **extra):
+        return override_settings(
+            KYC_IDENTITY_BASE_URL=stub.url,
+            KIAHOOSHAN_USERNAME="user",
+            KIAHOOSHAN_PASSWORD="pass",
+            KIAHOOSHAN_ORGNAME="org",
+            KIAHOOSHAN_ORGNATIONALCODE="123",
+            **extra,
+        )
+
+    @staticmethod
+    def _shahkar(client, national_code):
+        return client.verify_mobile_national_id(national_code, "09120000000")
+
+    def test_fan_out_shares_token_and_respects_endpoint_limit(self):
+        with ProviderStub() as stub, self._settings(
+                stub, KYC_ASYNC_ENDPOINT_CONCURRENCY={"shahkar": 2}
+        ):
+            codes = {i: f"00{i}" for i in range(6)}
+            results = run_concurrently(self._shahkar, codes)
+
+        self.assertEqual(len(results), 6)
+        for i, result in results.items():
+            self.assertTrue(result["success"])
+            self.assertTrue(result["is_matched"])
+            self.assertEqual(result["unique_id"], f"u-00{i}")
+        self.assertEqual(len(stub.issued), 1)
+        self.assertEqual(stub.max_in_flight, 2)
+
+    def test_rejected_token_is_replaced_once(self):
+        with ProviderStub(delay=0, reject_first_token=True) as stub, \
+                self._settings(stub):
+            results = run_concurrently(
+                self._shahkar, {i: f"00{i}" for i in range(4)}
+            )
+
+        self.assertTrue(all(r["success"] for r in results.values()))
+        self.assertEqual(len(stub.issued), 2)
+
+    def test_video_results(self):
+        with ProviderStub(delay=0) as stub, self._settings(stub):
+            results = run_concurrently(
+                lambda client, uid: client.get_video_verification_result(uid),
+                {1: "done", 2: "pending"},
+            )
+
+        self.assertTrue(results[1]["success"])
+        self.assertEqual(results[1]["verifyStatus"], "ACCEPT")
+        self.assertEqual(results[2]["status"], "in_progress")
+
+    def test_unreachable_provider_maps_to_network_error(self):
+        stub = ProviderStub()
+        stub.server.server_close()
+        with self._settings(stub):
+            cache.set("kyc_identity_access_token", jwt.encode(
+                {"exp": int(time.time()) + 3600}, "s", algorithm="HS256"
+            ))
+            results = run_concurrently(
+                lambda client, uid: client.get_video_verification_result(uid),
+                {1: "done"},
+            )
+
+        self.assertEqual(results[1]["status"], "network")
@@ -36,6 +36,12 @@ class IdentityAuthServiceTestCase(TestCase):
         service = IdentityAuthService()
         self.assertIsInstance(service, IdentityAuthService)
     
+    def test_token_lease_outlives_provider_timeout(self):
+        """Renewal lease covers refresh + login; waiters outlive the lease."""
+        tokens = self.service.tokens
+        self.assertGreater(tokens.lease_seconds, 2 * self.service.timeout)
+        self.assertGreater(tokens.wait_seconds, tokens.lease_seconds)
+    
     def test_get_identity_auth_service_new_instance(self):
         """Test that get_identity_auth_service returns new instances."""
         service1 = get_identity_auth_service()
@@ -0,0 +1,138 @@
+# kyc/tests/services/test_token_manager.py
+
+import threading
+import time
+
+import jwt
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from kyc.services.token_manager import SingleFlightTokenManager
+
+
+def make_token(expires_in: int, n: int = 0) -> str:
+    return jwt.encode(
+        {"exp": int(time.time()) + expires_in, "n": n},
+        "secret", algorithm="HS256"
+    )
+
+
+class FakeProvider:
+    """Token endpoint stand-in that counts calls and takes a while."""
+
+    def __init__(self, delay=0.3, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.logins = 0
+        self.refreshes = 0
+        self.lock = threading.Lock()
+
+    def authenticate(self):
+        with self.lock:
+            self.logins += 1
+            n = self.logins
+        time.sleep(self.delay)
+        if self.fail:
+            return None, None
+        return make_token(3600, n), make_token(86400, n)
+
+    def refresh(self, refresh_token, access_token=None):
+        with self.lock:
+            self.refreshes += 1
+            n = 100 + self.refreshes
+        time.sleep(self.delay)
+        return make_token(3600, n), None
+
+
+class SingleFlightTokenManagerTestCase(SimpleTestCase):
+    """Token renewal happens once per rollover, however many callers."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _manager(self, provider, **kwargs):
+        return SingleFlightTokenManager(
+            "test_kyc_", refresh=provider.refresh,
+            authenticate=provider.authenticate, **kwargs
+        )
+
+    def _call_concurrently(self, manager, n=8):
+        results = [None] * n
+        durations = [None] * n
+
+        def worker(i):
+            started = time.monotonic()
+            results[i] = manager.get_tokens()
+            durations[i] = time.monotonic() - started
+
+        threads = [
+            threading.Thread(target=worker, args=(i,)) for i in range(n)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results, durations
+
+    def test_cold_start_logs_in_once(self):
+        provider = FakeProvider()
+        manager = self._manager(provider)
+
+        results, _ = self._call_concurrently(manager)
+
+        self.assertEqual(provider.logins, 1)
+        self.assertEqual(len({access for access, _ in results}), 1)
+        self.assertIsNotNone(results[0][0])
+
+    def test_near_expiry_renews_ahead_without_blocking(self):
+        provider = FakeProvider()
+        manager = self._manager(provider, refresh_ahead_seconds=120)
+        old = make_token(90)
+        manager.store(old, make_token(86400))
+
+        results, durations = self._call_concurrently(manager)
+
+        self.assertEqual(provider.refreshes, 1)
+        self.assertEqual(provider.logins, 0)
+        # Everyone but the refresher kept using the still-valid token
+        served_old = [i for i, (access, _) in enumerate(results)
+                      if access == old]
+        self.assertEqual(len(served_old), 7)
+        self.assertTrue(all(durations[i] < 0.2 for i in served_old))
+        self.assertNotEqual(manager.cached()[0], old)
+        self.assertTrue(manager.is_fresh(manager.cached()[0]))
+
+    def test_expired_token_uses_refresh_token(self):
+        provider = FakeProvider(delay=0)
+        manager = self._manager(provider)
+        manager.store(make_token(10), make_token(86400))
+
+        access, refresh = manager.get_tokens()
+
+        self.assertEqual(provider.refreshes, 1)
+        self.assertEqual(provider.logins, 0)
+        self.assertTrue(manager.is_fresh(access))
+        # The refresh endpoint returned no new refresh token; keep the old
+        self.assertIsNotNone(refresh)
+
+    def test_failed_login_is_shared_by_waiters(self):
+        provider = FakeProvider(fail=True)
+        manager = self._manager(provider)
+
+        results, _ = self._call_concurrently(manager)
+
+        self.assertEqual(provider.logins, 1)
+        self.assertTrue(all(r == (None, None) for r in results))
+
+    def test_invalidate_keeps_a_replaced_token(self):
+        provider = FakeProvider(delay=0)
+        manager = self._manager(provider)
+        current = make_token(3600)
+        manager.store(current)
+
+        manager.invalidate(make_token(3600, 7))
+        self.assertEqual(manager.cached()[0], current)
+
+        manager.invalidate(current)
+        self.assertIsNone(manager.cached()[0])
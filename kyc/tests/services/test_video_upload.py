@@ -0,0 +1,110 @@
+# kyc/tests/services/test_video_upload.py
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import Mock, patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from kyc.services.video_identity_verification_service import (
+    VideoIdentityVerificationService,
+)
+from kyc.utils.video_blob import (
+    get_video_storage, reap_expired_video_blobs, save_video_blob,
+)
+
+
+class VideoUploadHandoffTestCase(TestCase):
+    """Uploads go to shared storage once and are streamed from there."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        storage_settings = override_settings(
+            STORAGES={
+                "default": {
+                    "BACKEND": "django.core.files.storage.FileSystemStorage",
+                    "OPTIONS": {"location": self.media_root},
+                },
+                "staticfiles": {
+                    "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+                },
+            }
+        )
+        storage_settings.enable()
+        self.addCleanup(storage_settings.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, True)
+        self.video = os.urandom(300 * 1024)
+
+    def _upload(self):
+        return SimpleUploadedFile(
+            "selfie.mp4", self.video, content_type="video/mp4"
+        )
+
+    def test_save_video_blob_hashes_while_writing(self):
+        blob = save_video_blob(self._upload())
+
+        self.assertEqual(blob.size, len(self.video))
+        self.assertEqual(blob.sha256, hashlib.sha256(self.video).hexdigest())
+        with get_video_storage().open(blob.key, "rb") as stored:
+            self.assertEqual(stored.read(), self.video)
+
+    def test_verify_streams_blob_from_storage(self):
+        blob = save_video_blob(self._upload())
+        service = VideoIdentityVerificationService()
+        service.base_url = "https://kyc.example"
+        sent = {}
+
+        def fake_post(url, data=None, headers=None, timeout=None):
+            sent["length"] = len(data)
+            sent["body"] = b"".join(data)
+            sent["headers"] = headers
+            response = Mock(status_code=200)
+            response.json.return_value = {"uniqueId": "abc"}
+            return response
+
+        with patch.object(service.session, "post", side_effect=fake_post):
+            result = service.verify_idcard_video(
+                national_code="1234567890",
+                birth_date="13700101",
+                selfie_video_path=None,
+                rand_action="blink",
+                access_token="token",
+                selfie_video_key=blob.key,
+            )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(sent["length"], len(sent["body"]))
+        self.assertIn(self.video, sent["body"])
+        self.assertIn(b'name="nationalCode"', sent["body"])
+        self.assertTrue(
+            sent["headers"]["Content-Type"].startswith(
+                "multipart/form-data; boundary="
+            )
+        )
+
+    def test_verify_missing_blob(self):
+        service = VideoIdentityVerificationService()
+        result = service.verify_idcard_video(
+            national_code="1234567890",
+            birth_date="13700101",
+            selfie_video_path=None,
+            rand_action="blink",
+            access_token="token",
+            selfie_video_key="kyc_uploads/missing.mp4",
+        )
+        self.assertEqual(result["error"], "selfie_video_file_not_found")
+
+    def test_reaper_deletes_only_expired_blobs(self):
+        storage = get_video_storage()
+        old = save_video_blob(self._upload())
+        fresh = save_video_blob(self._upload())
+        two_days_ago = time.time() - 48 * 3600
+        os.utime(storage.path(old.key), (two_days_ago, two_days_ago))
+
+        self.assertEqual(reap_expired_video_blobs(ttl_hours=24), 1)
+        self.assertFalse(storage.exists(old.key))
+        self.assertTrue(storage.exists(fresh.key))
@@ -0,0 +1,119 @@
+# kyc/utils/video_blob.py
+
+import hashlib
+import logging
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import storages
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Storage alias (settings.STORAGES) shared by web and worker nodes; the
+# default FileSystemStorage is the local-directory stand-in.
+KYC_VIDEO_UPLOAD_STORAGE = getattr(
+    settings, "KYC_VIDEO_UPLOAD_STORAGE", "default"
+)
+# Uploads not kept as durable assets land here and are reaped by TTL
+KYC_VIDEO_UPLOAD_PREFIX = getattr(
+    settings, "KYC_VIDEO_UPLOAD_PREFIX", "kyc_uploads/"
+)
+KYC_VIDEO_UPLOAD_TTL_HOURS = getattr(
+    settings, "KYC_VIDEO_UPLOAD_TTL_HOURS", 24
+)
+
+
+@dataclass(frozen=True)
+class VideoBlob:
+    key: str
+    size: int
+    sha256: str
+
+
+class _HashingFile(File):
+    """Feeds every byte the storage backend pulls through a SHA-256."""
+
+    def __init__(self, file, name=None):
+        super().__init__(file, name)
+        self.digest = hashlib.sha256()
+        self.bytes_read = 0
+
+    def _seen(self, data):
+        self.digest.update(data)
+        self.bytes_read += len(data)
+        return data
+
+    def read(self, *args, **kwargs):
+        return self._seen(self.file.read(*args, **kwargs))
+
+    def chunks(self, chunk_size=None):
+        for chunk in self.file.chunks(chunk_size):
+            yield self._seen(chunk)
+
+
+def get_video_storage():
+    return storages[KYC_VIDEO_UPLOAD_STORAGE]
+
+
+def save_video_blob(uploaded_file, prefix: str = KYC_VIDEO_UPLOAD_PREFIX,
+                    name: str = None) -> VideoBlob:
+    """
+    Stream an upload into shared storage in one pass, hashing on the way.
+    The returned key is what crosses the task boundary instead of a path
+    on the web node's disk.
+    """
+    try:
+        uploaded_file.seek(0)
+    except Exception:
+        pass
+    ext = os.path.splitext(getattr(uploaded_file, "name", "") or "")[1]
+    base = name or f"{uuid.uuid4().hex}{ext or '.mp4'}"
+    content = _HashingFile(uploaded_file, name=base)
+    key = get_video_storage().save(
+        prefix.rstrip("/") + "/" + base, content
+    )
+    return VideoBlob(
+        key=key, size=content.bytes_read, sha256=content.digest.hexdigest()
+    )
+
+
+def delete_video_blob(key: str) -> None:
+    if not key:
+        return
+    try:
+        get_video_storage().delete(key)
+    except Exception as e:
+        logger.warning(f"Failed to delete video blob {key}: {e}")
+
+
+def reap_expired_video_blobs(
+        ttl_hours: int = KYC_VIDEO_UPLOAD_TTL_HOURS, now=None
+) -> int:
+    """
+    Delete upload blobs older than the TTL, e.g. left behind by a task
+    that never ran. Durable KYC assets live under another prefix.
+    """
+    storage = get_video_storage()
+    prefix = KYC_VIDEO_UPLOAD_PREFIX.rstrip("/")
+    cutoff = (now or timezone.now()) - timedelta(hours=ttl_hours)
+    try:
+        _, files = storage.listdir(prefix)
+    except FileNotFoundError:
+        return 0
+
+    deleted = 0
+    for filename in files:
+        key = f"{prefix}/{filename}"
+        try:
+            if storage.get_modified_time(key) >= cutoff:
+                continue
+            storage.delete(key)
+            deleted += 1
+        except Exception as e:
+            logger.warning(f"Failed to reap video blob {key}: {e}")
+    return deleted
@@ -0,0 +1,53 @@
+# outbox/admin/message.py
+
+from django.contrib import admin, messages
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from lib.erp_base.admin import BaseAdmin
+from outbox.models import OutboxMessage
+from outbox.utils.choices import OutboxStatus
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(BaseAdmin):
+    list_display = [
+        "id",
+        "task_name",
+        "status",
+        "dedup_key",
+        "attempts",
+        "available_at",
+        "dispatched_at",
+        "jalali_creation_time",
+    ]
+    list_filter = ["status", "task_name"]
+    search_fields = ["task_name", "dedup_key"]
+    readonly_fields = [
+        "task_name",
+        "args",
+        "kwargs",
+        "dedup_key",
+        "status",
+        "available_at",
+        "attempts",
+        "last_error",
+        "dispatched_at",
+        "jalali_creation_time",
+        "jalali_update_time",
+    ]
+    actions = ["retry_failed"]
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description=_("ارسال مجدد پیام‌های ناموفق"))
+    def retry_failed(self, request, queryset):
+        updated = queryset.filter(status=OutboxStatus.FAILED).update(
+            status=OutboxStatus.PENDING,
+            attempts=0,
+            available_at=timezone.localtime(timezone.now()),
+        )
+        self.message_user(
+            request, f"{updated} پیام برای ارسال مجدد صف شد.", messages.SUCCESS
+        )
@@ -0,0 +1,46 @@
+# Generated by Django 5.0 on 2026-10-16 13:00
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.UUIDField(default=uuid.uuid4, null=True, unique=True, verbose_name='GUID')),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('extra_document', models.FileField(blank=True, max_length=127, null=True, upload_to='extra_documents', verbose_name='دستورات و مستندات')),
+                ('task_name', models.CharField(max_length=255, verbose_name='تسک')),
+                ('args', models.JSONField(blank=True, default=list, verbose_name='آرگومان‌ها')),
+                ('kwargs', models.JSONField(blank=True, default=dict, verbose_name='پارامترها')),
+                ('dedup_key', models.CharField(blank=True, max_length=255, null=True, verbose_name='کلید یکتاسازی')),
+                ('status', models.CharField(choices=[('pending', 'در انتظار ارسال'), ('dispatched', 'ارسال شده'), ('failed', 'ناموفق')], default='pending', max_length=16, verbose_name='وضعیت')),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='زمان قابل ارسال')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='تعداد تلاش')),
+                ('last_error', models.TextField(blank=True, verbose_name='آخرین خطا')),
+                ('dispatched_at', models.DateTimeField(blank=True, null=True, verbose_name='زمان ارسال')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_creations', to=settings.AUTH_USER_MODEL, verbose_name='ایجاد کننده')),
+            ],
+            options={
+                'verbose_name': 'پیام صف خروجی',
+                'verbose_name_plural': 'پیام‌های صف خروجی',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['available_at', 'id'], name='outbox_pending_idx'), models.Index(fields=['status', 'dispatched_at'], name='outbox_status_dispatched_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('dedup_key',), name='outbox_pending_dedup_key_uniq')],
+            },
+        ),
+    ]
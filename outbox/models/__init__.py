@@ -0,0 +1,5 @@
+from .message import OutboxMessage
+
+__all__ = [
+    'OutboxMessage',
+]
@@ -0,0 +1,67 @@
+# outbox/models/message.py
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from lib.erp_base.models import BaseModel
+from outbox.utils.choices import OutboxStatus
+
+
+class OutboxMessage(BaseModel):
+    """
+    A Celery task invocation recorded in the producer's transaction and
+    relayed to the broker only after that transaction has committed.
+    """
+    task_name = models.CharField(max_length=255, verbose_name=_("تسک"))
+    args = models.JSONField(default=list, blank=True, verbose_name=_("آرگومان‌ها"))
+    kwargs = models.JSONField(default=dict, blank=True, verbose_name=_("پارامترها"))
+    dedup_key = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        verbose_name=_("کلید یکتاسازی"),
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=OutboxStatus.choices,
+        default=OutboxStatus.PENDING,
+        verbose_name=_("وضعیت"),
+    )
+    available_at = models.DateTimeField(
+        default=timezone.now, verbose_name=_("زمان قابل ارسال")
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name=_("تعداد تلاش")
+    )
+    last_error = models.TextField(blank=True, verbose_name=_("آخرین خطا"))
+    dispatched_at = models.DateTimeField(
+        null=True, blank=True, verbose_name=_("زمان ارسال")
+    )
+
+    def __str__(self):
+        return f"{self.task_name} ({self.get_status_display()})"
+
+    class Meta:
+        verbose_name = _("پیام صف خروجی")
+        verbose_name_plural = _("پیام‌های صف خروجی")
+        ordering = ["-created_at"]
+        constraints = [
+            # At most one undispatched message per dedup key
+            models.UniqueConstraint(
+                fields=["dedup_key"],
+                condition=models.Q(status="pending"),
+                name="outbox_pending_dedup_key_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["available_at", "id"],
+                condition=models.Q(status="pending"),
+                name="outbox_pending_idx",
+            ),
+            models.Index(
+                fields=["status", "dispatched_at"],
+                name="outbox_status_dispatched_idx",
+            ),
+        ]
@@ -0,0 +1 @@
+from .outbox import enqueue, relay_pending, purge_dispatched
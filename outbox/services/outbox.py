@@ -0,0 +1,168 @@
+# outbox/services/outbox.py
+
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+
+from celery import current_app
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from outbox.models import OutboxMessage
+from outbox.utils.choices import OutboxStatus
+from outbox.utils.consts import (
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_RELAY_BATCH_SIZE,
+    OUTBOX_RELAY_MAX_BATCHES,
+    OUTBOX_RETENTION_DAYS,
+    OUTBOX_RETRY_BACKOFF_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RelayResult:
+    dispatched_count: int
+    retry_count: int
+    failed_count: int
+    batches: int
+
+
+def enqueue(
+        task,
+        args=(),
+        kwargs=None,
+        *,
+        dedup_key: Optional[str] = None,
+        countdown: int = 0,
+) -> Optional[OutboxMessage]:
+    """
+    Record a task invocation in the caller's transaction. Nothing reaches the
+    broker until the relay picks the row up after commit, so a rolled-back
+    request never fires its side effects and a broker outage loses nothing.
+
+    `task` is a Celery task or its registered name. While a message with the
+    same dedup_key is still pending, further enqueues are dropped (None).
+    """
+    task_name = task if isinstance(task, str) else task.name
+    try:
+        with transaction.atomic():
+            return OutboxMessage.objects.create(
+                task_name=task_name,
+                args=list(args),
+                kwargs=dict(kwargs or {}),
+                dedup_key=dedup_key,
+                available_at=timezone.localtime(timezone.now()) + timedelta(
+                    seconds=countdown
+                ),
+            )
+    except IntegrityError:
+        if dedup_key is None:
+            raise
+        logger.info("Outbox duplicate dropped: %s (%s)", task_name, dedup_key)
+        return None
+
+
+def _publish(message: OutboxMessage) -> None:
+    # The message guid doubles as the Celery task id, so a consumer can
+    # recognise a redelivery of the same outbox row.
+    options = {"task_id": str(message.guid)}
+    task = current_app.tasks.get(message.task_name)
+    if task is not None:
+        task.apply_async(args=message.args, kwargs=message.kwargs, **options)
+    else:
+        current_app.send_task(
+            message.task_name, args=message.args, kwargs=message.kwargs,
+            **options
+        )
+
+
+@transaction.atomic
+def _relay_batch(now, batch_size: int):
+    messages = list(
+        OutboxMessage.objects.select_for_update(skip_locked=True)
+        .filter(status=OutboxStatus.PENDING, available_at__lte=now)
+        .order_by("available_at", "id")[:batch_size]
+    )
+    dispatched_ids = []
+    unsent = []
+    for message in messages:
+        try:
+            _publish(message)
+        except Exception as exc:
+            message.attempts += 1
+            message.updated_at = now
+            message.last_error = repr(exc)[:2000]
+            if message.attempts >= OUTBOX_MAX_ATTEMPTS:
+                message.status = OutboxStatus.FAILED
+                logger.error(
+                    "Outbox message %s (%s) failed permanently: %s",
+                    message.pk, message.task_name, exc
+                )
+            else:
+                message.available_at = now + timedelta(
+                    seconds=OUTBOX_RETRY_BACKOFF_SECONDS * message.attempts
+                )
+            unsent.append(message)
+        else:
+            dispatched_ids.append(message.pk)
+
+    if dispatched_ids:
+        # Payloads may carry secrets (OTP texts); they are not needed once sent
+        OutboxMessage.objects.filter(pk__in=dispatched_ids).update(
+            status=OutboxStatus.DISPATCHED,
+            dispatched_at=now,
+            attempts=F("attempts") + 1,
+            args=[],
+            kwargs={},
+            updated_at=now,
+        )
+    if unsent:
+        OutboxMessage.objects.bulk_update(
+            unsent,
+            ["attempts", "last_error", "status", "available_at", "updated_at"],
+        )
+    failed = sum(1 for m in unsent if m.status == OutboxStatus.FAILED)
+    return len(messages), len(dispatched_ids), len(unsent) - failed, failed
+
+
+def relay_pending(
+        batch_size: int = OUTBOX_RELAY_BATCH_SIZE,
+        max_batches: int = OUTBOX_RELAY_MAX_BATCHES,
+) -> RelayResult:
+    """
+    Publish due pending messages to Celery, one short transaction per batch.
+    Rows are claimed with skip_locked, so concurrent relays never publish the
+    same row twice, and a row is marked DISPATCHED in the transaction that
+    published it.
+    """
+    dispatched = retried = failed = batches = 0
+    for _ in range(max_batches):
+        now = timezone.localtime(timezone.now())
+        claimed, ok, retry, dead = _relay_batch(now, batch_size)
+        if not claimed:
+            break
+        batches += 1
+        dispatched += ok
+        retried += retry
+        failed += dead
+        if claimed < batch_size:
+            break
+    return RelayResult(
+        dispatched_count=dispatched,
+        retry_count=retried,
+        failed_count=failed,
+        batches=batches,
+    )
+
+
+def purge_dispatched(days: int = OUTBOX_RETENTION_DAYS) -> int:
+    """Delete dispatched rows older than the retention window."""
+    cutoff = timezone.localtime(timezone.now()) - timedelta(days=days)
+    deleted, _ = OutboxMessage.objects.filter(
+        status=OutboxStatus.DISPATCHED, dispatched_at__lt=cutoff
+    ).delete()
+    return deleted
@@ -0,0 +1,28 @@
+# outbox/tasks.py
+
+from celery import shared_task
+
+from outbox.services import purge_dispatched, relay_pending
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=5)
+def task_relay_outbox(self):
+    """Relay committed outbox rows to the broker in batches."""
+    try:
+        result = relay_pending()
+        return {
+            "status": "success",
+            "result": {
+                "dispatched_count": result.dispatched_count,
+                "retry_count": result.retry_count,
+                "failed_count": result.failed_count,
+                "batches": result.batches,
+            },
+        }
+    except Exception as exc:
+        raise self.retry(exc=exc)
+
+
+@shared_task
+def task_purge_outbox():
+    return {"deleted": purge_dispatched()}
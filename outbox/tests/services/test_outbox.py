@@ -0,0 +1,99 @@
+# outbox/tests/services/test_outbox.py
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from outbox.models import OutboxMessage
+from outbox.services import enqueue, purge_dispatched, relay_pending
+from outbox.utils.choices import OutboxStatus
+from outbox.utils.consts import OUTBOX_MAX_ATTEMPTS
+
+pytestmark = pytest.mark.django_db
+
+TASK = "outbox.tests.fake_task"
+
+
+class TestEnqueue:
+    def test_records_task_call(self):
+        message = enqueue(TASK, (1, "a"), {"flag": True}, countdown=30)
+        assert message.status == OutboxStatus.PENDING
+        assert message.args == [1, "a"]
+        assert message.kwargs == {"flag": True}
+        assert message.available_at > timezone.now() + timedelta(seconds=20)
+
+    def test_duplicate_pending_key_is_dropped(self):
+        assert enqueue(TASK, dedup_key="k1") is not None
+        assert enqueue(TASK, dedup_key="k1") is None
+        assert OutboxMessage.objects.count() == 1
+
+    def test_key_reusable_after_dispatch(self):
+        first = enqueue(TASK, dedup_key="k1")
+        OutboxMessage.objects.filter(pk=first.pk).update(
+            status=OutboxStatus.DISPATCHED
+        )
+        assert enqueue(TASK, dedup_key="k1") is not None
+
+
+class TestRelay:
+    def test_dispatches_due_rows_once(self):
+        due = enqueue(TASK, (1,))
+        later = enqueue(TASK, (2,), countdown=600)
+
+        with patch("outbox.services.outbox._publish") as publish:
+            result = relay_pending(batch_size=10)
+            relay_pending(batch_size=10)
+
+        publish.assert_called_once()
+        assert result.dispatched_count == 1
+        due.refresh_from_db()
+        later.refresh_from_db()
+        assert due.status == OutboxStatus.DISPATCHED
+        assert due.args == []  # payload scrubbed once sent
+        assert later.status == OutboxStatus.PENDING
+
+    def test_publish_error_backs_off_then_fails(self):
+        message = enqueue(TASK)
+        OutboxMessage.objects.filter(pk=message.pk).update(
+            attempts=OUTBOX_MAX_ATTEMPTS - 2
+        )
+
+        with patch(
+                "outbox.services.outbox._publish",
+                side_effect=ConnectionError("broker down"),
+        ):
+            first = relay_pending()
+            message.refresh_from_db()
+            assert first.retry_count == 1
+            assert message.status == OutboxStatus.PENDING
+            assert message.available_at > timezone.now()
+
+            OutboxMessage.objects.filter(pk=message.pk).update(
+                available_at=timezone.now()
+            )
+            second = relay_pending()
+
+        message.refresh_from_db()
+        assert second.failed_count == 1
+        assert message.status == OutboxStatus.FAILED
+        assert "broker down" in message.last_error
+
+
+def test_purge_keeps_recent_and_pending_rows():
+    old = enqueue(TASK)
+    recent = enqueue(TASK)
+    pending = enqueue(TASK)
+    now = timezone.now()
+    OutboxMessage.objects.filter(pk=old.pk).update(
+        status=OutboxStatus.DISPATCHED, dispatched_at=now - timedelta(days=30)
+    )
+    OutboxMessage.objects.filter(pk=recent.pk).update(
+        status=OutboxStatus.DISPATCHED, dispatched_at=now
+    )
+
+    assert purge_dispatched(days=7) == 1
+    assert set(OutboxMessage.objects.values_list("pk", flat=True)) == {
+        recent.pk, pending.pk
+    }
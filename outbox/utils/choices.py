@@ -0,0 +1,10 @@
+# outbox/utils/choices.py
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class OutboxStatus(models.TextChoices):
+    PENDING = "pending", _("در انتظار ارسال")
+    DISPATCHED = "dispatched", _("ارسال شده")
+    FAILED = "failed", _("ناموفق")
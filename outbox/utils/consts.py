@@ -0,0 +1,16 @@
+# outbox/utils/consts.py
+
+from django.conf import settings
+
+# Rows relayed to the broker per transaction, and batches per relay run
+OUTBOX_RELAY_BATCH_SIZE = getattr(settings, "OUTBOX_RELAY_BATCH_SIZE", 200)
+OUTBOX_RELAY_MAX_BATCHES = getattr(settings, "OUTBOX_RELAY_MAX_BATCHES", 20)
+
+# Publish failures back off linearly; after this many attempts a row is FAILED
+OUTBOX_MAX_ATTEMPTS = getattr(settings, "OUTBOX_MAX_ATTEMPTS", 10)
+OUTBOX_RETRY_BACKOFF_SECONDS = getattr(
+    settings, "OUTBOX_RETRY_BACKOFF_SECONDS", 30
+)
+
+# Dispatched rows are kept this long for auditing, then purged
+OUTBOX_RETENTION_DAYS = getattr(settings, "OUTBOX_RETENTION_DAYS", 7)
@@ -0,0 +1,50 @@
+# polling/admin/job.py
+
+from django.contrib import admin, messages
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from lib.erp_base.admin import BaseAdmin
+from polling.models import PollJob
+from polling.utils.choices import PollJobStatus
+
+
+@admin.register(PollJob)
+class PollJobAdmin(BaseAdmin):
+    list_display = [
+        "id",
+        "kind",
+        "object_id",
+        "status",
+        "attempts",
+        "next_check_at",
+        "last_checked_at",
+        "jalali_creation_time",
+    ]
+    list_filter = ["status", "kind"]
+    search_fields = ["object_id"]
+    readonly_fields = [
+        "kind",
+        "object_id",
+        "status",
+        "attempts",
+        "next_check_at",
+        "last_checked_at",
+        "last_error",
+        "jalali_creation_time",
+        "jalali_update_time",
+    ]
+    actions = ["check_now"]
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description=_("بررسی فوری استعلام‌های در انتظار"))
+    def check_now(self, request, queryset):
+        updated = queryset.filter(status=PollJobStatus.PENDING).update(
+            next_check_at=timezone.localtime(timezone.now()),
+        )
+        self.message_user(
+            request, f"{updated} استعلام برای بررسی فوری صف شد.",
+            messages.SUCCESS
+        )
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class PollingConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "polling"
+
+    def ready(self):
+        # Each app registers its result pollers in `<app>/pollers.py`
+        autodiscover_modules("pollers")
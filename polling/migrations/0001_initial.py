@@ -0,0 +1,44 @@
+# Generated by Django 5.0 on 2026-10-16 23:00
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PollJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.UUIDField(default=uuid.uuid4, null=True, unique=True, verbose_name='GUID')),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('extra_document', models.FileField(blank=True, max_length=127, null=True, upload_to='extra_documents', verbose_name='دستورات و مستندات')),
+                ('kind', models.CharField(choices=[('video_kyc', 'نتیجه احراز هویت ویدیویی'), ('loan_report', 'گزارش اعتبارسنجی وام')], max_length=32, verbose_name='نوع')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='شناسه رکورد')),
+                ('status', models.CharField(choices=[('pending', 'در انتظار نتیجه'), ('done', 'انجام شده'), ('failed', 'ناموفق')], default='pending', max_length=16, verbose_name='وضعیت')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='تعداد بررسی')),
+                ('next_check_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='زمان بررسی بعدی')),
+                ('last_checked_at', models.DateTimeField(blank=True, null=True, verbose_name='آخرین بررسی')),
+                ('last_error', models.TextField(blank=True, verbose_name='آخرین خطا')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_creations', to=settings.AUTH_USER_MODEL, verbose_name='ایجاد کننده')),
+            ],
+            options={
+                'verbose_name': 'استعلام زمان‌بندی‌شده',
+                'verbose_name_plural': 'استعلام‌های زمان‌بندی‌شده',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['next_check_at', 'id'], name='poll_due_idx'), models.Index(fields=['status', 'updated_at'], name='poll_status_updated_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('kind', 'object_id'), name='poll_pending_kind_object_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,5 @@
+from .job import PollJob
+
+__all__ = [
+    'PollJob',
+]
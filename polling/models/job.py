@@ -0,0 +1,62 @@
+# polling/models/job.py
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from lib.erp_base.models import BaseModel
+from polling.utils.choices import PollJobStatus, PollKind
+
+
+class PollJob(BaseModel):
+    """
+    An external result (video KYC verdict, loan report, ...) still being
+    waited for, with the time it should next be asked for.
+    """
+    kind = models.CharField(
+        max_length=32, choices=PollKind.choices, verbose_name=_("نوع")
+    )
+    object_id = models.PositiveBigIntegerField(verbose_name=_("شناسه رکورد"))
+    status = models.CharField(
+        max_length=16,
+        choices=PollJobStatus.choices,
+        default=PollJobStatus.PENDING,
+        verbose_name=_("وضعیت"),
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name=_("تعداد بررسی")
+    )
+    next_check_at = models.DateTimeField(
+        default=timezone.now, verbose_name=_("زمان بررسی بعدی")
+    )
+    last_checked_at = models.DateTimeField(
+        null=True, blank=True, verbose_name=_("آخرین بررسی")
+    )
+    last_error = models.TextField(blank=True, verbose_name=_("آخرین خطا"))
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} ({self.get_status_display()})"
+
+    class Meta:
+        verbose_name = _("استعلام زمان‌بندی‌شده")
+        verbose_name_plural = _("استعلام‌های زمان‌بندی‌شده")
+        ordering = ["-created_at"]
+        constraints = [
+            # At most one open job per polled object
+            models.UniqueConstraint(
+                fields=["kind", "object_id"],
+                condition=models.Q(status="pending"),
+                name="poll_pending_kind_object_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["next_check_at", "id"],
+                condition=models.Q(status="pending"),
+                name="poll_due_idx",
+            ),
+            models.Index(
+                fields=["status", "updated_at"],
+                name="poll_status_updated_idx",
+            ),
+        ]
@@ -0,0 +1,8 @@
+from .registry import ResultPoller, get_poller, register_poller
+from .scheduler import (
+    backoff_delay,
+    poll_due,
+    purge_finished,
+    schedule_poll,
+    schedule_polls,
+)
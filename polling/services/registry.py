@@ -0,0 +1,67 @@
+# polling/services/registry.py
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class ResultPoller(ABC):
+    """
+    How to poll one kind of external result. Subclasses set `kind` and the
+    backoff bounds and implement the hooks; the scheduler calls them for a
+    whole batch of due jobs at once:
+
+    - prepare(object_id): sync, checks the object still waits for a result
+      and returns what fetch() needs, or None when there is nothing left to
+      poll (the job is closed as done).
+    - fetch(client, prepared): async provider call on the shared
+      AsyncProviderClient, run concurrently for the batch.
+    - apply(object_id, prepared, result): sync, stores a final result and
+      returns True, or returns False when the result is not ready yet.
+    - give_up(object_id, prepared, result): called once `max_attempts`
+      checks have not produced a final result; `result` may be the
+      exception the last fetch raised.
+
+    prepare, fetch and apply are abstract, so registering a poller that
+    misses one fails at import time rather than on its first due job.
+
+    Waits between checks grow as base_delay * 2**attempts up to max_delay,
+    with jitter so jobs created together do not stay in lockstep.
+    """
+    kind: str = ""
+    first_delay: int = 10
+    base_delay: int = 10
+    max_delay: int = 10 * 60
+    max_attempts: int = 20
+
+    @abstractmethod
+    def prepare(self, object_id: int) -> Optional[Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch(self, client, prepared: Any) -> Dict:
+        raise NotImplementedError
+
+    @abstractmethod
+    def apply(self, object_id: int, prepared: Any, result: Dict) -> bool:
+        raise NotImplementedError
+
+    def give_up(self, object_id: int, prepared: Any, result) -> None:
+        pass
+
+
+_pollers: Dict[str, ResultPoller] = {}
+
+
+def register_poller(cls):
+    """
+    Class decorator: register one instance of a ResultPoller subclass.
+    Instantiating it raises TypeError if an abstract hook is missing.
+    """
+    if not cls.kind:
+        raise ValueError(f"{cls.__name__} has no kind")
+    _pollers[cls.kind] = cls()
+    return cls
+
+
+def get_poller(kind: str) -> Optional[ResultPoller]:
+    return _pollers.get(kind)
@@ -0,0 +1,261 @@
+# polling/services/scheduler.py
+
+import logging
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Iterable, Optional
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from kyc.services.async_provider_client import run_concurrently
+from polling.models import PollJob
+from polling.services.registry import ResultPoller, get_poller
+from polling.utils.choices import PollJobStatus
+from polling.utils.consts import (
+    POLL_BATCH_SIZE,
+    POLL_CLAIM_LEASE_SECONDS,
+    POLL_MAX_BATCHES,
+    POLL_RETENTION_DAYS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PollResult:
+    polled_count: int
+    finished_count: int
+    failed_count: int
+    batches: int
+
+
+def _now():
+    return timezone.localtime(timezone.now())
+
+
+def _poller(kind: str) -> ResultPoller:
+    poller = get_poller(kind)
+    if poller is None:
+        raise ValueError(f"No result poller registered for {kind!r}")
+    return poller
+
+
+def backoff_delay(poller: ResultPoller, attempts: int) -> float:
+    """
+    Seconds to wait after the `attempts`-th check came back not ready:
+    base_delay doubled per check, capped at max_delay, then jittered into
+    [delay / 2, delay] so jobs that started together spread out.
+    """
+    exponent = min(max(attempts - 1, 0), 30)
+    delay = min(poller.base_delay * 2 ** exponent, poller.max_delay)
+    return random.uniform(delay / 2, delay)
+
+
+def schedule_poll(
+        kind: str, object_id: int, *, delay: Optional[float] = None
+) -> Optional[PollJob]:
+    """
+    Start polling `object_id` after `delay` seconds (the poller's
+    first_delay by default). Runs in the caller's transaction, so a job
+    exists exactly when the state that needs it was committed.
+
+    An object already being polled keeps its job (None is returned); the
+    next check is only brought forward when `delay` asks for an earlier
+    one, e.g. for a manual "check now".
+    """
+    poller = _poller(kind)
+    now = _now()
+    due = now + timedelta(
+        seconds=poller.first_delay if delay is None else delay
+    )
+    try:
+        with transaction.atomic():
+            return PollJob.objects.create(
+                kind=kind, object_id=object_id, next_check_at=due
+            )
+    except IntegrityError:
+        PollJob.objects.filter(
+            kind=kind, object_id=object_id, status=PollJobStatus.PENDING,
+            next_check_at__gt=due,
+        ).update(next_check_at=due, updated_at=now)
+        return None
+
+
+def schedule_polls(
+        kind: str, object_ids: Iterable[int], *, spread: float = 0
+) -> int:
+    """
+    Bulk schedule_poll for objects that have no open job yet, with first
+    checks spread uniformly over `spread` seconds after first_delay.
+    Returns the number of jobs created.
+    """
+    poller = _poller(kind)
+    object_ids = set(object_ids)
+    if not object_ids:
+        return 0
+    existing = set(
+        PollJob.objects.filter(
+            kind=kind, object_id__in=object_ids,
+            status=PollJobStatus.PENDING,
+        ).values_list("object_id", flat=True)
+    )
+    now = _now()
+    jobs = [
+        PollJob(
+            kind=kind,
+            object_id=object_id,
+            next_check_at=now + timedelta(
+                seconds=poller.first_delay + random.uniform(0, spread)
+            ),
+            created_at=now,
+            updated_at=now,
+        )
+        for object_id in sorted(object_ids - existing)
+    ]
+    PollJob.objects.bulk_create(jobs, ignore_conflicts=True)
+    return len(jobs)
+
+
+@transaction.atomic
+def _claim_due(now, batch_size: int) -> list[PollJob]:
+    """
+    Take up to batch_size due jobs. skip_locked keeps concurrent runs on
+    disjoint rows, and moving next_check_at past the lease keeps them off
+    these rows after the claim commits, while the batch is being polled.
+    """
+    jobs = list(
+        PollJob.objects.select_for_update(skip_locked=True)
+        .filter(status=PollJobStatus.PENDING, next_check_at__lte=now)
+        .order_by("next_check_at", "id")[:batch_size]
+    )
+    if jobs:
+        PollJob.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            next_check_at=now + timedelta(seconds=POLL_CLAIM_LEASE_SECONDS),
+            updated_at=now,
+        )
+    return jobs
+
+
+def _close(job: PollJob, status: str, now, error: str = "") -> None:
+    job.status = status
+    job.last_error = error[:2000]
+    job.updated_at = now
+
+
+def _poll_kind(kind: str, jobs: list[PollJob]) -> None:
+    """Poll one kind's share of a batch; updates the job objects in place."""
+    poller = get_poller(kind)
+    if poller is None:
+        for job in jobs:
+            _close(job, PollJobStatus.FAILED, _now(), "no poller registered")
+        return
+
+    prepared, errors = {}, {}
+    for job in jobs:
+        try:
+            value = poller.prepare(job.object_id)
+        except Exception as exc:
+            logger.exception("Poll %s:%s prepare failed", kind, job.object_id)
+            errors[job.pk] = exc
+            continue
+        if value is None:
+            # Resolved elsewhere (manual check, reset, ...): nothing to poll
+            _close(job, PollJobStatus.DONE, _now())
+        else:
+            prepared[job.pk] = value
+
+    results = run_concurrently(
+        lambda client, value: poller.fetch(client, value), prepared
+    )
+    results.update(errors)
+
+    now = _now()
+    for job in jobs:
+        if job.pk not in results:
+            continue
+        result, value = results[job.pk], prepared.get(job.pk)
+        job.attempts += 1
+        job.last_checked_at = now
+        job.updated_at = now
+        finished, error = False, ""
+        if isinstance(result, Exception):
+            error = repr(result)
+        else:
+            try:
+                finished = poller.apply(job.object_id, value, result)
+            except Exception as exc:
+                logger.exception("Poll %s:%s apply failed", kind, job.object_id)
+                error = repr(exc)
+            else:
+                if not finished:
+                    error = str(result.get("error") or result.get("status"))
+
+        if finished:
+            _close(job, PollJobStatus.DONE, now)
+        elif job.attempts >= poller.max_attempts:
+            try:
+                poller.give_up(job.object_id, value, result)
+            except Exception:
+                logger.exception("Poll %s:%s give_up failed", kind, job.object_id)
+            _close(job, PollJobStatus.FAILED, now, error)
+            logger.warning(
+                "Poll %s:%s gave up after %s checks", kind, job.object_id,
+                job.attempts
+            )
+        else:
+            job.last_error = error[:2000]
+            job.next_check_at = now + timedelta(
+                seconds=backoff_delay(poller, job.attempts)
+            )
+
+
+def poll_due(
+        batch_size: int = POLL_BATCH_SIZE,
+        max_batches: int = POLL_MAX_BATCHES,
+) -> PollResult:
+    """
+    Check every due job, batch by batch. Each batch's provider calls go out
+    concurrently on one client, grouped by kind; results are applied by the
+    kind's poller and unfinished jobs are rescheduled with backoff.
+    """
+    polled = finished = failed = batches = 0
+    for _ in range(max_batches):
+        jobs = _claim_due(_now(), batch_size)
+        if not jobs:
+            break
+        batches += 1
+        by_kind = {}
+        for job in jobs:
+            by_kind.setdefault(job.kind, []).append(job)
+        for kind, kind_jobs in by_kind.items():
+            _poll_kind(kind, kind_jobs)
+
+        PollJob.objects.bulk_update(
+            jobs,
+            [
+                "status", "attempts", "next_check_at", "last_checked_at",
+                "last_error", "updated_at",
+            ],
+        )
+        polled += len(jobs)
+        finished += sum(1 for j in jobs if j.status == PollJobStatus.DONE)
+        failed += sum(1 for j in jobs if j.status == PollJobStatus.FAILED)
+        if len(jobs) < batch_size:
+            break
+    return PollResult(
+        polled_count=polled,
+        finished_count=finished,
+        failed_count=failed,
+        batches=batches,
+    )
+
+
+def purge_finished(days: int = POLL_RETENTION_DAYS) -> int:
+    """Delete done jobs older than the retention window."""
+    cutoff = _now() - timedelta(days=days)
+    deleted, _ = PollJob.objects.filter(
+        status=PollJobStatus.DONE, updated_at__lt=cutoff
+    ).delete()
+    return deleted
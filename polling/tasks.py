@@ -0,0 +1,28 @@
+# polling/tasks.py
+
+from celery import shared_task
+
+from polling.services import poll_due, purge_finished
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=5)
+def task_poll_due_results(self):
+    """Check due external results in batches, with per-job backoff."""
+    try:
+        result = poll_due()
+        return {
+            "status": "success",
+            "result": {
+                "polled_count": result.polled_count,
+                "finished_count": result.finished_count,
+                "failed_count": result.failed_count,
+                "batches": result.batches,
+            },
+        }
+    except Exception as exc:
+        raise self.retry(exc=exc)
+
+
+@shared_task
+def task_purge_poll_jobs():
+    return {"deleted": purge_finished()}
@@ -0,0 +1,168 @@
+# polling/tests/services/test_scheduler.py
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from polling.models import PollJob
+from polling.services import (
+    ResultPoller,
+    backoff_delay,
+    get_poller,
+    poll_due,
+    register_poller,
+    schedule_poll,
+    schedule_polls,
+)
+from polling.services.scheduler import _claim_due
+from polling.utils.choices import PollJobStatus
+
+pytestmark = pytest.mark.django_db
+
+KIND = "test_result"
+
+
+@register_poller
+class FakePoller(ResultPoller):
+    kind = KIND
+    first_delay = 0
+    base_delay = 10
+    max_delay = 40
+    max_attempts = 3
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.ready = set()
+        self.resolved = set()
+        self.given_up = []
+
+    def prepare(self, object_id):
+        return None if object_id in self.resolved else object_id
+
+    async def fetch(self, client, object_id):
+        if object_id in self.ready:
+            return {"success": True}
+        return {"success": False, "status": "in_progress"}
+
+    def apply(self, object_id, prepared, result):
+        return result["success"]
+
+    def give_up(self, object_id, prepared, result):
+        self.given_up.append(object_id)
+
+
+def test_register_rejects_incomplete_poller():
+    class NoApply(ResultPoller):
+        kind = "test_incomplete"
+
+        def prepare(self, object_id):
+            return object_id
+
+        async def fetch(self, client, object_id):
+            return {}
+
+    with pytest.raises(TypeError):
+        register_poller(NoApply)
+    assert get_poller("test_incomplete") is None
+
+
+def _run_inline(call, items):
+    return {key: asyncio.run(call(None, value)) for key, value in items.items()}
+
+
+@pytest.fixture
+def poller():
+    fake = get_poller(KIND)
+    fake.reset()
+    with patch(
+            "polling.services.scheduler.run_concurrently", _run_inline
+    ):
+        yield fake
+
+
+class TestSchedule:
+    def test_one_open_job_per_object(self):
+        assert schedule_poll(KIND, 1, delay=60) is not None
+        assert schedule_poll(KIND, 1, delay=60) is None
+        assert PollJob.objects.filter(kind=KIND, object_id=1).count() == 1
+
+    def test_earlier_request_brings_check_forward(self):
+        job = schedule_poll(KIND, 1, delay=600)
+        schedule_poll(KIND, 1, delay=0)
+        job.refresh_from_db()
+        assert job.next_check_at <= timezone.now()
+
+    def test_bulk_skips_objects_already_polled(self):
+        schedule_poll(KIND, 1)
+        assert schedule_polls(KIND, [1, 2, 3], spread=60) == 2
+        assert PollJob.objects.filter(kind=KIND).count() == 3
+
+
+def test_backoff_grows_with_jitter_and_cap():
+    fake = get_poller(KIND)
+    for attempts, full in [(1, 10), (2, 20), (3, 40), (10, 40)]:
+        delays = [backoff_delay(fake, attempts) for _ in range(50)]
+        assert all(full / 2 <= d <= full for d in delays)
+    assert len({backoff_delay(fake, 1) for _ in range(10)}) > 1
+
+
+class TestPollDue:
+    def test_only_due_jobs_are_polled(self, poller):
+        poller.ready = {1, 2}
+        due = schedule_poll(KIND, 1)
+        later = schedule_poll(KIND, 2, delay=600)
+
+        result = poll_due(batch_size=10)
+
+        assert result.polled_count == 1
+        assert result.finished_count == 1
+        due.refresh_from_db()
+        later.refresh_from_db()
+        assert due.status == PollJobStatus.DONE
+        assert later.status == PollJobStatus.PENDING
+        assert later.attempts == 0
+
+    def test_not_ready_is_rescheduled_with_backoff(self, poller):
+        job = schedule_poll(KIND, 1)
+
+        poll_due()
+
+        job.refresh_from_db()
+        assert job.status == PollJobStatus.PENDING
+        assert job.attempts == 1
+        wait = (job.next_check_at - job.last_checked_at).total_seconds()
+        assert 5 <= wait <= 10
+        assert job.last_error == "in_progress"
+
+    def test_resolved_elsewhere_closes_without_a_check(self, poller):
+        poller.resolved = {1}
+        job = schedule_poll(KIND, 1)
+
+        poll_due()
+
+        job.refresh_from_db()
+        assert job.status == PollJobStatus.DONE
+        assert job.attempts == 0
+
+    def test_gives_up_after_max_attempts(self, poller):
+        job = schedule_poll(KIND, 1)
+        PollJob.objects.filter(pk=job.pk).update(attempts=2)
+
+        result = poll_due()
+
+        job.refresh_from_db()
+        assert result.failed_count == 1
+        assert job.status == PollJobStatus.FAILED
+        assert poller.given_up == [1]
+
+    def test_claimed_jobs_are_leased(self, poller):
+        schedule_poll(KIND, 1)
+        now = timezone.now()
+
+        assert len(_claim_due(now, 10)) == 1
+        assert _claim_due(now + timedelta(seconds=1), 10) == []
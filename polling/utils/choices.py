@@ -0,0 +1,15 @@
+# polling/utils/choices.py
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class PollJobStatus(models.TextChoices):
+    PENDING = "pending", _("در انتظار نتیجه")
+    DONE = "done", _("انجام شده")
+    FAILED = "failed", _("ناموفق")
+
+
+class PollKind(models.TextChoices):
+    VIDEO_KYC = "video_kyc", _("نتیجه احراز هویت ویدیویی")
+    LOAN_REPORT = "loan_report", _("گزارش اعتبارسنجی وام")
@@ -0,0 +1,14 @@
+# polling/utils/consts.py
+
+from django.conf import settings
+
+# Due jobs claimed per transaction, and batches per scheduler run
+POLL_BATCH_SIZE = getattr(settings, "POLL_BATCH_SIZE", 100)
+POLL_MAX_BATCHES = getattr(settings, "POLL_MAX_BATCHES", 10)
+
+# Claimed jobs are pushed this far ahead while their batch is polled, so a
+# crashed run only delays them instead of losing them
+POLL_CLAIM_LEASE_SECONDS = getattr(settings, "POLL_CLAIM_LEASE_SECONDS", 120)
+
+# Finished jobs are kept this long for auditing, then purged
+POLL_RETENTION_DAYS = getattr(settings, "POLL_RETENTION_DAYS", 7)
@@ -10,8 +10,8 @@ from django.utils.safestring import mark_safe
 from profiles.models.kyc_attempt import ProfileKYCAttempt
 from profiles.models.profile import Profile
 from profiles.tasks import (
-    verify_identity_phone_national_id,
-    check_profile_video_auth_result,
+    verify_identity_phone_national_id_batch,
+    check_video_auth_results_batch,
     reset_profile_video_auth,
 )
 from profiles.utils.choices import KYCStatus, AuthenticationStage
@@ -144,7 +144,7 @@ class ProfileAdmin(admin.ModelAdmin):
         description="ارسال دوباره استعلام شاهکار برای پروفایل‌های انتخاب‌شده"
     )
     def action_requeue_shahkar_for_profiles(self, request, queryset):
-        count = 0
+        profile_ids = []
         for p in queryset:
             if not (p.national_id and p.phone_number):
                 continue
@@ -152,8 +152,10 @@ class ProfileAdmin(admin.ModelAdmin):
                                                     KYCStatus.REJECTED,
                                                     KYCStatus.FAILED):
                 continue
-            verify_identity_phone_national_id.delay(p.id)
-            count += 1
+            profile_ids.append(p.id)
+        count = len(profile_ids)
+        if profile_ids:
+            verify_identity_phone_national_id_batch.delay(profile_ids)
         self.message_user(
             request,
             f"استعلام شاهکار برای {count} پروفایل صف شد." if count else "پروفایل واجد شرایطی وجود ندارد.",
@@ -164,10 +166,10 @@ class ProfileAdmin(admin.ModelAdmin):
         description="پول نتیجهٔ احراز ویدئویی برای پروفایل‌های انتخاب‌شده"
     )
     def action_poll_video_result_for_profiles(self, request, queryset):
-        count = 0
-        for p in queryset:
-            check_profile_video_auth_result.delay(p.id)
-            count += 1
+        profile_ids = list(queryset.values_list("id", flat=True))
+        count = len(profile_ids)
+        if profile_ids:
+            check_video_auth_results_batch.delay(profile_ids)
         self.message_user(
             request, f"پول نتیجه برای {count} پروفایل صف شد.",
             level=messages.SUCCESS
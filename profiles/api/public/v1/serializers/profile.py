@@ -2,10 +2,10 @@
 
 import re
 
-from django.db import transaction
 from rest_framework import serializers
 
 from auth_api.api.public.v1.serializers.mixins import OTPValidationMixin
+from outbox.services import enqueue
 from profiles.models.profile import Profile
 from profiles.tasks import verify_identity_phone_national_id
 from profiles.utils.choices import AuthenticationStage
@@ -156,8 +156,9 @@ class ProfileSerializer(serializers.ModelSerializer, OTPValidationMixin):
         instance.save()
 
         if national_id_updated:
-            transaction.on_commit(
-                lambda: verify_identity_phone_national_id.delay(instance.id)
+            enqueue(
+                verify_identity_phone_national_id, (instance.id,),
+                dedup_key=f"kyc:shahkar:{instance.id}",
             )
 
         return instance
@@ -1,16 +1,11 @@
 # profiles/api/public/v1/views/video_kyc.py
 
-import hashlib
-import os
-import tempfile
-
 from django.conf import settings
-from django.core.files.base import ContentFile
-from django.core.files.storage import default_storage
 from rest_framework import status, generics
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from kyc.utils.video_blob import delete_video_blob, save_video_blob
 from profiles.api.public.v1.schema import VIDEO_KYC_SUBMIT_SCHEMA
 from profiles.api.public.v1.serializers import VideoKYCSerializer
 from profiles.models.kyc_video_asset import KYCVideoAsset
@@ -38,7 +33,9 @@ class VideoKYCSubmitView(generics.GenericAPIView):
         video_file = serializer.validated_data['selfieVideo']
         rand_action = serializer.validated_data['randAction']
 
-        # Persist a durable copy only when policy requires (approved_only or short_all)
+        # One streamed write to shared storage. When policy keeps a durable
+        # copy (approved_only / short_all) that copy is the blob the worker
+        # reads; otherwise the blob is temporary and reaped after the task.
         asset_id = None
         if getattr(settings, "KYC_VIDEO_RETENTION_MODE", "approved_only") in (
                 "approved_only", "short_all"):
@@ -51,14 +48,9 @@ class VideoKYCSubmitView(generics.GenericAPIView):
                 created_by_attempt=None,  # بعداً در task لینک می‌شود
             )
             asset_id = asset.id
-            # rewind file pointer for temp save
-            try:
-                video_file.seek(0)
-            except Exception:
-                pass
-
-        # Save a temp file for calling provider (always)
-        tmp_file_path = self._save_temp_video(video_file)
+            video_key = asset.file.name
+        else:
+            video_key = save_video_blob(video_file).key
 
         try:
             # Submit video authentication task (async)
@@ -66,7 +58,7 @@ class VideoKYCSubmitView(generics.GenericAPIView):
                 profile_id=profile.id,
                 national_code=profile.national_id,
                 birth_date=profile.birth_date.replace("/", ""),
-                selfie_video_path=tmp_file_path,
+                selfie_video_key=video_key,
                 rand_action=rand_action,
                 durable_asset_id=asset_id,
             )
@@ -79,12 +71,9 @@ class VideoKYCSubmitView(generics.GenericAPIView):
                 status=status.HTTP_202_ACCEPTED,
             )
         except Exception as e:
-            # Clean up temporary file on error
-            if os.path.exists(tmp_file_path):
-                try:
-                    os.unlink(tmp_file_path)
-                except Exception:
-                    pass
+            # The task never got the blob; drop it unless it is the asset
+            if asset_id is None:
+                delete_video_blob(video_key)
 
             return Response(
                 {
@@ -94,13 +83,3 @@ class VideoKYCSubmitView(generics.GenericAPIView):
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
-
-    def _save_temp_video(self, video_file) -> str:
-        """Save uploaded video to a temporary file and return its absolute path."""
-        suffix = os.path.splitext(video_file.name)[1] or ".mp4"
-        with tempfile.NamedTemporaryFile(
-                delete=False, suffix=suffix
-        ) as tmp_file:
-            for chunk in video_file.chunks():
-                tmp_file.write(chunk)
-            return tmp_file.name
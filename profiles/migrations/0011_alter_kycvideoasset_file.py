@@ -0,0 +1,19 @@
+# Generated by Django 5.0 on 2026-10-16 21:00
+
+import kyc.utils.video_blob
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0010_rename_kycvideoasset2_kycvideoasset'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='kycvideoasset',
+            name='file',
+            field=models.FileField(storage=kyc.utils.video_blob.get_video_storage, upload_to='kyc_videos/%Y/%m/%d/', verbose_name='فایل ویدئو'),
+        ),
+    ]
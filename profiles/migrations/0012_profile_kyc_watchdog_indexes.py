@@ -0,0 +1,22 @@
+# Generated by Django 5.0 on 2026-10-16 22:00
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0011_alter_kycvideoasset_file'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('updated_at', 'created_at'), condition=models.Q(('national_id__isnull', False), ('phone_number__isnull', False), models.Q(('phone_national_id_match_status__isnull', True), ('phone_national_id_match_status', 'processing'), _connector='OR')), name='profile_shahkar_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('video_auth_last_checked_at', 'video_submitted_at', 'updated_at', 'created_at'), condition=models.Q(('auth_stage', 2), ('video_auth_status', 'processing')), name='profile_video_pending_idx'),
+        ),
+    ]
@@ -1,20 +1,20 @@
 # profiles/models/kyc_video_asset.py
 
-import hashlib
+import os
 
-from django.core.files.base import ContentFile
-from django.core.files.storage import default_storage
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from kyc.utils.video_blob import get_video_storage, save_video_blob
 from lib.erp_base.models import BaseModel
 
 
 class KYCVideoAsset(BaseModel):
     """
     Durable copy of a submitted KYC video with retention policy metadata.
-    - 'file' should be stored on a durable storage (S3, etc).
+    - 'file' lives on the shared video storage (KYC_VIDEO_UPLOAD_STORAGE),
+      the same blob the provider task streams from.
     - 'retention_until' = None means keep indefinitely (infinite retention).
     """
     profile = models.ForeignKey(
@@ -24,7 +24,9 @@ class KYCVideoAsset(BaseModel):
         verbose_name=_("پروفایل"),
     )
     file = models.FileField(
-        upload_to="kyc_videos/%Y/%m/%d/", verbose_name=_("فایل ویدئو")
+        upload_to="kyc_videos/%Y/%m/%d/",
+        storage=get_video_storage,
+        verbose_name=_("فایل ویدئو"),
     )
     sha256 = models.CharField(
         max_length=64, blank=True, null=True, verbose_name=_("هش SHA256")
@@ -52,21 +54,21 @@ class KYCVideoAsset(BaseModel):
     ) -> "KYCVideoAsset":
         """
         Persist a durable copy from an uploaded Django file:
-        - Streams file to memory for hashing (OK for <= ~50MB per your validator)
-        - Saves through default_storage using a prefixed path
-        - Returns created KYCVideoAsset with sha256 & size
+        - Streams the upload once into the shared video storage, hashing
+          chunk by chunk on the way
+        - Returns created KYCVideoAsset with sha256 & size; its file key
+          can be handed to the provider task as-is
         """
-        # read() is acceptable here given your 50MB validator; if larger, refactor to chunked hashing
-        content = django_file.read()
-        sha256 = hashlib.sha256(content).hexdigest()
-        prefix = (storage_prefix or "kyc_videos/").rstrip("/") + "/"
-        filename = f"{prefix}{profile.id}-{django_file.name}"
-        path = default_storage.save(filename, ContentFile(content))
+        blob = save_video_blob(
+            django_file,
+            prefix=storage_prefix or "kyc_videos/",
+            name=f"{profile.id}-{os.path.basename(django_file.name)}",
+        )
         return cls.objects.create(
             profile=profile,
-            file=path,
-            sha256=sha256,
-            size=len(content),
+            file=blob.key,
+            sha256=blob.sha256,
+            size=blob.size,
             created_by_attempt=created_by_attempt,
         )
 
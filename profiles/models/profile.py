@@ -4,6 +4,7 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 from django.db import models, transaction
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -299,4 +300,32 @@ class Profile(BaseModel):
             models.Index(fields=["video_auth_status"]),
             models.Index(fields=["phone_national_id_match_status"]),
             models.Index(fields=["video_task_id"]),
+            # Watchdog scans: only profiles still waiting on Shahkar / video
+            models.Index(
+                Coalesce("updated_at", "created_at"),
+                condition=(
+                    models.Q(
+                        national_id__isnull=False,
+                        phone_number__isnull=False,
+                    )
+                    & (
+                        models.Q(phone_national_id_match_status__isnull=True)
+                        | models.Q(
+                            phone_national_id_match_status=KYCStatus.PROCESSING
+                        )
+                    )
+                ),
+                name="profile_shahkar_pending_idx",
+            ),
+            models.Index(
+                Coalesce(
+                    "video_auth_last_checked_at", "video_submitted_at",
+                    "updated_at", "created_at",
+                ),
+                condition=models.Q(
+                    auth_stage=AuthenticationStage.IDENTITY_VERIFIED,
+                    video_auth_status=KYCStatus.PROCESSING,
+                ),
+                name="profile_video_pending_idx",
+            ),
         ]
@@ -0,0 +1,51 @@
+# profiles/pollers.py
+
+from django.conf import settings
+
+from polling.services import ResultPoller, register_poller
+from polling.utils.choices import PollKind
+from profiles.tasks import (
+    _begin_video_result_check,
+    _finish_video_result_check,
+    _note_video_result_pending,
+    _video_result_not_ready,
+)
+
+
+@register_poller
+class VideoKYCResultPoller(ResultPoller):
+    """Waits for the provider's verdict on a submitted selfie video."""
+    kind = PollKind.VIDEO_KYC
+    first_delay = getattr(settings, "KYC_VIDEO_POLL_FIRST_DELAY", 30)
+    base_delay = getattr(settings, "KYC_VIDEO_POLL_BASE_DELAY", 15)
+    max_delay = getattr(settings, "KYC_VIDEO_POLL_MAX_DELAY", 10 * 60)
+    max_attempts = getattr(settings, "KYC_VIDEO_POLL_MAX_ATTEMPTS", 20)
+
+    def prepare(self, profile_id):
+        attempt, video_task_id, early = _begin_video_result_check(profile_id)
+        if early is not None:
+            return None
+        return attempt, video_task_id
+
+    async def fetch(self, client, prepared):
+        _, video_task_id = prepared
+        return await client.get_video_verification_result(video_task_id)
+
+    def apply(self, profile_id, prepared, result):
+        attempt, _ = prepared
+        if _video_result_not_ready(result):
+            _note_video_result_pending(profile_id, attempt)
+            return False
+        _finish_video_result_check(profile_id, attempt, result)
+        return True
+
+    def give_up(self, profile_id, prepared, result):
+        if prepared is None:
+            return
+        attempt, _ = prepared
+        if isinstance(result, Exception):
+            attempt.mark_failed(
+                error_message=str(result), error_code="network_error"
+            )
+        else:
+            attempt.mark_failed("max_retries_exceeded", response_payload=result)
@@ -1,19 +1,25 @@
 # profiles/tasks.py
 
 import logging
-import os
 from datetime import timedelta
 
 from celery import shared_task
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from kyc.services.async_provider_client import run_concurrently
 from kyc.services.identity_auth_service import (
     IdentityAuthService,
     get_identity_auth_service,
 )
+from kyc.utils.video_blob import delete_video_blob, reap_expired_video_blobs
+from outbox.services import enqueue
+from polling.services import schedule_poll, schedule_polls
+from polling.utils.choices import PollKind
 from profiles.models import Profile, KYCVideoAsset
 from profiles.models.kyc_attempt import (
     ProfileKYCAttempt,
@@ -107,70 +113,100 @@ def _apply_retention_policy(
             a.delete()
 
 
-def _cleanup_temp_file(file_path: str) -> None:
-    """Safely delete a temporary file if it exists."""
-    if file_path and os.path.exists(file_path):
-        try:
-            os.unlink(file_path)
-            logger.info(f"Cleaned up temporary file: {file_path}")
-        except Exception as e:
-            logger.warning(f"Failed to cleanup temp file {file_path}: {e}")
+def _discard_upload(video_key: str, durable_asset_id: int | None) -> None:
+    """
+    Drop the uploaded video blob once the provider no longer needs it.
+    A blob backing a durable asset is left to the retention policy.
+    """
+    if durable_asset_id:
+        return
+    delete_video_blob(video_key)
+    logger.info(f"Discarded uploaded video blob: {video_key}")
 
 
 # -----------------------------
-# Helper to (re)queue Shahkar
+# Watchdog selection & dispatch
 # -----------------------------
-def _should_queue_shahkar(
-        profile: Profile, now: timezone.datetime, stale_after: timedelta
-) -> bool:
+def _stale_shahkar_profiles(now, stale_after: timedelta):
     """
-    Decide if Shahkar verification should be (re)queued for this profile.
-    Rules:
+    Profiles whose Shahkar verification should be (re)queued, decided in
+    SQL on top of profile_shahkar_pending_idx. Rules:
       - must have national_id & phone_number
-      - if status is ACCEPTED/REJECTED -> do not queue
-      - if status is FAILED -> do not auto queue (needs user fix), except you want otherwise
-      - if status is PROCESSING but stale (no update since 'stale_after') -> queue
-      - if status is None -> queue if last attempt is stale or missing
+      - ACCEPTED/REJECTED are terminal; FAILED needs a user fix -> skipped
+      - PROCESSING but not updated since 'stale_after' -> queue
+      - None -> queue if never attempted, or if the last attempt did not
+        succeed and is older than 'stale_after'
+    Oldest first.
     """
-    if not profile.national_id or not profile.phone_number:
-        return False
-
-    status = profile.phone_national_id_match_status
-
-    # Accepted or Rejected are terminal for Shahkar flow (no auto-retry)
-    if status in (KYCStatus.ACCEPTED, KYCStatus.REJECTED):
-        return False
-
-    # Validation FAILED usually requires user correction; do not auto-enqueue
-    if status == KYCStatus.FAILED:
-        return False
-
-    # For PROCESSING -> stale?
-    if status == KYCStatus.PROCESSING:
-        updated = profile.updated_at or profile.created_at
-        return (now - updated) > stale_after
-
-    # For None -> check attempt recency
-    last_attempt = (
-        ProfileKYCAttempt.objects
-        .filter(profile=profile, attempt_type=AttemptType.SHAHKAR)
-        .order_by("-created_at")
-        .first()
+    cutoff = now - stale_after
+    last_attempt = ProfileKYCAttempt.objects.filter(
+        profile=OuterRef("pk"), attempt_type=AttemptType.SHAHKAR
+    ).order_by("-created_at")
+    return (
+        Profile.objects
+        .filter(
+            Q(phone_national_id_match_status__isnull=True)
+            | Q(phone_national_id_match_status=KYCStatus.PROCESSING),
+            national_id__isnull=False,
+            phone_number__isnull=False,
+        )
+        .exclude(national_id="")
+        .exclude(phone_number="")
+        .annotate(
+            touched_at=Coalesce("updated_at", "created_at"),
+            last_attempt_at=Subquery(last_attempt.values("created_at")[:1]),
+            last_attempt_status=Subquery(last_attempt.values("status")[:1]),
+        )
+        .filter(
+            Q(
+                phone_national_id_match_status=KYCStatus.PROCESSING,
+                touched_at__lt=cutoff,
+            )
+            | Q(
+                phone_national_id_match_status__isnull=True,
+                last_attempt_at__isnull=True,
+            )
+            | (
+                    Q(
+                        phone_national_id_match_status__isnull=True,
+                        last_attempt_at__lt=cutoff,
+                    )
+                    & ~Q(last_attempt_status=AttemptStatus.SUCCESS)
+            )
+        )
+        .order_by("touched_at")
     )
-    if not last_attempt:
-        return True
 
-    # If last attempt is SUCCESS and we are None => shouldn't happen; skip
-    if last_attempt.status == AttemptStatus.SUCCESS:
-        return False
 
-    # If last attempt FAILED/REJECTED recently, skip; else requeue
-    return (now - last_attempt.created_at) > stale_after
+def _stale_video_profiles(now, stale_after: timedelta):
+    """
+    Profiles waiting on a video result that nobody has polled since
+    'stale_after' (profile_video_pending_idx). Oldest first.
+    """
+    return (
+        Profile.objects
+        .filter(
+            auth_stage=AuthenticationStage.IDENTITY_VERIFIED,
+            video_auth_status=KYCStatus.PROCESSING,
+        )
+        .exclude(video_task_id__isnull=True)
+        .exclude(video_task_id__exact="")
+        .annotate(
+            last_touched_at=Coalesce(
+                "video_auth_last_checked_at", "video_submitted_at",
+                "updated_at", "created_at",
+            )
+        )
+        .filter(last_touched_at__lt=now - stale_after)
+        .order_by("last_touched_at")
+    )
 
 
-def _enqueue_shahkar(profile_id: int) -> None:
-    """Enqueue Shahkar verification task."""
-    verify_identity_phone_national_id.apply_async((profile_id,), countdown=1)
+def _batches(profile_ids: list[int], batch_size: int) -> list[list[int]]:
+    return [
+        profile_ids[i:i + batch_size]
+        for i in range(0, len(profile_ids), batch_size)
+    ]
 
 
 @shared_task(bind=True)
@@ -179,7 +215,7 @@ def submit_profile_video_auth(
         profile_id: int,
         national_code: str,
         birth_date: str,
-        selfie_video_path: str,
+        selfie_video_key: str,
         rand_action: str,
         matching_thr: int | None = None,
         liveness_thr: int | None = None,
@@ -210,7 +246,7 @@ def submit_profile_video_auth(
             except Exception:
                 logger.warning("Could not link KYCVideoAsset to attempt")
     except AttemptAlreadyProcessing:
-        _cleanup_temp_file(selfie_video_path)
+        _discard_upload(selfie_video_key, durable_asset_id)
         logger.warning(
             f"Profile {profile_id}: duplicate video submit while processing"
         )
@@ -225,12 +261,12 @@ def submit_profile_video_auth(
         try:
             profile = Profile.objects.select_for_update().get(id=profile_id)
         except Profile.DoesNotExist:
-            _cleanup_temp_file(selfie_video_path)
+            _discard_upload(selfie_video_key, durable_asset_id)
             attempt.mark_failed("profile_not_found")
             return {"success": False, "error": "profile_not_found"}
 
         if not profile.can_submit_video_auth():
-            _cleanup_temp_file(selfie_video_path)
+            _discard_upload(selfie_video_key, durable_asset_id)
             attempt.mark_failed("invalid_profile_state")
             logger.warning(
                 f"Profile {profile_id} cannot submit video authentication. "
@@ -246,7 +282,7 @@ def submit_profile_video_auth(
             }
 
         if profile.is_video_auth_in_progress():
-            _cleanup_temp_file(selfie_video_path)
+            _discard_upload(selfie_video_key, durable_asset_id)
             attempt.mark_failed("kyc_in_progress")
             logger.warning(
                 f"Profile {profile_id} already has video authentication in progress (status: {profile.video_auth_status})."
@@ -258,7 +294,7 @@ def submit_profile_video_auth(
             }
 
         if profile.video_auth_status == KYCStatus.ACCEPTED:
-            _cleanup_temp_file(selfie_video_path)
+            _discard_upload(selfie_video_key, durable_asset_id)
             attempt.mark_failed("already_accepted")
             logger.warning(
                 f"Profile {profile_id} already has accepted video authentication status."
@@ -275,19 +311,20 @@ def submit_profile_video_auth(
         result = service.verify_idcard_video(
             national_code=national_code,
             birth_date=birth_date,
-            selfie_video_path=selfie_video_path,
+            selfie_video_path=None,
+            selfie_video_key=selfie_video_key,
             rand_action=rand_action,
             matching_thr=matching_thr,
             liveness_thr=liveness_thr,
         )
     except Exception as e:
-        _cleanup_temp_file(selfie_video_path)
-        # Retry on transient errors
+        # Retry on transient errors; the blob stays for the next attempt
         max_retries = getattr(settings, "KYC_VIDEO_SUBMIT_MAX_RETRIES", 3)
         retry_delay = getattr(settings, "KYC_VIDEO_SUBMIT_RETRY_DELAY", 60)
         attempt.bump_retry()
         if self.request.retries < max_retries:
             raise self.retry(exc=e, countdown=retry_delay)
+        _discard_upload(selfie_video_key, durable_asset_id)
         attempt.mark_failed(
             error_message=str(e),
             error_code="service_unavailable",
@@ -297,7 +334,7 @@ def submit_profile_video_auth(
         }
 
     if not result.get("success"):
-        _cleanup_temp_file(selfie_video_path)
+        _discard_upload(selfie_video_key, durable_asset_id)
         error_msg = result.get("error", "Unknown service error")
         attempt.mark_failed(error_msg, response_payload=result)
         logger.error(
@@ -311,7 +348,7 @@ def submit_profile_video_auth(
     data = (result or {}).get("data") or {}
     unique_id = data.get("uniqueId")
     if not unique_id:
-        _cleanup_temp_file(selfie_video_path)
+        _discard_upload(selfie_video_key, durable_asset_id)
         attempt.mark_failed("missing_unique_id", response_payload=result)
         logger.error(
             f"Profile {profile_id}: No unique ID returned from KYC service"
@@ -322,8 +359,8 @@ def submit_profile_video_auth(
             "message": "No unique ID returned from KYC service",
         }
 
-    # Cleanup temp file on success too
-    _cleanup_temp_file(selfie_video_path)
+    # Discard the upload blob on success too
+    _discard_upload(selfie_video_key, durable_asset_id)
 
     # Save task id & schedule polling
     with transaction.atomic():
@@ -333,11 +370,7 @@ def submit_profile_video_auth(
             attempt.mark_success(
                 response_payload=result, external_id=unique_id
             )
-            transaction.on_commit(
-                lambda: check_profile_video_auth_result.apply_async(
-                    (profile_id,), countdown=30
-                )
-            )
+            schedule_poll(PollKind.VIDEO_KYC, profile_id)
             logger.info(
                 f"Profile {profile_id}: Video authentication submitted. Task ID: {unique_id}"
             )
@@ -371,11 +404,11 @@ def submit_profile_video_auth(
     return {"success": True, "unique_id": unique_id}
 
 
-@shared_task(bind=True)
-def check_profile_video_auth_result(self, profile_id: int) -> dict:
+def _begin_video_result_check(profile_id: int):
     """
-    Poll provider for video authentication result and update profile.
-    Reschedules itself if result is not ready yet.
+    Open (or resume) the VIDEO_RESULT attempt and check the profile is
+    still waiting for a result. Returns (attempt, video_task_id, None), or
+    (None, None, result) when there is nothing to poll.
     """
     try:
         attempt = ProfileKYCAttempt.start_new(
@@ -392,7 +425,7 @@ def check_profile_video_auth_result(self, profile_id: int) -> dict:
                    .order_by("-created_at")
                    .first())
         if not attempt:
-            return {"success": False, "error": "poll_in_progress"}
+            return None, None, {"success": False, "error": "poll_in_progress"}
 
     # Lock and verify state
     with transaction.atomic():
@@ -400,14 +433,14 @@ def check_profile_video_auth_result(self, profile_id: int) -> dict:
             profile = Profile.objects.select_for_update().get(id=profile_id)
         except Profile.DoesNotExist:
             attempt.mark_failed("profile_not_found")
-            return {"success": False, "error": "profile_not_found"}
+            return None, None, {"success": False, "error": "profile_not_found"}
 
         if not profile.is_video_auth_in_progress():
             attempt.mark_failed("invalid_profile_state")
             logger.warning(
                 f"Profile {profile_id} invalid for result check: {profile.auth_stage}/{profile.video_auth_status}"
             )
-            return {
+            return None, None, {
                 "success": False,
                 "error": "invalid_profile_state",
                 "message": (
@@ -419,63 +452,33 @@ def check_profile_video_auth_result(self, profile_id: int) -> dict:
         if not profile.has_valid_video_task():
             attempt.mark_failed("missing_video_task_id")
             logger.error(f"Profile {profile_id} has no valid video task ID")
-            return {"success": False, "error": "missing_video_task_id"}
-
-        video_task_id = profile.video_task_id
-
-    service: IdentityAuthService = get_identity_auth_service()
-    try:
-        result = service.get_video_verification_result(video_task_id)
-    except Exception as e:
-        max_retries = getattr(settings, "KYC_VIDEO_CHECK_MAX_RETRIES", 6)
-        retry_delay = getattr(settings, "KYC_VIDEO_CHECK_RETRY_DELAY", 30)
-        attempt.bump_retry()
-
-        with transaction.atomic():
-            try:
-                profile = Profile.objects.select_for_update().get(
-                    id=profile_id
-                )
-                profile.touch_video_auth_check()
-            except Profile.DoesNotExist:
-                pass
+            return None, None, {
+                "success": False, "error": "missing_video_task_id"
+            }
 
-        if self.request.retries < max_retries:
-            raise self.retry(exc=e, countdown=retry_delay)
+        return attempt, profile.video_task_id, None
 
-        attempt.mark_failed(error_message=str(e), error_code="network_error")
-        logger.error(f"Profile {profile_id}: Network error after max retries")
-        return {"success": False, "error": "poll_timeout"}
 
-    # Not-ready signals
-    if not result.get("success") and result.get("status") in {
+def _video_result_not_ready(result: dict) -> bool:
+    return not result.get("success") and result.get("status") in {
         404,
         "in_progress",
         "network"
-    }:
-        max_retries = getattr(settings, "KYC_VIDEO_CHECK_MAX_RETRIES", 6)
-        retry_delay = getattr(settings, "KYC_VIDEO_CHECK_RETRY_DELAY", 30)
-        attempt.bump_retry()
-        with transaction.atomic():
-            try:
-                profile = Profile.objects.select_for_update().get(
-                    id=profile_id
-                )
-                profile.touch_video_auth_check()
-            except Profile.DoesNotExist:
-                pass
+    }
 
-        if self.request.retries < max_retries:
-            logger.info(
-                f"Profile {profile_id}: result not ready; retrying in {retry_delay}s"
-            )
-            raise self.retry(
-                exc=Exception("result_not_ready"), countdown=retry_delay
-            )
 
-        attempt.mark_failed("max_retries_exceeded", response_payload=result)
-        return {"success": False, "error": "poll_timeout"}
+def _note_video_result_pending(profile_id: int, attempt) -> None:
+    attempt.bump_retry()
+    with transaction.atomic():
+        try:
+            profile = Profile.objects.select_for_update().get(id=profile_id)
+            profile.touch_video_auth_check()
+        except Profile.DoesNotExist:
+            pass
+
 
+def _finish_video_result_check(profile_id: int, attempt, result: dict) -> dict:
+    """Apply a final provider answer (verdict or hard error) to the profile."""
     # Other service errors
     if not result.get("success"):
         error_msg = result.get("error", "Unknown service error")
@@ -556,6 +559,70 @@ def check_profile_video_auth_result(self, profile_id: int) -> dict:
     return {"success": True, "accepted": accepted, "status": final_status}
 
 
+@shared_task(bind=True)
+def check_profile_video_auth_result(self, profile_id: int) -> dict:
+    """
+    Poll provider for video authentication result and update profile.
+    A result that is not ready yet is left to the polling scheduler, which
+    checks again with backoff.
+    """
+    attempt, video_task_id, early = _begin_video_result_check(profile_id)
+    if early is not None:
+        return early
+
+    service: IdentityAuthService = get_identity_auth_service()
+    try:
+        result = service.get_video_verification_result(video_task_id)
+    except Exception as e:
+        logger.warning(f"Profile {profile_id}: result check failed: {e}")
+        result = None
+
+    # Not-ready signals
+    if result is None or _video_result_not_ready(result):
+        _note_video_result_pending(profile_id, attempt)
+        schedule_poll(PollKind.VIDEO_KYC, profile_id)
+        logger.info(f"Profile {profile_id}: result not ready; polling later")
+        return {"success": False, "error": "result_not_ready"}
+
+    return _finish_video_result_check(profile_id, attempt, result)
+
+
+@shared_task
+def check_video_auth_results_batch(profile_ids: list[int]) -> dict:
+    """
+    Async variant of check_profile_video_auth_result for many profiles:
+    one worker polls the provider for all of them concurrently. Profiles
+    whose result is not ready are handed to the polling scheduler.
+    """
+    checks = {}
+    for profile_id in profile_ids:
+        attempt, video_task_id, early = _begin_video_result_check(profile_id)
+        if early is None:
+            checks[profile_id] = (attempt, video_task_id)
+
+    results = run_concurrently(
+        lambda client, check: client.get_video_verification_result(check[1]),
+        checks,
+    )
+
+    finished, pending = 0, []
+    for profile_id, (attempt, _) in checks.items():
+        result = results[profile_id]
+        if isinstance(result, Exception) or _video_result_not_ready(result):
+            _note_video_result_pending(profile_id, attempt)
+            pending.append(profile_id)
+            continue
+        _finish_video_result_check(profile_id, attempt, result)
+        finished += 1
+
+    schedule_polls(PollKind.VIDEO_KYC, pending)
+    logger.info(
+        f"Video result batch: polled={len(checks)} finished={finished} "
+        f"pending={len(pending)}"
+    )
+    return {"success": True, "finished": finished, "pending": len(pending)}
+
+
 @shared_task(bind=True)
 def reset_profile_video_auth(
         self, profile_id: int, reason: str = "manual_reset"
@@ -623,33 +690,44 @@ def reset_profile_video_auth(
     }
 
 
-@shared_task(bind=True)
-def verify_identity_phone_national_id(self, profile_id: int) -> dict:
+def _begin_shahkar_check(profile_id: int, attempt_id: int | None = None):
     """
-    Verify phone number and national ID matching using Shahkar API.
-    Updates phone_national_id_match_status and auth_stage based on verification result.
+    Open the SHAHKAR attempt (or resume `attempt_id` on a batch retry) and
+    mark the profile as processing. Returns (attempt, profile, None), or
+    (None, None, result) when the provider should not be called.
     """
-    try:
-        attempt = ProfileKYCAttempt.start_new(
-            profile_id=profile_id,
-            attempt_type=AttemptType.SHAHKAR,
-        )
-    except AttemptAlreadyProcessing:
-        logger.info(f"Profile {profile_id}: shahkar already in processing")
-        return {"success": False, "error": "shahkar_in_progress"}
+    if attempt_id is None:
+        try:
+            attempt = ProfileKYCAttempt.start_new(
+                profile_id=profile_id,
+                attempt_type=AttemptType.SHAHKAR,
+            )
+        except AttemptAlreadyProcessing:
+            logger.info(f"Profile {profile_id}: shahkar already in processing")
+            return None, None, {
+                "success": False, "error": "shahkar_in_progress"
+            }
+    else:
+        attempt = ProfileKYCAttempt.objects.filter(
+            pk=attempt_id, status=AttemptStatus.PROCESSING
+        ).first()
+        if attempt is None:
+            return None, None, {
+                "success": False, "error": "attempt_not_processing"
+            }
 
     try:
         profile = Profile.objects.get(id=profile_id)
     except Profile.DoesNotExist:
         attempt.mark_failed("profile_not_found")
-        return {"success": False, "error": "profile_not_found"}
+        return None, None, {"success": False, "error": "profile_not_found"}
 
     if not profile.national_id or not profile.phone_number:
         attempt.mark_failed("missing_required_fields")
         logger.warning(
             f"Profile {profile_id}: Missing national_id or phone_number"
         )
-        return {
+        return None, None, {
             "success": False,
             "error": "missing_required_fields",
             "message": "National ID and phone number are required",
@@ -662,46 +740,41 @@ def verify_identity_phone_national_id(self, profile_id: int) -> dict:
             if p.phone_national_id_match_status in (KYCStatus.ACCEPTED,
                                                     KYCStatus.REJECTED):
                 attempt.mark_failed("terminal_state")
-                return {"success": False, "error": "terminal_state"}
+                return None, None, {
+                    "success": False, "error": "terminal_state"
+                }
             p.begin_phone_national_id_check()
         except Profile.DoesNotExist:
             attempt.mark_failed("profile_not_found")
-            return {"success": False, "error": "profile_not_found"}
+            return None, None, {
+                "success": False, "error": "profile_not_found"
+            }
 
-    service: IdentityAuthService = get_identity_auth_service()
+    return attempt, profile, None
+
+
+def _shahkar_service_unavailable(profile_id: int, attempt, error) -> dict:
+    logger.error(
+        f"Profile {profile_id}: Shahkar API error after max retries: {error}"
+    )
     try:
-        result = service.verify_mobile_national_id(
-            national_code=profile.national_id,
-            mobile_number=profile.phone_number,
-        )
-    except Exception as e:
-        max_retries = getattr(settings, "KYC_SHAHKAR_MAX_RETRIES", 3)
-        retry_delay = getattr(settings, "KYC_SHAHKAR_RETRY_DELAY", 60)
-        attempt.bump_retry()
-        if self.request.retries < max_retries:
-            logger.warning(
-                f"Profile {profile_id}: Shahkar API error, retrying: {e}"
+        with transaction.atomic():
+            p = Profile.objects.select_for_update().get(id=profile_id)
+            p.phone_national_id_match_status = None
+            p.save(
+                update_fields=["phone_national_id_match_status",
+                               "updated_at"]
             )
-            raise self.retry(exc=e, countdown=retry_delay)
+    except Profile.DoesNotExist:
+        pass
+    attempt.mark_failed(
+        error_message=str(error), error_code="service_unavailable"
+    )
+    return {"success": False, "error": "service_unavailable"}
 
-        logger.error(
-            f"Profile {profile_id}: Shahkar API error after max retries: {e}"
-        )
-        try:
-            with transaction.atomic():
-                p = Profile.objects.select_for_update().get(id=profile_id)
-                p.phone_national_id_match_status = None
-                p.save(
-                    update_fields=["phone_national_id_match_status",
-                                   "updated_at"]
-                )
-        except Profile.DoesNotExist:
-            pass
-        attempt.mark_failed(
-            error_message=str(e), error_code="service_unavailable"
-        )
-        return {"success": False, "error": "service_unavailable"}
 
+def _finish_shahkar_check(profile_id: int, attempt, result: dict) -> dict:
+    """Apply a Shahkar provider answer to the profile and the attempt."""
     if not result.get("success"):
         error_msg = result.get("error", "Unknown service error")
         is_validation_error = result.get("is_validation_error", False)
@@ -781,6 +854,94 @@ def verify_identity_phone_national_id(self, profile_id: int) -> dict:
         }
 
 
+@shared_task(bind=True)
+def verify_identity_phone_national_id(self, profile_id: int) -> dict:
+    """
+    Verify phone number and national ID matching using Shahkar API.
+    Updates phone_national_id_match_status and auth_stage based on verification result.
+    """
+    attempt, profile, early = _begin_shahkar_check(profile_id)
+    if early is not None:
+        return early
+
+    service: IdentityAuthService = get_identity_auth_service()
+    try:
+        result = service.verify_mobile_national_id(
+            national_code=profile.national_id,
+            mobile_number=profile.phone_number,
+        )
+    except Exception as e:
+        max_retries = getattr(settings, "KYC_SHAHKAR_MAX_RETRIES", 3)
+        retry_delay = getattr(settings, "KYC_SHAHKAR_RETRY_DELAY", 60)
+        attempt.bump_retry()
+        if self.request.retries < max_retries:
+            logger.warning(
+                f"Profile {profile_id}: Shahkar API error, retrying: {e}"
+            )
+            raise self.retry(exc=e, countdown=retry_delay)
+        return _shahkar_service_unavailable(profile_id, attempt, e)
+
+    return _finish_shahkar_check(profile_id, attempt, result)
+
+
+@shared_task
+def verify_identity_phone_national_id_batch(
+        profile_ids: list[int],
+        attempt_ids: list[int] | None = None,
+        attempt_round: int = 0,
+) -> dict:
+    """
+    Async variant of verify_identity_phone_national_id for many profiles:
+    one worker sends all Shahkar inquiries concurrently. Profiles whose
+    call raised are retried together, keeping their attempts
+    (`attempt_ids`, parallel to `profile_ids`).
+    """
+    max_retries = getattr(settings, "KYC_SHAHKAR_MAX_RETRIES", 3)
+    retry_delay = getattr(settings, "KYC_SHAHKAR_RETRY_DELAY", 60)
+
+    checks = {}
+    for profile_id, attempt_id in zip(
+            profile_ids, attempt_ids or [None] * len(profile_ids)
+    ):
+        attempt, profile, early = _begin_shahkar_check(profile_id, attempt_id)
+        if early is None:
+            checks[profile_id] = (attempt, profile)
+
+    results = run_concurrently(
+        lambda client, check: client.verify_mobile_national_id(
+            national_code=check[1].national_id,
+            mobile_number=check[1].phone_number,
+        ),
+        checks,
+    )
+
+    finished, retry = 0, []
+    for profile_id, (attempt, _) in checks.items():
+        result = results[profile_id]
+        if isinstance(result, Exception):
+            attempt.bump_retry()
+            if attempt_round < max_retries:
+                retry.append((profile_id, attempt.pk))
+            else:
+                _shahkar_service_unavailable(profile_id, attempt, result)
+            continue
+        _finish_shahkar_check(profile_id, attempt, result)
+        finished += 1
+
+    if retry:
+        retry_profile_ids, retry_attempt_ids = map(list, zip(*retry))
+        enqueue(
+            verify_identity_phone_national_id_batch,
+            (retry_profile_ids, retry_attempt_ids, attempt_round + 1),
+            countdown=retry_delay,
+        )
+    logger.info(
+        f"Shahkar batch: checked={len(checks)} finished={finished} "
+        f"retrying={len(retry)}"
+    )
+    return {"success": True, "finished": finished, "retrying": len(retry)}
+
+
 # ---------------------------------------------------
 # Periodic watchdog to requeue stuck/missed Shahkar checks
 # ---------------------------------------------------
@@ -790,54 +951,69 @@ def rehydrate_shahkar_checks(self) -> dict:
     Periodic watchdog:
       - re-enqueue Shahkar verification for profiles that are stale or never attempted
       - ensures users don't get stuck due to transient/system failures
+    Stale profiles are selected in SQL, at most KYC_WATCHDOG_MAX_PER_RUN
+    per run, and sent as batch tasks through the outbox.
     """
     # Configurable staleness window (minutes)
     stale_minutes = int(getattr(settings, "KYC_SHAHKAR_STALE_MINUTES", 15))
     stale_after = timedelta(minutes=stale_minutes)
     now = timezone.localtime(timezone.now())
+    max_per_run = int(getattr(settings, "KYC_WATCHDOG_MAX_PER_RUN", 1000))
+    batch_size = int(getattr(settings, "KYC_WATCHDOG_BATCH_SIZE", 50))
 
-    qs = Profile.objects.filter(
-        national_id__isnull=False,
-        phone_number__isnull=False,
-    ).exclude(
-        phone_national_id_match_status=KYCStatus.ACCEPTED
-    ).exclude(
-        phone_national_id_match_status=KYCStatus.REJECTED
-    )
-
-    requeued = 0
-    for profile in qs.iterator(chunk_size=500):
-        try:
-            if _should_queue_shahkar(profile, now, stale_after):
-                _enqueue_shahkar(profile.id)
-                requeued += 1
-        except Exception as e:
-            logger.warning(f"Watchdog skip profile {profile.id}: {e}")
+    with transaction.atomic():
+        profile_ids = list(
+            _stale_shahkar_profiles(now, stale_after)
+            .select_for_update(skip_locked=True, of=("self",))
+            .values_list("id", flat=True)[:max_per_run]
+        )
+        # Dedupe in the DB: marked PROCESSING together with the outbox rows,
+        # the profiles drop out of the stale selection for `stale_after`
+        Profile.objects.filter(pk__in=profile_ids).update(
+            phone_national_id_match_status=KYCStatus.PROCESSING,
+            updated_at=now,
+        )
+        batches = _batches(profile_ids, batch_size)
+        for batch in batches:
+            enqueue(
+                verify_identity_phone_national_id_batch, (batch,),
+                dedup_key=f"kyc:shahkar:batch:{batch[0]}:{batch[-1]}",
+            )
 
-    logger.info(f"Shahkar watchdog requeued={requeued}")
-    return {"success": True, "requeued": requeued}
+    logger.info(
+        f"Shahkar watchdog requeued={len(profile_ids)} batches={len(batches)}"
+    )
+    return {
+        "success": True, "requeued": len(profile_ids),
+        "batches": len(batches),
+    }
 
 
 @shared_task(bind=True)
 def rehydrate_video_auth_checks(self) -> dict:
+    """
+    Periodic watchdog: make sure every profile still waiting on a video
+    result has a polling job (e.g. jobs that gave up, or profiles submitted
+    before the scheduler existed). It does not call the provider itself;
+    first checks are spread over the watchdog period.
+    """
     stale_minutes = int(getattr(settings, "KYC_VIDEO_STALE_MINUTES", 20))
     stale_after = timedelta(minutes=stale_minutes)
     now = timezone.localtime(timezone.now())
+    max_per_run = int(getattr(settings, "KYC_WATCHDOG_MAX_PER_RUN", 1000))
 
-    qs = Profile.objects.filter(
-        auth_stage=AuthenticationStage.IDENTITY_VERIFIED,
-        video_auth_status=KYCStatus.PROCESSING,
-    ).exclude(video_task_id__isnull=True).exclude(video_task_id__exact="")
-
-    requeued = 0
-    for p in qs.iterator(chunk_size=500):
-        last = p.video_auth_last_checked_at or p.video_submitted_at or p.updated_at or p.created_at
-        if (now - last) > stale_after:
-            check_profile_video_auth_result.apply_async((p.id,), countdown=1)
-            requeued += 1
+    stale_ids = list(
+        _stale_video_profiles(now, stale_after)
+        .values_list("id", flat=True)[:max_per_run]
+    )
+    scheduled = schedule_polls(
+        PollKind.VIDEO_KYC, stale_ids, spread=stale_after.total_seconds()
+    )
 
-    logger.info(f"Video watchdog requeued={requeued}")
-    return {"success": True, "requeued": requeued}
+    logger.info(
+        f"Video watchdog stale={len(stale_ids)} scheduled={scheduled}"
+    )
+    return {"success": True, "requeued": scheduled}
 
 
 @shared_task
@@ -858,3 +1034,9 @@ def purge_expired_kyc_videos() -> dict:
         a.delete()
         deleted += 1
     return {"deleted": deleted}
+
+
+@shared_task
+def reap_kyc_upload_blobs() -> dict:
+    """Delete temporary KYC upload blobs older than KYC_VIDEO_UPLOAD_TTL_HOURS."""
+    return {"deleted": reap_expired_video_blobs()}
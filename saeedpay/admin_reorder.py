@@ -24,6 +24,7 @@ ADMIN_REORDER = (
         "models": (
             "store.Store",
             "store.StoreApiKey",
+            "store.StoreWebhook",
         ),
     },
     {
@@ -61,6 +62,7 @@ ADMIN_REORDER = (
             "credit.Statement",
             "credit.StatementLine",
             "credit.LoanRiskReport",
+            "credit.StatementRolloverRun",
         ),
     },
     {
@@ -69,10 +71,30 @@ ADMIN_REORDER = (
         "models": (
             "wallets.Wallet",
             "wallets.Transaction",
+            "wallets.ArchivedTransaction",
             "wallets.PaymentRequest",
             "wallets.WalletTransferRequest",
             "wallets.Installment",
             "wallets.InstallmentPlan",
+            "wallets.WalletDailySnapshot",
+            "wallets.MerchantSettlement",
+            "wallets.SettlementItem",
+            "wallets.PartnerIdempotencyKey",
+            "wallets.WebhookDelivery",
+        ),
+    },
+    {
+        "app": "outbox",
+        "label": "صف خروجی",
+        "models": (
+            "outbox.OutboxMessage",
+        ),
+    },
+    {
+        "app": "polling",
+        "label": "استعلام‌های زمان‌بندی‌شده",
+        "models": (
+            "polling.PollJob",
         ),
     },
     {
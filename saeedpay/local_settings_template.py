@@ -22,7 +22,15 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
-    }
+    },
+    # Optional read replica for opted-in list views (utils.db_routing);
+    # without it every read goes to 'default'.
+    # 'replica': {
+    #     'ENGINE': 'django.db.backends.postgresql',
+    #     'NAME': 'saeedpay',
+    #     'HOST': 'replica.db.internal',
+    #     'TEST': {'MIRROR': 'default'},
+    # },
 }
 REDIS_PASSWORD=''
 
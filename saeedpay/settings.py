@@ -61,6 +61,8 @@ LOCAL_APPS = [
     "blogs",
     "contact",
     "kyc",
+    "outbox",
+    "polling",
 ]
 
 INSTALLED_APPS = DEFAULT_APPS + LOCAL_APPS
@@ -76,8 +78,17 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "admin_reorder.middleware.ModelAdminReorder",
+    "utils.db_routing.ReadYourWritesMiddleware",
 ]
 
+# Opted-in read views use the "replica" alias when DATABASES defines one;
+# a client that just wrote keeps reading the primary for this many seconds.
+DATABASE_ROUTERS = ["utils.db_routing.ReplicaRouter"]
+DATABASE_REPLICA_ALIAS = "replica"
+DATABASE_READ_YOUR_WRITES_SECONDS = config(
+    "DATABASE_READ_YOUR_WRITES_SECONDS", default=10, cast=int
+)
+
 ROOT_URLCONF = "saeedpay.urls"
 
 TEMPLATES = [
@@ -105,6 +116,11 @@ WSGI_APPLICATION = "saeedpay.wsgi.application"
 # Card Validator Configuration
 CARD_VALIDATOR_MOCK = True  # Set to False for production validation
 
+# Wallets: number of escrow wallets cash payments are spread over
+WALLETS_ESCROW_SHARD_COUNT = config(
+    "WALLETS_ESCROW_SHARD_COUNT", default=1, cast=int
+)
+
 # KYC Configuration
 KYC_IDENTITY_BASE_URL = config(
     "KYC_IDENTITY_BASE_URL", default="https://sandbox.vidaverify.ir:9091"
@@ -113,6 +129,26 @@ KYC_IDENTITY_TIMEOUT = config("KYC_IDENTITY_TIMEOUT", default=30, cast=int)
 KYC_IDENTITY_TOKEN_SKEW_SECONDS = config(
     "KYC_IDENTITY_TOKEN_SKEW_SECONDS", default=30, cast=int
 )
+# Provider token renewal: start this long before expiry. One worker holds
+# the renewal lease while the others wait; both windows are derived from
+# KYC_IDENTITY_TIMEOUT (see IdentityAuthService).
+KYC_IDENTITY_TOKEN_REFRESH_AHEAD_SECONDS = config(
+    "KYC_IDENTITY_TOKEN_REFRESH_AHEAD_SECONDS", default=120, cast=int
+)
+# Async provider client (batch KYC tasks): pool size and in-flight
+# requests per endpoint
+KYC_ASYNC_MAX_CONNECTIONS = config(
+    "KYC_ASYNC_MAX_CONNECTIONS", default=20, cast=int
+)
+KYC_ASYNC_ENDPOINT_CONCURRENCY = {
+    "shahkar": config("KYC_ASYNC_SHAHKAR_CONCURRENCY", default=10, cast=int),
+    "video_result": config(
+        "KYC_ASYNC_VIDEO_RESULT_CONCURRENCY", default=10, cast=int
+    ),
+    "loan_report": config(
+        "KYC_ASYNC_LOAN_REPORT_CONCURRENCY", default=5, cast=int
+    ),
+}
 
 # KYC Retry Configuration
 KYC_VIDEO_SUBMIT_MAX_RETRIES = config(
@@ -121,11 +157,31 @@ KYC_VIDEO_SUBMIT_MAX_RETRIES = config(
 KYC_VIDEO_SUBMIT_RETRY_DELAY = config(
     "KYC_VIDEO_SUBMIT_RETRY_DELAY", default=60, cast=int
 )
-KYC_VIDEO_CHECK_MAX_RETRIES = config(
-    "KYC_VIDEO_CHECK_MAX_RETRIES", default=6, cast=int
+# Video results are polled by the polling scheduler: first check after
+# FIRST_DELAY, then waits doubling from BASE_DELAY up to MAX_DELAY (seconds)
+KYC_VIDEO_POLL_FIRST_DELAY = config(
+    "KYC_VIDEO_POLL_FIRST_DELAY", default=30, cast=int
+)
+KYC_VIDEO_POLL_BASE_DELAY = config(
+    "KYC_VIDEO_POLL_BASE_DELAY", default=15, cast=int
 )
-KYC_VIDEO_CHECK_RETRY_DELAY = config(
-    "KYC_VIDEO_CHECK_RETRY_DELAY", default=30, cast=int
+KYC_VIDEO_POLL_MAX_DELAY = config(
+    "KYC_VIDEO_POLL_MAX_DELAY", default=600, cast=int
+)
+KYC_VIDEO_POLL_MAX_ATTEMPTS = config(
+    "KYC_VIDEO_POLL_MAX_ATTEMPTS", default=20, cast=int
+)
+LOAN_REPORT_POLL_FIRST_DELAY = config(
+    "LOAN_REPORT_POLL_FIRST_DELAY", default=10, cast=int
+)
+LOAN_REPORT_POLL_BASE_DELAY = config(
+    "LOAN_REPORT_POLL_BASE_DELAY", default=10, cast=int
+)
+LOAN_REPORT_POLL_MAX_DELAY = config(
+    "LOAN_REPORT_POLL_MAX_DELAY", default=300, cast=int
+)
+LOAN_REPORT_POLL_MAX_ATTEMPTS = config(
+    "LOAN_REPORT_POLL_MAX_ATTEMPTS", default=12, cast=int
 )
 KYC_SHAHKAR_MAX_RETRIES = config(
     "KYC_SHAHKAR_MAX_RETRIES", default=3, cast=int
@@ -133,6 +189,13 @@ KYC_SHAHKAR_MAX_RETRIES = config(
 KYC_SHAHKAR_RETRY_DELAY = config(
     "KYC_SHAHKAR_RETRY_DELAY", default=60, cast=int
 )
+# Shahkar / video-result watchdogs: profiles requeued per run and per task
+KYC_WATCHDOG_MAX_PER_RUN = config(
+    "KYC_WATCHDOG_MAX_PER_RUN", default=1000, cast=int
+)
+KYC_WATCHDOG_BATCH_SIZE = config(
+    "KYC_WATCHDOG_BATCH_SIZE", default=50, cast=int
+)
 CREDIT_DEFAULT_APPROVED_LIMIT = config(
     "CREDIT_DEFAULT_APPROVED_LIMIT", default=5000000, cast=int
 )
@@ -161,6 +224,10 @@ KYC_VIDEO_RETENTION_DAYS_REJECTED = os.getenv(
     "KYC_VIDEO_RETENTION_DAYS_REJECTED", "7"
 )
 KYC_VIDEO_STORAGE_PREFIX = os.getenv("KYC_VIDEO_STORAGE_PREFIX", "kyc_videos/")
+# Shared storage (STORAGES alias) handing uploaded videos to the workers
+KYC_VIDEO_UPLOAD_STORAGE = os.getenv("KYC_VIDEO_UPLOAD_STORAGE", "default")
+KYC_VIDEO_UPLOAD_PREFIX = os.getenv("KYC_VIDEO_UPLOAD_PREFIX", "kyc_uploads/")
+KYC_VIDEO_UPLOAD_TTL_HOURS = int(os.getenv("KYC_VIDEO_UPLOAD_TTL_HOURS", "24"))
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -387,6 +454,26 @@ def _redis_url(db: int) -> str:
     return f"redis://{pwd}{REDIS_HOST}:{REDIS_PORT}/{db}"
 
 
+# Cache: shared by every web and worker process, since the provider token
+# lease, API-key snapshots and task dedupe rely on it. A per-process cache
+# is only good enough for a single-process DEBUG run (CACHE_LOCMEM).
+REDIS_CACHE_DB = config("REDIS_CACHE_DB", default=2, cast=int)
+if config("CACHE_LOCMEM", default=DEBUG, cast=bool):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": _redis_url(REDIS_CACHE_DB),
+            "KEY_PREFIX": "saeedpay",
+        }
+    }
+
+
 # Celery
 CELERY_BROKER_URL = _redis_url(REDIS_BROKER_DB)
 CELERY_RESULT_BACKEND = _redis_url(REDIS_BACKEND_DB)
@@ -404,6 +491,11 @@ CELERY_TASK_ROUTES = {
     "credit.tasks.credit_tasks.*": {"queue": "credit"},
 }
 
+OUTBOX_RELAY_INTERVAL_SECONDS = config(
+    "OUTBOX_RELAY_INTERVAL_SECONDS", default=2, cast=int
+)
+POLL_INTERVAL_SECONDS = config("POLL_INTERVAL_SECONDS", default=5, cast=int)
+
 CELERY_BEAT_SCHEDULE = {
     # wallet
     "expire-pending-payment-requests-every-minute": {
@@ -418,6 +510,25 @@ CELERY_BEAT_SCHEDULE = {
         "task": "wallets.tasks.task_expire_pending_transfer_requests",
         "schedule": crontab(minute="*/1"),
     },
+    # wallet: net payouts for deferred-settlement stores
+    "settle-pending-merchant-payments-every-15m": {
+        "task": "wallets.tasks.task_settle_pending_payments",
+        "schedule": crontab(minute="*/15"),
+    },
+    # wallet: fold settled transactions into daily balance snapshots
+    "build-wallet-daily-snapshots-every-15m": {
+        "task": "wallets.tasks.task_build_wallet_snapshots",
+        "schedule": crontab(minute="5-59/15"),
+    },
+    # wallet: move closed months of transactions to the archive table
+    "archive-wallet-transactions-monthly": {
+        "task": "wallets.tasks.task_archive_transactions",
+        "schedule": crontab(minute=30, hour=4, day_of_month=2),
+    },
+    "purge-partner-idempotency-keys-hourly": {
+        "task": "wallets.tasks.task_purge_idempotency_keys",
+        "schedule": crontab(minute=20, hour="*"),
+    },
     # banking
     "reenqueue-stale-pending-cards-every-minute": {
         "task": "banking.tasks.reenqueue_stale_pending_cards",
@@ -430,11 +541,41 @@ CELERY_BEAT_SCHEDULE = {
         "task": "credit.tasks.task_month_end_rollover",
         "schedule": crontab(minute=10, hour=0),
     },
+    # Credit: nightly full reconcile of incrementally maintained balances
+    "credit-reconcile-statement-balances-daily-0230": {
+        "task": "credit.tasks.task_reconcile_statement_balances",
+        "schedule": crontab(minute=30, hour=2),
+    },
+    # Credit: nightly recompute of cached CreditLimit.used_credit
+    "credit-reconcile-used-credit-daily-0245": {
+        "task": "credit.tasks.task_reconcile_used_credit",
+        "schedule": crontab(minute=45, hour=2),
+    },
     # Credit: finalize due windows hourly
     "credit-finalize-due-windows-hourly-0015": {
         "task": "credit.tasks.task_finalize_due_windows",
         "schedule": crontab(minute=15, hour="*"),
     },
+    # outbox: relay committed side effects to the broker
+    "outbox-relay": {
+        "task": "outbox.tasks.task_relay_outbox",
+        "schedule": OUTBOX_RELAY_INTERVAL_SECONDS,  # seconds
+        "options": {"expires": OUTBOX_RELAY_INTERVAL_SECONDS * 5},
+    },
+    "outbox-purge-daily-0400": {
+        "task": "outbox.tasks.task_purge_outbox",
+        "schedule": crontab(minute=0, hour=4),
+    },
+    # polling: check due provider results (video KYC, loan reports)
+    "poll-due-results": {
+        "task": "polling.tasks.task_poll_due_results",
+        "schedule": POLL_INTERVAL_SECONDS,  # seconds
+        "options": {"expires": POLL_INTERVAL_SECONDS * 5},
+    },
+    "polling-purge-daily-0410": {
+        "task": "polling.tasks.task_purge_poll_jobs",
+        "schedule": crontab(minute=10, hour=4),
+    },
     # profile
     "rehydrate-shahkar-checks-every-15m": {
         "task": "profiles.tasks.rehydrate_shahkar_checks",
@@ -449,6 +590,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "profiles.tasks.purge_expired_kyc_videos",
         "schedule": crontab(minute=30, hour=3),
     },
+    "reap-kyc-upload-blobs-hourly": {
+        "task": "profiles.tasks.reap_kyc_upload_blobs",
+        "schedule": crontab(minute=15),
+    },
 }
 
 # reCAPTCHA Configuration
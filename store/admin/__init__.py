@@ -1,2 +1,3 @@
 from .store import StoreAdmin
 from .store_apikey import StoreApiKeyAdmin
+from .store_webhook import StoreWebhookAdmin
@@ -15,11 +15,12 @@ class StoreAdmin(dynamic_cardboard_model_admin(Store, BaseAdmin)):
         "code",
         "merchant",
         "is_active",
+        "settlement_mode",
         "get_status",
         "store_reviewer_verifier",
         "jalali_verification_time",
     ]
-    list_filter = ["is_active"]
+    list_filter = ["is_active", "settlement_mode"]
     search_fields = ["name", "id"]
 
     def get_fieldsets(self, request, obj=None):
@@ -34,6 +35,7 @@ class StoreAdmin(dynamic_cardboard_model_admin(Store, BaseAdmin)):
                 "code",
                 "address",
                 "is_active",
+                "settlement_mode",
             )
         }),) + super(StoreAdmin, self).get_fieldsets(
             request, obj
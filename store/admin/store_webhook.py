@@ -0,0 +1,27 @@
+from django.contrib import admin
+
+from store.models import StoreWebhook
+
+
+@admin.register(StoreWebhook)
+class StoreWebhookAdmin(admin.ModelAdmin):
+    list_display = ["store", "url", "is_active", "secret_regenerated_at"]
+    readonly_fields = ["secret", "secret_regenerated_at"]
+    list_filter = ["is_active"]
+    search_fields = ["store__name", "store__code", "url"]
+    list_select_related = ["store"]
+
+    def has_module_permission(self, request):
+        return request.user.is_superuser
+
+    def has_view_permission(self, request, obj=None):
+        return request.user.is_superuser
+
+    def has_change_permission(self, request, obj=None):
+        return request.user.is_superuser
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return request.user.is_superuser
@@ -5,3 +5,6 @@ from .store import (
     StoreSerializer, StoreCreateSerializer,
     PublicStoreSerializer,
 )
+from .webhook import (
+    StoreWebhookSerializer, StoreWebhookSecretResponseSerializer,
+)
@@ -0,0 +1,37 @@
+# store/api/public/v1/serializers/webhook.py
+
+from urllib.parse import urlsplit
+
+from rest_framework import serializers
+
+from store.models import StoreWebhook
+from utils.public_address import NonPublicAddressError, resolve_public_ips
+
+
+class StoreWebhookSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = StoreWebhook
+        fields = ["url", "is_active", "secret_regenerated_at"]
+        read_only_fields = ["secret_regenerated_at"]
+
+    def validate_url(self, value):
+        if not value.lower().startswith("https://"):
+            raise serializers.ValidationError(
+                "آدرس وب‌هوک باید با https شروع شود."
+            )
+        # No loopback, private, link-local or metadata hosts; the address
+        # is checked again on every delivery (see wallets.services.webhook).
+        try:
+            parts = urlsplit(value)
+            resolve_public_ips(parts.hostname, parts.port or 443)
+        except (NonPublicAddressError, ValueError):
+            raise serializers.ValidationError(
+                "آدرس وب‌هوک باید به یک میزبان عمومی اشاره کند."
+            )
+        return value
+
+
+class StoreWebhookSecretResponseSerializer(serializers.Serializer):
+    url = serializers.URLField()
+    is_active = serializers.BooleanField()
+    secret = serializers.CharField()
@@ -3,7 +3,7 @@
 from drf_spectacular.utils import extend_schema
 from drf_spectacular.utils import extend_schema_view
 from rest_framework.decorators import action
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.mixins import (
     CreateModelMixin,
     ListModelMixin,
@@ -33,9 +33,15 @@ from store.api.public.v1.serializers import (
     StoreSerializer,
     StoreCreateSerializer,
     PublicStoreSerializer,
+    StoreWebhookSerializer,
+    StoreWebhookSecretResponseSerializer,
 )
-from store.models import Store
+from store.models import Store, StoreWebhook
 from store.services.apikey import regenerate_store_api_key
+from store.services.webhook import (
+    configure_store_webhook,
+    regenerate_store_webhook_secret,
+)
 
 
 @extend_schema_view(
@@ -66,6 +72,8 @@ class StoreViewSet(
         "partial_update": "stores-write",
         "destroy": "stores-write",
         "regenerate_api_key": "store-apikey-regen",
+        "webhook": "stores-write",
+        "regenerate_webhook_secret": "store-apikey-regen",
     }
 
     def get_queryset(self):
@@ -107,6 +115,76 @@ class StoreViewSet(
             status=201
         )
 
+    @extend_schema(
+        methods=["GET"],
+        tags=["Store · Webhook"],
+        summary="مشاهده تنظیمات وب‌هوک فروشگاه",
+        responses={200: StoreWebhookSerializer},
+    )
+    @extend_schema(
+        methods=["PUT"],
+        tags=["Store · Webhook"],
+        summary="ثبت یا ویرایش وب‌هوک فروشگاه",
+        description=(
+            "تغییر وضعیت درخواست‌های پرداخت به این آدرس ارسال می‌شود. "
+            "کلید امضا فقط در اولین ثبت برگردانده می‌شود."
+        ),
+        request=StoreWebhookSerializer,
+        responses={
+            200: StoreWebhookSerializer,
+            201: StoreWebhookSecretResponseSerializer,
+        },
+    )
+    @action(detail=True, methods=["get", "put"], url_path="webhook")
+    def webhook(self, request, pk=None):
+        store = self.get_object()
+        if request.method == "GET":
+            try:
+                webhook = store.webhook
+            except StoreWebhook.DoesNotExist:
+                raise NotFound("وب‌هوکی برای این فروشگاه ثبت نشده است.")
+            return Response(StoreWebhookSerializer(webhook).data)
+
+        serializer = StoreWebhookSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        webhook, secret = configure_store_webhook(
+            store,
+            url=serializer.validated_data["url"],
+            is_active=serializer.validated_data.get("is_active", True),
+        )
+        if secret is None:
+            return Response(StoreWebhookSerializer(webhook).data)
+        payload = {
+            "url": webhook.url, "is_active": webhook.is_active,
+            "secret": secret,
+        }
+        return Response(
+            StoreWebhookSecretResponseSerializer(payload).data, status=201
+        )
+
+    @extend_schema(
+        tags=["Store · Webhook"],
+        summary="تولید مجدد کلید امضای وب‌هوک",
+        request=None,
+        responses={201: StoreWebhookSecretResponseSerializer},
+    )
+    @action(
+        detail=True, methods=["post"], url_path="regenerate-webhook-secret"
+    )
+    def regenerate_webhook_secret(self, request, pk=None):
+        store = self.get_object()
+        secret = regenerate_store_webhook_secret(store)
+        if secret is None:
+            raise NotFound("وب‌هوکی برای این فروشگاه ثبت نشده است.")
+        webhook = store.webhook
+        payload = {
+            "url": webhook.url, "is_active": webhook.is_active,
+            "secret": secret,
+        }
+        return Response(
+            StoreWebhookSecretResponseSerializer(payload).data, status=201
+        )
+
 
 @extend_schema_view(
     list=public_store_list_schema,
@@ -2,13 +2,50 @@
 
 import hashlib
 
+from django.contrib.auth import get_user_model
+from django.utils.functional import SimpleLazyObject
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 
-from store.models import StoreApiKey
+from store.models import Store, StoreApiKey
+from store.utils.apikey_cache import resolve_api_key
+
+
+class StoreMerchantUser(SimpleLazyObject):
+    """
+    The store's merchant user, loaded on first real use. pk/id and the
+    authentication flags are answered from the key snapshot, so throttling
+    and permission checks do not load it.
+    """
+
+    def __init__(self, user_id):
+        super().__init__(lambda: get_user_model().objects.get(pk=user_id))
+        self.__dict__["_user_id"] = user_id
+
+    @property
+    def pk(self):
+        return self.__dict__["_user_id"]
+
+    id = pk
+    is_authenticated = True
+    is_anonymous = False
+
+    def __bool__(self):
+        return True
 
 
 class StoreApiKeyAuthentication(BaseAuthentication):
+    """
+    `Authorization: ApiKey <key>`. The key is resolved through
+    resolve_api_key, so a warm request does not touch the database:
+    request.auth is the cached snapshot (ids and flags), and request.user,
+    request.store and request.store_api_key are loaded only when a handler
+    uses them.
+
+    A revoked key or deactivated store is rejected at once by the process
+    that made the change; other processes keep answering from their local
+    tier until STORE_API_KEY_LOCAL_TTL has passed.
+    """
     keyword = "ApiKey"
 
     def authenticate(self, request):
@@ -19,14 +56,19 @@ class StoreApiKeyAuthentication(BaseAuthentication):
         api_key = auth[len(self.keyword) + 1:]
         key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
 
-        try:
-            api_key_obj = StoreApiKey.objects.get(
-                key_hash=key_hash, is_active=True
-            )
-        except StoreApiKey.DoesNotExist:
+        snapshot = resolve_api_key(key_hash)
+        if snapshot is None or not snapshot["is_active"]:
             raise AuthenticationFailed("Invalid API Key")
 
-        user = api_key_obj.store.merchant.user
-        request.store = api_key_obj.store
-        request.store_api_key = api_key_obj
-        return (user, None)
+        # Built per request from the cached ids, loaded on first use
+        key_id = snapshot["key_id"]
+        store_id = snapshot["store_id"]
+        request.store = SimpleLazyObject(
+            lambda: Store.objects.select_related("merchant__user").get(
+                pk=store_id
+            )
+        )
+        request.store_api_key = SimpleLazyObject(
+            lambda: StoreApiKey.objects.get(pk=key_id)
+        )
+        return StoreMerchantUser(snapshot["merchant_user_id"]), snapshot
@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-16 17:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0005_delete_storecontract'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='store',
+            name='settlement_mode',
+            field=models.CharField(choices=[('immediate', 'تسویه آنی'), ('deferred', 'تسویه دوره‌ای')], default='immediate', max_length=16, verbose_name='نحوه تسویه'),
+        ),
+    ]
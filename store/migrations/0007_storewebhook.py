@@ -0,0 +1,29 @@
+# Generated by Django 5.0 on 2026-10-16 20:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0006_store_settlement_mode'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoreWebhook',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=500, verbose_name='آدرس وب‌هوک')),
+                ('secret', models.CharField(max_length=128, verbose_name='کلید امضا')),
+                ('secret_regenerated_at', models.DateTimeField(blank=True, null=True)),
+                ('is_active', models.BooleanField(default=True, verbose_name='فعال')),
+                ('store', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='webhook', to='store.store', verbose_name='فروشگاه')),
+            ],
+            options={
+                'verbose_name': 'وب‌هوک فروشگاه',
+                'verbose_name_plural': 'وب‌هوک‌های فروشگاه',
+            },
+        ),
+    ]
@@ -1,3 +1,4 @@
 from .store import Store
 from .store_user import StoreUser
 from .apikey import StoreApiKey
+from .webhook import StoreWebhook
@@ -7,6 +7,7 @@ from django.db import models
 from django.utils import timezone
 
 from store.models import Store
+from store.utils.apikey_cache import invalidate_api_key
 
 
 class StoreApiKey(models.Model):
@@ -37,12 +38,22 @@ class StoreApiKey(models.Model):
         key_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()
         return key, key_hash
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_api_key(self.key_hash)
+
+    def delete(self, *args, **kwargs):
+        invalidate_api_key(self.key_hash)
+        return super().delete(*args, **kwargs)
+
     def regenerate(self):
+        old_key_hash = self.key_hash
         key, key_hash = self.generate_key_and_hash()
         self.key_hash = key_hash
         self.last_regenerated_at = timezone.localtime(timezone.now())
         self.is_active = True
         self.save()
+        invalidate_api_key(old_key_hash)
         return key
 
     def check_key(self, raw_key: str):
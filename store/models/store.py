@@ -9,6 +9,7 @@ from django.utils.translation import gettext_lazy as _
 
 from lib.erp_base.models import dynamic_cardboard
 from merchants.models import Merchant
+from store.utils.choices import StoreSettlementMode
 
 
 def validate_image_extension(value):
@@ -88,6 +89,30 @@ class Store(
         default=True,
         verbose_name=_("فعال است؟")
     )
+    settlement_mode = models.CharField(
+        max_length=16,
+        choices=StoreSettlementMode.choices,
+        default=StoreSettlementMode.IMMEDIATE,
+        verbose_name=_("نحوه تسویه")
+    )
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Cached API key resolutions carry the store's active flag and merchant
+        self._invalidate_api_keys()
+
+    def delete(self, *args, **kwargs):
+        self._invalidate_api_keys()
+        return super().delete(*args, **kwargs)
+
+    def _invalidate_api_keys(self):
+        from store.models.apikey import StoreApiKey
+        from store.utils.apikey_cache import invalidate_api_key
+        invalidate_api_key(
+            *StoreApiKey.objects.filter(store_id=self.pk).values_list(
+                "key_hash", flat=True
+            )
+        )
 
     def __str__(self):
         return f"{self.name} ({self.code})"
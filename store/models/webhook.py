@@ -0,0 +1,51 @@
+# store/models/webhook.py
+
+import secrets
+
+from django.db import models
+from django.utils import timezone
+
+from store.models import Store
+
+
+class StoreWebhook(models.Model):
+    store = models.OneToOneField(
+        Store,
+        on_delete=models.CASCADE,
+        related_name="webhook",
+        verbose_name="فروشگاه"
+    )
+    url = models.URLField(
+        max_length=500,
+        verbose_name="آدرس وب‌هوک"
+    )
+    # Kept in clear text: every delivery is signed with it (HMAC-SHA256)
+    secret = models.CharField(
+        max_length=128,
+        verbose_name="کلید امضا"
+    )
+    secret_regenerated_at = models.DateTimeField(
+        null=True,
+        blank=True
+    )
+    is_active = models.BooleanField(
+        default=True,
+        verbose_name="فعال"
+    )
+
+    @classmethod
+    def generate_secret(cls):
+        return f"whsec_{secrets.token_urlsafe(32)}"
+
+    def regenerate_secret(self):
+        self.secret = self.generate_secret()
+        self.secret_regenerated_at = timezone.localtime(timezone.now())
+        self.save(update_fields=["secret", "secret_regenerated_at"])
+        return self.secret
+
+    def __str__(self):
+        return f"{self.store} → {self.url}"
+
+    class Meta:
+        verbose_name = "وب‌هوک فروشگاه"
+        verbose_name_plural = "وب‌هوک‌های فروشگاه"
@@ -0,0 +1,17 @@
+# store/permissions.py
+from rest_framework import permissions
+
+from merchants.permissions import IsMerchant
+
+
+class IsStoreApiKeyMerchant(permissions.BasePermission):
+    """IsMerchant for API-key requests, answered from the key snapshot."""
+    message = IsMerchant.message
+
+    def has_permission(self, request, view):
+        snapshot = request.auth
+        return (
+                isinstance(snapshot, dict)
+                and snapshot.get("is_active", False)
+                and snapshot.get("merchant_id") is not None
+        )
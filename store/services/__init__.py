@@ -1 +1,2 @@
 from .apikey import regenerate_store_api_key
+from .webhook import configure_store_webhook, regenerate_store_webhook_secret
@@ -0,0 +1,31 @@
+# store/services/webhook.py
+
+from store.models import StoreWebhook
+
+
+def configure_store_webhook(store, url, is_active=True):
+    """
+    Create or update the store's webhook endpoint. Returns the webhook and
+    the signing secret when one was just issued (first configuration),
+    otherwise None; an existing secret is never shown again.
+    """
+    try:
+        webhook = store.webhook
+    except StoreWebhook.DoesNotExist:
+        secret = StoreWebhook.generate_secret()
+        webhook = StoreWebhook.objects.create(
+            store=store, url=url, secret=secret, is_active=is_active
+        )
+        return webhook, secret
+
+    webhook.url = url
+    webhook.is_active = is_active
+    webhook.save(update_fields=["url", "is_active"])
+    return webhook, None
+
+
+def regenerate_store_webhook_secret(store):
+    try:
+        return store.webhook.regenerate_secret()
+    except StoreWebhook.DoesNotExist:
+        return None
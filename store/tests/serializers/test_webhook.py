@@ -0,0 +1,36 @@
+# store/tests/serializers/test_webhook.py
+
+import pytest
+
+from store.api.public.v1.serializers.webhook import StoreWebhookSerializer
+
+
+def _is_valid(url):
+    serializer = StoreWebhookSerializer(data={"url": url, "is_active": True})
+    return serializer.is_valid()
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://127.0.0.1/hooks",
+        "https://[::1]/hooks",
+        "https://10.1.2.3/hooks",
+        "https://172.16.0.5:8443/hooks",
+        "https://192.168.1.10/hooks",
+        "https://169.254.169.254/latest/meta-data/",
+        "https://[::ffff:10.0.0.1]/hooks",
+        "https://0.0.0.0/hooks",
+        "https://localhost/hooks",
+    ],
+)
+def test_non_public_hosts_are_rejected(url):
+    assert not _is_valid(url)
+
+
+def test_plain_http_is_rejected():
+    assert not _is_valid("http://93.184.216.34/hooks")
+
+
+def test_public_address_is_accepted():
+    assert _is_valid("https://93.184.216.34/hooks")
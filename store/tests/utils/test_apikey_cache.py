@@ -0,0 +1,160 @@
+# store/tests/utils/test_apikey_cache.py
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import RequestFactory
+from rest_framework.exceptions import AuthenticationFailed
+
+from merchants.models import Merchant
+from store.authentication import StoreApiKeyAuthentication
+from store.models import Store, StoreApiKey
+from store.permissions import IsStoreApiKeyMerchant
+from store.utils import apikey_cache
+from store.utils.apikey_cache import resolve_api_key
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    cache.clear()
+    apikey_cache._local.clear()
+    yield
+    cache.clear()
+    apikey_cache._local.clear()
+
+
+@pytest.fixture
+def store():
+    user = get_user_model().objects.create(username="apikey_merchant")
+    merchant = Merchant.objects.create(user=user)
+    return Store.objects.create(name="apikey-store", merchant=merchant)
+
+
+@pytest.fixture
+def api_key(store, django_capture_on_commit_callbacks):
+    key, key_hash = StoreApiKey.generate_key_and_hash()
+    with django_capture_on_commit_callbacks(execute=True):
+        obj = StoreApiKey.objects.create(store=store, key_hash=key_hash)
+    obj.raw_key = key
+    return obj
+
+
+def _authenticate(raw_key):
+    request = RequestFactory().get(
+        "/", HTTP_AUTHORIZATION=f"ApiKey {raw_key}"
+    )
+    user, snapshot = StoreApiKeyAuthentication().authenticate(request)
+    request.user, request.auth = user, snapshot
+    return request, user
+
+
+class TestResolve:
+    def test_unknown_key_is_a_miss(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            assert resolve_api_key("0" * 64) is None
+
+    def test_cold_then_warm(self, api_key, store, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            snapshot = resolve_api_key(api_key.key_hash)
+        assert snapshot == {
+            "key_id": api_key.pk,
+            "store_id": store.pk,
+            "merchant_id": store.merchant_id,
+            "merchant_user_id": store.merchant.user_id,
+            "is_active": True,
+        }
+        with django_assert_num_queries(0):
+            assert resolve_api_key(api_key.key_hash) == snapshot
+
+    def test_shared_cache_hit_needs_no_query(
+            self, api_key, django_assert_num_queries
+    ):
+        resolve_api_key(api_key.key_hash)
+        apikey_cache._local.clear()
+        with django_assert_num_queries(0):
+            assert resolve_api_key(api_key.key_hash)["key_id"] == api_key.pk
+
+    def test_callers_get_their_own_copy(self, api_key):
+        resolve_api_key(api_key.key_hash)["is_active"] = False
+        assert resolve_api_key(api_key.key_hash)["is_active"] is True
+
+
+class TestInvalidation:
+    def test_key_save(self, api_key, django_capture_on_commit_callbacks):
+        resolve_api_key(api_key.key_hash)
+        api_key.is_active = False
+        with django_capture_on_commit_callbacks(execute=True):
+            api_key.save()
+        assert resolve_api_key(api_key.key_hash)["is_active"] is False
+
+    def test_regenerate(self, api_key, django_capture_on_commit_callbacks):
+        old_hash = api_key.key_hash
+        resolve_api_key(old_hash)
+        with django_capture_on_commit_callbacks(execute=True):
+            api_key.regenerate()
+        assert resolve_api_key(old_hash) is None
+        assert resolve_api_key(api_key.key_hash)["key_id"] == api_key.pk
+
+    def test_read_before_revocation_is_not_recached(
+            self, api_key, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        # A request reads the key, then the revocation commits before the
+        # request writes its snapshot to the shared cache.
+        real_set = apikey_cache.cache.set
+
+        def revoke_then_set(*args, **kwargs):
+            monkeypatch.setattr(apikey_cache.cache, "set", real_set)
+            api_key.is_active = False
+            with django_capture_on_commit_callbacks(execute=True):
+                api_key.save()
+            real_set(*args, **kwargs)
+
+        monkeypatch.setattr(apikey_cache.cache, "set", revoke_then_set)
+        assert resolve_api_key(api_key.key_hash)["is_active"] is True
+
+        apikey_cache._local.clear()
+        assert resolve_api_key(api_key.key_hash)["is_active"] is False
+
+    def test_store_save(self, api_key, store, django_capture_on_commit_callbacks):
+        resolve_api_key(api_key.key_hash)
+        store.is_active = False
+        with django_capture_on_commit_callbacks(execute=True):
+            store.save()
+        assert resolve_api_key(api_key.key_hash)["is_active"] is False
+
+
+class TestAuthentication:
+    def test_inactive_store_is_rejected(
+            self, api_key, store, django_capture_on_commit_callbacks
+    ):
+        store.is_active = False
+        with django_capture_on_commit_callbacks(execute=True):
+            store.save()
+        with pytest.raises(AuthenticationFailed):
+            _authenticate(api_key.raw_key)
+
+    def test_each_request_gets_its_own_instances(self, api_key, store):
+        first, first_user = _authenticate(api_key.raw_key)
+        second, second_user = _authenticate(api_key.raw_key)
+
+        assert first.store.pk == second.store.pk == store.pk
+        assert first_user.pk == second_user.pk == store.merchant.user_id
+        first.store.name = "changed"
+        assert second.store.name == "apikey-store"
+        assert first_user.username == second_user.username
+        assert first_user._wrapped is not second_user._wrapped
+
+    def test_warm_request_needs_no_query(
+            self, api_key, store, django_assert_num_queries
+    ):
+        _authenticate(api_key.raw_key)
+        with django_assert_num_queries(0):
+            request, user = _authenticate(api_key.raw_key)
+            assert IsStoreApiKeyMerchant().has_permission(request, None)
+            assert user and user.is_authenticated
+            assert user.pk == store.merchant.user_id
+            assert request.auth["store_id"] == store.pk
+        with django_assert_num_queries(1):
+            assert user.username == "apikey_merchant"
@@ -0,0 +1,160 @@
+# store/utils/apikey_cache.py
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.cache import cache
+from django.db import transaction
+
+from store.utils.consts import (
+    STORE_API_KEY_CACHE_TTL,
+    STORE_API_KEY_LOCAL_MAXSIZE,
+    STORE_API_KEY_LOCAL_TTL,
+)
+
+
+class LocalTTLCache:
+    """Small thread-safe LRU map whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_local = LocalTTLCache(STORE_API_KEY_LOCAL_MAXSIZE, STORE_API_KEY_LOCAL_TTL)
+
+
+def _cache_key(key_hash: str) -> str:
+    # v3: snapshots carry the generation they were read under
+    return f"store:apikey:v3:{key_hash}"
+
+
+def _generation_key(key_hash: str) -> str:
+    return f"store:apikey:gen:{key_hash}"
+
+
+# Outlives the snapshots written under it; a lost generation only costs a
+# re-read, since a new one never matches an old token.
+_GENERATION_TTL = 2 * STORE_API_KEY_CACHE_TTL
+
+
+def _current_generation(key_hash: str, generation):
+    if generation is not None:
+        return generation
+    token = uuid.uuid4().hex
+    if cache.add(_generation_key(key_hash), token, _GENERATION_TTL):
+        return token
+    return cache.get(_generation_key(key_hash)) or token
+
+
+def resolve_api_key(key_hash: str):
+    """
+    Resolve a key hash to its snapshot, or None when unknown:
+    {"key_id", "store_id", "merchant_id", "merchant_user_id", "is_active"}.
+    is_active is False for a deactivated key or an inactive store, so
+    revoked keys are answered from cache too.
+
+    Only these plain ids are cached, never model instances: callers build
+    their own Store/User per request. Warm path: in-process hit, no DB or
+    cache round-trip. Shared-cache hit: no query. Cold: one query.
+
+    Shared snapshots are tagged with the key's generation token, read
+    before the DB row; invalidation replaces the token, so a snapshot read
+    before a revocation committed is ignored even if written after it.
+    """
+    from store.models import StoreApiKey
+
+    snapshot = _local.get(key_hash)
+    if snapshot is not None:
+        return dict(snapshot)
+
+    cached = cache.get_many([_cache_key(key_hash), _generation_key(key_hash)])
+    generation = cached.get(_generation_key(key_hash))
+    entry = cached.get(_cache_key(key_hash))
+    if entry is not None and generation is not None and (
+            entry["generation"] == generation
+    ):
+        snapshot = entry["snapshot"]
+    else:
+        generation = _current_generation(key_hash, generation)
+        row = (
+            StoreApiKey.objects
+            .filter(key_hash=key_hash)
+            .values(
+                "pk", "store_id", "store__merchant_id",
+                "store__merchant__user_id", "is_active",
+                "store__is_active",
+            )
+            .first()
+        )
+        if row is None:
+            return None
+        snapshot = {
+            "key_id": row["pk"],
+            "store_id": row["store_id"],
+            "merchant_id": row["store__merchant_id"],
+            "merchant_user_id": row["store__merchant__user_id"],
+            "is_active": bool(row["is_active"] and row["store__is_active"]),
+        }
+        cache.set(
+            _cache_key(key_hash),
+            {"generation": generation, "snapshot": snapshot},
+            STORE_API_KEY_CACHE_TTL,
+        )
+
+    _local.set(key_hash, snapshot)
+    return dict(snapshot)
+
+
+def invalidate_api_key(*key_hashes):
+    """
+    Drop cached resolutions of the given hashes after commit. Each hash
+    gets a new generation token, so a request that read the old state
+    before the commit cannot re-cache it afterwards.
+    """
+    key_hashes = [h for h in key_hashes if h]
+
+    def _drop():
+        for key_hash in key_hashes:
+            _local.pop(key_hash)
+        cache.set_many(
+            {_generation_key(h): uuid.uuid4().hex for h in key_hashes},
+            _GENERATION_TTL,
+        )
+        cache.delete_many([_cache_key(h) for h in key_hashes])
+
+    if key_hashes:
+        transaction.on_commit(_drop)
@@ -14,3 +14,8 @@ class StoreVerificationStatus(models.TextChoices):
     PENDING = "pending", _("در انتظار تایید")
     APPROVED = "approved", _("تایید شده")
     REJECTED = "rejected", _("رد شده")
+
+
+class StoreSettlementMode(models.TextChoices):
+    IMMEDIATE = "immediate", _("تسویه آنی")
+    DEFERRED = "deferred", _("تسویه دوره‌ای")
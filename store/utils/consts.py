@@ -0,0 +1,14 @@
+# store/utils/consts.py
+
+from django.conf import settings
+
+# Resolved API keys are cached in the shared Django cache for this long;
+# writes to the key or its store invalidate the entry right away.
+STORE_API_KEY_CACHE_TTL = getattr(settings, "STORE_API_KEY_CACHE_TTL", 300)
+
+# Per-process tier in front of the shared cache. Other workers see a
+# revocation within this many seconds; 0 disables the local tier.
+STORE_API_KEY_LOCAL_TTL = getattr(settings, "STORE_API_KEY_LOCAL_TTL", 5)
+STORE_API_KEY_LOCAL_MAXSIZE = getattr(
+    settings, "STORE_API_KEY_LOCAL_MAXSIZE", 1024
+)
@@ -13,6 +13,7 @@ from tickets.api.public.v1.serializers import (
     TicketCategoryDetailSerializer,
 )
 from tickets.models import TicketCategory
+from utils.db_routing import ReplicaReadMixin
 
 
 @extend_schema_view(
@@ -28,6 +29,7 @@ from tickets.models import TicketCategory
     ),
 )
 class TicketCategoryViewSet(
+    ReplicaReadMixin,
     ScopedThrottleByActionMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
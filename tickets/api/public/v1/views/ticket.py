@@ -27,10 +27,12 @@ from tickets.api.public.v1.serializers import (
 )
 from tickets.filters import TicketFilter
 from tickets.models import Ticket, TicketMessage
+from utils.db_routing import ReplicaReadMixin
 
 
 @ticket_viewset_schema
 class TicketViewSet(
+    ReplicaReadMixin,
     ScopedThrottleByActionMixin,
     CreateModelMixin, ListModelMixin, RetrieveModelMixin, GenericViewSet,
 ):
@@ -0,0 +1,137 @@
+"""
+Read-replica routing.
+
+Reads go to the primary unless a view opts in. Opted-in views
+(ReplicaReadMixin, replica_reads, ReplicaChangeListMixin) run their safe
+requests inside `use_replica()`, and ReplicaRouter sends the reads made
+there to settings.DATABASE_REPLICA_ALIAS. Writes, and reads inside an open
+transaction on the primary, always use the primary.
+
+After any unsafe request the client gets a short-lived cookie; while it is
+present that client reads from the primary, so it sees its own writes
+despite replica lag. Without a replica alias in DATABASES everything stays
+on the primary.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_ALIAS = getattr(settings, "DATABASE_REPLICA_ALIAS", "replica")
+READ_YOUR_WRITES_SECONDS = getattr(
+    settings, "DATABASE_READ_YOUR_WRITES_SECONDS", 10
+)
+READ_YOUR_WRITES_COOKIE = getattr(
+    settings, "DATABASE_READ_YOUR_WRITES_COOKIE", "db_primary"
+)
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_read_alias = ContextVar("db_read_alias", default=None)
+
+
+def replica_configured() -> bool:
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def wants_replica(request) -> bool:
+    """Safe request of a client that has not written recently."""
+    return (
+            request.method in SAFE_METHODS
+            and READ_YOUR_WRITES_COOKIE not in request.COOKIES
+            and replica_configured()
+    )
+
+
+@contextmanager
+def use_replica(enabled=True):
+    if not enabled or not replica_configured():
+        yield
+        return
+    token = _read_alias.set(REPLICA_ALIAS)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+class ReplicaRouter:
+    """Point reads at the replica inside use_replica(); all else primary."""
+
+    def db_for_read(self, model, **hints):
+        alias = _read_alias.get()
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        # Explicit, so instances loaded from the replica are saved to the
+        # primary instead of falling back to instance._state.db.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != REPLICA_ALIAS
+
+
+class ReadYourWritesMiddleware:
+    """Pin a client to the primary for a while after it sends a write."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method not in SAFE_METHODS and READ_YOUR_WRITES_SECONDS:
+            response.set_cookie(
+                READ_YOUR_WRITES_COOKIE,
+                "1",
+                max_age=READ_YOUR_WRITES_SECONDS,
+                httponly=True,
+                samesite="Lax",
+                secure=request.is_secure(),
+            )
+        return response
+
+
+class ReplicaReadMixin:
+    """
+    DRF view/viewset opt-in: safe requests read from the replica.
+    Set `replica_actions` to limit it to some viewset actions, e.g. when
+    a detail action writes on GET.
+    """
+    replica_actions = None
+
+    def dispatch(self, request, *args, **kwargs):
+        enabled = wants_replica(request)
+        if enabled and self.replica_actions is not None:
+            action_map = getattr(self, "action_map", None) or {}
+            enabled = (
+                    action_map.get(request.method.lower())
+                    in self.replica_actions
+            )
+        with use_replica(enabled):
+            return super().dispatch(request, *args, **kwargs)
+
+
+def replica_reads(view_func):
+    """Function-view opt-in, same rules as ReplicaReadMixin."""
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        with use_replica(wants_replica(request)):
+            return view_func(request, *args, **kwargs)
+
+    return wrapper
+
+
+class ReplicaChangeListMixin:
+    """ModelAdmin opt-in: change list pages (not actions) read the replica."""
+
+    def changelist_view(self, request, extra_context=None):
+        with use_replica(wants_replica(request)):
+            return super().changelist_view(request, extra_context)
@@ -0,0 +1,198 @@
+# utils/pagination.py
+
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only cursor over (created_at, id).
+
+    Each page is a single index range scan from the previous page's last row,
+    so page 500 costs the same as page 1 and no COUNT(*) is issued. The
+    direction follows the queryset's created_at ordering (newest first unless
+    it is ordered by ascending created_at); other orderings are replaced.
+    """
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = api_settings.PAGE_SIZE or 20
+    max_page_size = 100
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.descending = self._is_descending(queryset)
+
+        position = self.decode_cursor(request)
+        if self.descending:
+            queryset = queryset.order_by("-created_at", "-id")
+            if position:
+                created_at, pk = position
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at)
+                    | Q(created_at=created_at, id__lt=pk)
+                )
+        else:
+            queryset = queryset.order_by("created_at", "id")
+            if position:
+                created_at, pk = position
+                queryset = queryset.filter(
+                    Q(created_at__gt=created_at)
+                    | Q(created_at=created_at, id__gt=pk)
+                )
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                },
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor from the previous page's next link.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    # ---- helpers ----
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        return replace_query_param(
+            self.base_url, self.cursor_query_param,
+            self.encode_cursor(last.created_at, last.pk),
+        )
+
+    @staticmethod
+    def _is_descending(queryset):
+        ordering = list(queryset.query.order_by)
+        return not ordering or ordering[0] != "created_at"
+
+    @staticmethod
+    def encode_cursor(created_at, pk):
+        raw = json.dumps({"t": created_at.isoformat(), "i": pk})
+        return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode("ascii"))
+            data = json.loads(raw)
+            created_at = parse_datetime(data["t"])
+            pk = int(data["i"])
+        except (
+                binascii.Error, UnicodeError, ValueError, TypeError, KeyError
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pk
+
+
+class OptInKeysetPagination(BasePagination):
+    """
+    The project's default page-number pagination, unless the client asks for
+    cursor mode with `?pagination=cursor` (or follows a `cursor` link).
+    Existing clients keep the page/count envelope unchanged.
+    """
+    mode_query_param = "pagination"
+    keyset_class = KeysetPagination
+
+    def __init__(self):
+        self.paginator = None
+
+    def use_keyset(self, request):
+        params = request.query_params
+        return (
+                params.get(self.mode_query_param) == "cursor"
+                or self.keyset_class.cursor_query_param in params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_keyset(request):
+            self.paginator = self.keyset_class()
+        else:
+            self.paginator = api_settings.DEFAULT_PAGINATION_CLASS()
+        return self.paginator.paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return api_settings.DEFAULT_PAGINATION_CLASS().get_paginated_response_schema(
+            schema
+        )
+
+    def get_schema_operation_parameters(self, view):
+        default = api_settings.DEFAULT_PAGINATION_CLASS()
+        return [
+            *default.get_schema_operation_parameters(view),
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    "Set to `cursor` for keyset pagination on "
+                    "(created_at, id); the response then carries only "
+                    "`next` and `results`."
+                ),
+                "schema": {"type": "string", "enum": ["cursor"]},
+            },
+            {
+                "name": self.keyset_class.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor from the previous page's next link.",
+                "schema": {"type": "string"},
+            },
+        ]
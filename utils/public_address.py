@@ -0,0 +1,41 @@
+# utils/public_address.py
+
+import ipaddress
+import socket
+
+
+class NonPublicAddressError(ValueError):
+    """A host is, or resolves to, an address outside the public internet."""
+
+
+def is_public_ip(address: str) -> bool:
+    """
+    False for loopback, private (RFC 1918, ULA), link-local (which holds
+    cloud metadata endpoints), shared, reserved and multicast addresses.
+    """
+    ip = ipaddress.ip_address(address)
+    if ip.version == 6 and ip.ipv4_mapped:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+def resolve_public_ips(host: str, port: int) -> list:
+    """
+    Every address `host` resolves to, in resolver order. Raises
+    NonPublicAddressError if it does not resolve or any address is not
+    public, so a name mixing public and internal records is refused.
+    """
+    if not host:
+        raise NonPublicAddressError("URL has no host")
+    try:
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (socket.gaierror, UnicodeError) as exc:
+        raise NonPublicAddressError(f"cannot resolve {host}") from exc
+
+    addresses = list(dict.fromkeys(info[4][0] for info in infos))
+    for address in addresses:
+        if not is_public_ip(address):
+            raise NonPublicAddressError(
+                f"{host} resolves to non-public address {address}"
+            )
+    return addresses
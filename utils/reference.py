@@ -1,13 +1,175 @@
 # utils/reference.py
 
-import datetime
-import random
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
 
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
 
-def generate_reference_code(prefix="", random_digits=6):
-    now = datetime.datetime.now()
-    date_part = now.strftime("%y%m%d")
-    rand_part = str(
-        random.randint(10 ** (random_digits - 1), 10 ** random_digits - 1)
-    )
-    return f"{prefix}{date_part}{rand_part}"
+# <prefix><yymmdd><sssss><nn><ccc>
+#   sssss: second of the day, nn: node id, ccc: per-node counter in that second
+NODE_LIMIT = 100
+COUNTER_LIMIT = 1000
+# A node lease is renewed after half its length, outside any transaction of
+# the caller so the renewal cannot be rolled back; inside one it is only
+# renewed once it is about to run out. A lease taken inside a caller's
+# transaction could be rolled back with it, so it is re-checked soon after.
+NODE_LEASE_SECONDS = 30 * 60
+NODE_LEASE_MARGIN_SECONDS = 60
+NODE_RECHECK_SECONDS = 5
+
+
+class ReferenceCodeGenerator:
+    """
+    Mints unique, time-sortable reference codes without touching the database
+    per code.
+
+    Uniqueness comes from (second, node id, counter): every process leases
+    its own node id (0-99) from the ReferenceCodeNode table (a forked child
+    leases a new one) and keeps a monotonic in-process counter. When a node
+    mints more than COUNTER_LIMIT codes in one second it borrows the next
+    second, so codes never repeat even if the wall clock stalls or goes
+    backwards. Pass `node` to pin the id instead (tests, offline scripts).
+    """
+
+    def __init__(self, node: int = None):
+        self._lock = threading.Lock()
+        self._fixed_node = node
+        self._node = node
+        self._pid = None
+        self._owner = ""
+        self._renew_at = 0.0
+        self._valid_until = 0.0
+        self._second = 0
+        self._counter = 0
+
+    def generate(self, prefix: str = "") -> str:
+        with self._lock:
+            node = self._current_node()
+            now = int(time.time())
+            if now > self._second:
+                self._second, self._counter = now, 0
+            elif self._counter >= COUNTER_LIMIT:
+                self._second, self._counter = self._second + 1, 0
+            second, counter = self._second, self._counter
+            self._counter += 1
+
+        moment = timezone.localtime(
+            datetime.fromtimestamp(second, tz=dt_timezone.utc)
+        )
+        second_of_day = moment.hour * 3600 + moment.minute * 60 + moment.second
+        return (
+            f"{prefix}{moment:%y%m%d}"
+            f"{second_of_day:05d}{node:02d}{counter:03d}"
+        )
+
+    def ensure_node(self) -> int:
+        """Lease (or renew) this process's node now, e.g. before a request."""
+        with self._lock:
+            return self._current_node()
+
+    # ---------- node id ----------
+    def _current_node(self) -> int:
+        if self._fixed_node is not None:
+            return self._fixed_node
+        pid = os.getpid()
+        if pid != self._pid:
+            # New process, or a fork: the parent's lease is not ours
+            self._pid, self._node = pid, None
+            self._owner = f"{socket.gethostname()}:{pid}:{uuid.uuid4().hex[:8]}"
+        now = time.monotonic()
+        if self._node is not None and now < self._renew_at:
+            return self._node
+        in_atomic = connection.in_atomic_block
+        if self._node is not None and in_atomic and now < self._valid_until:
+            # Our committed lease still holds; renew after this transaction
+            return self._node
+        self._node = self._lease(self._node)
+        now = time.monotonic()
+        if in_atomic:
+            self._renew_at = self._valid_until = now + NODE_RECHECK_SECONDS
+        else:
+            self._renew_at = now + NODE_LEASE_SECONDS / 2
+            self._valid_until = (
+                now + NODE_LEASE_SECONDS - NODE_LEASE_MARGIN_SECONDS
+            )
+        return self._node
+
+    def _lease(self, node) -> int:
+        from wallets.models import ReferenceCodeNode
+
+        now = timezone.now()
+        expires_at = now + timedelta(seconds=NODE_LEASE_SECONDS)
+        if node is not None and ReferenceCodeNode.objects.filter(
+                node=node, owner=self._owner
+        ).update(expires_at=expires_at, updated_at=now):
+            return node
+
+        def free():
+            return (
+                ReferenceCodeNode.objects.select_for_update(skip_locked=True)
+                .filter(expires_at__lt=now)
+                .order_by("expires_at", "node")
+                .first()
+            )
+
+        with transaction.atomic():
+            row = free()
+            if row is None:
+                ReferenceCodeNode.objects.bulk_create(
+                    [
+                        ReferenceCodeNode(
+                            node=n, expires_at=now - timedelta(seconds=1),
+                            created_at=now, updated_at=now,
+                        )
+                        for n in range(NODE_LIMIT)
+                    ],
+                    ignore_conflicts=True,
+                )
+                row = free()
+            if row is None:
+                raise RuntimeError(
+                    f"All {NODE_LIMIT} reference code nodes are leased"
+                )
+            previous_expiry = row.expires_at
+            row.owner, row.expires_at, row.updated_at = (
+                self._owner, expires_at, now
+            )
+            row.save(update_fields=["owner", "expires_at", "updated_at"])
+
+        # The previous holder stopped minting before its lease ran out;
+        # start after that second so its last codes cannot come back.
+        self._second = max(self._second, int(previous_expiry.timestamp()))
+        self._counter = COUNTER_LIMIT
+        return row.node
+
+
+_generator = ReferenceCodeGenerator()
+
+
+def generate_reference_code(prefix=""):
+    return _generator.generate(prefix)
+
+
+def ensure_reference_node(**kwargs) -> None:
+    """Signal receiver: lease the node before a request or task starts."""
+    _generator.ensure_node()
+
+
+def save_with_reference_code(instance, mint, save, *args, **kwargs):
+    """
+    Save a new row with `instance.reference_code = mint()` in a single
+    INSERT. Codes are unique by construction (leased node + counter), so
+    there is no existence check and no savepoint; a clash means two
+    processes shared a node and is raised as IntegrityError.
+    """
+    instance.reference_code = mint()
+    try:
+        return save(*args, **kwargs)
+    except IntegrityError:
+        instance.reference_code = None
+        raise
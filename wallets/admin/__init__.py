@@ -4,3 +4,8 @@ from .transaction import TransactionAdmin
 from .transfer import WalletTransferRequestAdmin
 from .installment import InstallmentAdmin
 from .installment_plan import InstallmentPlanAdmin
+from .idempotency import PartnerIdempotencyKeyAdmin
+from .settlement import MerchantSettlementAdmin, SettlementItemAdmin
+from .snapshot import WalletDailySnapshotAdmin
+from .transaction_archive import ArchivedTransactionAdmin
+from .webhook import WebhookDeliveryAdmin
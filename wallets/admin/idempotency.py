@@ -0,0 +1,38 @@
+# wallets/admin/idempotency.py
+
+from django.contrib import admin
+
+from lib.erp_base.admin import BaseAdmin
+from wallets.models import PartnerIdempotencyKey
+
+
+@admin.register(PartnerIdempotencyKey)
+class PartnerIdempotencyKeyAdmin(BaseAdmin):
+    list_display = (
+        "key",
+        "store",
+        "scope",
+        "response_status",
+        "expires_at",
+        "jalali_creation_time",
+    )
+    list_filter = ("scope", "response_status", "created_at")
+    search_fields = ("key", "store__name")
+    readonly_fields = (
+        "store",
+        "key",
+        "scope",
+        "request_fingerprint",
+        "response_status",
+        "response_body",
+        "expires_at",
+        "jalali_creation_time",
+    )
+    list_select_related = ("store",)
+    ordering = ("-created_at",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
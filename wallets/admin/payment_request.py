@@ -6,12 +6,13 @@ from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
 from lib.erp_base.admin import BaseAdmin
+from utils.db_routing import ReplicaChangeListMixin
 from wallets.models import PaymentRequest
 from wallets.utils.choices import PaymentRequestStatus
 
 
 @admin.register(PaymentRequest)
-class PaymentRequestAdmin(BaseAdmin):
+class PaymentRequestAdmin(ReplicaChangeListMixin, BaseAdmin):
     list_display = (
         "reference_code",
         "status_badge",
@@ -0,0 +1,92 @@
+# wallets/admin/settlement.py
+
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+
+from lib.erp_base.admin import BaseAdmin
+from wallets.models import MerchantSettlement, SettlementItem
+
+
+class SettlementItemInline(admin.TabularInline):
+    model = SettlementItem
+    fields = ("payment_request", "amount", "created_at")
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+    show_change_link = True
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(MerchantSettlement)
+class MerchantSettlementAdmin(BaseAdmin):
+    list_display = (
+        "id",
+        "store",
+        "amount",
+        "items_count",
+        "transaction",
+        "jalali_creation_time",
+    )
+    list_filter = ("store", "created_at")
+    search_fields = ("store__name", "transaction__reference_code")
+    readonly_fields = (
+        "store",
+        "escrow_wallet",
+        "merchant_wallet",
+        "amount",
+        "items_count",
+        "transaction",
+        "jalali_creation_time",
+    )
+    list_select_related = ("store", "transaction")
+    inlines = (SettlementItemInline,)
+    ordering = ("-created_at",)
+    date_hierarchy = "created_at"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(SettlementItem)
+class SettlementItemAdmin(BaseAdmin):
+    list_display = (
+        "payment_request",
+        "store",
+        "amount",
+        "is_settled",
+        "settlement",
+        "jalali_creation_time",
+    )
+    list_filter = ("store", ("settlement", admin.EmptyFieldListFilter))
+    search_fields = ("payment_request__reference_code", "store__name")
+    readonly_fields = (
+        "payment_request",
+        "store",
+        "escrow_wallet",
+        "amount",
+        "settlement",
+        "jalali_creation_time",
+    )
+    list_select_related = ("payment_request", "store", "settlement")
+    ordering = ("-created_at",)
+
+    @admin.display(description=_("تسویه شده"), boolean=True)
+    def is_settled(self, obj: SettlementItem):
+        return obj.settlement_id is not None
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
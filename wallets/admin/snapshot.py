@@ -0,0 +1,37 @@
+# wallets/admin/snapshot.py
+
+from django.contrib import admin
+
+from lib.erp_base.admin import BaseAdmin
+from wallets.models import WalletDailySnapshot
+
+
+@admin.register(WalletDailySnapshot)
+class WalletDailySnapshotAdmin(BaseAdmin):
+    list_display = (
+        "wallet",
+        "day",
+        "total_in",
+        "total_out",
+        "transactions_count",
+        "closing_balance",
+    )
+    list_filter = ("day",)
+    search_fields = ("wallet__wallet_number", "wallet__user__username")
+    readonly_fields = (
+        "wallet",
+        "day",
+        "total_in",
+        "total_out",
+        "transactions_count",
+        "closing_balance",
+    )
+    list_select_related = ("wallet",)
+    ordering = ("-day",)
+    date_hierarchy = "day"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -6,12 +6,13 @@ from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
 from lib.erp_base.admin import BaseAdmin
+from utils.db_routing import ReplicaChangeListMixin
 from wallets.models import Transaction
 from wallets.utils.choices import TransactionStatus
 
 
 @admin.register(Transaction)
-class TransactionAdmin(BaseAdmin):
+class TransactionAdmin(ReplicaChangeListMixin, BaseAdmin):
     list_display = (
         "reference_code",
         "status_badge",
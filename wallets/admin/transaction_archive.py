@@ -0,0 +1,33 @@
+# wallets/admin/transaction_archive.py
+
+from django.contrib import admin
+
+from utils.db_routing import ReplicaChangeListMixin
+from wallets.models import ArchivedTransaction
+
+
+@admin.register(ArchivedTransaction)
+class ArchivedTransactionAdmin(ReplicaChangeListMixin, admin.ModelAdmin):
+    list_display = (
+        "reference_code",
+        "status",
+        "purpose",
+        "amount",
+        "from_wallet_id",
+        "to_wallet_id",
+        "created_at",
+        "archived_at",
+    )
+    list_filter = ("status", "purpose")
+    search_fields = ("reference_code",)
+    ordering = ("-created_at",)
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,73 @@
+# wallets/admin/webhook.py
+
+from django.contrib import admin, messages
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+
+from lib.erp_base.admin import BaseAdmin
+from utils.db_routing import ReplicaChangeListMixin
+from wallets.models import WebhookDelivery
+from wallets.services.webhook import redeliver
+from wallets.utils.choices import WebhookDeliveryStatus
+
+
+@admin.register(WebhookDelivery)
+class WebhookDeliveryAdmin(ReplicaChangeListMixin, BaseAdmin):
+    list_display = (
+        "id",
+        "store",
+        "payment_request",
+        "event",
+        "status",
+        "attempts",
+        "response_status",
+        "next_attempt_at",
+        "jalali_creation_time",
+    )
+    list_filter = ("status", "event", "created_at")
+    search_fields = (
+        "store__name",
+        "payment_request__reference_code",
+        "payment_request__external_guid",
+    )
+    readonly_fields = (
+        "store",
+        "payment_request",
+        "event",
+        "payload",
+        "status",
+        "attempts",
+        "response_status",
+        "last_error",
+        "next_attempt_at",
+        "delivered_at",
+        "attempt_log",
+        "jalali_creation_time",
+    )
+    list_select_related = ("store", "payment_request")
+    ordering = ("-created_at",)
+    date_hierarchy = "created_at"
+    actions = ("redeliver_action",)
+
+    @admin.action(description=_("ارسال مجدد وب‌هوک"))
+    def redeliver_action(self, request, queryset):
+        done = 0
+        with transaction.atomic():
+            for delivery in queryset.exclude(
+                    status=WebhookDeliveryStatus.PENDING
+            ):
+                redeliver(delivery)
+                done += 1
+        self.message_user(
+            request, _(f"{done} مورد برای ارسال مجدد ثبت شد."),
+            level=messages.SUCCESS
+        )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
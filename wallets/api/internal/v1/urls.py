@@ -1,8 +1,10 @@
 # wallets/api/internal/v1/urls.py
 from django.urls import path
 
-from wallets.api.internal.v1.views import \
-    InternalCustomerWalletListByNationalIdView
+from wallets.api.internal.v1.views import (
+    InternalCustomerWalletListByNationalIdView,
+    InternalEscrowBalanceView,
+)
 
 app_name = "wallets_internal_v1"
 
@@ -12,4 +14,9 @@ urlpatterns = [
         InternalCustomerWalletListByNationalIdView.as_view(),
         name="wallet-list"
     ),
+    path(
+        "escrow/balance/",
+        InternalEscrowBalanceView.as_view(),
+        name="escrow-balance"
+    ),
 ]
@@ -1 +1,2 @@
-from .wallet import InternalCustomerWalletListByNationalIdView
\ No newline at end of file
+from .wallet import InternalCustomerWalletListByNationalIdView
+from .escrow import InternalEscrowBalanceView
@@ -0,0 +1,33 @@
+# wallets/api/internal/v1/views/escrow.py
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from lib.cas_auth.views import CasAuthAPIView
+from wallets.utils.escrow import escrow_wallets_queryset
+
+
+class InternalEscrowBalanceView(CasAuthAPIView):
+    """Aggregate balance over all escrow shards."""
+
+    def get(self, request):
+        shards = list(
+            escrow_wallets_queryset()
+            .order_by("pk")
+            .values("wallet_number", "user__username", "balance")
+        )
+        return Response(
+            {
+                "total_balance": sum(int(s["balance"]) for s in shards),
+                "shard_count": len(shards),
+                "shards": [
+                    {
+                        "wallet_number": s["wallet_number"],
+                        "username": s["user__username"],
+                        "balance": int(s["balance"]),
+                    }
+                    for s in shards
+                ],
+            },
+            status=status.HTTP_200_OK
+        )
@@ -3,18 +3,23 @@
 # wallets/api/partner/v1/views/payment.py
 
 from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
 from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
-    extend_schema, OpenApiResponse,
+    extend_schema, OpenApiParameter, OpenApiResponse,
 )
 from rest_framework import status, mixins, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 from lib.erp_base.rest.throttling import ScopedThrottleByActionMixin
-from merchants.permissions import IsMerchant
 from profiles.models import Profile
 from store.authentication import StoreApiKeyAuthentication
+from store.permissions import IsStoreApiKeyMerchant
 from wallets.api.partner.v1.serializers import (
     PaymentRequestCreateSerializer,
     PaymentRequestCreateResponseSerializer,
@@ -22,12 +27,30 @@ from wallets.api.partner.v1.serializers import (
     PaymentRequestPartnerDetailSerializer,
 )
 from wallets.models import PaymentRequest
+from wallets.services.idempotency import (
+    request_fingerprint,
+    run_idempotent,
+)
 from wallets.services.payment import (
     create_payment_request,
     verify_payment_request,
 )
 from wallets.utils.choices import PaymentRequestStatus
-from wallets.utils.consts import FRONTEND_PAYMENT_DETAIL_URL
+from wallets.utils.consts import (
+    FRONTEND_PAYMENT_DETAIL_URL,
+    PARTNER_IDEMPOTENCY_KEY_MAX_LENGTH,
+)
+
+IDEMPOTENCY_KEY_PARAMETER = OpenApiParameter(
+    name="Idempotency-Key",
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.HEADER,
+    required=False,
+    description=(
+        "کلید یکتای درخواست؛ تکرار درخواست با همین کلید پاسخ قبلی را "
+        "بدون اجرای مجدد برمی‌گرداند."
+    ),
+)
 
 
 @extend_schema(tags=["Wallet · Payment Requests (Partner)"])
@@ -43,7 +66,7 @@ class PartnerPaymentRequestViewSet(
     verify:   POST /payment-requests/{ref}/verify/ → finalize payment after success callback
     """
     authentication_classes = [StoreApiKeyAuthentication]
-    permission_classes = [IsMerchant]
+    permission_classes = [IsStoreApiKeyMerchant]
     serializer_class = PaymentRequestPartnerDetailSerializer
     lookup_field = "reference_code"
     lookup_value_regex = r"[-A-Za-z0-9_]+"
@@ -56,18 +79,23 @@ class PartnerPaymentRequestViewSet(
     }
 
     def get_queryset(self):
-        # Scope to the authenticated store (from API Key)
+        # Scope to the authenticated store (id from the API key snapshot)
         return (
             PaymentRequest.objects
             .select_related("store", "paid_by", "paid_wallet")
-            .filter(store=self.request.store)
+            .filter(store_id=self.request.auth["store_id"])
         )
 
     # ---------- create ----------
     @extend_schema(
         summary="ایجاد درخواست پرداخت",
         request=PaymentRequestCreateSerializer,
-        responses={201: PaymentRequestCreateResponseSerializer},
+        parameters=[IDEMPOTENCY_KEY_PARAMETER],
+        responses={
+            201: PaymentRequestCreateResponseSerializer,
+            409: OpenApiResponse(description="Duplicate external_guid"),
+            422: OpenApiResponse(description="Idempotency-Key reused"),
+        },
     )
     def create(self, request, *args, **kwargs):
         ser = PaymentRequestCreateSerializer(
@@ -75,25 +103,37 @@ class PartnerPaymentRequestViewSet(
         )
         ser.is_valid(raise_exception=True)
         data = ser.validated_data
+        return self._idempotent(
+            request, "create", lambda: self._create_payment_request(data)
+        )
 
-        # Resolve customer by national_id
+    def _create_payment_request(self, data):
+        # Resolve customer by national_id. Only "not found" is an answer;
+        # other errors propagate so an idempotent retry can still succeed.
         try:
             profile = Profile.objects.get(national_id=data["national_id"])
             customer = profile.user.customer
-        except Exception:
-            return Response(
+        except ObjectDoesNotExist:
+            return (
+                status.HTTP_404_NOT_FOUND,
                 {"detail": "مشتری با این کد ملی یافت نشد."},
-                status=status.HTTP_404_NOT_FOUND
             )
 
-        req = create_payment_request(
-            store=request.store,
-            customer=customer,
-            amount=data["amount"],
-            return_url=data.get("return_url"),
-            description=data.get("description", ""),
-            external_guid=data.get("external_guid"),
-        )
+        try:
+            with transaction.atomic():
+                req = create_payment_request(
+                    store=self.request.store,
+                    customer=customer,
+                    amount=data["amount"],
+                    return_url=data.get("return_url"),
+                    description=data.get("description", ""),
+                    external_guid=data.get("external_guid"),
+                )
+        except IntegrityError:
+            return (
+                status.HTTP_409_CONFLICT,
+                {"detail": "درخواست پرداخت با این شناسه خارجی قبلاً ثبت شده است."},
+            )
         payment_url = f"{settings.FRONTEND_BASE_URL}{FRONTEND_PAYMENT_DETAIL_URL}{req.reference_code}/"
         payload = {
             "payment_request_id": req.id,
@@ -105,7 +145,7 @@ class PartnerPaymentRequestViewSet(
             "payment_url": payment_url,
         }
         out = PaymentRequestCreateResponseSerializer(payload).data
-        return Response(out, status=status.HTTP_201_CREATED)
+        return status.HTTP_201_CREATED, out
 
     # ---------- retrieve ----------
     @extend_schema(
@@ -128,29 +168,34 @@ class PartnerPaymentRequestViewSet(
     @extend_schema(
         summary="تایید نهایی پرداخت",
         description="پس از پرداخت موفق توسط مشتری، فروشگاه با این API پرداخت را تایید نهایی می‌کند",
+        parameters=[IDEMPOTENCY_KEY_PARAMETER],
         responses={
             200: PaymentVerifyResponseSerializer,
             400: OpenApiResponse(description="Validation error"),
             404: OpenApiResponse(description="Payment request not found"),
+            422: OpenApiResponse(description="Idempotency-Key reused"),
         },
     )
     @action(detail=True, methods=["post"], url_path="verify")
     def verify(self, request, *args, **kwargs):
         ref = kwargs.get(self.lookup_field)
+        return self._idempotent(
+            request, "verify", lambda: self._verify_payment_request(ref)
+        )
+
+    def _verify_payment_request(self, ref):
         try:
             pr = self.get_queryset().get(reference_code=ref)
         except PaymentRequest.DoesNotExist:
-            return Response(
+            return (
+                status.HTTP_404_NOT_FOUND,
                 {"detail": "درخواست پرداخت پیدا نشد."},
-                status=status.HTTP_404_NOT_FOUND
             )
 
         try:
             txn = verify_payment_request(pr)
-        except Exception as e:
-            return Response(
-                {"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST
-            )
+        except (ValidationError, DjangoValidationError) as e:
+            return status.HTTP_400_BAD_REQUEST, {"detail": str(e)}
 
         payload = {
             "detail": "پرداخت نهایی شد.",
@@ -158,7 +203,32 @@ class PartnerPaymentRequestViewSet(
             "transaction_reference_code": txn.reference_code,
             "amount": pr.amount,
         }
-        return Response(
+        return (
+            status.HTTP_200_OK,
             PaymentVerifyResponseSerializer(payload).data,
-            status=status.HTTP_200_OK
         )
+
+    # ---------- idempotency ----------
+    def _idempotent(self, request, scope, handler):
+        """
+        With an Idempotency-Key header a final outcome is stored per store
+        and key; retries are answered from it without touching wallets.
+        """
+        key = request.headers.get("Idempotency-Key")
+        if not key:
+            status_code, body = handler()
+            return Response(body, status=status_code)
+        if len(key) > PARTNER_IDEMPOTENCY_KEY_MAX_LENGTH:
+            return Response(
+                {"detail": "طول کلید یکتایی بیش از حد مجاز است."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        fingerprint = request_fingerprint(scope, request.path, request.data)
+        result = run_idempotent(
+            request.store, key, scope, fingerprint, handler
+        )
+        response = Response(result.body, status=result.status)
+        if result.replayed:
+            response["Idempotent-Replayed"] = "true"
+        return response
@@ -6,6 +6,7 @@ from rest_framework import viewsets, mixins
 from rest_framework.filters import OrderingFilter
 
 from lib.erp_base.rest.throttling import ScopedThrottleByActionMixin
+from utils.db_routing import ReplicaReadMixin
 from wallets.api.public.v1.schema import installments_schema
 from wallets.api.public.v1.serializers import InstallmentSerializer
 from wallets.filters import InstallmentFilter
@@ -14,6 +15,7 @@ from wallets.models import Installment
 
 @installments_schema
 class InstallmentViewSet(
+    ReplicaReadMixin,
     ScopedThrottleByActionMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
@@ -8,6 +8,7 @@ from rest_framework.filters import OrderingFilter
 from rest_framework.response import Response
 
 from lib.erp_base.rest.throttling import ScopedThrottleByActionMixin
+from utils.db_routing import ReplicaReadMixin
 from wallets.api.public.v1.schema import (
     plan_installments_action_schema,
     installment_plans_schema,
@@ -22,6 +23,7 @@ from wallets.models import InstallmentPlan, Installment
 
 @installment_plans_schema
 class InstallmentPlanViewSet(
+    ReplicaReadMixin,
     ScopedThrottleByActionMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
@@ -8,6 +8,8 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 from lib.erp_base.rest.throttling import ScopedThrottleByActionMixin
+from utils.db_routing import ReplicaReadMixin
+from utils.pagination import OptInKeysetPagination
 from wallets.api.public.v1.schema import (
     payment_confirm_schema,
     payment_retrieve_schema,
@@ -50,6 +52,7 @@ def _error_response(detail, code, http_status, pr=None):
 
 
 class PaymentRequestViewSet(
+    ReplicaReadMixin,
     ScopedThrottleByActionMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
@@ -60,6 +63,9 @@ class PaymentRequestViewSet(
     retrieve: Details by reference_code (includes available_wallets for authenticated user).
     confirm:  POST /payment-requests/{reference_code}/confirm/ to pay using a wallet.
     """
+    pagination_class = OptInKeysetPagination
+    # retrieve may expire the request on read, so it stays on the primary
+    replica_actions = {"list"}
     lookup_field = "reference_code"
     lookup_value_regex = r"[-A-Za-z0-9_]+"
     throttle_scope_map = {
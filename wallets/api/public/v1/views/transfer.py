@@ -8,6 +8,8 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from lib.erp_base.rest.throttling import ScopedThrottleByActionMixin
+from utils.db_routing import ReplicaReadMixin
+from utils.pagination import OptInKeysetPagination
 from wallets.api.public.v1.schema import (
     transfer_reject_schema,
     transfer_confirm_schema,
@@ -25,6 +27,8 @@ from wallets.services import (
     create_wallet_transfer_request,
     confirm_wallet_transfer_request,
     reject_wallet_transfer_request,
+    resolve_transfer_party,
+    transfer_inbox_queryset,
 )
 from wallets.services.transfer import check_and_expire_transfer_request
 from wallets.utils.choices import TransferStatus
@@ -32,6 +36,7 @@ from wallets.utils.choices import TransferStatus
 
 @transfers_list_schema
 class WalletTransferViewSet(
+    ReplicaReadMixin,
     ScopedThrottleByActionMixin,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
@@ -60,6 +65,7 @@ class WalletTransferViewSet(
             "transaction_id",
         )
     )
+    pagination_class = OptInKeysetPagination
     serializer_class = WalletTransferDetailSerializer
     lookup_field = "pk"
     throttle_scope_map = {
@@ -72,25 +78,15 @@ class WalletTransferViewSet(
     }
 
     def list(self, request, *args, **kwargs):
-        user = request.user
-        phone = getattr(getattr(user, "profile", None), "phone_number", None)
         role = request.query_params.get("role", "all")
         status_param = request.query_params.get("status")
         ordering = request.query_params.get("ordering") or "-created_at"
 
-        if role == "sender":
-            qs = self.queryset.filter(sender_wallet__user=user)
-        elif role == "receiver":
-            qs = self.queryset.filter(
-                models.Q(receiver_wallet__user=user) |
-                models.Q(receiver_phone_number=phone)
-            )
-        else:
-            qs = self.queryset.filter(
-                models.Q(sender_wallet__user=user) |
-                models.Q(receiver_wallet__user=user) |
-                models.Q(receiver_phone_number=phone)
-            ).distinct()
+        if role not in {"sender", "receiver"}:
+            role = "all"
+        qs = transfer_inbox_queryset(
+            resolve_transfer_party(request.user), role, self.queryset
+        )
 
         if status_param:
             qs = qs.filter(status=status_param)
@@ -211,12 +207,11 @@ class WalletTransferViewSet(
             self, request, pk: int
     ) -> WalletTransferRequest:
         """User must be a party (sender/receiver) or intended phone receiver."""
-        user = request.user
-        phone = getattr(getattr(user, "profile", None), "phone_number", None)
-        return get_object_or_404(
-            self.queryset,
-            models.Q(id=pk),
-            models.Q(sender_wallet__user=user) |
-            models.Q(receiver_wallet__user=user) |
-            models.Q(receiver_phone_number=phone),
+        party = resolve_transfer_party(request.user)
+        involved = (
+                models.Q(sender_wallet_id__in=party.wallet_ids) |
+                models.Q(receiver_wallet_id__in=party.wallet_ids)
         )
+        if party.phone_number:
+            involved |= models.Q(receiver_phone_number=party.phone_number)
+        return get_object_or_404(self.queryset, models.Q(id=pk), involved)
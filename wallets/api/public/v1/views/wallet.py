@@ -5,6 +5,7 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 from rest_framework import viewsets, mixins
 
 from lib.erp_base.rest.throttling import ScopedThrottleByActionMixin
+from utils.db_routing import ReplicaReadMixin
 from wallets.api.public.v1.serializers import WalletSerializer
 from wallets.models import Wallet
 
@@ -24,6 +25,7 @@ from wallets.models import Wallet
     ],
 )
 class WalletViewSet(
+    ReplicaReadMixin,
     ScopedThrottleByActionMixin,
     mixins.ListModelMixin,
     viewsets.GenericViewSet
@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class WalletsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "wallets"
+
+    def ready(self):
+        from celery.signals import task_prerun
+        from django.core.signals import request_started
+
+        from utils.reference import ensure_reference_node
+
+        # Lease the reference-code node before any transaction is open
+        request_started.connect(
+            ensure_reference_node, dispatch_uid="wallets.reference_node"
+        )
+        task_prerun.connect(
+            ensure_reference_node, dispatch_uid="wallets.reference_node"
+        )
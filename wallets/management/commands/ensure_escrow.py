@@ -1,14 +1,30 @@
 # wallets/management/commands/ensure_escrow.py
 from django.core.management.base import BaseCommand
 
-from wallets.utils.escrow import ensure_escrow_wallet_exists
+from wallets.utils.consts import ESCROW_SHARD_COUNT
+from wallets.utils.escrow import (
+    ensure_escrow_wallet_exists, get_total_escrow_balance,
+)
 
 
 class Command(BaseCommand):
-    help = "Ensure escrow user and wallet exist."
+    help = "Ensure escrow users and wallets exist for every escrow shard."
 
-    def handle(self, *args, **kwargs):
-        ensure_escrow_wallet_exists()
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--shards",
+            type=int,
+            default=ESCROW_SHARD_COUNT,
+            help="Number of escrow shards to provision "
+                 "(default: WALLETS_ESCROW_SHARD_COUNT).",
+        )
+
+    def handle(self, *args, **options):
+        shards = max(1, int(options["shards"]))
+        ensure_escrow_wallet_exists(shards=shards)
         self.stdout.write(
-            self.style.SUCCESS('Escrow user and wallet ensured!')
+            self.style.SUCCESS(
+                f"Escrow users and wallets ensured! shards={shards}, "
+                f"total balance={get_total_escrow_balance()}"
             )
+        )
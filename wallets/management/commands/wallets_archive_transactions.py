@@ -0,0 +1,51 @@
+# wallets/management/commands/wallets_archive_transactions.py
+
+from django.core.management.base import BaseCommand
+
+from wallets.services.archive import archive_closed_months
+from wallets.utils.consts import (
+    TRANSACTION_ARCHIVE_BATCH_SIZE, TRANSACTION_HOT_MONTHS,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Move transactions of closed months (older than --hot-months) to the "
+        "archive table. Safe to re-run; only snapshotted, unreferenced rows "
+        "are moved."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hot-months",
+            type=int,
+            default=TRANSACTION_HOT_MONTHS,
+            help="Closed months kept in the hot table "
+                 "(default: WALLETS_TRANSACTION_HOT_MONTHS).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=TRANSACTION_ARCHIVE_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop after this many batches (default: no limit).",
+        )
+
+    def handle(self, *args, **options):
+        result = archive_closed_months(
+            hot_months=max(1, options["hot_months"]),
+            batch_size=max(1, options["batch_size"]),
+            max_batches=options["max_batches"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived: {result.archived_count}, "
+                f"Kept (referenced): {result.kept_count}, "
+                f"Batches: {result.batches}, "
+                f"Cutoff: {result.cutoff.date()}"
+            )
+        )
@@ -0,0 +1,59 @@
+# wallets/management/commands/wallets_onboard_customers.py
+
+import csv
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+
+from wallets.services.onboarding import OnboardResult, onboard_customers_batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Onboard customers from a CSV file: create missing users, profiles "
+        "and customers and provision their default wallets in bulk batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("csv_path", help="CSV file with a header row.")
+        parser.add_argument(
+            "--column",
+            default="phone_number",
+            help="Header of the phone number column (default: phone_number).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per transaction (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        column = options["column"]
+        batch_size = max(1, options["batch_size"])
+        total = OnboardResult()
+        try:
+            handle = open(options["csv_path"], newline="", encoding="utf-8-sig")
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        with handle:
+            reader = csv.DictReader(handle)
+            if column not in (reader.fieldnames or []):
+                raise CommandError(f"Column '{column}' not found in CSV header.")
+            phones = (row.get(column) for row in reader)
+            while True:
+                batch = list(islice(phones, batch_size))
+                if not batch:
+                    break
+                total.add(onboard_customers_batch(batch))
+                self.stdout.write(f"Processed {total.rows} rows...")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rows: {total.rows}, Invalid: {total.invalid}, "
+                f"Users created: {total.users_created}, "
+                f"Customers created: {total.customers_created}, "
+                f"Wallets created: {total.wallets_created}"
+            )
+        )
@@ -0,0 +1,54 @@
+# wallets/management/commands/wallets_reconcile_ledger.py
+
+from django.core.management.base import BaseCommand
+
+from wallets.services.ledger import (
+    build_daily_snapshots, reconcile_wallet_balances,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Bring daily wallet snapshots up to date, then replay every wallet "
+        "from its last snapshot and report balances that drift from the "
+        "transaction ledger."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--skip-build",
+            action="store_true",
+            help="Reconcile against the snapshots as they are.",
+        )
+        parser.add_argument(
+            "--show",
+            type=int,
+            default=50,
+            help="How many drifted wallet ids to print (default: 50).",
+        )
+
+    def handle(self, *args, **options):
+        if not options["skip_build"]:
+            built = build_daily_snapshots()
+            self.stdout.write(
+                f"Snapshots: transactions={built.transactions_count}, "
+                f"rows={built.snapshots_touched}, "
+                f"watermark={built.last_transaction_id}"
+            )
+
+        result = reconcile_wallet_balances()
+        style = (
+            self.style.WARNING if result.wallets_drifted
+            else self.style.SUCCESS
+        )
+        self.stdout.write(
+            style(
+                f"Checked: {result.wallets_checked}, "
+                f"Drifted: {result.wallets_drifted}"
+            )
+        )
+        shown = result.drifted_wallet_ids[:max(0, options["show"])]
+        if shown:
+            self.stdout.write(
+                "Drifted wallets: " + ", ".join(str(pk) for pk in shown)
+            )
@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallets', '0012_paymentrequest_created_expires_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='escrow_shard',
+            field=models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='شارد امانی'),
+        ),
+    ]
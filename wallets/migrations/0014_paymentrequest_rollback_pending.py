@@ -0,0 +1,53 @@
+# Generated by Django 5.0 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+def backfill_rollback_pending(apps, schema_editor):
+    # Requests that already expired or were cancelled while still holding
+    # escrow funds or a credit authorization were never rolled back; flag
+    # them so the rollback processor picks them up.
+    PaymentRequest = apps.get_model('wallets', 'PaymentRequest')
+    Transaction = apps.get_model('wallets', 'Transaction')
+    CreditAuthorization = apps.get_model('credit', 'CreditAuthorization')
+    closed = Transaction.objects.filter(
+        payment_request_id=models.OuterRef('pk'),
+        purpose__in=['reversal', 'settlement'],
+        status='success',
+    )
+    held_escrow = Transaction.objects.filter(
+        payment_request_id=models.OuterRef('pk'),
+        purpose='escrow_debit',
+        status='success',
+    )
+    active_auth = CreditAuthorization.objects.filter(
+        payment_request_id=models.OuterRef('pk'),
+        status='active',
+    )
+    PaymentRequest.objects.filter(
+        status__in=['expired', 'cancelled'],
+    ).filter(
+        (models.Exists(held_escrow) & ~models.Exists(closed))
+        | models.Exists(active_auth)
+    ).update(rollback_pending=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('credit', '0002_creditauthorization_and_more'),
+        ('wallets', '0013_transaction_escrow_shard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paymentrequest',
+            name='rollback_pending',
+            field=models.BooleanField(default=False, verbose_name='در انتظار بازگشت وجه'),
+        ),
+        migrations.AddIndex(
+            model_name='paymentrequest',
+            index=models.Index(condition=models.Q(('rollback_pending', True)), fields=['id'], name='pr_rollback_pending_idx'),
+        ),
+        migrations.RunPython(backfill_rollback_pending, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.0 on 2026-10-16 14:00
+
+import django.core.serializers.json
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0005_delete_storecontract'),
+        ('wallets', '0014_paymentrequest_rollback_pending'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PartnerIdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.UUIDField(default=uuid.uuid4, null=True, unique=True, verbose_name='GUID')),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('extra_document', models.FileField(blank=True, max_length=127, null=True, upload_to='extra_documents', verbose_name='دستورات و مستندات')),
+                ('key', models.CharField(max_length=255, verbose_name='کلید')),
+                ('scope', models.CharField(max_length=32, verbose_name='عملیات')),
+                ('request_fingerprint', models.CharField(max_length=64, verbose_name='اثر انگشت درخواست')),
+                ('response_status', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='کد وضعیت پاسخ')),
+                ('response_body', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='بدنه پاسخ')),
+                ('expires_at', models.DateTimeField(verbose_name='زمان انقضا')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_creations', to=settings.AUTH_USER_MODEL, verbose_name='ایجاد کننده')),
+                ('store', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='idempotency_keys', to='store.store', verbose_name='فروشگاه')),
+            ],
+            options={
+                'verbose_name': 'کلید یکتایی درخواست',
+                'verbose_name_plural': 'کلیدهای یکتایی درخواست',
+                'indexes': [models.Index(fields=['expires_at'], name='idem_expires_idx')],
+                'constraints': [models.UniqueConstraint(fields=('store', 'key'), name='uniq_store_idempotency_key')],
+            },
+        ),
+    ]
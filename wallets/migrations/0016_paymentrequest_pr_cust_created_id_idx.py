@@ -0,0 +1,21 @@
+# Generated by Django 5.0 on 2026-10-16 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallets', '0015_partneridempotencykey'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='paymentrequest',
+            name='pr_cust_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='paymentrequest',
+            index=models.Index(fields=['customer', '-created_at', '-id'], name='pr_cust_created_id_idx'),
+        ),
+    ]
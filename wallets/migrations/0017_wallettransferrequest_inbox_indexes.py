@@ -0,0 +1,37 @@
+# Generated by Django 5.0 on 2026-10-16 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallets', '0016_paymentrequest_pr_cust_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='wallettransferrequest',
+            name='wallets_wal_sender__ca65b7_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='wallettransferrequest',
+            name='wallets_wal_receive_c4ea50_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='wallettransferrequest',
+            name='wallets_wal_receive_f65db1_idx',
+        ),
+        migrations.AddIndex(
+            model_name='wallettransferrequest',
+            index=models.Index(fields=['sender_wallet', '-created_at', '-id'], name='wtr_sender_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wallettransferrequest',
+            index=models.Index(fields=['receiver_wallet', '-created_at', '-id'], name='wtr_receiver_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wallettransferrequest',
+            index=models.Index(fields=['receiver_phone_number', '-created_at', '-id'], name='wtr_phone_created_idx'),
+        ),
+    ]
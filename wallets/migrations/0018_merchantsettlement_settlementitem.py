@@ -0,0 +1,61 @@
+# Generated by Django 5.0 on 2026-10-16 17:00
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0006_store_settlement_mode'),
+        ('wallets', '0017_wallettransferrequest_inbox_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MerchantSettlement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.UUIDField(default=uuid.uuid4, null=True, unique=True, verbose_name='GUID')),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('extra_document', models.FileField(blank=True, max_length=127, null=True, upload_to='extra_documents', verbose_name='دستورات و مستندات')),
+                ('amount', models.BigIntegerField(verbose_name='مبلغ')),
+                ('items_count', models.PositiveIntegerField(verbose_name='تعداد پرداخت‌ها')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_creations', to=settings.AUTH_USER_MODEL, verbose_name='ایجاد کننده')),
+                ('escrow_wallet', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='wallets.wallet', verbose_name='کیف امانی')),
+                ('merchant_wallet', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='settlements', to='wallets.wallet', verbose_name='کیف فروشنده')),
+                ('store', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='settlements', to='store.store', verbose_name='فروشگاه')),
+                ('transaction', models.OneToOneField(on_delete=django.db.models.deletion.PROTECT, related_name='merchant_settlement', to='wallets.transaction', verbose_name='تراکنش')),
+            ],
+            options={
+                'verbose_name': 'تسویه فروشگاه',
+                'verbose_name_plural': 'تسویه‌های فروشگاه',
+                'indexes': [models.Index(fields=['store', '-created_at'], name='ms_store_created_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SettlementItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.UUIDField(default=uuid.uuid4, null=True, unique=True, verbose_name='GUID')),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('extra_document', models.FileField(blank=True, max_length=127, null=True, upload_to='extra_documents', verbose_name='دستورات و مستندات')),
+                ('amount', models.BigIntegerField(verbose_name='مبلغ')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_creations', to=settings.AUTH_USER_MODEL, verbose_name='ایجاد کننده')),
+                ('escrow_wallet', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='wallets.wallet', verbose_name='کیف امانی')),
+                ('payment_request', models.OneToOneField(on_delete=django.db.models.deletion.PROTECT, related_name='settlement_item', to='wallets.paymentrequest', verbose_name='درخواست پرداخت')),
+                ('settlement', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='items', to='wallets.merchantsettlement', verbose_name='تسویه')),
+                ('store', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='settlement_items', to='store.store', verbose_name='فروشگاه')),
+            ],
+            options={
+                'verbose_name': 'پرداخت در انتظار تسویه',
+                'verbose_name_plural': 'پرداخت‌های در انتظار تسویه',
+                'indexes': [models.Index(condition=models.Q(('settlement__isnull', True)), fields=['id'], name='sti_pending_idx')],
+            },
+        ),
+    ]
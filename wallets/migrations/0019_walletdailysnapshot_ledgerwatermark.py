@@ -0,0 +1,57 @@
+# Generated by Django 5.0 on 2026-10-16 18:00
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallets', '0018_merchantsettlement_settlementitem'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LedgerWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.UUIDField(default=uuid.uuid4, null=True, unique=True, verbose_name='GUID')),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('extra_document', models.FileField(blank=True, max_length=127, null=True, upload_to='extra_documents', verbose_name='دستورات و مستندات')),
+                ('name', models.CharField(max_length=64, unique=True, verbose_name='نام')),
+                ('last_transaction_id', models.BigIntegerField(default=0, verbose_name='آخرین شناسه تراکنش')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_creations', to=settings.AUTH_USER_MODEL, verbose_name='ایجاد کننده')),
+            ],
+            options={
+                'verbose_name': 'نشانگر پردازش دفتر',
+                'verbose_name_plural': 'نشانگرهای پردازش دفتر',
+            },
+        ),
+        migrations.CreateModel(
+            name='WalletDailySnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.UUIDField(default=uuid.uuid4, null=True, unique=True, verbose_name='GUID')),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('extra_document', models.FileField(blank=True, max_length=127, null=True, upload_to='extra_documents', verbose_name='دستورات و مستندات')),
+                ('day', models.DateField(verbose_name='روز')),
+                ('total_in', models.BigIntegerField(default=0, verbose_name='جمع واریز')),
+                ('total_out', models.BigIntegerField(default=0, verbose_name='جمع برداشت')),
+                ('transactions_count', models.PositiveIntegerField(default=0, verbose_name='تعداد تراکنش')),
+                ('closing_balance', models.BigIntegerField(default=0, verbose_name='مانده پایان روز')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_creations', to=settings.AUTH_USER_MODEL, verbose_name='ایجاد کننده')),
+                ('wallet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_snapshots', to='wallets.wallet', verbose_name='کیف پول')),
+            ],
+            options={
+                'verbose_name': 'مانده روزانه کیف پول',
+                'verbose_name_plural': 'مانده‌های روزانه کیف پول',
+                'indexes': [models.Index(fields=['day'], name='wds_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('wallet', 'day'), name='uniq_wallet_snapshot_day')],
+            },
+        ),
+    ]
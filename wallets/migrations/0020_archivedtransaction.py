@@ -0,0 +1,52 @@
+# Generated by Django 5.0 on 2026-10-16 19:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def tune_archive_storage(apps, schema_editor):
+    # Archived rows are never updated: pack pages fully.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "ALTER TABLE wallets_archivedtransaction SET (fillfactor = 100)"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallets', '0019_walletdailysnapshot_ledgerwatermark'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedTransaction',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.UUIDField(blank=True, null=True, verbose_name='GUID')),
+                ('reference_code', models.CharField(blank=True, max_length=20, null=True, verbose_name='کد پیگیری')),
+                ('status', models.CharField(choices=[('pending', 'در انتظار تایید'), ('success', 'موفق'), ('failed', 'ناموفق'), ('reversed', 'برگشت‌خورده')], max_length=16, verbose_name='وضعیت')),
+                ('purpose', models.CharField(choices=[('escrow_debit', 'انتقال به امانی (Escrow)'), ('settlement', 'تسویه با فروشنده'), ('reversal', 'بازگشت وجه')], max_length=32, null=True, verbose_name='نوع عملیات')),
+                ('amount', models.BigIntegerField(verbose_name='مبلغ')),
+                ('escrow_shard', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='شارد امانی')),
+                ('description', models.TextField(blank=True)),
+                ('extra_document', models.CharField(blank=True, max_length=127, null=True)),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='زمان بایگانی')),
+                ('creator', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='ایجاد کننده')),
+                ('from_wallet', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='wallets.wallet', verbose_name='از کیف پول')),
+                ('payment_request', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='wallets.paymentrequest', verbose_name='درخواست پرداخت')),
+                ('to_wallet', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='wallets.wallet', verbose_name='به کیف پول')),
+            ],
+            options={
+                'verbose_name': 'تراکنش بایگانی‌شده',
+                'verbose_name_plural': 'تراکنش‌های بایگانی‌شده',
+                'indexes': [models.Index(fields=['from_wallet', 'created_at'], name='atrx_from_created_idx'), models.Index(fields=['to_wallet', 'created_at'], name='atrx_to_created_idx'), models.Index(fields=['payment_request'], name='atrx_pr_idx'), models.Index(fields=['reference_code'], name='atrx_ref_idx')],
+            },
+        ),
+        migrations.RunPython(tune_archive_storage, migrations.RunPython.noop),
+    ]
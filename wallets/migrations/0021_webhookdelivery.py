@@ -0,0 +1,45 @@
+# Generated by Django 5.0 on 2026-10-16 20:00
+
+import django.core.serializers.json
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0007_storewebhook'),
+        ('wallets', '0020_archivedtransaction'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebhookDelivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.UUIDField(default=uuid.uuid4, null=True, unique=True, verbose_name='GUID')),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('extra_document', models.FileField(blank=True, max_length=127, null=True, upload_to='extra_documents', verbose_name='دستورات و مستندات')),
+                ('event', models.CharField(max_length=64, verbose_name='رویداد')),
+                ('payload', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='محتوا')),
+                ('status', models.CharField(choices=[('pending', 'در انتظار ارسال'), ('delivered', 'تحویل شده'), ('failed', 'ناموفق')], default='pending', max_length=16, verbose_name='وضعیت')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='تعداد تلاش')),
+                ('response_status', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='کد پاسخ')),
+                ('last_error', models.TextField(blank=True, verbose_name='آخرین خطا')),
+                ('next_attempt_at', models.DateTimeField(blank=True, null=True, verbose_name='زمان تلاش بعدی')),
+                ('delivered_at', models.DateTimeField(blank=True, null=True, verbose_name='زمان تحویل')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_creations', to=settings.AUTH_USER_MODEL, verbose_name='ایجاد کننده')),
+                ('payment_request', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='webhook_deliveries', to='wallets.paymentrequest', verbose_name='درخواست پرداخت')),
+                ('store', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='webhook_deliveries', to='store.store', verbose_name='فروشگاه')),
+            ],
+            options={
+                'verbose_name': 'ارسال وب‌هوک',
+                'verbose_name_plural': 'ارسال‌های وب‌هوک',
+                'indexes': [models.Index(fields=['payment_request', '-created_at'], name='whd_pr_created_idx'), models.Index(condition=models.Q(('status', 'pending')), fields=['next_attempt_at'], name='whd_pending_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0 on 2026-10-16 23:45
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('wallets', '0022_webhookdelivery_attempt_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReferenceCodeNode',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guid', models.UUIDField(default=uuid.uuid4, null=True, unique=True, verbose_name='GUID')),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('extra_document', models.FileField(blank=True, max_length=127, null=True, upload_to='extra_documents', verbose_name='دستورات و مستندات')),
+                ('node', models.PositiveSmallIntegerField(unique=True, verbose_name='شناسه گره')),
+                ('owner', models.CharField(blank=True, max_length=128, verbose_name='فرایند دارنده')),
+                ('expires_at', models.DateTimeField(verbose_name='پایان اجاره')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_creations', to=settings.AUTH_USER_MODEL, verbose_name='ایجاد کننده')),
+            ],
+            options={
+                'verbose_name': 'گره کد پیگیری',
+                'verbose_name_plural': 'گره‌های کد پیگیری',
+                'ordering': ['node'],
+            },
+        ),
+    ]
@@ -4,3 +4,9 @@ from .transaction import Transaction
 from .transfer import WalletTransferRequest
 from .installment_plan import InstallmentPlan
 from .installment import Installment
+from .idempotency import PartnerIdempotencyKey
+from .settlement import MerchantSettlement, SettlementItem
+from .snapshot import WalletDailySnapshot, LedgerWatermark
+from .transaction_archive import ArchivedTransaction
+from .webhook import WebhookDelivery
+from .reference_node import ReferenceCodeNode
@@ -0,0 +1,49 @@
+# wallets/models/idempotency.py
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from lib.erp_base.models import BaseModel
+from store.models import Store
+
+
+class PartnerIdempotencyKey(BaseModel):
+    """
+    Stored outcome of a partner call made with an Idempotency-Key header.
+    A retry with the same key is answered from here instead of re-running
+    the payment flow.
+    """
+    store = models.ForeignKey(
+        Store,
+        on_delete=models.CASCADE,
+        related_name="idempotency_keys",
+        verbose_name=_("فروشگاه"),
+    )
+    key = models.CharField(max_length=255, verbose_name=_("کلید"))
+    scope = models.CharField(max_length=32, verbose_name=_("عملیات"))
+    request_fingerprint = models.CharField(
+        max_length=64, verbose_name=_("اثر انگشت درخواست")
+    )
+    response_status = models.PositiveSmallIntegerField(
+        null=True, blank=True, verbose_name=_("کد وضعیت پاسخ")
+    )
+    response_body = models.JSONField(
+        default=dict, encoder=DjangoJSONEncoder, verbose_name=_("بدنه پاسخ")
+    )
+    expires_at = models.DateTimeField(verbose_name=_("زمان انقضا"))
+
+    class Meta:
+        verbose_name = _("کلید یکتایی درخواست")
+        verbose_name_plural = _("کلیدهای یکتایی درخواست")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["store", "key"], name="uniq_store_idempotency_key"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["expires_at"], name="idem_expires_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.store_id}:{self.key}"
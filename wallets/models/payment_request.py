@@ -8,7 +8,7 @@ from django.utils.translation import gettext_lazy as _
 from customers.models import Customer
 from lib.erp_base.models import BaseModel
 from store.models import Store
-from utils.reference import generate_reference_code
+from utils.reference import generate_reference_code, save_with_reference_code
 from wallets.models.wallet import Wallet
 from wallets.utils.choices import PaymentRequestStatus
 from wallets.utils.consts import PAYMENT_REQUEST_EXPIRY_MINUTES
@@ -95,23 +95,38 @@ class PaymentRequest(BaseModel):
 
     paid_at = models.DateTimeField(null=True, blank=True)
 
+    # Set when a request was expired in bulk while holding escrow funds or a
+    # credit authorization; cleared once rollback_payment() has run for it.
+    rollback_pending = models.BooleanField(
+        default=False,
+        verbose_name=_("در انتظار بازگشت وجه")
+    )
+
+    def notify_status_changed(self):
+        from wallets.services.webhook import emit_payment_status_changed
+        emit_payment_status_changed(self)
+
     def mark_awaiting_merchant(self):
         self.status = PaymentRequestStatus.AWAITING_MERCHANT_CONFIRMATION
         self.save(update_fields=["status"])
+        self.notify_status_changed()
 
     def mark_completed(self):
         self.status = PaymentRequestStatus.COMPLETED
         self.save(update_fields=["status"])
+        self.notify_status_changed()
 
     def mark_cancelled(self):
         self.status = PaymentRequestStatus.CANCELLED
         self.save(update_fields=["status"])
+        self.notify_status_changed()
         from wallets.services.payment import rollback_payment
         rollback_payment(self)
 
     def mark_expired(self):
         self.status = PaymentRequestStatus.EXPIRED
         self.save(update_fields=["status"])
+        self.notify_status_changed()
         from wallets.services.payment import rollback_payment
         rollback_payment(self)
 
@@ -122,19 +137,12 @@ class PaymentRequest(BaseModel):
                 ) + timezone.timedelta(
                 minutes=PAYMENT_REQUEST_EXPIRY_MINUTES
             )
-        if not self.reference_code:
-            for _ in range(5):
-                code = generate_reference_code(prefix="PR", random_digits=6)
-                if not PaymentRequest.objects.filter(
-                        reference_code=code
-                ).exists():
-                    self.reference_code = code
-                    break
-            else:
-                raise Exception(
-                    "Reference code generation failed. Please try again."
-                )
-        super().save(*args, **kwargs)
+        if self.reference_code:
+            return super().save(*args, **kwargs)
+        return save_with_reference_code(
+            self, lambda: generate_reference_code(prefix="PR"),
+            super().save, *args, **kwargs
+        )
 
     def __str__(self):
         return f"درخواست پرداخت #{self.id} - {self.amount} ریال - فروشگاه {self.store.name}"
@@ -144,7 +152,8 @@ class PaymentRequest(BaseModel):
         verbose_name_plural = _("درخواست‌های پرداخت")
         indexes = [
             models.Index(
-                fields=["customer", "-created_at"], name="pr_cust_created_idx"
+                fields=["customer", "-created_at", "-id"],
+                name="pr_cust_created_id_idx",
             ),
             models.Index(fields=["status"], name="pr_status_idx"),
             models.Index(fields=["expires_at"], name="pr_expires_idx"),
@@ -155,6 +164,11 @@ class PaymentRequest(BaseModel):
             models.Index(
                 fields=["store", "external_guid"], name="pr_store_ext_idx"
             ),
+            models.Index(
+                fields=["id"],
+                condition=models.Q(rollback_pending=True),
+                name="pr_rollback_pending_idx",
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -0,0 +1,29 @@
+# wallets/models/reference_node.py
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from lib.erp_base.models import BaseModel
+
+
+class ReferenceCodeNode(BaseModel):
+    """
+    One of the node ids stamped into reference codes (utils.reference).
+    Each process that mints codes leases a free node and renews the lease
+    while it runs; a node whose lease ran out may be taken by another.
+    """
+    node = models.PositiveSmallIntegerField(
+        unique=True, verbose_name=_("شناسه گره")
+    )
+    owner = models.CharField(
+        max_length=128, blank=True, verbose_name=_("فرایند دارنده")
+    )
+    expires_at = models.DateTimeField(verbose_name=_("پایان اجاره"))
+
+    class Meta:
+        verbose_name = _("گره کد پیگیری")
+        verbose_name_plural = _("گره‌های کد پیگیری")
+        ordering = ["node"]
+
+    def __str__(self):
+        return f"{self.node:02d} → {self.owner or '-'}"
@@ -0,0 +1,102 @@
+# wallets/models/settlement.py
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from lib.erp_base.models import BaseModel
+from store.models import Store
+from wallets.models.payment_request import PaymentRequest
+from wallets.models.transaction import Transaction
+from wallets.models.wallet import Wallet
+
+
+class MerchantSettlement(BaseModel):
+    """One net escrow→merchant payout covering many verified payments."""
+    store = models.ForeignKey(
+        Store,
+        on_delete=models.CASCADE,
+        related_name="settlements",
+        verbose_name=_("فروشگاه")
+    )
+    escrow_wallet = models.ForeignKey(
+        Wallet,
+        on_delete=models.PROTECT,
+        related_name="+",
+        verbose_name=_("کیف امانی")
+    )
+    merchant_wallet = models.ForeignKey(
+        Wallet,
+        on_delete=models.PROTECT,
+        related_name="settlements",
+        verbose_name=_("کیف فروشنده")
+    )
+    amount = models.BigIntegerField(verbose_name=_("مبلغ"))
+    items_count = models.PositiveIntegerField(
+        verbose_name=_("تعداد پرداخت‌ها")
+    )
+    transaction = models.OneToOneField(
+        Transaction,
+        on_delete=models.PROTECT,
+        related_name="merchant_settlement",
+        verbose_name=_("تراکنش")
+    )
+
+    class Meta:
+        verbose_name = _("تسویه فروشگاه")
+        verbose_name_plural = _("تسویه‌های فروشگاه")
+        indexes = [
+            models.Index(
+                fields=["store", "-created_at"], name="ms_store_created_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.store_id}: {self.amount}"
+
+
+class SettlementItem(BaseModel):
+    """
+    A verified cash payment of a deferred-settlement store. Items without a
+    settlement are still in escrow, waiting for the next settlement run.
+    """
+    payment_request = models.OneToOneField(
+        PaymentRequest,
+        on_delete=models.PROTECT,
+        related_name="settlement_item",
+        verbose_name=_("درخواست پرداخت")
+    )
+    store = models.ForeignKey(
+        Store,
+        on_delete=models.CASCADE,
+        related_name="settlement_items",
+        verbose_name=_("فروشگاه")
+    )
+    escrow_wallet = models.ForeignKey(
+        Wallet,
+        on_delete=models.PROTECT,
+        related_name="+",
+        verbose_name=_("کیف امانی")
+    )
+    amount = models.BigIntegerField(verbose_name=_("مبلغ"))
+    settlement = models.ForeignKey(
+        MerchantSettlement,
+        null=True,
+        blank=True,
+        on_delete=models.PROTECT,
+        related_name="items",
+        verbose_name=_("تسویه")
+    )
+
+    class Meta:
+        verbose_name = _("پرداخت در انتظار تسویه")
+        verbose_name_plural = _("پرداخت‌های در انتظار تسویه")
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=models.Q(settlement__isnull=True),
+                name="sti_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.payment_request_id}: {self.amount}"
@@ -0,0 +1,80 @@
+# wallets/models/snapshot.py
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from lib.erp_base.models import BaseModel
+from wallets.models.wallet import Wallet
+
+
+class WalletDailySnapshotManager(models.Manager):
+    def closing_balance_on(self, wallet_id, day) -> int:
+        """Ledger balance of the wallet at the end of `day` (0 before any)."""
+        closing = (
+            self.filter(wallet_id=wallet_id, day__lte=day)
+            .order_by("-day")
+            .values_list("closing_balance", flat=True)
+            .first()
+        )
+        return int(closing or 0)
+
+
+class WalletDailySnapshot(BaseModel):
+    """
+    Per-wallet, per-day totals of successful transactions. closing_balance is
+    the running ledger balance, so a point-in-time balance or an audit reads
+    one row per day instead of the whole transaction history.
+    """
+    wallet = models.ForeignKey(
+        Wallet,
+        on_delete=models.CASCADE,
+        related_name="daily_snapshots",
+        verbose_name=_("کیف پول")
+    )
+    day = models.DateField(verbose_name=_("روز"))
+    total_in = models.BigIntegerField(
+        default=0, verbose_name=_("جمع واریز")
+    )
+    total_out = models.BigIntegerField(
+        default=0, verbose_name=_("جمع برداشت")
+    )
+    transactions_count = models.PositiveIntegerField(
+        default=0, verbose_name=_("تعداد تراکنش")
+    )
+    closing_balance = models.BigIntegerField(
+        default=0, verbose_name=_("مانده پایان روز")
+    )
+
+    objects = WalletDailySnapshotManager()
+
+    class Meta:
+        verbose_name = _("مانده روزانه کیف پول")
+        verbose_name_plural = _("مانده‌های روزانه کیف پول")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["wallet", "day"], name="uniq_wallet_snapshot_day"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["day"], name="wds_day_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.wallet_id} @ {self.day}: {self.closing_balance}"
+
+
+class LedgerWatermark(BaseModel):
+    """Last transaction id folded into the daily snapshots."""
+    name = models.CharField(
+        max_length=64, unique=True, verbose_name=_("نام")
+    )
+    last_transaction_id = models.BigIntegerField(
+        default=0, verbose_name=_("آخرین شناسه تراکنش")
+    )
+
+    class Meta:
+        verbose_name = _("نشانگر پردازش دفتر")
+        verbose_name_plural = _("نشانگرهای پردازش دفتر")
+
+    def __str__(self):
+        return f"{self.name}: {self.last_transaction_id}"
@@ -4,11 +4,41 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from lib.erp_base.models import BaseModel
-from utils.reference import generate_reference_code
+from utils.reference import generate_reference_code, save_with_reference_code
 from wallets.models import Wallet
 from wallets.utils.choices import TransactionStatus, TransactionPurpose
 
 
+HISTORY_FIELDS = (
+    "id", "reference_code", "status", "purpose", "from_wallet_id",
+    "to_wallet_id", "amount", "payment_request_id", "escrow_shard",
+    "description", "created_at",
+)
+
+
+class TransactionManager(models.Manager):
+    def with_archive(self, *args, **kwargs):
+        """
+        Rows matching the filters from both the hot table and the archive,
+        as one UNION ALL of HISTORY_FIELDS dicts plus an `archived` flag.
+        Order and slice the result as usual, e.g. `.order_by("-created_at")`.
+        """
+        from wallets.models.transaction_archive import ArchivedTransaction
+        archived = models.Value(True, output_field=models.BooleanField())
+        hot = models.Value(False, output_field=models.BooleanField())
+        return (
+            self.filter(*args, **kwargs)
+            .annotate(archived=hot)
+            .values(*HISTORY_FIELDS, "archived")
+            .union(
+                ArchivedTransaction.objects.filter(*args, **kwargs)
+                .annotate(archived=archived)
+                .values(*HISTORY_FIELDS, "archived"),
+                all=True,
+            )
+        )
+
+
 class Transaction(BaseModel):
     reference_code = models.CharField(
         max_length=20,
@@ -50,22 +80,22 @@ class Transaction(BaseModel):
         on_delete=models.SET_NULL,
         verbose_name=_("درخواست پرداخت")
     )
+    escrow_shard = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        verbose_name=_("شارد امانی")
+    )
     description = models.TextField(blank=True)
 
+    objects = TransactionManager()
+
     def save(self, *args, **kwargs):
-        if not self.reference_code:
-            for _ in range(5):
-                code = generate_reference_code(prefix="TRX", random_digits=6)
-                if not Transaction.objects.filter(
-                        reference_code=code
-                ).exists():
-                    self.reference_code = code
-                    break
-            else:
-                raise Exception(
-                    "Reference code generation failed. Please try again."
-                )
-        super().save(*args, **kwargs)
+        if self.reference_code:
+            return super().save(*args, **kwargs)
+        return save_with_reference_code(
+            self, lambda: generate_reference_code(prefix="TRX"),
+            super().save, *args, **kwargs
+        )
 
     class Meta:
         verbose_name = _("تراکنش کیف پول")
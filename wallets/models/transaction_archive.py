@@ -0,0 +1,103 @@
+# wallets/models/transaction_archive.py
+
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from wallets.models.wallet import Wallet
+from wallets.utils.choices import TransactionStatus, TransactionPurpose
+
+
+class ArchivedTransaction(models.Model):
+    """
+    Cold copy of a closed-month Transaction, keeping its original id.
+    Foreign keys are kept for ORM joins but carry no database constraint,
+    so the archive never slows down or blocks writes on the hot tables.
+    """
+    id = models.BigIntegerField(primary_key=True, verbose_name="ID")
+    guid = models.UUIDField(null=True, blank=True, verbose_name="GUID")
+    reference_code = models.CharField(
+        max_length=20,
+        null=True,
+        blank=True,
+        verbose_name="کد پیگیری"
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=TransactionStatus.choices,
+        verbose_name=_("وضعیت")
+    )
+    purpose = models.CharField(
+        max_length=32,
+        choices=TransactionPurpose.choices,
+        null=True,
+        verbose_name=_("نوع عملیات")
+    )
+    from_wallet = models.ForeignKey(
+        Wallet,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        verbose_name=_("از کیف پول")
+    )
+    to_wallet = models.ForeignKey(
+        Wallet,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        verbose_name=_("به کیف پول")
+    )
+    amount = models.BigIntegerField(verbose_name=_("مبلغ"))
+    payment_request = models.ForeignKey(
+        "wallets.PaymentRequest",
+        null=True,
+        blank=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        verbose_name=_("درخواست پرداخت")
+    )
+    escrow_shard = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        verbose_name=_("شارد امانی")
+    )
+    description = models.TextField(blank=True)
+    extra_document = models.CharField(max_length=127, blank=True, null=True)
+    creator = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        verbose_name=_("ایجاد کننده")
+    )
+    created_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(
+        auto_now_add=True, verbose_name=_("زمان بایگانی")
+    )
+
+    class Meta:
+        verbose_name = _("تراکنش بایگانی‌شده")
+        verbose_name_plural = _("تراکنش‌های بایگانی‌شده")
+        indexes = [
+            models.Index(
+                fields=["from_wallet", "created_at"],
+                name="atrx_from_created_idx"
+            ),
+            models.Index(
+                fields=["to_wallet", "created_at"],
+                name="atrx_to_created_idx"
+            ),
+            models.Index(
+                fields=["payment_request"], name="atrx_pr_idx"
+            ),
+            models.Index(
+                fields=["reference_code"], name="atrx_ref_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.reference_code} (archived)"
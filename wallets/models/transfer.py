@@ -7,7 +7,7 @@ from lib.erp_base.models import BaseModel
 from wallets.models.transaction import Transaction
 from wallets.models.wallet import Wallet
 from wallets.utils.choices import TransferStatus
-from utils.reference import generate_reference_code
+from utils.reference import generate_reference_code, save_with_reference_code
 
 
 class WalletTransferRequest(BaseModel):
@@ -59,23 +59,16 @@ class WalletTransferRequest(BaseModel):
     )
 
     def save(self, *args, **kwargs):
-        if not self.reference_code:
-            for _ in range(5):
-                code = generate_reference_code(prefix="WT", random_digits=6)
-                if not WalletTransferRequest.objects.filter(
-                        reference_code=code
-                ).exists():
-                    self.reference_code = code
-                    break
-            else:
-                raise Exception(
-                    "Reference code generation failed. Please try again."
-                )
         if not self.expires_at:
             self.expires_at = timezone.localtime(
                 timezone.now()
                 ) + timezone.timedelta(minutes=1)
-        super().save(*args, **kwargs)
+        if self.reference_code:
+            return super().save(*args, **kwargs)
+        return save_with_reference_code(
+            self, lambda: generate_reference_code(prefix="WT"),
+            super().save, *args, **kwargs
+        )
 
     def __str__(self):
         return f"انتقال از {self.sender_wallet} به {self.receiver_wallet or self.receiver_phone_number} - {self.amount} ریال"
@@ -84,9 +77,18 @@ class WalletTransferRequest(BaseModel):
         verbose_name = "درخواست انتقال کیف"
         verbose_name_plural = "درخواست‌های انتقال کیف"
         indexes = [
-            models.Index(fields=["sender_wallet"]),
-            models.Index(fields=["receiver_wallet"]),
-            models.Index(fields=["receiver_phone_number"]),
+            models.Index(
+                fields=["sender_wallet", "-created_at", "-id"],
+                name="wtr_sender_created_idx",
+            ),
+            models.Index(
+                fields=["receiver_wallet", "-created_at", "-id"],
+                name="wtr_receiver_created_idx",
+            ),
+            models.Index(
+                fields=["receiver_phone_number", "-created_at", "-id"],
+                name="wtr_phone_created_idx",
+            ),
             models.Index(fields=["reference_code"]),
             models.Index(fields=["status"]),
         ]
@@ -4,23 +4,153 @@ import random
 
 from django.contrib.auth import get_user_model
 from django.db import models, IntegrityError
-from django.db.models import Q
+from django.db.models import F, Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from lib.erp_base.models import BaseModel
 from wallets.utils.choices import WalletKind, OwnerType, WALLET_KIND_PREFIX
 
 
-def generate_wallet_number(kind, length=12):
+def _random_wallet_number(kind, length):
     prefix = WALLET_KIND_PREFIX.get(kind, "60")
     number_length = length - len(prefix)
-    while True:
-        random_digits = ''.join(
-            str(random.randint(0, 9)) for _ in range(number_length)
+    random_digits = ''.join(
+        str(random.randint(0, 9)) for _ in range(number_length)
+    )
+    return f"{prefix}{random_digits}"
+
+
+def generate_wallet_numbers(kinds, length=12):
+    """
+    One unused wallet number per entry of `kinds`. Candidates are checked
+    against the table with a single IN query per round; only collisions are
+    redrawn, so a batch costs about one query regardless of its size.
+    """
+    numbers = [None] * len(kinds)
+    pending = list(range(len(kinds)))
+    taken = set()
+    while pending:
+        candidates = {}
+        for index in pending:
+            number = _random_wallet_number(kinds[index], length)
+            if number not in taken and number not in candidates:
+                candidates[number] = index
+        taken.update(
+            Wallet.objects.filter(
+                wallet_number__in=list(candidates)
+            ).values_list("wallet_number", flat=True)
+        )
+        for number, index in candidates.items():
+            if number not in taken:
+                numbers[index] = number
+                taken.add(number)
+        pending = [index for index in pending if numbers[index] is None]
+    return numbers
+
+
+def generate_wallet_number(kind, length=12):
+    return generate_wallet_numbers([kind], length)[0]
+
+
+class WalletManager(models.Manager):
+    def lock(self, *wallet_ids):
+        """
+        Lock every given wallet with one SELECT ... FOR UPDATE ordered by pk.
+        Paths that move money between several wallet pairs in one
+        transaction (e.g. a settlement page) lock through here first, so
+        concurrent transactions acquire wallet row locks in the same order;
+        single movements rely on move() ordering its two UPDATEs.
+        Returns a {pk: Wallet} mapping; raises Wallet.DoesNotExist if any id
+        is missing. Must be called inside transaction.atomic().
+        """
+        ids = sorted({int(pk) for pk in wallet_ids if pk is not None})
+        locked = {
+            wallet.pk: wallet
+            for wallet in self.select_for_update().filter(
+                pk__in=ids
+            ).order_by("pk")
+        }
+        missing = [pk for pk in ids if pk not in locked]
+        if missing:
+            raise self.model.DoesNotExist(
+                f"Wallet(s) not found for locking: {missing}"
+            )
+        return locked
+
+    # ---------- balance mutations ----------
+    # Each mutation is one conditional UPDATE with F() expressions: no
+    # SELECT round-trip and no read-modify-write in Python. The row lock it
+    # takes lasts until the caller's transaction commits. They return True
+    # when the wallet row was updated and False when the guard failed (e.g.
+    # insufficient available balance); callers must run them inside
+    # transaction.atomic() and raise on False.
+
+    def _mutate(self, wallet_id, condition: Q, **changes) -> bool:
+        changes["updated_at"] = timezone.now()
+        return self.filter(condition, pk=wallet_id).update(**changes) == 1
+
+    def credit(self, wallet_id, amount: int) -> bool:
+        return self._mutate(
+            wallet_id, Q(), balance=F("balance") + _positive(amount)
         )
-        wallet_number = f"{prefix}{random_digits}"
-        if not Wallet.objects.filter(wallet_number=wallet_number).exists():
-            return wallet_number
+
+    def debit(self, wallet_id, amount: int) -> bool:
+        """Debit only if balance - reserved_balance >= amount."""
+        amount = _positive(amount)
+        return self._mutate(
+            wallet_id,
+            Q(balance__gte=F("reserved_balance") + amount),
+            balance=F("balance") - amount,
+        )
+
+    def reserve(self, wallet_id, amount: int) -> bool:
+        amount = _positive(amount)
+        return self._mutate(
+            wallet_id,
+            Q(balance__gte=F("reserved_balance") + amount),
+            reserved_balance=F("reserved_balance") + amount,
+        )
+
+    def release(self, wallet_id, amount: int) -> bool:
+        amount = _positive(amount)
+        return self._mutate(
+            wallet_id,
+            Q(reserved_balance__gte=amount),
+            reserved_balance=F("reserved_balance") - amount,
+        )
+
+    def debit_reserved(self, wallet_id, amount: int) -> bool:
+        """Consume a previous reservation: debit balance and reserved_balance."""
+        amount = _positive(amount)
+        return self._mutate(
+            wallet_id,
+            Q(reserved_balance__gte=amount, balance__gte=amount),
+            balance=F("balance") - amount,
+            reserved_balance=F("reserved_balance") - amount,
+        )
+
+    def move(
+            self, from_wallet_id, to_wallet_id, amount: int, *,
+            from_reserved: bool = False
+    ) -> bool:
+        """
+        Debit one wallet and credit another, touching the rows in pk order so
+        concurrent movements never wait on each other in a cycle.
+        """
+        debit = self.debit_reserved if from_reserved else self.debit
+        steps = sorted(
+            [(from_wallet_id, debit), (to_wallet_id, self.credit)],
+            key=lambda step: step[0],
+        )
+        return all(mutate(pk, amount) for pk, mutate in steps)
+
+
+def _positive(amount) -> int:
+    amount = int(amount)
+    if amount <= 0:
+        raise ValueError("Amount must be greater than zero.")
+    return amount
 
 
 class Wallet(BaseModel):
@@ -59,6 +189,8 @@ class Wallet(BaseModel):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = WalletManager()
+
     @property
     def available_balance(self) -> int:
         return self.balance - self.reserved_balance
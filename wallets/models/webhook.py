@@ -0,0 +1,77 @@
+# wallets/models/webhook.py
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from lib.erp_base.models import BaseModel
+from store.models import Store
+from wallets.models.payment_request import PaymentRequest
+from wallets.utils.choices import WebhookDeliveryStatus
+
+
+class WebhookDelivery(BaseModel):
+    """
+    One signed notification to a store's webhook endpoint, and its delivery
+    log. The payload is frozen when the event happens; retries resend it
+    as-is with a fresh signature timestamp.
+    """
+    store = models.ForeignKey(
+        Store,
+        on_delete=models.CASCADE,
+        related_name="webhook_deliveries",
+        verbose_name=_("فروشگاه")
+    )
+    payment_request = models.ForeignKey(
+        PaymentRequest,
+        on_delete=models.CASCADE,
+        related_name="webhook_deliveries",
+        verbose_name=_("درخواست پرداخت")
+    )
+    event = models.CharField(max_length=64, verbose_name=_("رویداد"))
+    payload = models.JSONField(
+        encoder=DjangoJSONEncoder, verbose_name=_("محتوا")
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=WebhookDeliveryStatus.choices,
+        default=WebhookDeliveryStatus.PENDING,
+        verbose_name=_("وضعیت")
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name=_("تعداد تلاش")
+    )
+    response_status = models.PositiveSmallIntegerField(
+        null=True, blank=True, verbose_name=_("کد پاسخ")
+    )
+    last_error = models.TextField(blank=True, verbose_name=_("آخرین خطا"))
+    next_attempt_at = models.DateTimeField(
+        null=True, blank=True, verbose_name=_("زمان تلاش بعدی")
+    )
+    delivered_at = models.DateTimeField(
+        null=True, blank=True, verbose_name=_("زمان تحویل")
+    )
+    attempt_log = models.JSONField(
+        default=list,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+        verbose_name=_("سوابق تلاش‌ها")
+    )
+
+    def __str__(self):
+        return f"{self.event} → {self.store} ({self.get_status_display()})"
+
+    class Meta:
+        verbose_name = _("ارسال وب‌هوک")
+        verbose_name_plural = _("ارسال‌های وب‌هوک")
+        indexes = [
+            models.Index(
+                fields=["payment_request", "-created_at"],
+                name="whd_pr_created_idx",
+            ),
+            models.Index(
+                fields=["next_attempt_at"],
+                condition=models.Q(status="pending"),
+                name="whd_pending_idx",
+            ),
+        ]
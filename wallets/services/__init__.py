@@ -1,4 +1,7 @@
-from .create_wallet import create_default_wallets_for_user
+from .create_wallet import (
+    create_default_wallets_for_user,
+    provision_default_wallets,
+)
 from .payment import (
     create_payment_request,
     pay_payment_request,
@@ -9,6 +12,8 @@ from .transfer import (
     confirm_wallet_transfer_request,
     reject_wallet_transfer_request,
     expire_pending_transfer_requests,
+    resolve_transfer_party,
+    transfer_inbox_queryset,
 )
 from .credit import evaluate_user_credit, calculate_installments
 from .installment import pay_installment, generate_installments_for_plan
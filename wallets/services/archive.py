@@ -0,0 +1,144 @@
+# wallets/services/archive.py
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db import transaction
+from django.utils import timezone
+
+from wallets.models import ArchivedTransaction, LedgerWatermark, Transaction
+from wallets.services.ledger import SNAPSHOT_WATERMARK
+from wallets.utils.consts import (
+    TRANSACTION_ARCHIVE_BATCH_SIZE, TRANSACTION_HOT_MONTHS,
+)
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_COPY_FIELDS = (
+    "id", "guid", "reference_code", "status", "purpose", "from_wallet_id",
+    "to_wallet_id", "amount", "payment_request_id", "escrow_shard",
+    "description", "extra_document", "creator_id", "created_at",
+    "updated_at",
+)
+
+
+@dataclass(frozen=True)
+class ArchiveResult:
+    archived_count: int
+    kept_count: int
+    batches: int
+    cutoff: datetime
+
+
+def archive_cutoff(now=None, hot_months: int = TRANSACTION_HOT_MONTHS):
+    """Start of the oldest month that stays in the hot table."""
+    now = timezone.localtime(now or timezone.now())
+    month_index = now.year * 12 + now.month - 1 - hot_months
+    return now.replace(
+        year=month_index // 12, month=month_index % 12 + 1, day=1,
+        hour=0, minute=0, second=0, microsecond=0,
+    )
+
+
+def _referenced_ids(ids):
+    """Ids still pointed at by a foreign key; those rows stay hot."""
+    referenced = set()
+    for rel in Transaction._meta.related_objects:
+        if rel.many_to_many:
+            continue
+        referenced.update(
+            rel.related_model._base_manager.filter(
+                **{f"{rel.field.name}_id__in": ids}
+            ).values_list(rel.field.attname, flat=True)
+        )
+    return referenced
+
+
+def _archive_batch(after_id, cutoff, max_id, batch_size):
+    """
+    Move the next id-ordered batch of closed-month rows. The scan walks the
+    primary key only and stops at the first row of an open month, so no
+    created_at index is needed on the hot table.
+    Returns (last_id, archived, kept, reached_open_month).
+    """
+    now = timezone.localtime(timezone.now())
+    with transaction.atomic():
+        rows = list(
+            Transaction.objects.select_for_update(
+                skip_locked=True, of=("self",)
+            )
+            .filter(id__gt=after_id, id__lte=max_id)
+            .order_by("id")
+            .values(*ARCHIVE_COPY_FIELDS)[:batch_size]
+        )
+        if not rows:
+            return None, 0, 0, True
+
+        closed = []
+        for row in rows:
+            if row["created_at"] is not None and row["created_at"] >= cutoff:
+                break
+            closed.append(row)
+        reached_open_month = len(closed) < len(rows)
+        if not closed:
+            return None, 0, 0, True
+
+        referenced = _referenced_ids([row["id"] for row in closed])
+        movable = [row for row in closed if row["id"] not in referenced]
+        if movable:
+            ArchivedTransaction.objects.bulk_create(
+                [ArchivedTransaction(archived_at=now, **row) for row in movable]
+            )
+            Transaction.objects.filter(
+                id__in=[row["id"] for row in movable]
+            ).delete()
+    return (
+        closed[-1]["id"], len(movable), len(closed) - len(movable),
+        reached_open_month,
+    )
+
+
+def archive_closed_months(
+        hot_months: int = TRANSACTION_HOT_MONTHS,
+        batch_size: int = TRANSACTION_ARCHIVE_BATCH_SIZE,
+        max_batches: int = None,
+        now=None,
+) -> ArchiveResult:
+    """
+    Move transactions of closed months to ArchivedTransaction.
+
+    Only rows already folded into the daily wallet snapshots are moved, so
+    ledger reconciliation never needs the archive. Rows still referenced by
+    a foreign key (transfers, statement lines, installments, settlements)
+    stay in the hot table.
+    """
+    cutoff = archive_cutoff(now, hot_months)
+    max_id = LedgerWatermark.objects.filter(
+        name=SNAPSHOT_WATERMARK
+    ).values_list("last_transaction_id", flat=True).first() or 0
+
+    after_id = 0
+    archived = kept = batches = 0
+    while max_batches is None or batches < max_batches:
+        last_id, moved, skipped, done = _archive_batch(
+            after_id, cutoff, max_id, batch_size
+        )
+        if last_id is not None:
+            batches += 1
+            archived += moved
+            kept += skipped
+            after_id = last_id
+        if done:
+            break
+
+    result = ArchiveResult(
+        archived_count=archived, kept_count=kept, batches=batches,
+        cutoff=cutoff,
+    )
+    logger.info(
+        "transaction_archive archived=%s kept=%s batches=%s cutoff=%s",
+        result.archived_count, result.kept_count, result.batches,
+        result.cutoff.date(),
+    )
+    return result
@@ -1,15 +1,62 @@
+from django.db import IntegrityError, transaction
+
 from wallets.models import Wallet
+from wallets.models.wallet import generate_wallet_numbers
 from wallets.utils.consts import DEFAULT_WALLETS
 
+PROVISION_ATTEMPTS = 3
+
 
 def create_default_wallets_for_user(user, owner_type):
+    provision_default_wallets([user.pk], owner_type)
+
+
+def provision_default_wallets(user_ids, owner_type) -> int:
+    """
+    Create the missing default wallets of `owner_type` for every user in
+    `user_ids` with one existence query, one wallet-number query and one
+    bulk INSERT. Already provisioned users are left alone. Returns the
+    number of wallets created.
+    """
     wallet_kinds = DEFAULT_WALLETS.get(owner_type, [])
+    user_ids = list(dict.fromkeys(user_ids))
+    if not wallet_kinds or not user_ids:
+        return 0
 
-    wallets = []
-    for kind in wallet_kinds:
-        wallet, _ = Wallet.objects.get_or_create(
-            user=user,
-            kind=kind,
-            owner_type=owner_type,
+    for attempt in range(PROVISION_ATTEMPTS):
+        existing = set(
+            Wallet.objects.filter(
+                user_id__in=user_ids,
+                owner_type=owner_type,
+                kind__in=wallet_kinds,
+            ).values_list("user_id", "kind")
         )
-        wallets.append(wallet)
+        missing = [
+            (user_id, kind)
+            for user_id in user_ids
+            for kind in wallet_kinds
+            if (user_id, kind) not in existing
+        ]
+        if not missing:
+            return 0
+
+        numbers = generate_wallet_numbers([kind for _, kind in missing])
+        wallets = [
+            Wallet(
+                user_id=user_id,
+                kind=kind,
+                owner_type=owner_type,
+                wallet_number=number,
+            )
+            for (user_id, kind), number in zip(missing, numbers)
+        ]
+        try:
+            # A concurrent registration or a wallet number drawn in
+            # between wins the race; re-read and retry the remainder.
+            with transaction.atomic():
+                Wallet.objects.bulk_create(wallets)
+            return len(wallets)
+        except IntegrityError:
+            if attempt == PROVISION_ATTEMPTS - 1:
+                raise
+    return 0
@@ -0,0 +1,141 @@
+# wallets/services/expiry.py
+
+import logging
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.utils import timezone
+
+from wallets.models import PaymentRequest
+from wallets.services.payment import rollback_payment
+from wallets.services.webhook import emit_payment_status_changed_bulk
+from wallets.utils.choices import PaymentRequestStatus
+from wallets.utils.consts import (
+    PAYMENT_ROLLBACK_BATCH_SIZE, PAYMENT_ROLLBACK_MAX_BATCHES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ExpiryResult:
+    expired_created_count: int
+    expired_awaiting_count: int
+
+
+@dataclass(frozen=True)
+class RollbackResult:
+    processed_count: int
+    failed_count: int
+    batches: int
+
+
+def expire_payment_requests(now=None) -> ExpiryResult:
+    """
+    Expire every overdue request with two set-based UPDATEs.
+    CREATED requests hold nothing; AWAITING ones hold escrow funds or a credit
+    authorization, so they are flagged for the rollback processor. Stores
+    with a webhook get a notification per expired request.
+    """
+    now = now or timezone.localtime(timezone.now())
+    overdue = PaymentRequest.objects.filter(expires_at__lt=now)
+    # Only requests of stores with a webhook need their ids read back
+    notify_ids = list(
+        overdue.filter(
+            status__in=[
+                PaymentRequestStatus.CREATED,
+                PaymentRequestStatus.AWAITING_MERCHANT_CONFIRMATION,
+            ],
+            store__webhook__is_active=True,
+        ).values_list("id", flat=True)
+    )
+
+    expired_created = overdue.filter(
+        status=PaymentRequestStatus.CREATED
+    ).update(status=PaymentRequestStatus.EXPIRED)
+    expired_awaiting = overdue.filter(
+        status=PaymentRequestStatus.AWAITING_MERCHANT_CONFIRMATION
+    ).update(status=PaymentRequestStatus.EXPIRED, rollback_pending=True)
+    if notify_ids:
+        emit_payment_status_changed_bulk(
+            PaymentRequest.objects.filter(
+                pk__in=notify_ids, status=PaymentRequestStatus.EXPIRED
+            ).values_list("id", flat=True)
+        )
+
+    result = ExpiryResult(
+        expired_created_count=expired_created,
+        expired_awaiting_count=expired_awaiting,
+    )
+    logger.info(
+        "payment_request_expiry expired_created=%s expired_awaiting=%s",
+        result.expired_created_count, result.expired_awaiting_count,
+    )
+    return result
+
+
+def process_pending_rollbacks(
+        batch_size: int = PAYMENT_ROLLBACK_BATCH_SIZE,
+        max_batches: int = PAYMENT_ROLLBACK_MAX_BATCHES,
+) -> RollbackResult:
+    """
+    Reverse escrow / release authorizations for flagged requests only.
+    Flagged ids are read in chunks, but each request is claimed with SKIP
+    LOCKED and rolled back in its own short transaction, so the escrow row
+    is locked for one movement rather than a whole chunk and concurrent
+    workers share the backlog. A request whose rollback fails keeps its
+    flag and is retried next run.
+    """
+    processed = batches = 0
+    failed_ids = set()
+    last_pk = 0
+
+    while batches < max_batches:
+        ids = list(
+            PaymentRequest.objects
+            .filter(rollback_pending=True, pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        batches += 1
+        last_pk = ids[-1]
+
+        for pk in ids:
+            try:
+                with transaction.atomic():
+                    payment_request = (
+                        PaymentRequest.objects.select_for_update(
+                            skip_locked=True
+                        )
+                        .filter(pk=pk, rollback_pending=True)
+                        .first()
+                    )
+                    # claimed by another worker, or already done
+                    if payment_request is None:
+                        continue
+                    rollback_payment(payment_request)
+                    PaymentRequest.objects.filter(pk=pk).update(
+                        rollback_pending=False
+                    )
+            except Exception:
+                logger.exception(
+                    "Rollback failed for payment request %s", pk
+                )
+                failed_ids.add(pk)
+                continue
+            processed += 1
+        if len(ids) < batch_size:
+            break
+
+    result = RollbackResult(
+        processed_count=processed,
+        failed_count=len(failed_ids),
+        batches=batches,
+    )
+    logger.info(
+        "payment_request_rollback processed=%s failed=%s batches=%s",
+        result.processed_count, result.failed_count, result.batches,
+    )
+    return result
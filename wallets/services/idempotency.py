@@ -0,0 +1,122 @@
+# wallets/services/idempotency.py
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Callable, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from wallets.models import PartnerIdempotencyKey
+from wallets.utils.consts import PARTNER_IDEMPOTENCY_TTL_HOURS
+
+logger = logging.getLogger(__name__)
+
+KEY_REUSED_STATUS = 422
+KEY_REUSED_BODY = {
+    "detail": "این کلید یکتایی قبلاً برای درخواست دیگری استفاده شده است.",
+    "code": "idempotency_key_reused",
+}
+# Conflicts a retry would hit again (duplicate external_guid). Other
+# errors, e.g. a 400 for missing escrow funds or a 404 for a customer not
+# registered yet, may turn out differently and are not stored.
+FINAL_CONFLICT_STATUSES = (409,)
+
+
+@dataclass(frozen=True)
+class IdempotentResult:
+    status: int
+    body: Any
+    replayed: bool
+
+
+def request_fingerprint(scope: str, path: str, payload) -> str:
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), cls=DjangoJSONEncoder
+    )
+    return hashlib.sha256(
+        f"{scope}\n{path}\n{canonical}".encode("utf-8")
+    ).hexdigest()
+
+
+def run_idempotent(
+        store,
+        key: str,
+        scope: str,
+        fingerprint: str,
+        handler: Callable[[], Tuple[int, Any]],
+) -> IdempotentResult:
+    """
+    Run `handler` at most once per (store, key) within the TTL.
+
+    The key row is inserted before the handler runs and committed together
+    with its outcome, so a concurrent duplicate blocks on the unique index
+    until the first call finishes and is then answered from the stored
+    response. Only final outcomes (2xx and FINAL_CONFLICT_STATUSES) are
+    kept; for any other status, or if the handler raises, the row is
+    dropped and the key stays usable for a retry.
+    """
+    now = timezone.localtime(timezone.now())
+    expires_at = now + timedelta(hours=PARTNER_IDEMPOTENCY_TTL_HOURS)
+
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                record = PartnerIdempotencyKey.objects.create(
+                    store=store,
+                    key=key,
+                    scope=scope,
+                    request_fingerprint=fingerprint,
+                    expires_at=expires_at,
+                )
+        except IntegrityError:
+            record = PartnerIdempotencyKey.objects.select_for_update().get(
+                store=store, key=key
+            )
+            if record.expires_at > now:
+                if (
+                        record.scope != scope
+                        or record.request_fingerprint != fingerprint
+                ):
+                    return IdempotentResult(
+                        KEY_REUSED_STATUS, KEY_REUSED_BODY, False
+                    )
+                logger.info(
+                    "Idempotent replay store=%s key=%s scope=%s",
+                    store.pk, key, scope,
+                )
+                return IdempotentResult(
+                    record.response_status, record.response_body, True
+                )
+            # Expired key: the purge task has not reached it yet, reuse it.
+            record.scope = scope
+            record.request_fingerprint = fingerprint
+            record.expires_at = expires_at
+
+        status_code, body = handler()
+        if is_final_outcome(status_code):
+            record.response_status = status_code
+            record.response_body = body
+            record.save()
+        else:
+            record.delete()
+    return IdempotentResult(status_code, body, False)
+
+
+def is_final_outcome(status_code: int) -> bool:
+    return (
+            200 <= status_code < 300
+            or status_code in FINAL_CONFLICT_STATUSES
+    )
+
+
+def purge_expired_idempotency_keys(now=None) -> int:
+    now = now or timezone.localtime(timezone.now())
+    deleted, _ = PartnerIdempotencyKey.objects.filter(
+        expires_at__lt=now
+    ).delete()
+    return deleted
@@ -0,0 +1,311 @@
+# wallets/services/ledger.py
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import List
+
+from django.db import connection, transaction
+from django.db.models import (
+    BigIntegerField, Count, F, Max, OuterRef, Q, Subquery, Sum,
+)
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from wallets.models import (
+    LedgerWatermark, Transaction, Wallet, WalletDailySnapshot,
+)
+from wallets.utils.choices import TransactionStatus
+from wallets.utils.consts import (
+    WALLET_RECONCILE_CHUNK_SIZE,
+    WALLET_SNAPSHOT_ID_CHUNK,
+    WALLET_SNAPSHOT_SETTLE_SECONDS,
+    WALLET_SNAPSHOT_SETTLE_WAIT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_WATERMARK = "wallet_daily_snapshots"
+_SETTLE_POLL_SECONDS = 0.2
+
+
+@dataclass(frozen=True)
+class SnapshotBuildResult:
+    transactions_count: int
+    snapshots_touched: int
+    last_transaction_id: int
+
+
+@dataclass(frozen=True)
+class LedgerReconcileResult:
+    wallets_checked: int
+    wallets_drifted: int
+    drifted_wallet_ids: List[int] = field(default_factory=list)
+
+
+def _day_deltas(first_id, last_id):
+    """
+    ({(wallet_id, day): [in, out, count]}, transactions) for SUCCESS
+    transactions in the id range.
+    """
+    txns = Transaction.objects.filter(
+        id__gt=first_id, id__lte=last_id, status=TransactionStatus.SUCCESS
+    ).annotate(day=TruncDate("created_at")).order_by()
+    deltas = defaultdict(lambda: [0, 0, 0])
+    transactions = 0
+    for row in txns.values("to_wallet_id", "day").annotate(
+            total=Sum("amount"), n=Count("id")
+    ):
+        delta = deltas[(row["to_wallet_id"], row["day"])]
+        delta[0] += row["total"]
+        delta[2] += row["n"]
+        transactions += row["n"]
+    for row in txns.values("from_wallet_id", "day").annotate(
+            total=Sum("amount"), n=Count("id")
+    ):
+        delta = deltas[(row["from_wallet_id"], row["day"])]
+        delta[1] += row["total"]
+        delta[2] += row["n"]
+    return deltas, transactions
+
+
+def _apply_deltas(deltas) -> int:
+    """
+    Add the deltas to the snapshot rows and re-chain closing balances from
+    the earliest touched day onwards. Touched days are normally today and
+    yesterday, so only a couple of rows per wallet are rewritten.
+    """
+    wallet_ids = {wallet_id for wallet_id, _ in deltas}
+    min_day = min(day for _, day in deltas)
+
+    rows = {
+        (snap.wallet_id, snap.day): snap
+        for snap in WalletDailySnapshot.objects.select_for_update().filter(
+            wallet_id__in=wallet_ids, day__gte=min_day
+        )
+    }
+    now = timezone.localtime(timezone.now())
+    new_rows = [
+        WalletDailySnapshot(
+            wallet_id=wallet_id, day=day, created_at=now, updated_at=now
+        )
+        for wallet_id, day in deltas if (wallet_id, day) not in rows
+    ]
+    WalletDailySnapshot.objects.bulk_create(new_rows)
+    for snap in new_rows:
+        rows[(snap.wallet_id, snap.day)] = snap
+
+    for key, (total_in, total_out, count) in deltas.items():
+        snap = rows[key]
+        snap.total_in += total_in
+        snap.total_out += total_out
+        snap.transactions_count += count
+
+    opening = dict(
+        Wallet.objects.filter(id__in=wallet_ids).annotate(
+            opening=Coalesce(
+                Subquery(
+                    WalletDailySnapshot.objects.filter(
+                        wallet_id=OuterRef("pk"), day__lt=min_day
+                    ).order_by("-day").values("closing_balance")[:1]
+                ),
+                0,
+                output_field=BigIntegerField(),
+            )
+        ).values_list("id", "opening")
+    )
+    for wallet_id, day in sorted(rows):
+        snap = rows[(wallet_id, day)]
+        snap.closing_balance = (
+                opening[wallet_id] + snap.total_in - snap.total_out
+        )
+        snap.updated_at = now
+        opening[wallet_id] = snap.closing_balance
+
+    WalletDailySnapshot.objects.bulk_update(
+        rows.values(),
+        [
+            "total_in", "total_out", "transactions_count",
+            "closing_balance", "updated_at",
+        ],
+    )
+    return len(rows)
+
+
+def _settled_transaction_id(wait_seconds=WALLET_SNAPSHOT_SETTLE_WAIT_SECONDS):
+    """
+    PostgreSQL: highest transaction id below which no id can still appear.
+
+    Every id up to the sequence's last value was handed out before the
+    snapshot taken just after it. The short pause between the two lets an
+    INSERT that drew its id but had no transaction id yet get one, so it
+    shows up as in flight. Once the transactions in flight in that snapshot
+    (other than our own) have ended, those ids are committed or gone for
+    good. Returns None when they are still open after `wait_seconds`; the
+    caller then leaves the watermark where it is.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_sequence_last_value(pg_get_serial_sequence(%s, 'id'))",
+            [Transaction._meta.db_table],
+        )
+        last_id = cursor.fetchone()[0] or 0
+        time.sleep(_SETTLE_POLL_SECONDS)
+        cursor.execute(
+            "SELECT array_agg(xid::text)"
+            " FROM pg_snapshot_xip(pg_current_snapshot()) AS xid"
+            " WHERE xid IS DISTINCT FROM pg_current_xact_id_if_assigned()"
+        )
+        in_flight = cursor.fetchone()[0] or []
+        deadline = time.monotonic() + wait_seconds
+        while in_flight:
+            cursor.execute(
+                "SELECT array_agg(xid::text) FROM unnest(%s::xid8[]) AS xid"
+                " WHERE pg_xact_status(xid) = 'in progress'",
+                [in_flight],
+            )
+            in_flight = cursor.fetchone()[0] or []
+            if in_flight and time.monotonic() >= deadline:
+                return None
+            if in_flight:
+                time.sleep(_SETTLE_POLL_SECONDS)
+    return last_id
+
+
+def build_daily_snapshots(
+        now=None, id_chunk: int = WALLET_SNAPSHOT_ID_CHUNK
+) -> SnapshotBuildResult:
+    """
+    Fold transactions past the watermark into the daily snapshots.
+
+    The watermark moves by id, so it must never pass an id that an open
+    transaction can still commit. On PostgreSQL only ids up to
+    _settled_transaction_id() are taken, however long the inserting
+    transaction ran. Other backends fall back to transactions older than
+    WALLET_SNAPSHOT_SETTLE_SECONDS. Each id chunk commits together with the
+    watermark advance, so a crash resumes where it stopped and concurrent
+    builders serialize on the watermark row.
+    """
+    now = now or timezone.localtime(timezone.now())
+    if connection.vendor == "postgresql":
+        settled_id = _settled_transaction_id()
+        bound = Q(id__lte=settled_id or 0)
+    else:
+        bound = Q(
+            created_at__lte=now - timedelta(
+                seconds=WALLET_SNAPSHOT_SETTLE_SECONDS
+            )
+        )
+    LedgerWatermark.objects.get_or_create(name=SNAPSHOT_WATERMARK)
+
+    processed = touched = 0
+    while True:
+        with transaction.atomic():
+            watermark = LedgerWatermark.objects.select_for_update().get(
+                name=SNAPSHOT_WATERMARK
+            )
+            start = watermark.last_transaction_id
+            eligible = Transaction.objects.filter(bound, id__gt=start)
+            step_end = list(
+                eligible.order_by("id").values_list(
+                    "id", flat=True
+                )[id_chunk - 1:id_chunk]
+            )
+            upto = step_end[0] if step_end else eligible.aggregate(
+                upto=Max("id")
+            )["upto"]
+            if upto is None:
+                break
+
+            deltas, transactions = _day_deltas(start, upto)
+            if deltas:
+                touched += _apply_deltas(deltas)
+                processed += transactions
+            watermark.last_transaction_id = upto
+            watermark.save(update_fields=["last_transaction_id", "updated_at"])
+
+    result = SnapshotBuildResult(
+        transactions_count=processed,
+        snapshots_touched=touched,
+        last_transaction_id=watermark.last_transaction_id,
+    )
+    logger.info(
+        "wallet_snapshots transactions=%s snapshots=%s watermark=%s",
+        result.transactions_count, result.snapshots_touched,
+        result.last_transaction_id,
+    )
+    return result
+
+
+def reconcile_wallet_balances(
+        chunk_size: int = WALLET_RECONCILE_CHUNK_SIZE,
+) -> LedgerReconcileResult:
+    """
+    Replay each wallet from its last snapshot plus the SUCCESS transactions
+    past the watermark and flag wallets whose stored balance differs.
+    Nothing is repaired: drift means money moved outside the ledger.
+    """
+    watermark = LedgerWatermark.objects.filter(
+        name=SNAPSHOT_WATERMARK
+    ).values_list("last_transaction_id", flat=True).first() or 0
+
+    def pending(direction):
+        return Coalesce(
+            Subquery(
+                Transaction.objects.filter(
+                    **{direction: OuterRef("pk")},
+                    id__gt=watermark,
+                    status=TransactionStatus.SUCCESS,
+                ).order_by().values(direction).annotate(
+                    total=Sum("amount")
+                ).values("total")
+            ),
+            0,
+            output_field=BigIntegerField(),
+        )
+
+    last_closing = Coalesce(
+        Subquery(
+            WalletDailySnapshot.objects.filter(
+                wallet_id=OuterRef("pk")
+            ).order_by("-day").values("closing_balance")[:1]
+        ),
+        0,
+        output_field=BigIntegerField(),
+    )
+
+    checked = 0
+    drifted_ids = []
+    last_pk = 0
+    while True:
+        chunk = list(
+            Wallet.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:chunk_size]
+        )
+        if not chunk:
+            break
+        checked += len(chunk)
+        last_pk = chunk[-1]
+        for wallet_id, balance, expected in (
+                Wallet.objects.filter(pk__in=chunk)
+                .annotate(
+                    expected=last_closing
+                    + pending("to_wallet_id") - pending("from_wallet_id")
+                )
+                .filter(~Q(balance=F("expected")))
+                .values_list("pk", "balance", "expected")
+        ):
+            logger.warning(
+                "Wallet %s ledger drift: balance=%s ledger=%s",
+                wallet_id, balance, expected,
+            )
+            drifted_ids.append(wallet_id)
+
+    return LedgerReconcileResult(
+        wallets_checked=checked,
+        wallets_drifted=len(drifted_ids),
+        drifted_wallet_ids=drifted_ids,
+    )
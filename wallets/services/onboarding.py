@@ -0,0 +1,109 @@
+# wallets/services/onboarding.py
+
+import re
+from dataclasses import dataclass
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from customers.models import Customer
+from profiles.models import Profile
+from wallets.services.create_wallet import provision_default_wallets
+from wallets.utils.choices import OwnerType
+
+PHONE_RE = re.compile(r"^09\d{9}$")
+
+
+@dataclass
+class OnboardResult:
+    rows: int = 0
+    invalid: int = 0
+    users_created: int = 0
+    customers_created: int = 0
+    wallets_created: int = 0
+
+    def add(self, other: "OnboardResult"):
+        self.rows += other.rows
+        self.invalid += other.invalid
+        self.users_created += other.users_created
+        self.customers_created += other.customers_created
+        self.wallets_created += other.wallets_created
+
+
+def onboard_customers_batch(phone_numbers) -> OnboardResult:
+    """
+    Register a batch of customers by phone number the way self sign-up does
+    (user, profile, customer, default wallets), with a fixed number of bulk
+    queries per batch. Existing users are completed, never duplicated; a
+    phone already on another user's profile is left untouched.
+    """
+    result = OnboardResult(rows=len(phone_numbers))
+    phones = []
+    for raw in phone_numbers:
+        phone = (raw or "").strip()
+        if PHONE_RE.match(phone):
+            phones.append(phone)
+        else:
+            result.invalid += 1
+    phones = list(dict.fromkeys(phones))
+    if not phones:
+        return result
+
+    User = get_user_model()
+    now = timezone.localtime(timezone.now())
+    with transaction.atomic():
+        existing = set(
+            User.objects.filter(username__in=phones).values_list(
+                "username", flat=True
+            )
+        )
+        new_users = []
+        for phone in phones:
+            if phone in existing:
+                continue
+            user = User(username=phone)
+            user.set_unusable_password()
+            new_users.append(user)
+        User.objects.bulk_create(new_users)
+        result.users_created = len(new_users)
+
+        user_ids = dict(
+            User.objects.filter(username__in=phones).values_list(
+                "username", "id"
+            )
+        )
+        with_profile = set(
+            Profile.objects.filter(
+                user_id__in=user_ids.values()
+            ).values_list("user_id", flat=True)
+        )
+        Profile.objects.bulk_create(
+            [
+                Profile(
+                    user_id=user_id, phone_number=phone,
+                    created_at=now, updated_at=now,
+                )
+                for phone, user_id in user_ids.items()
+                if user_id not in with_profile
+            ],
+            ignore_conflicts=True,
+        )
+
+        with_customer = set(
+            Customer.objects.filter(
+                user_id__in=user_ids.values()
+            ).values_list("user_id", flat=True)
+        )
+        new_customers = [
+            Customer(user_id=user_id, created_at=now, updated_at=now)
+            for user_id in user_ids.values()
+            if user_id not in with_customer
+        ]
+        Customer.objects.bulk_create(new_customers)
+        result.customers_created = len(new_customers)
+
+        result.wallets_created = provision_default_wallets(
+            user_ids.values(), OwnerType.CUSTOMER
+        )
+    return result
@@ -9,14 +9,22 @@ from django.db import transaction
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
-from wallets.models import PaymentRequest, Wallet, Transaction
+from store.utils.choices import StoreSettlementMode
+from wallets.models import (
+    ArchivedTransaction,
+    PaymentRequest,
+    SettlementItem,
+    Transaction,
+    Wallet,
+)
+from wallets.services.settlement import record_pending_settlement
 from wallets.utils.choices import (
     PaymentRequestStatus, TransactionStatus, TransactionPurpose, WalletKind,
 )
 from wallets.utils.consts import (
-    ESCROW_WALLET_KIND, ESCROW_USER_NAME,
     MERCHANT_CONFIRM_WINDOW_MINUTES, CREDIT_AUTH_HOLD_EXPIRY_MINUTES,
 )
+from wallets.utils.escrow import resolve_escrow_wallet, select_escrow_shard
 
 logger = logging.getLogger(__name__)
 
@@ -64,29 +72,24 @@ def pay_payment_request(request_obj: PaymentRequest, user, wallet: Wallet):
 
     with transaction.atomic():
         if wallet.kind == WalletKind.CASH:
-            customer_wallet = Wallet.objects.select_for_update().get(
-                pk=wallet.pk
-            )
-            escrow_wallet = Wallet.objects.select_for_update().get(
-                user__username=ESCROW_USER_NAME, kind=ESCROW_WALLET_KIND
+            escrow_shard, escrow_wallet_id = resolve_escrow_wallet(
+                select_escrow_shard(request_obj)
             )
-            if customer_wallet.available_balance < request_obj.amount:
+            if not Wallet.objects.move(
+                    wallet.pk, escrow_wallet_id, request_obj.amount
+            ):
                 raise ValidationError(
                     "موجودی کافی نیست.", code="insufficient_funds"
                 )
 
-            customer_wallet.balance -= request_obj.amount
-            escrow_wallet.balance += request_obj.amount
-            customer_wallet.save(update_fields=["balance"])
-            escrow_wallet.save(update_fields=["balance"])
-
             Transaction.objects.create(
-                from_wallet=customer_wallet,
-                to_wallet=escrow_wallet,
+                from_wallet_id=wallet.pk,
+                to_wallet_id=escrow_wallet_id,
                 amount=request_obj.amount,
                 payment_request=request_obj,
                 status=TransactionStatus.SUCCESS,
                 purpose=TransactionPurpose.ESCROW_DEBIT,
+                escrow_shard=escrow_shard,
                 description="Customer → Escrow",
             )
 
@@ -138,6 +141,7 @@ def pay_payment_request(request_obj: PaymentRequest, user, wallet: Wallet):
                 "status", "merchant_confirm_expires_at", "expires_at"
             ]
         )
+        request_obj.notify_status_changed()
 
     return None
 
@@ -167,7 +171,8 @@ def check_and_expire_payment_request(
 
 def verify_payment_request(payment_request: PaymentRequest) -> PaymentRequest:
     """
-    CASH: Escrow→Merchant (new SUCCESS transaction with purpose=SETTLEMENT)
+    CASH: Escrow→Merchant (new SUCCESS transaction with purpose=SETTLEMENT),
+          or a pending SettlementItem for deferred-settlement stores
     CREDIT: settle authorization + add PURCHASE line to CURRENT statement
     """
     # Enforce current phase deadline
@@ -180,7 +185,9 @@ def verify_payment_request(payment_request: PaymentRequest) -> PaymentRequest:
         )
 
     with transaction.atomic():
-        # detect CASH by presence of success ESCROW_DEBIT
+        # detect CASH by presence of success ESCROW_DEBIT; hot table only,
+        # since the request is still awaiting confirmation and archiving
+        # only moves rows from closed months past TRANSACTION_HOT_MONTHS
         cash_escrow_txn = (
             Transaction.objects.select_for_update()
             .filter(
@@ -191,33 +198,37 @@ def verify_payment_request(payment_request: PaymentRequest) -> PaymentRequest:
             .first()
         )
 
-        if cash_escrow_txn:
-            escrow_wallet = Wallet.objects.select_for_update().get(
-                pk=cash_escrow_txn.to_wallet_id
+        if cash_escrow_txn and (
+                payment_request.store.settlement_mode
+                == StoreSettlementMode.DEFERRED
+        ):
+            record_pending_settlement(
+                payment_request, cash_escrow_txn.to_wallet_id
             )
-            merchant_wallet = Wallet.objects.select_for_update().get(
+        elif cash_escrow_txn:
+            merchant_wallet_id = Wallet.objects.values_list(
+                "pk", flat=True
+            ).get(
                 user=payment_request.store.merchant.user,
                 kind="merchant_gateway",
                 owner_type="merchant",
             )
-            if escrow_wallet.balance < payment_request.amount:
+            if not Wallet.objects.move(
+                    cash_escrow_txn.to_wallet_id, merchant_wallet_id,
+                    payment_request.amount
+            ):
                 logger.error(
-                    "ESCROW low balance verify: need %s, have %s",
-                    payment_request.amount, escrow_wallet.balance
+                    "ESCROW low balance verify: need %s on wallet %s",
+                    payment_request.amount, cash_escrow_txn.to_wallet_id
                 )
                 raise ValidationError(
                     "عملیات با خطا مواجه شد. لطفاً بعداً تلاش کنید.",
                     code="escrow_insufficient"
                 )
 
-            escrow_wallet.balance -= payment_request.amount
-            merchant_wallet.balance += payment_request.amount
-            escrow_wallet.save(update_fields=["balance"])
-            merchant_wallet.save(update_fields=["balance"])
-
             Transaction.objects.create(
-                from_wallet=escrow_wallet,
-                to_wallet=merchant_wallet,
+                from_wallet_id=cash_escrow_txn.to_wallet_id,
+                to_wallet_id=merchant_wallet_id,
                 amount=payment_request.amount,
                 payment_request=payment_request,
                 status=TransactionStatus.SUCCESS,
@@ -231,8 +242,7 @@ def verify_payment_request(payment_request: PaymentRequest) -> PaymentRequest:
                 payment_request=payment_request, status=Auth.Status.ACTIVE
             ).first()
             if auth:
-                auth.status = Auth.Status.SETTLED
-                auth.save(update_fields=["status"])
+                auth.settle()
 
                 from credit.services.use_cases import StatementUseCases
                 StatementUseCases.record_successful_purchase_for_credit(
@@ -261,6 +271,8 @@ def rollback_payment(payment_request: PaymentRequest) -> None:
     CREDIT: release ACTIVE authorization (no wallet movement)
     """
     with transaction.atomic():
+        # the escrow debit must be a live row to lock; one that was already
+        # archived is refused below rather than mistaken for a credit payment
         cash_escrow_txn = (
             Transaction.objects.select_for_update()
             .filter(
@@ -270,32 +282,49 @@ def rollback_payment(payment_request: PaymentRequest) -> None:
             )
             .first()
         )
-        if cash_escrow_txn:
-            escrow_wallet = Wallet.objects.select_for_update().get(
-                pk=cash_escrow_txn.to_wallet_id
-            )
-            customer_wallet = Wallet.objects.select_for_update().get(
-                pk=cash_escrow_txn.from_wallet_id
+        if cash_escrow_txn is None and ArchivedTransaction.objects.filter(
+                payment_request=payment_request,
+                purpose=TransactionPurpose.ESCROW_DEBIT,
+        ).exists():
+            raise ValidationError(
+                "تراکنش این پرداخت بایگانی شده و قابل بازگشت نیست.",
+                code="archived"
             )
-
-            if escrow_wallet.balance < cash_escrow_txn.amount:
+        if cash_escrow_txn:
+            # idempotent: escrow already settled to merchant or reversed
+            if Transaction.objects.with_archive(
+                    payment_request=payment_request,
+                    status=TransactionStatus.SUCCESS,
+                    purpose__in=[
+                        TransactionPurpose.SETTLEMENT,
+                        TransactionPurpose.REVERSAL,
+                    ],
+            ).exists():
+                return
+            # verified for a deferred-settlement store: the funds belong to
+            # the merchant even while they wait in escrow
+            if SettlementItem.objects.filter(
+                    payment_request=payment_request
+            ).exists():
+                return
+
+            if not Wallet.objects.move(
+                    cash_escrow_txn.to_wallet_id,
+                    cash_escrow_txn.from_wallet_id,
+                    cash_escrow_txn.amount
+            ):
                 logger.error(
-                    "ESCROW low balance rollback: need %s, have %s",
-                    cash_escrow_txn.amount, escrow_wallet.balance
+                    "ESCROW low balance rollback: need %s on wallet %s",
+                    cash_escrow_txn.amount, cash_escrow_txn.to_wallet_id
                 )
                 raise ValidationError(
                     "عملیات بازگشت وجه با خطا مواجه شد.",
                     code="escrow_insufficient"
                 )
 
-            escrow_wallet.balance -= cash_escrow_txn.amount
-            customer_wallet.balance += cash_escrow_txn.amount
-            escrow_wallet.save(update_fields=["balance"])
-            customer_wallet.save(update_fields=["balance"])
-
             Transaction.objects.create(
-                from_wallet=escrow_wallet,
-                to_wallet=customer_wallet,
+                from_wallet_id=cash_escrow_txn.to_wallet_id,
+                to_wallet_id=cash_escrow_txn.from_wallet_id,
                 amount=cash_escrow_txn.amount,
                 payment_request=payment_request,
                 status=TransactionStatus.SUCCESS,
@@ -309,5 +338,4 @@ def rollback_payment(payment_request: PaymentRequest) -> None:
             payment_request=payment_request, status=Auth.Status.ACTIVE
         ).first()
         if auth:
-            auth.status = Auth.Status.RELEASED
-            auth.save(update_fields=["status"])
+            auth.release()
@@ -0,0 +1,185 @@
+# wallets/services/settlement.py
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.db import transaction
+
+from store.models import Store
+from wallets.models import (
+    MerchantSettlement, PaymentRequest, SettlementItem, Transaction, Wallet,
+)
+from wallets.utils.choices import (
+    OwnerType, TransactionPurpose, TransactionStatus, WalletKind,
+)
+from wallets.utils.consts import SETTLEMENT_BATCH_SIZE, SETTLEMENT_MAX_BATCHES
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SettlementResult:
+    settlements_count: int
+    items_count: int
+    failed_count: int
+    batches: int
+
+
+class _EscrowShortfall(Exception):
+    pass
+
+
+def record_pending_settlement(
+        payment_request: PaymentRequest, escrow_wallet_id: int
+) -> SettlementItem:
+    """
+    Leave a verified cash payment in escrow for the next settlement run.
+    No wallet row is touched, so verify never waits on the merchant wallet.
+    """
+    return SettlementItem.objects.create(
+        payment_request=payment_request,
+        store_id=payment_request.store_id,
+        escrow_wallet_id=escrow_wallet_id,
+        amount=payment_request.amount,
+    )
+
+
+def _merchant_wallet_ids(store_ids):
+    merchant_users = dict(
+        Store.objects.filter(id__in=store_ids).values_list(
+            "id", "merchant__user_id"
+        )
+    )
+    wallet_by_user = dict(
+        Wallet.objects.filter(
+            user_id__in=set(merchant_users.values()),
+            kind=WalletKind.MERCHANT_GATEWAY,
+            owner_type=OwnerType.MERCHANT,
+        ).values_list("user_id", "id")
+    )
+    return {
+        store_id: wallet_by_user.get(user_id)
+        for store_id, user_id in merchant_users.items()
+    }
+
+
+def _settle_group(store_id, escrow_wallet_id, merchant_wallet_id, items):
+    total = sum(item.amount for item in items)
+    with transaction.atomic():
+        if not Wallet.objects.move(escrow_wallet_id, merchant_wallet_id, total):
+            raise _EscrowShortfall()
+        txn = Transaction.objects.create(
+            from_wallet_id=escrow_wallet_id,
+            to_wallet_id=merchant_wallet_id,
+            amount=total,
+            status=TransactionStatus.SUCCESS,
+            purpose=TransactionPurpose.SETTLEMENT,
+            description=f"Escrow → Merchant ({len(items)} payments)",
+        )
+        settlement = MerchantSettlement.objects.create(
+            store_id=store_id,
+            escrow_wallet_id=escrow_wallet_id,
+            merchant_wallet_id=merchant_wallet_id,
+            amount=total,
+            items_count=len(items),
+            transaction=txn,
+        )
+        SettlementItem.objects.filter(
+            id__in=[item.id for item in items]
+        ).update(settlement=settlement)
+    return settlement
+
+
+def _settle_page(after_id, batch_size):
+    """
+    Lock one page of pending items and the wallets they touch, and settle
+    it as one net movement per (store, escrow wallet).
+    Returns (last_id, settlements, items, failed).
+    """
+    with transaction.atomic():
+        items = list(
+            SettlementItem.objects.select_for_update(
+                skip_locked=True, of=("self",)
+            )
+            .filter(settlement__isnull=True, id__gt=after_id)
+            .only("id", "store_id", "escrow_wallet_id", "amount")
+            .order_by("id")[:batch_size]
+        )
+        if not items:
+            return None, 0, 0, 0
+
+        groups = defaultdict(list)
+        for item in items:
+            groups[(item.store_id, item.escrow_wallet_id)].append(item)
+        merchant_wallets = _merchant_wallet_ids(
+            {store_id for store_id, _ in groups}
+        )
+        # The page moves money between several wallet pairs in one
+        # transaction; take all their row locks up front in pk order
+        Wallet.objects.lock(
+            *(escrow_wallet_id for _, escrow_wallet_id in groups),
+            *merchant_wallets.values(),
+        )
+
+        settled = settled_items = failed = 0
+        for (store_id, escrow_wallet_id), group in groups.items():
+            merchant_wallet_id = merchant_wallets.get(store_id)
+            if merchant_wallet_id is None:
+                logger.error(
+                    "Settlement skipped: store %s has no gateway wallet",
+                    store_id,
+                )
+                failed += len(group)
+                continue
+            try:
+                _settle_group(
+                    store_id, escrow_wallet_id, merchant_wallet_id, group
+                )
+            except _EscrowShortfall:
+                logger.error(
+                    "ESCROW low balance settlement: store %s wallet %s",
+                    store_id, escrow_wallet_id,
+                )
+                failed += len(group)
+                continue
+            settled += 1
+            settled_items += len(group)
+    return items[-1].id, settled, settled_items, failed
+
+
+def settle_pending_payments(
+        batch_size: int = SETTLEMENT_BATCH_SIZE,
+        max_batches: int = SETTLEMENT_MAX_BATCHES,
+) -> SettlementResult:
+    """
+    Pay deferred-settlement stores: every page of pending items turns into
+    one escrow→merchant transaction per store and escrow shard. Failed groups
+    stay pending and are retried on the next run.
+    """
+    after_id = 0
+    settlements = items = failed = batches = 0
+    while batches < max_batches:
+        last_id, page_settlements, page_items, page_failed = _settle_page(
+            after_id, batch_size
+        )
+        if last_id is None:
+            break
+        batches += 1
+        settlements += page_settlements
+        items += page_items
+        failed += page_failed
+        after_id = last_id
+
+    result = SettlementResult(
+        settlements_count=settlements,
+        items_count=items,
+        failed_count=failed,
+        batches=batches,
+    )
+    logger.info(
+        "merchant_settlement settlements=%s items=%s failed=%s batches=%s",
+        result.settlements_count, result.items_count, result.failed_count,
+        result.batches,
+    )
+    return result
@@ -1,18 +1,84 @@
 # wallets/services/transfer.py
 
+import logging
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
 from django.db import transaction
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
+from profiles.models import Profile
 from wallets.models.transfer import WalletTransferRequest
 from wallets.models.wallet import Wallet
 from wallets.utils.choices import TransferStatus
-from utils.reference import generate_reference_code
+
+logger = logging.getLogger(__name__)
 
 ALLOWED_SENDER_KINDS = ['cash']
 ALLOWED_RECEIVER_KINDS = ['cash']
 
 
+@dataclass(frozen=True)
+class TransferParty:
+    wallet_ids: Tuple[int, ...]
+    phone_number: Optional[str]
+
+
+def resolve_transfer_party(user) -> TransferParty:
+    """Wallet ids and phone of `user`, read once instead of joined per row."""
+    wallet_ids = tuple(
+        Wallet.objects.filter(user=user).values_list("id", flat=True)
+    )
+    phone_number = (
+        Profile.objects.filter(user=user)
+        .values_list("phone_number", flat=True)
+        .first()
+    )
+    return TransferParty(wallet_ids=wallet_ids, phone_number=phone_number)
+
+
+def transfer_inbox_queryset(
+        party: TransferParty, role: str = "all", queryset=None
+):
+    """
+    Transfers `party` is involved in, as a plain filter on ids.
+
+    Every branch hits one index — (sender_wallet, created_at),
+    (receiver_wallet, created_at) or (receiver_phone_number, created_at) —
+    and the branches are combined with UNION, which also deduplicates, so
+    neither OR-across-joins nor DISTINCT reaches the planner. `queryset`
+    (select_related/only etc.) is narrowed to the matching ids.
+    """
+    if queryset is None:
+        queryset = WalletTransferRequest.objects.all()
+    base = WalletTransferRequest.objects
+    branches = []
+    if role in ("all", "sender") and party.wallet_ids:
+        branches.append(
+            base.filter(sender_wallet_id__in=party.wallet_ids).values("id")
+        )
+    if role in ("all", "receiver"):
+        if party.wallet_ids:
+            branches.append(
+                base.filter(
+                    receiver_wallet_id__in=party.wallet_ids
+                ).values("id")
+            )
+        if party.phone_number:
+            branches.append(
+                base.filter(
+                    receiver_phone_number=party.phone_number
+                ).values("id")
+            )
+
+    if not branches:
+        return queryset.none()
+    if len(branches) == 1:
+        return queryset.filter(id__in=branches[0])
+    return queryset.filter(id__in=branches[0].union(*branches[1:]))
+
+
 def create_wallet_transfer_request(
         sender_wallet: Wallet, amount: int, receiver_wallet: Wallet = None,
         receiver_phone: str = None, description: str = '', creator=None
@@ -35,62 +101,71 @@ def create_wallet_transfer_request(
     ):
         raise ValidationError("انتقال بین کیف‌های یک نفر مجاز نیست.")
     with transaction.atomic():
-        sender_wallet = Wallet.objects.select_for_update().get(
-            pk=sender_wallet.pk
-        )
-        if sender_wallet.available_balance < amount:
+        if receiver_wallet:
+            # Direct wallet-to-wallet: no reservation round-trip needed.
+            if not Wallet.objects.move(
+                    sender_wallet.pk, receiver_wallet.pk, amount
+            ):
+                raise ValidationError("موجودی کافی نیست.")
+        elif not Wallet.objects.reserve(sender_wallet.pk, amount):
             raise ValidationError("موجودی قابل رزرو کافی نیست.")
 
-        sender_wallet.reserved_balance += amount
-        sender_wallet.save()
-        reference_code = generate_reference_code(prefix="WT", random_digits=6)
-
         transfer = WalletTransferRequest.objects.create(
             sender_wallet=sender_wallet,
             receiver_wallet=receiver_wallet,
             receiver_phone_number=receiver_phone,
             amount=amount,
-            reference_code=reference_code,
             description=description,
             status=TransferStatus.SUCCESS if receiver_wallet else TransferStatus.PENDING_CONFIRMATION,
             creator=creator
         )
 
         if receiver_wallet:
-            if sender_wallet.reserved_balance < amount or sender_wallet.balance < amount:
-                raise ValidationError("موجودی کافی نیست.")
-            sender_wallet.reserved_balance -= amount
-            sender_wallet.balance -= amount
-            sender_wallet.save()
-            receiver_wallet = Wallet.objects.select_for_update().get(
-                pk=receiver_wallet.pk
-            )
-            receiver_wallet.balance += amount
-            receiver_wallet.save()
             from wallets.models.transaction import Transaction
             txn = Transaction.objects.create(
-                from_wallet=sender_wallet,
-                to_wallet=receiver_wallet,
+                from_wallet_id=sender_wallet.pk,
+                to_wallet_id=receiver_wallet.pk,
                 amount=amount,
                 status="success",
                 description="انتقال مستقیم کیف به کیف"
             )
             transfer.transaction = txn
-            transfer.status = TransferStatus.SUCCESS
-            transfer.save()
+            transfer.save(update_fields=["transaction"])
     return transfer
 
 
+def _claim_pending_transfer(transfer, status, **changes) -> bool:
+    """
+    Move a PENDING_CONFIRMATION transfer to `status` with one conditional
+    UPDATE. Only the caller that gets True may touch the reservation, so
+    confirm, reject and expiry racing on one transfer cannot both act.
+    """
+    return WalletTransferRequest.objects.filter(
+        pk=transfer.pk, status=TransferStatus.PENDING_CONFIRMATION
+    ).update(status=status, updated_at=timezone.now(), **changes) == 1
+
+
+def _expire_transfer(transfer) -> bool:
+    with transaction.atomic():
+        if not _claim_pending_transfer(transfer, TransferStatus.EXPIRED):
+            return False
+        transfer.status = TransferStatus.EXPIRED
+        if not Wallet.objects.release(
+                transfer.sender_wallet_id, transfer.amount
+        ):
+            logger.error(
+                "Transfer %s expired but wallet %s has less than %s reserved",
+                transfer.pk, transfer.sender_wallet_id, transfer.amount,
+            )
+    return True
+
+
 def check_and_expire_transfer_request(transfer_request):
     if transfer_request.expires_at and transfer_request.expires_at < timezone.localtime(
             timezone.now()
             ):
         if transfer_request.status == TransferStatus.PENDING_CONFIRMATION:
-            transfer_request.status = TransferStatus.EXPIRED
-            transfer_request.save()
-            sender_wallet = transfer_request.sender_wallet
-            sender_wallet.balance += transfer_request.amount
-            sender_wallet.save()
+            _expire_transfer(transfer_request)
         raise ValidationError("درخواست انتقال منقضی شده است.")
 
 
@@ -104,58 +179,45 @@ def confirm_wallet_transfer_request(
                 user, "profile"
         ) and user.profile.phone_number != transfer.receiver_phone_number:
             raise ValidationError("شما مجاز به تایید این انتقال نیستید.")
-        if transfer.status != TransferStatus.PENDING_CONFIRMATION:
+        if not _claim_pending_transfer(
+                transfer, TransferStatus.SUCCESS,
+                receiver_wallet=receiver_wallet,
+        ):
             raise ValidationError(
                 "این انتقال قابل تایید نیست یا قبلاً تایید شده است."
             )
-        sender_wallet = Wallet.objects.select_for_update().get(
-            pk=transfer.sender_wallet.pk
-        )
-        if sender_wallet.reserved_balance < transfer.amount:
+        if not Wallet.objects.move(
+                transfer.sender_wallet_id, receiver_wallet.pk,
+                transfer.amount, from_reserved=True
+        ):
             raise ValidationError("موجودی رزروشده کافی نیست.")
-        if sender_wallet.balance < transfer.amount:
-            raise ValidationError("موجودی کیف پول کافی نیست.")
-
-        sender_wallet.reserved_balance -= transfer.amount
-        sender_wallet.balance -= transfer.amount
-        sender_wallet.save()
-
-        receiver_wallet = Wallet.objects.select_for_update().get(
-            pk=receiver_wallet.pk
-        )
-        receiver_wallet.balance += transfer.amount
-        receiver_wallet.save()
 
         from wallets.models.transaction import Transaction
         txn = Transaction.objects.create(
-            from_wallet=sender_wallet,
-            to_wallet=receiver_wallet,
+            from_wallet_id=transfer.sender_wallet_id,
+            to_wallet_id=receiver_wallet.pk,
             amount=transfer.amount,
             status="success",
             description="انتقال تاییدشده با شماره موبایل"
         )
 
         transfer.receiver_wallet = receiver_wallet
-        transfer.transaction = txn
         transfer.status = TransferStatus.SUCCESS
-        transfer.save()
+        transfer.transaction = txn
+        transfer.save(update_fields=["transaction"])
 
     return transfer
 
 
 def reject_wallet_transfer_request(transfer: WalletTransferRequest):
-    from django.db import transaction
     with transaction.atomic():
-        sender_wallet = Wallet.objects.select_for_update().get(
-            pk=transfer.sender_wallet.pk
-        )
-        if sender_wallet.reserved_balance < transfer.amount:
+        if not _claim_pending_transfer(transfer, TransferStatus.REJECTED):
+            raise ValidationError("این انتقال قابل رد نیست.")
+        if not Wallet.objects.release(
+                transfer.sender_wallet_id, transfer.amount
+        ):
             raise ValidationError("موجودی رزروشده برای آزادسازی کافی نیست.")
-        sender_wallet.reserved_balance -= transfer.amount
-        sender_wallet.save()
-
         transfer.status = TransferStatus.REJECTED
-        transfer.save()
     return transfer
 
 
@@ -166,12 +228,4 @@ def expire_pending_transfer_requests():
         expires_at__lt=now,
     )
     for req in expired:
-        with transaction.atomic():
-            sender_wallet = Wallet.objects.select_for_update().get(
-                pk=req.sender_wallet.pk
-            )
-            if sender_wallet.reserved_balance >= req.amount:
-                sender_wallet.reserved_balance -= req.amount
-                sender_wallet.save()
-            req.status = TransferStatus.EXPIRED
-            req.save()
+        _expire_transfer(req)
@@ -0,0 +1,312 @@
+# wallets/services/webhook.py
+
+import hashlib
+import hmac
+import json
+import logging
+import time
+from datetime import timedelta
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+
+from outbox.services import enqueue
+from store.models import StoreWebhook
+from utils.public_address import NonPublicAddressError, resolve_public_ips
+from wallets.models import PaymentRequest, WebhookDelivery
+from wallets.utils.choices import WebhookDeliveryStatus
+from wallets.utils.consts import (
+    WEBHOOK_DELIVERY_HEADER,
+    WEBHOOK_EVENT_HEADER,
+    WEBHOOK_ALLOW_PRIVATE_HOSTS,
+    WEBHOOK_MAX_ATTEMPTS,
+    WEBHOOK_RETRY_BASE_SECONDS,
+    WEBHOOK_RETRY_MAX_SECONDS,
+    WEBHOOK_SIGNATURE_HEADER,
+    WEBHOOK_TIMEOUT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+PAYMENT_STATUS_EVENT = "payment_request.status_changed"
+# Registered name of wallets.tasks.task_deliver_webhook; referenced by name
+# so the outbox row can be written without importing the tasks module.
+DELIVER_TASK_NAME = "wallets.tasks.task_deliver_webhook"
+
+
+def sign_payload(secret: str, timestamp: int, body: bytes) -> str:
+    """
+    Signature header value: `t=<unix ts>,v1=<hex hmac>`, where the HMAC-SHA256
+    covers "<ts>." + raw body. Merchants recompute it with their secret and
+    reject stale timestamps to stop replays.
+    """
+    message = f"{timestamp}.".encode("utf-8") + body
+    digest = hmac.new(
+        secret.encode("utf-8"), message, hashlib.sha256
+    ).hexdigest()
+    return f"t={timestamp},v1={digest}"
+
+
+def verify_signature(secret: str, header: str, body: bytes) -> bool:
+    try:
+        parts = dict(item.split("=", 1) for item in header.split(","))
+        timestamp = int(parts["t"])
+    except (KeyError, ValueError):
+        return False
+    expected = sign_payload(secret, timestamp, body)
+    return hmac.compare_digest(expected, header)
+
+
+def build_payment_payload(payment_request: PaymentRequest, occurred_at):
+    return {
+        "event": PAYMENT_STATUS_EVENT,
+        "occurred_at": occurred_at,
+        "data": {
+            "reference_code": payment_request.reference_code,
+            "external_guid": payment_request.external_guid,
+            "status": payment_request.status,
+            "amount": payment_request.amount,
+            "paid_at": payment_request.paid_at,
+        },
+    }
+
+
+def _active_webhook_store_ids(store_ids):
+    return set(
+        StoreWebhook.objects.filter(
+            store_id__in=store_ids, is_active=True
+        ).values_list("store_id", flat=True)
+    )
+
+
+def emit_payment_status_changed(payment_request: PaymentRequest):
+    """
+    Record a status notification for the request's store, if it has an
+    active webhook. The delivery row and its outbox message are written in
+    the caller's transaction, so a rolled-back transition notifies nobody.
+    """
+    if not payment_request.store_id:
+        return None
+    if not _active_webhook_store_ids([payment_request.store_id]):
+        return None
+    delivery = WebhookDelivery.objects.create(
+        store_id=payment_request.store_id,
+        payment_request=payment_request,
+        event=PAYMENT_STATUS_EVENT,
+        payload=build_payment_payload(
+            payment_request, timezone.localtime(timezone.now())
+        ),
+    )
+    enqueue(DELIVER_TASK_NAME, args=[delivery.pk])
+    return delivery
+
+
+def emit_payment_status_changed_bulk(payment_request_ids) -> int:
+    """
+    Same as emit_payment_status_changed for requests moved by a set-based
+    UPDATE: one query for the requests, one for the webhooks, one INSERT.
+    """
+    payment_requests = list(
+        PaymentRequest.objects.filter(
+            pk__in=list(payment_request_ids), store__isnull=False
+        )
+    )
+    if not payment_requests:
+        return 0
+    active = _active_webhook_store_ids(
+        {pr.store_id for pr in payment_requests}
+    )
+    now = timezone.localtime(timezone.now())
+    deliveries = WebhookDelivery.objects.bulk_create(
+        [
+            WebhookDelivery(
+                store_id=pr.store_id,
+                payment_request=pr,
+                event=PAYMENT_STATUS_EVENT,
+                payload=build_payment_payload(pr, now),
+                created_at=now,
+                updated_at=now,
+            )
+            for pr in payment_requests
+            if pr.store_id in active
+        ]
+    )
+    for delivery in deliveries:
+        enqueue(DELIVER_TASK_NAME, args=[delivery.pk])
+    return len(deliveries)
+
+
+def retry_delay_seconds(attempts: int) -> int:
+    return min(
+        WEBHOOK_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0),
+        WEBHOOK_RETRY_MAX_SECONDS,
+    )
+
+
+def _post(webhook: StoreWebhook, delivery: WebhookDelivery):
+    body = json.dumps(
+        delivery.payload, cls=DjangoJSONEncoder, separators=(",", ":")
+    ).encode("utf-8")
+    headers = {
+        "Content-Type": "application/json",
+        WEBHOOK_EVENT_HEADER: delivery.event,
+        WEBHOOK_DELIVERY_HEADER: str(delivery.guid),
+        WEBHOOK_SIGNATURE_HEADER: sign_payload(
+            webhook.secret, int(time.time()), body
+        ),
+    }
+    if WEBHOOK_ALLOW_PRIVATE_HOSTS:
+        return requests.post(
+            webhook.url, data=body, headers=headers,
+            timeout=WEBHOOK_TIMEOUT_SECONDS, allow_redirects=False,
+        )
+
+    # Resolve once, refuse non-public answers and connect to the address
+    # that was checked, so a DNS rebind between check and connect cannot
+    # point the POST at an internal host. TLS still verifies the hostname.
+    parts = urlsplit(webhook.url)
+    address = resolve_public_ips(parts.hostname, parts.port or 443)[0]
+    host = f"[{address}]" if ":" in address else address
+    if parts.port:
+        host = f"{host}:{parts.port}"
+    headers["Host"] = parts.netloc.rpartition("@")[2]
+    with requests.Session() as session:
+        session.mount("https://", _PinnedHostAdapter(parts.hostname))
+        return session.post(
+            urlunsplit(parts._replace(netloc=host)), data=body,
+            headers=headers, timeout=WEBHOOK_TIMEOUT_SECONDS,
+            allow_redirects=False,
+        )
+
+
+class _PinnedHostAdapter(HTTPAdapter):
+    """Sends SNI for, and checks the certificate against, `hostname`."""
+
+    def __init__(self, hostname, **kwargs):
+        self.hostname = hostname
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["server_hostname"] = self.hostname
+        kwargs["assert_hostname"] = self.hostname
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _claim_attempt(delivery_id: int):
+    """
+    Lock a pending delivery whose next attempt is due and take that attempt:
+    `attempts` is bumped, next_attempt_at moves to the following retry and
+    that retry is queued, all before anything is POSTed. A duplicate or
+    early message then finds nothing due, and a worker dying mid-POST still
+    leaves its retry behind. Returns (delivery, webhook), or (None, None).
+    """
+    now = timezone.localtime(timezone.now())
+    with transaction.atomic():
+        delivery = (
+            WebhookDelivery.objects.select_for_update(of=("self",))
+            .select_related("store__webhook")
+            .filter(
+                Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now),
+                pk=delivery_id,
+                status=WebhookDeliveryStatus.PENDING,
+            )
+            .first()
+        )
+        if delivery is None:
+            return None, None
+
+        webhook = getattr(delivery.store, "webhook", None)
+        if webhook is None or not webhook.is_active:
+            delivery.status = WebhookDeliveryStatus.FAILED
+            delivery.last_error = "webhook endpoint disabled"
+            delivery.updated_at = now
+            delivery.save(update_fields=["status", "last_error", "updated_at"])
+            return delivery, None
+
+        delivery.attempts += 1
+        delay = retry_delay_seconds(delivery.attempts)
+        delivery.next_attempt_at = now + timedelta(seconds=delay)
+        delivery.updated_at = now
+        delivery.save(
+            update_fields=["attempts", "next_attempt_at", "updated_at"]
+        )
+        if delivery.attempts < WEBHOOK_MAX_ATTEMPTS:
+            enqueue(DELIVER_TASK_NAME, args=[delivery.pk], countdown=delay)
+    return delivery, webhook
+
+
+def deliver_webhook(delivery_id: int):
+    """
+    Send one pending delivery. The attempt is claimed first (see
+    _claim_attempt); the HTTP call runs outside any transaction. A non-2xx
+    answer or a network error leaves the queued retry to run after the
+    exponential backoff, until WEBHOOK_MAX_ATTEMPTS; so does a URL whose
+    host no longer resolves to a public address. Every attempt is appended
+    to attempt_log.
+    """
+    delivery, webhook = _claim_attempt(delivery_id)
+    if webhook is None:
+        return delivery
+
+    error = ""
+    try:
+        response = _post(webhook, delivery)
+    except (requests.RequestException, NonPublicAddressError) as exc:
+        delivery.response_status = None
+        error = repr(exc)
+    else:
+        delivery.response_status = response.status_code
+        if not 200 <= response.status_code < 300:
+            error = f"HTTP {response.status_code}: {response.text[:500]}"
+
+    now = timezone.localtime(timezone.now())
+    delivery.updated_at = now
+    delivery.attempt_log = [
+        *delivery.attempt_log,
+        {
+            "attempt": delivery.attempts,
+            "at": now,
+            "response_status": delivery.response_status,
+            "error": error[:500],
+        },
+    ]
+    if not error:
+        delivery.status = WebhookDeliveryStatus.DELIVERED
+        delivery.delivered_at = now
+        delivery.next_attempt_at = None
+        delivery.last_error = ""
+    elif delivery.attempts >= WEBHOOK_MAX_ATTEMPTS:
+        delivery.status = WebhookDeliveryStatus.FAILED
+        delivery.next_attempt_at = None
+        delivery.last_error = error[:2000]
+        logger.error(
+            "Webhook delivery %s to store %s failed permanently: %s",
+            delivery.pk, delivery.store_id, error
+        )
+    else:
+        delivery.last_error = error[:2000]
+
+    delivery.save(
+        update_fields=[
+            "status", "response_status", "last_error", "next_attempt_at",
+            "delivered_at", "attempt_log", "updated_at",
+        ]
+    )
+    return delivery
+
+
+def redeliver(delivery: WebhookDelivery):
+    """Queue a failed (or delivered) notification for one more round."""
+    delivery.status = WebhookDeliveryStatus.PENDING
+    delivery.attempts = 0
+    delivery.next_attempt_at = None
+    delivery.updated_at = timezone.localtime(timezone.now())
+    delivery.save(
+        update_fields=["status", "attempts", "next_attempt_at", "updated_at"]
+    )
+    enqueue(DELIVER_TASK_NAME, args=[delivery.pk])
@@ -1,48 +1,107 @@
 # wallets/tasks.py
 
 from celery import shared_task
-from django.utils import timezone
+from django.db import transaction
 
-from wallets.models import PaymentRequest
+from outbox.services import enqueue
 from wallets.services import expire_pending_transfer_requests
-from wallets.services.payment import rollback_payment
-from wallets.utils.choices import PaymentRequestStatus
+from wallets.services.expiry import (
+    expire_payment_requests,
+    process_pending_rollbacks,
+)
+from wallets.services.archive import archive_closed_months
+from wallets.services.idempotency import purge_expired_idempotency_keys
+from wallets.services.ledger import build_daily_snapshots
+from wallets.services.settlement import settle_pending_payments
+from wallets.services.webhook import deliver_webhook
 
 
 def expire_pending_payment_requests():
-    now = timezone.localtime(timezone.now())
-    expired = PaymentRequest.objects.filter(
-        status__in=[
-            PaymentRequestStatus.CREATED,
-            PaymentRequestStatus.AWAITING_MERCHANT_CONFIRMATION,
-        ],
-        expires_at__lt=now,
-    )
-    for req in expired:
-        req.mark_expired()
+    # Rollbacks run as their own job, kicked off through the outbox in the
+    # same transaction that flagged the requests.
+    with transaction.atomic():
+        expired = expire_payment_requests()
+        if expired.expired_awaiting_count:
+            enqueue(
+                task_cleanup_cancelled_and_expired_requests,
+                dedup_key="wallets:pending_rollbacks",
+            )
+    return expired
 
 
 def cleanup_cancelled_and_expired_requests():
-    for req in PaymentRequest.objects.filter(
-            status__in=[
-                PaymentRequestStatus.EXPIRED,
-                PaymentRequestStatus.CANCELLED
-            ]
-    ):
-        # Works for both CASH (reversal) and CREDIT (release authorization)
-        rollback_payment(req)
+    # Works for both CASH (reversal) and CREDIT (release authorization);
+    # only requests still flagged rollback_pending are touched.
+    return process_pending_rollbacks()
 
 
 @shared_task
 def task_expire_pending_payment_requests():
-    expire_pending_payment_requests()
+    expired = expire_pending_payment_requests()
+    return {
+        "expired_created_count": expired.expired_created_count,
+        "expired_awaiting_count": expired.expired_awaiting_count,
+    }
 
 
 @shared_task
 def task_cleanup_cancelled_and_expired_requests():
-    cleanup_cancelled_and_expired_requests()
+    result = cleanup_cancelled_and_expired_requests()
+    return {
+        "rollback_processed_count": result.processed_count,
+        "rollback_failed_count": result.failed_count,
+        "batches": result.batches,
+    }
 
 
 @shared_task
 def task_expire_pending_transfer_requests():
     expire_pending_transfer_requests()
+
+
+@shared_task
+def task_purge_idempotency_keys():
+    return {"deleted_count": purge_expired_idempotency_keys()}
+
+
+@shared_task
+def task_settle_pending_payments():
+    result = settle_pending_payments()
+    return {
+        "settlements_count": result.settlements_count,
+        "items_count": result.items_count,
+        "failed_count": result.failed_count,
+        "batches": result.batches,
+    }
+
+
+@shared_task
+def task_build_wallet_snapshots():
+    result = build_daily_snapshots()
+    return {
+        "transactions_count": result.transactions_count,
+        "snapshots_touched": result.snapshots_touched,
+        "last_transaction_id": result.last_transaction_id,
+    }
+
+
+@shared_task
+def task_archive_transactions():
+    result = archive_closed_months()
+    return {
+        "archived_count": result.archived_count,
+        "kept_count": result.kept_count,
+        "batches": result.batches,
+    }
+
+
+@shared_task
+def task_deliver_webhook(delivery_id):
+    delivery = deliver_webhook(delivery_id)
+    if delivery is None:
+        return {"status": "skipped"}
+    return {
+        "status": delivery.status,
+        "attempts": delivery.attempts,
+        "response_status": delivery.response_status,
+    }
@@ -1,8 +1,15 @@
 # wallets/tests/models/test_transaction.py
 
+from datetime import timedelta
+
 import pytest
+from django.utils import timezone
 
-from wallets.models import Wallet, PaymentRequest, Transaction
+from utils import reference
+from utils.reference import ReferenceCodeGenerator
+from wallets.models import (
+    PaymentRequest, ReferenceCodeNode, Transaction, Wallet,
+)
 from wallets.utils.choices import OwnerType, WalletKind, TransactionStatus
 
 
@@ -101,3 +108,86 @@ class TestTransactionModel:
                 from_wallet=w_from, to_wallet=w_to, amount=1100,
                 payment_request=pr, reference_code="DUPLICATE"
             )
+
+
+class TestReferenceCodeGenerator:
+
+    def test_codes_are_unique_sortable_and_fit_column(self):
+        generator = ReferenceCodeGenerator(node=3)
+        codes = [generator.generate("AUTH") for _ in range(2_500)]
+        assert len(set(codes)) == len(codes)
+        assert codes == sorted(codes)
+        assert all(len(code) <= 20 for code in codes)
+        assert all(code[4:].isdigit() for code in codes)
+
+    def test_codes_carry_node_id(self):
+        code = ReferenceCodeGenerator(node=42).generate("TRX")
+        assert code[-5:-3] == "42"
+
+    @pytest.mark.django_db
+    def test_each_process_leases_its_own_node(self):
+        first, second = ReferenceCodeGenerator(), ReferenceCodeGenerator()
+        assert first.ensure_node() != second.ensure_node()
+        assert first.generate("TRX")[-5:-3] != second.generate("TRX")[-5:-3]
+
+    @pytest.mark.django_db
+    def test_expired_node_is_taken_over_and_holder_moves_on(self):
+        first = ReferenceCodeGenerator()
+        node = first.ensure_node()
+        ReferenceCodeNode.objects.filter(node=node).update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        assert ReferenceCodeGenerator().ensure_node() == node
+        first._renew_at = first._valid_until = 0
+        assert first.ensure_node() != node
+
+
+@pytest.mark.django_db
+class TestTransactionReferenceQueries:
+
+    def test_create_does_not_check_code_existence(
+            self, store, django_assert_num_queries, monkeypatch
+    ):
+        monkeypatch.setattr(
+            reference, "_generator", ReferenceCodeGenerator(node=1)
+        )
+        user = store.merchant.user
+        w_from = Wallet.objects.create(
+            user=user, kind=WalletKind.CASH, owner_type=OwnerType.CUSTOMER
+        )
+        w_to = Wallet.objects.create(
+            user=user, kind=WalletKind.MERCHANT_GATEWAY,
+            owner_type=OwnerType.MERCHANT
+        )
+        # a single INSERT: no lookup of the code, no savepoint
+        with django_assert_num_queries(1):
+            t = Transaction.objects.create(
+                from_wallet=w_from, to_wallet=w_to, amount=1000
+            )
+        assert t.reference_code.startswith("TRX")
+
+    def test_colliding_code_raises_and_is_cleared(self, store, monkeypatch):
+        from django.db import IntegrityError
+        from wallets.models import transaction as trx_mod
+
+        user = store.merchant.user
+        w_from = Wallet.objects.create(
+            user=user, kind=WalletKind.CASH, owner_type=OwnerType.CUSTOMER
+        )
+        w_to = Wallet.objects.create(
+            user=user, kind=WalletKind.MERCHANT_GATEWAY,
+            owner_type=OwnerType.MERCHANT
+        )
+        Transaction.objects.create(
+            from_wallet=w_from, to_wallet=w_to, amount=1,
+            reference_code="TRX-TAKEN",
+        )
+        monkeypatch.setattr(
+            trx_mod, "generate_reference_code", lambda prefix="": "TRX-TAKEN"
+        )
+
+        t = Transaction(from_wallet=w_from, to_wallet=w_to, amount=2)
+        with pytest.raises(IntegrityError):
+            t.save()
+        assert t.reference_code is None
@@ -51,3 +51,79 @@ class TestWalletModel:
         now = timezone.localtime(timezone.now())
         assert now - wallet.created_at < timedelta(seconds=5)
         assert now - wallet.updated_at < timedelta(seconds=5)
+
+
+@pytest.mark.django_db
+class TestWalletLock:
+
+    def make_wallets(self):
+        user = get_user_model().objects.create(username="lockuser")
+        cash = Wallet.objects.create(
+            user=user, kind=WalletKind.CASH, owner_type=OwnerType.CUSTOMER
+        )
+        credit = Wallet.objects.create(
+            user=user, kind=WalletKind.CREDIT, owner_type=OwnerType.CUSTOMER
+        )
+        return cash, credit
+
+    def test_lock_returns_all_wallets_by_pk(self):
+        cash, credit = self.make_wallets()
+        locked = Wallet.objects.lock(credit.pk, cash.pk, None, cash.pk)
+        assert set(locked) == {cash.pk, credit.pk}
+        assert locked[cash.pk].kind == WalletKind.CASH
+
+    def test_lock_uses_single_query(self, django_assert_num_queries):
+        cash, credit = self.make_wallets()
+        with django_assert_num_queries(1):
+            Wallet.objects.lock(cash.pk, credit.pk)
+
+    def test_lock_missing_wallet_raises(self):
+        cash, _ = self.make_wallets()
+        with pytest.raises(Wallet.DoesNotExist):
+            Wallet.objects.lock(cash.pk, cash.pk + 10_000)
+
+
+@pytest.mark.django_db
+class TestWalletBalanceMutations:
+
+    def make_wallet(self, username="mutuser", balance=1_000, reserved=0):
+        user = get_user_model().objects.create(username=username)
+        return Wallet.objects.create(
+            user=user, kind=WalletKind.CASH, owner_type=OwnerType.CUSTOMER,
+            balance=balance, reserved_balance=reserved,
+        )
+
+    def test_debit_respects_reserved_balance(self):
+        wallet = self.make_wallet(balance=1_000, reserved=600)
+        assert Wallet.objects.debit(wallet.pk, 500) is False
+        assert Wallet.objects.debit(wallet.pk, 400) is True
+        wallet.refresh_from_db()
+        assert wallet.balance == 600
+        assert wallet.reserved_balance == 600
+
+    def test_reserve_release_and_debit_reserved(self):
+        wallet = self.make_wallet(balance=1_000)
+        assert Wallet.objects.reserve(wallet.pk, 700) is True
+        assert Wallet.objects.reserve(wallet.pk, 400) is False
+        assert Wallet.objects.debit_reserved(wallet.pk, 300) is True
+        assert Wallet.objects.release(wallet.pk, 500) is False
+        assert Wallet.objects.release(wallet.pk, 400) is True
+        wallet.refresh_from_db()
+        assert wallet.balance == 700
+        assert wallet.reserved_balance == 0
+
+    def test_move_is_single_update_per_wallet(
+            self, django_assert_num_queries
+    ):
+        src = self.make_wallet("src", balance=1_000)
+        dst = self.make_wallet("dst", balance=0)
+        with django_assert_num_queries(2):
+            assert Wallet.objects.move(src.pk, dst.pk, 250) is True
+        src.refresh_from_db()
+        dst.refresh_from_db()
+        assert (src.balance, dst.balance) == (750, 250)
+
+    def test_non_positive_amount_rejected(self):
+        wallet = self.make_wallet()
+        with pytest.raises(ValueError):
+            Wallet.objects.credit(wallet.pk, 0)
@@ -0,0 +1,107 @@
+# wallets/tests/public/v1/views/test_replica_reads.py
+
+import pytest
+from django.conf import settings as django_settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from utils.db_routing import (
+    READ_YOUR_WRITES_COOKIE, REPLICA_ALIAS, ReplicaRouter, use_replica,
+)
+from wallets.models import Wallet
+from wallets.utils.choices import OwnerType, WalletKind
+
+URL = "/saeedpay/api/wallets/public/v1/wallets/"
+
+
+@pytest.fixture(scope="class")
+def replica_alias():
+    """
+    A second alias on the test database, as a replica would be configured
+    with TEST MIRROR. Registered before the django_db mark sets up the test,
+    which only allows aliases that are already in DATABASES.
+    """
+    default = connections[DEFAULT_DB_ALIAS].settings_dict
+    replica_settings = {
+        **default, "TEST": {**default.get("TEST", {}), "MIRROR": "default"}
+    }
+    connections.settings[REPLICA_ALIAS] = replica_settings
+    with override_settings(
+            DATABASES={
+                **django_settings.DATABASES, REPLICA_ALIAS: replica_settings
+            }
+    ):
+        yield
+    del connections.settings[REPLICA_ALIAS]
+
+
+@pytest.fixture
+def replica(replica_alias):
+    """
+    The replica connection. Rows are committed (transaction=True) so its own
+    connection sees them.
+    """
+    yield connections[REPLICA_ALIAS]
+    connections[REPLICA_ALIAS].close()
+    del connections[REPLICA_ALIAS]
+
+
+@pytest.fixture
+def client(transactional_db):
+    cache.clear()
+    user = get_user_model().objects.create(username="09120000000")
+    Wallet.objects.create(
+        user=user, kind=WalletKind.CASH, owner_type=OwnerType.CUSTOMER,
+        balance=100
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def _results(resp):
+    return resp.data["results"] if isinstance(resp.data, dict) else resp.data
+
+
+@pytest.mark.usefixtures("replica_alias")
+@pytest.mark.django_db(
+    transaction=True, databases=[DEFAULT_DB_ALIAS, REPLICA_ALIAS]
+)
+class TestReplicaReads:
+
+    def test_list_reads_from_replica(self, client, replica):
+        with CaptureQueriesContext(replica) as replica_queries:
+            resp = client.get(URL)
+
+        assert resp.status_code == 200
+        assert len(_results(resp)) == 1
+        assert any("wallets_wallet" in q["sql"] for q in replica_queries)
+
+    def test_recent_writer_reads_primary(self, client, replica):
+        client.cookies[READ_YOUR_WRITES_COOKIE] = "1"
+        with CaptureQueriesContext(replica) as replica_queries:
+            resp = client.get(URL)
+
+        assert resp.status_code == 200
+        assert len(replica_queries) == 0
+
+    def test_unsafe_request_sets_stickiness_cookie(self, client, replica):
+        resp = client.post(URL, {})
+        assert READ_YOUR_WRITES_COOKIE in resp.cookies
+
+    def test_writes_and_transactions_stay_on_primary(self, replica):
+        router = ReplicaRouter()
+        with use_replica():
+            assert router.db_for_read(Wallet) == REPLICA_ALIAS
+            assert router.db_for_write(Wallet) == DEFAULT_DB_ALIAS
+            with transaction.atomic():
+                assert router.db_for_read(Wallet) == DEFAULT_DB_ALIAS
+        assert router.db_for_read(Wallet) == DEFAULT_DB_ALIAS
+
+
+def test_without_replica_reads_use_primary():
+    with use_replica():
+        assert ReplicaRouter().db_for_read(Wallet) == DEFAULT_DB_ALIAS
@@ -0,0 +1,95 @@
+# wallets/tests/services/test_archive.py
+
+from datetime import timedelta
+
+import pytest
+from django.db.models import Q
+from django.utils import timezone
+
+from wallets.models import (
+    ArchivedTransaction, Transaction, Wallet, WalletTransferRequest,
+)
+from wallets.services.archive import archive_closed_months, archive_cutoff
+from wallets.services.ledger import build_daily_snapshots
+from wallets.utils.choices import OwnerType, TransactionStatus, WalletKind
+
+
+@pytest.mark.django_db
+class TestTransactionArchive:
+
+    @pytest.fixture
+    def wallets(self, user_factory):
+        return [
+            Wallet.objects.create(
+                user=user_factory(f"arch_{i}"), kind=WalletKind.CREDIT,
+                owner_type=OwnerType.CUSTOMER,
+            )
+            for i in range(2)
+        ]
+
+    def txn(self, src, dst, amount, created_at):
+        t = Transaction.objects.create(
+            from_wallet=src, to_wallet=dst, amount=amount,
+            status=TransactionStatus.SUCCESS,
+        )
+        Transaction.objects.filter(pk=t.pk).update(created_at=created_at)
+        return t
+
+    def test_moves_old_unreferenced_rows_and_reads_through(self, wallets):
+        a, b = wallets
+        old = archive_cutoff(hot_months=1) - timedelta(days=3)
+        moved = self.txn(a, b, 10, old)
+        referenced = self.txn(a, b, 20, old)
+        WalletTransferRequest.objects.create(
+            sender_wallet=a, receiver_wallet=b, amount=20,
+            transaction=referenced,
+        )
+        recent = self.txn(a, b, 30, timezone.now())
+        build_daily_snapshots(now=timezone.now() + timedelta(hours=1))
+
+        result = archive_closed_months(hot_months=1)
+
+        assert result.archived_count == 1
+        assert result.kept_count == 1
+        assert not Transaction.objects.filter(pk=moved.pk).exists()
+        assert ArchivedTransaction.objects.get(pk=moved.pk).amount == 10
+        assert Transaction.objects.filter(
+            pk__in=[referenced.pk, recent.pk]
+        ).count() == 2
+
+        history = list(
+            Transaction.objects.with_archive(from_wallet=a)
+            .order_by("created_at", "id")
+        )
+        assert {row["id"] for row in history} == {
+            moved.pk, referenced.pk, recent.pk
+        }
+        assert history[-1]["id"] == recent.pk
+        assert [
+            row["id"] for row in history if row["archived"]
+        ] == [moved.pk]
+
+    def test_rows_past_snapshot_watermark_stay_hot(self, wallets):
+        a, b = wallets
+        old = archive_cutoff(hot_months=1) - timedelta(days=3)
+        t = self.txn(a, b, 10, old)
+
+        result = archive_closed_months(hot_months=1)
+
+        assert result.archived_count == 0
+        assert Transaction.objects.filter(pk=t.pk).exists()
+
+    def test_history_count_includes_archived_rows(self, wallets):
+        a, b = wallets
+        old = archive_cutoff(hot_months=1) - timedelta(days=3)
+        self.txn(a, b, 10, old)
+        self.txn(b, a, 20, timezone.now())
+        build_daily_snapshots(now=timezone.now() + timedelta(hours=1))
+        archive_closed_months(hot_months=1)
+
+        user_rows = Transaction.objects.with_archive(
+            Q(from_wallet__user=a.user) | Q(to_wallet__user=a.user),
+            status=TransactionStatus.SUCCESS,
+        )
+
+        assert user_rows.count() == 2
@@ -0,0 +1,117 @@
+# wallets/tests/services/test_idempotency.py
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from wallets.models import PartnerIdempotencyKey
+from wallets.services.idempotency import (
+    KEY_REUSED_STATUS,
+    purge_expired_idempotency_keys,
+    request_fingerprint,
+    run_idempotent,
+)
+
+
+@pytest.mark.django_db
+class TestRunIdempotent:
+
+    def make_handler(self, status_code=201, body=None):
+        calls = []
+
+        def handler():
+            calls.append(1)
+            return status_code, body or {"ok": len(calls)}
+
+        return handler, calls
+
+    def test_replay_does_not_rerun_handler(self, store):
+        handler, calls = self.make_handler()
+        fp = request_fingerprint("create", "/p/", {"amount": 10})
+
+        first = run_idempotent(store, "k1", "create", fp, handler)
+        second = run_idempotent(store, "k1", "create", fp, handler)
+
+        assert len(calls) == 1
+        assert first.replayed is False
+        assert second.replayed is True
+        assert second.status == 201
+        assert second.body == first.body
+
+    def test_same_key_different_payload_is_rejected(self, store):
+        handler, calls = self.make_handler()
+        run_idempotent(
+            store, "k1", "create",
+            request_fingerprint("create", "/p/", {"amount": 10}), handler
+        )
+        result = run_idempotent(
+            store, "k1", "create",
+            request_fingerprint("create", "/p/", {"amount": 20}), handler
+        )
+        assert result.status == KEY_REUSED_STATUS
+        assert len(calls) == 1
+
+    def test_handler_error_leaves_key_reusable(self, store):
+        fp = request_fingerprint("verify", "/p/1/verify/", {})
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            run_idempotent(store, "k1", "verify", fp, failing)
+        assert not PartnerIdempotencyKey.objects.exists()
+
+        handler, calls = self.make_handler(status_code=200)
+        result = run_idempotent(store, "k1", "verify", fp, handler)
+        assert result.status == 200 and len(calls) == 1
+
+    def test_retryable_error_is_not_stored(self, store):
+        fp = request_fingerprint("create", "/p/", {"amount": 10})
+        handler, calls = self.make_handler(status_code=404)
+        result = run_idempotent(store, "k1", "create", fp, handler)
+        assert result.status == 404
+        assert not PartnerIdempotencyKey.objects.exists()
+
+        handler, calls = self.make_handler(status_code=201)
+        result = run_idempotent(store, "k1", "create", fp, handler)
+        assert result.status == 201 and result.replayed is False
+        assert len(calls) == 1
+
+    def test_expired_retryable_error_drops_the_key(self, store):
+        fp = request_fingerprint("verify", "/p/1/verify/", {})
+        run_idempotent(store, "k1", "verify", fp, self.make_handler(200)[0])
+        PartnerIdempotencyKey.objects.update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        result = run_idempotent(
+            store, "k1", "verify", fp, self.make_handler(400)[0]
+        )
+        assert result.status == 400
+        assert not PartnerIdempotencyKey.objects.exists()
+
+    def test_conflict_is_replayed(self, store):
+        fp = request_fingerprint("create", "/p/", {"amount": 10})
+        handler, calls = self.make_handler(status_code=409)
+        run_idempotent(store, "k1", "create", fp, handler)
+        result = run_idempotent(store, "k1", "create", fp, handler)
+        assert result.status == 409 and result.replayed is True
+        assert len(calls) == 1
+
+    def test_expired_key_runs_again_and_is_purged(self, store):
+        handler, calls = self.make_handler()
+        fp = request_fingerprint("create", "/p/", {"amount": 10})
+        run_idempotent(store, "k1", "create", fp, handler)
+        PartnerIdempotencyKey.objects.update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        result = run_idempotent(store, "k1", "create", fp, handler)
+        assert result.replayed is False
+        assert len(calls) == 2
+
+        PartnerIdempotencyKey.objects.update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        assert purge_expired_idempotency_keys() == 1
@@ -0,0 +1,111 @@
+# wallets/tests/services/test_settlement.py
+
+import pytest
+
+from customers.models import Customer
+from store.utils.choices import StoreSettlementMode
+from wallets.models import MerchantSettlement, SettlementItem, Transaction
+from wallets.services.payment import (
+    create_payment_request, pay_payment_request, rollback_payment,
+    verify_payment_request,
+)
+from wallets.services.settlement import settle_pending_payments
+from wallets.utils.choices import (
+    PaymentRequestStatus, TransactionPurpose,
+)
+
+
+@pytest.mark.django_db
+class TestDeferredSettlement:
+
+    @pytest.fixture
+    def deferred_store(self, store):
+        store.settlement_mode = StoreSettlementMode.DEFERRED
+        store.save()
+        return store
+
+    def make_verified(self, store, customer_user, wallet, amount):
+        customer, _ = Customer.objects.get_or_create(user=customer_user)
+        pr = create_payment_request(
+            store=store, customer=customer, amount=amount,
+            return_url="https://ok.com"
+        )
+        pay_payment_request(pr, customer_user, wallet)
+        verify_payment_request(pr)
+        return pr
+
+    def test_verify_defers_and_job_nets_per_store(
+            self, deferred_store, customer_user, customer_cash_wallet,
+            merchant_gateway_wallet, ensure_escrow
+    ):
+        prs = [
+            self.make_verified(
+                deferred_store, customer_user, customer_cash_wallet, amount
+            )
+            for amount in (1_000, 2_000, 3_000)
+        ]
+        merchant_gateway_wallet.refresh_from_db()
+        assert merchant_gateway_wallet.balance == 0
+        assert all(
+            pr.status == PaymentRequestStatus.COMPLETED for pr in prs
+        )
+        assert SettlementItem.objects.filter(
+            settlement__isnull=True
+        ).count() == 3
+
+        result = settle_pending_payments()
+
+        assert result.items_count == 3
+        assert result.failed_count == 0
+        settlement = MerchantSettlement.objects.get()
+        assert settlement.amount == 6_000
+        assert settlement.items_count == 3
+        assert settlement.transaction.purpose == TransactionPurpose.SETTLEMENT
+        assert not SettlementItem.objects.filter(
+            settlement__isnull=True
+        ).exists()
+        merchant_gateway_wallet.refresh_from_db()
+        assert merchant_gateway_wallet.balance == 6_000
+
+        # nothing left: a second run is a no-op
+        assert settle_pending_payments().settlements_count == 0
+
+    def test_rollback_after_deferred_verify_is_noop(
+            self, deferred_store, customer_user, customer_cash_wallet,
+            merchant_gateway_wallet, ensure_escrow
+    ):
+        pr = self.make_verified(
+            deferred_store, customer_user, customer_cash_wallet, 500
+        )
+        customer_cash_wallet.refresh_from_db()
+        before = customer_cash_wallet.balance
+
+        rollback_payment(pr)
+
+        customer_cash_wallet.refresh_from_db()
+        assert customer_cash_wallet.balance == before
+        assert not Transaction.objects.filter(
+            payment_request=pr, purpose=TransactionPurpose.REVERSAL
+        ).exists()
+
+    def test_store_without_gateway_wallet_stays_pending(
+            self, deferred_store, customer_user, customer_cash_wallet,
+            ensure_escrow
+    ):
+        self.make_verified(
+            deferred_store, customer_user, customer_cash_wallet, 700
+        )
+        result = settle_pending_payments()
+        assert result.failed_count == 1
+        assert SettlementItem.objects.filter(
+            settlement__isnull=True
+        ).count() == 1
+
+    def test_immediate_store_settles_at_verify(
+            self, store, customer_user, customer_cash_wallet,
+            merchant_gateway_wallet, ensure_escrow
+    ):
+        self.make_verified(store, customer_user, customer_cash_wallet, 400)
+        merchant_gateway_wallet.refresh_from_db()
+        assert merchant_gateway_wallet.balance == 400
+        assert not SettlementItem.objects.exists()
@@ -10,6 +10,7 @@ from wallets.services.transfer import (
     confirm_wallet_transfer_request,
     reject_wallet_transfer_request,
     check_and_expire_transfer_request, expire_pending_transfer_requests,
+    resolve_transfer_party, transfer_inbox_queryset,
 )
 from wallets.utils.choices import OwnerType, WalletKind, TransferStatus
 
@@ -91,6 +92,43 @@ class TestTransferFlow:
         assert tr.status in [TransferStatus.EXPIRED,
                              TransferStatus.PENDING_CONFIRMATION]
 
+    def test_stale_expiry_after_confirm_keeps_other_reservation(
+            self, user_factory
+    ):
+        sender = user_factory("sender4", phone="09120000041")
+        receiver = user_factory("receiver4", phone="09120000042")
+        w_sender = Wallet.objects.create(
+            user=sender, kind=WalletKind.CASH, owner_type=OwnerType.CUSTOMER,
+            balance=10_000
+        )
+        w_receiver = Wallet.objects.create(
+            user=receiver, kind=WalletKind.CASH, owner_type=OwnerType.CUSTOMER,
+            balance=0
+        )
+        tr = create_wallet_transfer_request(
+            sender_wallet=w_sender, amount=1_000, receiver_phone="09120000042"
+        )
+        create_wallet_transfer_request(
+            sender_wallet=w_sender, amount=2_000, receiver_phone="09120000099"
+        )
+        tr.expires_at = timezone.now().replace(year=2000)
+        tr.save(update_fields=["expires_at"])
+        stale = type(tr).objects.get(pk=tr.pk)
+
+        confirm_wallet_transfer_request(
+            tr, receiver_wallet=w_receiver, user=receiver
+        )
+        with pytest.raises(ValidationError):
+            check_and_expire_transfer_request(stale)
+        with pytest.raises(ValidationError):
+            reject_wallet_transfer_request(stale)
+
+        tr.refresh_from_db()
+        w_sender.refresh_from_db()
+        assert tr.status == TransferStatus.SUCCESS
+        assert w_sender.balance == 9_000
+        assert w_sender.reserved_balance == 2_000
+
     def test_self_transfer_forbidden(self, user_factory):
         u = user_factory("same", phone="09120000055")
         w1 = Wallet.objects.create(
@@ -124,3 +162,50 @@ class TestTransferTasks:
         tr.refresh_from_db()
         assert tr.status == TransferStatus.EXPIRED
         assert sender.reserved_balance == 0
+
+
+@pytest.mark.django_db
+class TestTransferInbox:
+
+    def test_roles_cover_wallet_and_phone_transfers_once(self, user_factory):
+        alice = user_factory("alice", phone="09120000011")
+        bob = user_factory("bob", phone="09120000012")
+        w_alice = Wallet.objects.create(
+            user=alice, kind=WalletKind.CASH, owner_type=OwnerType.CUSTOMER,
+            balance=50_000
+        )
+        w_bob = Wallet.objects.create(
+            user=bob, kind=WalletKind.CASH, owner_type=OwnerType.CUSTOMER,
+            balance=50_000
+        )
+        sent = create_wallet_transfer_request(
+            sender_wallet=w_alice, amount=1_000, receiver_wallet=w_bob
+        )
+        by_phone = create_wallet_transfer_request(
+            sender_wallet=w_bob, amount=2_000, receiver_phone="09120000011"
+        )
+        received = create_wallet_transfer_request(
+            sender_wallet=w_bob, amount=3_000, receiver_wallet=w_alice
+        )
+
+        party = resolve_transfer_party(alice)
+        assert party.phone_number == "09120000011"
+
+        def ids(role):
+            return sorted(
+                transfer_inbox_queryset(party, role).values_list(
+                    "id", flat=True
+                )
+            )
+
+        assert ids("sender") == [sent.id]
+        assert ids("receiver") == sorted([by_phone.id, received.id])
+        assert ids("all") == sorted([sent.id, by_phone.id, received.id])
+
+    def test_user_without_wallets_or_phone_sees_nothing(
+            self, user_factory
+    ):
+        loner = user_factory("loner")
+        assert not transfer_inbox_queryset(
+            resolve_transfer_party(loner)
+        ).exists()
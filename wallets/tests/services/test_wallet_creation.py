@@ -4,7 +4,9 @@ import pytest
 from django.contrib.auth import get_user_model
 
 from wallets.models import Wallet
-from wallets.services import create_default_wallets_for_user
+from wallets.services import (
+    create_default_wallets_for_user, provision_default_wallets,
+)
 from wallets.utils.choices import OwnerType
 from wallets.utils.consts import DEFAULT_WALLETS
 
@@ -43,3 +45,46 @@ class TestCreateDefaultWalletsService:
         user = get_user_model().objects.create(username="customtype")
         create_default_wallets_for_user(user, "other-type")
         assert Wallet.objects.filter(user=user).count() == 0
+
+
+@pytest.mark.django_db
+class TestBulkProvisioning:
+
+    def test_provisions_many_users_and_skips_existing(self):
+        User = get_user_model()
+        users = [User.objects.create(username=f"bulk{i}") for i in range(5)]
+        create_default_wallets_for_user(users[0], OwnerType.CUSTOMER)
+
+        created = provision_default_wallets(
+            [u.pk for u in users], OwnerType.CUSTOMER
+        )
+
+        per_user = len(DEFAULT_WALLETS[OwnerType.CUSTOMER])
+        assert created == per_user * 4
+        assert Wallet.objects.filter(user__in=users).count() == per_user * 5
+        numbers = list(
+            Wallet.objects.filter(user__in=users).values_list(
+                "wallet_number", flat=True
+            )
+        )
+        assert all(numbers) and len(set(numbers)) == len(numbers)
+        assert provision_default_wallets(
+            [u.pk for u in users], OwnerType.CUSTOMER
+        ) == 0
+
+    def test_onboard_batch_creates_customers_and_wallets(self):
+        from customers.models import Customer
+        from wallets.services.onboarding import onboard_customers_batch
+
+        existing = get_user_model().objects.create(username="09120000101")
+        result = onboard_customers_batch(
+            ["09120000101", "09120000102", "09120000102", "bad"]
+        )
+
+        assert result.invalid == 1
+        assert result.users_created == 1
+        assert result.customers_created == 2
+        assert Customer.objects.filter(user=existing).exists()
+        assert Wallet.objects.filter(
+            user__username__in=["09120000101", "09120000102"]
+        ).count() == 2 * len(DEFAULT_WALLETS[OwnerType.CUSTOMER])
@@ -0,0 +1,213 @@
+# wallets/tests/services/test_webhook.py
+
+import json
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from django.utils import timezone
+
+from customers.models import Customer
+from outbox.models import OutboxMessage
+from store.services.webhook import configure_store_webhook
+from wallets.models import PaymentRequest, WebhookDelivery
+from wallets.services.expiry import expire_payment_requests
+from wallets.services.payment import (
+    create_payment_request, pay_payment_request, verify_payment_request,
+)
+from wallets.services import webhook as webhook_service
+from wallets.services.webhook import (
+    DELIVER_TASK_NAME, deliver_webhook, verify_signature,
+)
+from wallets.utils.choices import (
+    PaymentRequestStatus, WebhookDeliveryStatus,
+)
+from wallets.utils.consts import (
+    WEBHOOK_DELIVERY_HEADER, WEBHOOK_SIGNATURE_HEADER,
+)
+
+
+class WebhookReceiver:
+    """Local HTTP stand-in for a merchant endpoint; records every POST."""
+
+    def __init__(self, status=200):
+        self.status = status
+        self.requests = []
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                receiver.requests.append(
+                    (dict(self.headers), self.rfile.read(length))
+                )
+                self.send_response(receiver.status)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hooks"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.mark.django_db
+class TestPaymentWebhooks:
+
+    @pytest.fixture(autouse=True)
+    def allow_local_receiver(self, monkeypatch):
+        monkeypatch.setattr(
+            webhook_service, "WEBHOOK_ALLOW_PRIVATE_HOSTS", True
+        )
+
+    @pytest.fixture
+    def customer(self, customer_user):
+        return Customer.objects.create(user=customer_user)
+
+    def make_request(self, store, customer, amount=1_000):
+        return create_payment_request(
+            store=store, customer=customer, amount=amount,
+            return_url="https://ok.com"
+        )
+
+    def test_status_transitions_record_deliveries(
+            self, store, customer, customer_user, customer_cash_wallet,
+            merchant_gateway_wallet, ensure_escrow
+    ):
+        configure_store_webhook(store, "https://merchant.example/hooks")
+        pr = self.make_request(store, customer)
+        assert not WebhookDelivery.objects.exists()
+
+        pay_payment_request(pr, customer_user, customer_cash_wallet)
+        verify_payment_request(pr)
+
+        statuses = list(
+            WebhookDelivery.objects.filter(payment_request=pr)
+            .order_by("id").values_list("payload__data__status", flat=True)
+        )
+        assert statuses == [
+            PaymentRequestStatus.AWAITING_MERCHANT_CONFIRMATION,
+            PaymentRequestStatus.COMPLETED,
+        ]
+        assert OutboxMessage.objects.filter(
+            task_name=DELIVER_TASK_NAME
+        ).count() == 2
+
+    def test_no_delivery_without_active_webhook(self, store, customer):
+        configure_store_webhook(
+            store, "https://merchant.example/hooks", is_active=False
+        )
+        pr = self.make_request(store, customer)
+        pr.mark_cancelled()
+        assert not WebhookDelivery.objects.exists()
+
+    def test_bulk_expiry_notifies(self, store, customer):
+        configure_store_webhook(store, "https://merchant.example/hooks")
+        pr = self.make_request(store, customer)
+        PaymentRequest.objects.filter(pk=pr.pk).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        expire_payment_requests()
+
+        delivery = WebhookDelivery.objects.get(payment_request=pr)
+        assert delivery.payload["data"]["status"] == PaymentRequestStatus.EXPIRED
+
+    def test_delivery_is_signed_and_logged(self, store, customer):
+        with WebhookReceiver() as receiver:
+            _, secret = configure_store_webhook(store, receiver.url)
+            pr = self.make_request(store, customer)
+            pr.mark_cancelled()
+            delivery = WebhookDelivery.objects.get(payment_request=pr)
+
+            deliver_webhook(delivery.pk)
+
+        delivery.refresh_from_db()
+        assert delivery.status == WebhookDeliveryStatus.DELIVERED
+        assert delivery.response_status == 200
+        assert delivery.attempts == 1
+        headers, body = receiver.requests[0]
+        signature = headers[WEBHOOK_SIGNATURE_HEADER]
+        assert verify_signature(secret, signature, body)
+        assert not verify_signature("whsec_other", signature, body)
+        assert headers[WEBHOOK_DELIVERY_HEADER] == str(delivery.guid)
+        assert json.loads(body)["data"]["reference_code"] == pr.reference_code
+
+        # A delivered notification is not sent twice
+        deliver_webhook(delivery.pk)
+        assert len(receiver.requests) == 1
+
+    def test_failed_delivery_is_retried_with_backoff(self, store, customer):
+        with WebhookReceiver(status=500) as receiver:
+            configure_store_webhook(store, receiver.url)
+            pr = self.make_request(store, customer)
+            pr.mark_cancelled()
+            delivery = WebhookDelivery.objects.get(payment_request=pr)
+
+            deliver_webhook(delivery.pk)
+
+        delivery.refresh_from_db()
+        assert delivery.status == WebhookDeliveryStatus.PENDING
+        assert delivery.attempts == 1
+        assert delivery.response_status == 500
+        assert delivery.next_attempt_at > timezone.now()
+        retry = OutboxMessage.objects.filter(
+            task_name=DELIVER_TASK_NAME
+        ).order_by("-id").first()
+        assert retry.args == [delivery.pk]
+        assert retry.available_at > timezone.now()
+        assert [entry["response_status"] for entry in delivery.attempt_log] \
+            == [500]
+
+    def test_duplicate_message_does_not_post_again(self, store, customer):
+        with WebhookReceiver(status=500) as receiver:
+            configure_store_webhook(store, receiver.url)
+            pr = self.make_request(store, customer)
+            pr.mark_cancelled()
+            delivery = WebhookDelivery.objects.get(payment_request=pr)
+
+            deliver_webhook(delivery.pk)
+            assert deliver_webhook(delivery.pk) is None
+
+            # once the retry is due the next attempt goes out
+            WebhookDelivery.objects.filter(pk=delivery.pk).update(
+                next_attempt_at=timezone.now()
+            )
+            deliver_webhook(delivery.pk)
+
+        delivery.refresh_from_db()
+        assert len(receiver.requests) == 2
+        assert delivery.attempts == 2
+        assert [entry["attempt"] for entry in delivery.attempt_log] == [1, 2]
+
+    def test_private_host_is_refused_at_send_time(
+            self, store, customer, monkeypatch
+    ):
+        monkeypatch.setattr(
+            webhook_service, "WEBHOOK_ALLOW_PRIVATE_HOSTS", False
+        )
+        with WebhookReceiver() as receiver:
+            configure_store_webhook(store, receiver.url)
+            pr = self.make_request(store, customer)
+            pr.mark_cancelled()
+            delivery = WebhookDelivery.objects.get(payment_request=pr)
+
+            deliver_webhook(delivery.pk)
+
+        delivery.refresh_from_db()
+        assert receiver.requests == []
+        assert delivery.status == WebhookDeliveryStatus.PENDING
+        assert delivery.response_status is None
+        assert "non-public address" in delivery.last_error
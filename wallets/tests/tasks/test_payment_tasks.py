@@ -61,3 +61,38 @@ class TestPaymentTasks:
         customer_wallet.refresh_from_db()
 
         assert customer_wallet.balance >= before
+
+    def test_bulk_expiry_flags_and_reverses_escrow_once(
+            self, store, customer_user, ensure_escrow
+    ):
+        from wallets.models import PaymentRequest
+        from wallets.services.expiry import (
+            expire_payment_requests, process_pending_rollbacks,
+        )
+        from wallets.services.payment import create_payment_request
+
+        customer_wallet = Wallet.objects.create(
+            user=customer_user, kind=WalletKind.CASH,
+            owner_type=OwnerType.CUSTOMER, balance=50_000
+        )
+        pr = create_payment_request(
+            store=store, amount=10_000, return_url="https://cb.com",
+            customer=None,
+        )
+        pay_payment_request(pr, customer_user, customer_wallet)
+        PaymentRequest.objects.filter(pk=pr.pk).update(
+            expires_at=timezone.now().replace(year=2000)
+        )
+
+        result = expire_payment_requests()
+        assert result.expired_awaiting_count == 1
+        pr.refresh_from_db()
+        assert pr.status == PaymentRequestStatus.EXPIRED
+        assert pr.rollback_pending is True
+
+        assert process_pending_rollbacks(batch_size=1).processed_count == 1
+        assert process_pending_rollbacks().processed_count == 0
+        pr.refresh_from_db()
+        customer_wallet.refresh_from_db()
+        assert pr.rollback_pending is False
+        assert customer_wallet.balance == 50_000
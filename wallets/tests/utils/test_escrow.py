@@ -5,7 +5,10 @@ import pytest
 from wallets.models import Wallet
 from wallets.utils.choices import OwnerType
 from wallets.utils.consts import ESCROW_WALLET_KIND, ESCROW_USER_NAME
-from wallets.utils.escrow import ensure_escrow_wallet_exists
+from wallets.utils.escrow import (
+    ensure_escrow_wallet_exists, escrow_user_name, get_total_escrow_balance,
+    resolve_escrow_wallet, select_escrow_shard,
+)
 
 
 @pytest.mark.django_db
@@ -22,3 +25,42 @@ class TestEscrowEnsure:
             user__username=ESCROW_USER_NAME, kind=ESCROW_WALLET_KIND
         )
         assert w1.id == w2.id
+
+    def test_sharded_creation_and_total_balance(self):
+        ensure_escrow_wallet_exists(shards=3)
+        wallets = Wallet.objects.filter(kind=ESCROW_WALLET_KIND)
+        assert wallets.count() == 3
+        assert wallets.filter(user__username=escrow_user_name(0)).exists()
+        assert wallets.filter(user__username=escrow_user_name(2)).exists()
+
+        wallets.update(balance=100)
+        assert get_total_escrow_balance() == 300
+
+    def test_shard_selection_is_deterministic(self, monkeypatch):
+        from wallets.utils import escrow
+
+        class _PR:
+            pk = 7
+
+        monkeypatch.setattr(escrow, "ESCROW_SHARD_COUNT", 4)
+        assert select_escrow_shard(_PR()) == 3
+        assert select_escrow_shard(_PR()) == 3
+
+    def test_configured_shard_uses_its_own_wallet(self):
+        ensure_escrow_wallet_exists(shards=3)
+        wallet = Wallet.objects.get(
+            user__username=escrow_user_name(2), kind=ESCROW_WALLET_KIND
+        )
+        assert resolve_escrow_wallet(2) == (2, wallet.pk)
+
+    def test_missing_shard_falls_back_to_an_existing_one(self, monkeypatch):
+        from wallets.utils import escrow
+
+        ensure_escrow_wallet_exists(shards=2)
+        monkeypatch.setattr(escrow, "ESCROW_SHARD_COUNT", 4)
+        shard, wallet_id = resolve_escrow_wallet(3)
+
+        assert shard == 1
+        assert wallet_id == Wallet.objects.get(
+            user__username=escrow_user_name(1), kind=ESCROW_WALLET_KIND
+        ).pk
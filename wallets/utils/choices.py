@@ -74,3 +74,9 @@ class InstallmentStatus(models.TextChoices):
     UNPAID = "unpaid", _("پرداخت‌نشده")
     PAID = "paid", _("پرداخت‌شده")
     OVERDUE = "overdue", _("سررسید گذشته")
+
+
+class WebhookDeliveryStatus(models.TextChoices):
+    PENDING = "pending", _("در انتظار ارسال")
+    DELIVERED = "delivered", _("تحویل شده")
+    FAILED = "failed", _("ناموفق")
@@ -1,10 +1,16 @@
 # wallets/utils/consts.py
 
+from django.conf import settings
+
 from wallets.utils.choices import OwnerType, WalletKind
 
 ESCROW_USER_NAME = "escrow_wallet_user"
 ESCROW_WALLET_KIND = "escrow"
 
+# Number of escrow wallets cash payments are spread over. Each payment request
+# is pinned to one shard, so checkouts only contend with 1/N of the traffic.
+ESCROW_SHARD_COUNT = getattr(settings, "WALLETS_ESCROW_SHARD_COUNT", 1)
+
 # How long a PaymentRequest is valid after customer confirmation (merchant window)
 # Keep it short; 10-20 minutes is typical. Default: 15min.
 PAYMENT_REQUEST_EXPIRY_MINUTES = 15
@@ -13,6 +19,35 @@ MERCHANT_CONFIRM_WINDOW_MINUTES = 1
 # Credit authorization hold expiry (if merchant doesn't confirm)
 CREDIT_AUTH_HOLD_EXPIRY_MINUTES = PAYMENT_REQUEST_EXPIRY_MINUTES
 
+# Expired/cancelled requests awaiting escrow reversal or auth release are
+# read in chunks of this size, at most this many chunks per run; each one is
+# rolled back in its own transaction.
+PAYMENT_ROLLBACK_BATCH_SIZE = 200
+PAYMENT_ROLLBACK_MAX_BATCHES = 50
+
+# Deferred-settlement stores are paid out by a periodic job that nets pending
+# payments per (store, escrow shard); it reads this many items per page.
+SETTLEMENT_BATCH_SIZE = getattr(settings, "WALLETS_SETTLEMENT_BATCH_SIZE", 1000)
+SETTLEMENT_MAX_BATCHES = getattr(settings, "WALLETS_SETTLEMENT_MAX_BATCHES", 50)
+
+# Daily wallet snapshots fold in transaction ids no open database
+# transaction can still commit below: on PostgreSQL the builder waits up to
+# WALLET_SNAPSHOT_SETTLE_WAIT_SECONDS for the transactions in flight when it
+# read the id sequence, elsewhere it takes rows older than the settle delay.
+# At most WALLET_SNAPSHOT_ID_CHUNK ids are folded per step; reconciliation
+# scans wallets in chunks of WALLET_RECONCILE_CHUNK_SIZE.
+WALLET_SNAPSHOT_SETTLE_SECONDS = 300
+WALLET_SNAPSHOT_SETTLE_WAIT_SECONDS = 10
+WALLET_SNAPSHOT_ID_CHUNK = getattr(
+    settings, "WALLETS_SNAPSHOT_ID_CHUNK", 50_000
+)
+WALLET_RECONCILE_CHUNK_SIZE = 1000
+
+# Transactions of months older than this many closed months move to the
+# archive table, in batches of TRANSACTION_ARCHIVE_BATCH_SIZE rows.
+TRANSACTION_HOT_MONTHS = getattr(settings, "WALLETS_TRANSACTION_HOT_MONTHS", 12)
+TRANSACTION_ARCHIVE_BATCH_SIZE = 5000
+
 DEFAULT_WALLETS = {
     OwnerType.CUSTOMER: [
         WalletKind.MICRO_CREDIT,
@@ -27,3 +62,24 @@ DEFAULT_WALLETS = {
 
 FRONTEND_PAYMENT_DETAIL_URL = "dashboard/payment-request/"
 FRONTEND_INSTALLMENT_REQUEST_DETAIL_URL = "dashboard/credit-request"
+
+# Stored partner responses answer Idempotency-Key retries for this long.
+PARTNER_IDEMPOTENCY_TTL_HOURS = getattr(
+    settings, "WALLETS_PARTNER_IDEMPOTENCY_TTL_HOURS", 24
+)
+PARTNER_IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+# Merchant webhooks: a failed delivery is retried with exponential backoff
+# (base * 2^(attempt-1), capped) until WEBHOOK_MAX_ATTEMPTS is reached.
+WEBHOOK_TIMEOUT_SECONDS = getattr(settings, "WALLETS_WEBHOOK_TIMEOUT_SECONDS", 5)
+WEBHOOK_MAX_ATTEMPTS = getattr(settings, "WALLETS_WEBHOOK_MAX_ATTEMPTS", 8)
+# Deliveries only go to hosts that resolve to public addresses; local
+# development and tests can lift that for their own receivers.
+WEBHOOK_ALLOW_PRIVATE_HOSTS = getattr(
+    settings, "WALLETS_WEBHOOK_ALLOW_PRIVATE_HOSTS", False
+)
+WEBHOOK_RETRY_BASE_SECONDS = 30
+WEBHOOK_RETRY_MAX_SECONDS = 6 * 60 * 60
+WEBHOOK_SIGNATURE_HEADER = "X-SaeedPay-Signature"
+WEBHOOK_DELIVERY_HEADER = "X-SaeedPay-Delivery"
+WEBHOOK_EVENT_HEADER = "X-SaeedPay-Event"
@@ -1,17 +1,91 @@
 # wallets/utils/escrow.py
+import logging
+
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Sum
 
 from wallets.models import Wallet
 from wallets.utils.choices import OwnerType
-from wallets.utils.consts import ESCROW_USER_NAME, ESCROW_WALLET_KIND
+from wallets.utils.consts import (
+    ESCROW_USER_NAME, ESCROW_WALLET_KIND, ESCROW_SHARD_COUNT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def escrow_user_name(shard: int = 0) -> str:
+    """
+    Shard 0 keeps the historical escrow username so existing data stays valid;
+    every other shard gets its own system user (one escrow wallet per user).
+    """
+    return ESCROW_USER_NAME if shard == 0 else f"{ESCROW_USER_NAME}_{shard}"
+
 
+def escrow_user_names(shards: int | None = None) -> list[str]:
+    count = max(1, int(shards or ESCROW_SHARD_COUNT))
+    return [escrow_user_name(shard) for shard in range(count)]
 
-def ensure_escrow_wallet_exists():
+
+def select_escrow_shard(payment_request) -> int:
+    """Deterministic shard for a payment request (stable across retries)."""
+    return int(payment_request.pk) % max(1, int(ESCROW_SHARD_COUNT))
+
+
+def ensure_escrow_wallet_exists(shards: int | None = None):
     User = get_user_model()
-    user, _ = User.objects.get_or_create(username=ESCROW_USER_NAME)
-    Wallet.objects.get_or_create(
-        user=user,
-        kind=ESCROW_WALLET_KIND,
-        owner_type=OwnerType.SYSTEM,
-        defaults={"balance": 0}
+    for username in escrow_user_names(shards):
+        user, _ = User.objects.get_or_create(username=username)
+        Wallet.objects.get_or_create(
+            user=user,
+            kind=ESCROW_WALLET_KIND,
+            owner_type=OwnerType.SYSTEM,
+            defaults={"balance": 0}
+        )
+
+
+def resolve_escrow_wallet(shard: int = 0) -> tuple[int, int]:
+    """
+    (shard, wallet id) to hold funds for `shard`. If that shard's wallet was
+    never created (ESCROW_SHARD_COUNT raised before `ensure_escrow` ran), an
+    existing shard is used instead, and returned so the transaction records
+    the wallet it really moved money into.
+    """
+    wallet_id = Wallet.objects.filter(
+        user__username=escrow_user_name(shard), kind=ESCROW_WALLET_KIND
+    ).values_list("pk", flat=True).first()
+    if wallet_id is not None:
+        return shard, wallet_id
+
+    shards = {
+        escrow_user_name(index): index
+        for index in range(max(1, int(ESCROW_SHARD_COUNT), shard + 1))
+    }
+    existing = sorted(
+        (shards[username], pk)
+        for username, pk in Wallet.objects.filter(
+            user__username__in=shards, kind=ESCROW_WALLET_KIND
+        ).values_list("user__username", "pk")
+    )
+    if not existing:
+        raise ImproperlyConfigured(
+            "No escrow wallet exists; run the ensure_escrow command."
+        )
+    fallback = existing[shard % len(existing)]
+    logger.warning(
+        "Escrow shard %s has no wallet, using shard %s; run ensure_escrow "
+        "for WALLETS_ESCROW_SHARD_COUNT=%s",
+        shard, fallback[0], ESCROW_SHARD_COUNT,
+    )
+    return fallback
+
+
+def escrow_wallets_queryset():
+    return Wallet.objects.filter(
+        kind=ESCROW_WALLET_KIND, owner_type=OwnerType.SYSTEM
     )
+
+
+def get_total_escrow_balance() -> int:
+    agg = escrow_wallets_queryset().aggregate(total=Sum("balance"))
+    return int(agg["total"] or 0)